@@ -3,21 +3,161 @@ Flask Web Application for Calculator - CA3
 Provides web interface and REST API for the Calculator class
 Student: X00203402 - Roko Skugor
 """
+import functools
+import hashlib
+import hmac
+import json
+import math
 import os
 import sys
+from urllib.parse import urlencode
 
-from flask import Flask, jsonify, render_template_string, request
+from flask import (
+    Flask,
+    Response,
+    g,
+    jsonify,
+    make_response,
+    redirect,
+    render_template_string,
+    request,
+)
 
 # Ensure project root is on Python path (fixes Azure App Service imports)
 PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
 if PROJECT_ROOT not in sys.path:
     sys.path.append(PROJECT_ROOT)
 
-from src.calculator import Calculator  # noqa: E402  (import after sys.path fix)
+from src.calculator import (  # noqa: E402  (import after sys.path fix)
+    INTEGER_OPERATIONS,
+    OPERATIONS,
+    UNARY_OPERATIONS,
+    Calculator,
+)
+from src import (  # noqa: E402
+    access_log,
+    audit_log,
+    batcher,
+    calc_graph,
+    capture,
+    finance,
+    int_format,
+    linalg,
+    profiler,
+    series,
+    shared_cache,
+    tabulate,
+    watchdog,
+    windows,
+)
+from src.singleflight import SingleFlight  # noqa: E402
+from src.timing import PhaseStats, PhaseTimer  # noqa: E402
 
 app = Flask(__name__)
+app.jinja_env.globals["unary_operations"] = sorted(UNARY_OPERATIONS)
 calc = Calculator()
 
+# Identical concurrent calculations share one computation (thundering herd)
+single_flight = SingleFlight()
+
+# Sampled structured request logs, written off the request path
+access_logger = access_log.from_env()
+# Opt-in audit trail of every calculation (AUDIT_LOG_PATH)
+audit_trail = audit_log.from_env()
+
+# Opt-in capture of calculation traffic for replay (CAPTURE_PATH)
+traffic_capture = capture.from_env()
+CAPTURE_ROUTES = {"POST /api/calculate": capture.API, "POST /": capture.FORM}
+
+# Opt-in sampling profiler of request threads (PROFILER=1)
+sampling_profiler = profiler.from_env()
+
+# Stacks and inputs of requests slower than SLOW_REQUEST_MS (0 disables)
+slow_watchdog = watchdog.from_env()
+
+# /admin endpoints require this token in the X-Admin-Token header; they are
+# disabled (404) when it is not set
+ADMIN_TOKEN = os.getenv("ADMIN_TOKEN", "")
+
+# Per-phase request timings, returned as Server-Timing and aggregated
+SERVER_TIMING = os.getenv("SERVER_TIMING", "1") == "1"
+phase_stats = PhaseStats()
+
+# GET /api/calculate/<operation> results are pure functions of the URL, so
+# shared caches may keep them indefinitely. Bump the version to invalidate
+# every ETag if calculation semantics ever change.
+API_CACHE_CONTROL = "public, max-age=31536000, immutable"
+API_CACHE_VERSION = "1"
+
+# Matrix operations and the number of matrix operands each takes
+matrix_calc = linalg.MatrixCalculator()
+MATRIX_OPERATIONS = {
+    "multiply": 2,
+    "transpose": 1,
+    "determinant": 1,
+    "solve": 2,
+    "inverse": 1,
+}
+MATRIX_MAX_DIM = int(os.getenv("MATRIX_MAX_DIM", "2000" if linalg.HAS_NUMPY else "300"))
+PACKED_MIMETYPE = "application/octet-stream"
+
+# Largest n accepted by factorial, binomial and fibonacci
+BIGINT_OPERATIONS = frozenset({"factorial", "binomial", "fibonacci"})
+BIGINT_MAX_N = int(os.getenv("BIGINT_MAX_N", "100000"))
+
+# Largest operand size (in bits) accepted by the number-theory operations
+NUMBER_THEORY_OPERATIONS = frozenset(
+    {"is_prime", "factorize", "gcd", "lcm", "mod_inverse"}
+)
+NUMBER_THEORY_MAX_BITS = int(os.getenv("NUMBER_THEORY_MAX_BITS", "1024"))
+
+# Host-wide result cache shared by every worker (SHARED_CACHE=1). A lookup
+# costs a few microseconds, so only the expensive operation families use it.
+result_cache = shared_cache.from_env()
+SHARED_CACHE_OPERATIONS = BIGINT_OPERATIONS | NUMBER_THEORY_OPERATIONS
+
+# Most calculations accepted by one /api/calculate/batch request
+BATCH_MAX_ITEMS = int(os.getenv("BATCH_MAX_ITEMS", "1000"))
+
+# Largest sweep /api/tabulate will stream in one request
+TABULATE_MAX_POINTS = int(os.getenv("TABULATE_MAX_POINTS", "10000000"))
+
+# Longest rolling window /api/window keeps in memory
+WINDOW_MAX_SIZE = int(os.getenv("WINDOW_MAX_SIZE", "1000000"))
+
+# /api/series kinds -> (Calculator method, fields in argument order)
+SERIES_KINDS = {
+    "arithmetic": ("arithmetic_series", ("first", "difference", "count")),
+    "geometric": ("geometric_series", ("first", "ratio", "count")),
+    "power_sum": ("power_sum", ("power", "n")),
+    "term": ("series_sum", ("term", "start", "stop")),
+    "compound": ("compound_growth", ("principal", "rate", "periods")),
+    "compound_interest": (
+        "compound_interest",
+        ("principal", "annual_rate", "years", "periods_per_year"),
+    ),
+}
+# Most terms /api/series adds up one by one when there is no closed form
+SERIES_MAX_TERMS = int(os.getenv("SERIES_MAX_TERMS", "10000000"))
+
+# Most loans, and schedule rows across them, in one /api/amortize request
+AMORTIZE_MAX_LOANS = int(os.getenv("AMORTIZE_MAX_LOANS", "10000"))
+AMORTIZE_MAX_ROWS = int(os.getenv("AMORTIZE_MAX_ROWS", "10000000"))
+
+# Calculation graphs kept per worker (least recently used are dropped first)
+GRAPH_MAX_GRAPHS = int(os.getenv("GRAPH_MAX_GRAPHS", "1000"))
+GRAPH_MAX_CELLS = int(os.getenv("GRAPH_MAX_CELLS", "10000"))
+# Largest integer a graph cell may hold, since it can feed further cells
+GRAPH_MAX_RESULT_BITS = int(os.getenv("GRAPH_MAX_RESULT_BITS", str(1 << 20)))
+
+# Integer results with more digits are returned in scientific notation unless
+# another representation is requested (CPython refuses int -> str past 4300)
+EXACT_RESULT_MAX_DIGITS = int(os.getenv("EXACT_RESULT_MAX_DIGITS", "4300"))
+
+# /api/calculate requests with a known operation, JSON number operands and no
+# representation fields skip the general parser and jsonify (same responses)
+API_FAST_PATH = os.getenv("API_FAST_PATH", "1") == "1"
+
 # HTML template for the web interface
 HTML_TEMPLATE = """
 <!DOCTYPE html>
@@ -150,6 +290,14 @@ HTML_TEMPLATE = """
                         <option value="divide">Division (÷)</option>
                         <option value="power">Power (x^y)</option>
                         <option value="square_root">Square Root (√x)</option>
+                        <option value="factorial">Factorial (x!)</option>
+                        <option value="binomial">Binomial (x choose y)</option>
+                        <option value="fibonacci">Fibonacci (F(x))</option>
+                        <option value="is_prime">Is Prime?</option>
+                        <option value="factorize">Prime Factors</option>
+                        <option value="gcd">GCD</option>
+                        <option value="lcm">LCM</option>
+                        <option value="mod_inverse">Modular Inverse (x⁻¹ mod y)</option>
                         <option value="modulo">Modulo (%)</option>
                         <option value="percentage">Percentage</option>
                     </select>
@@ -191,6 +339,14 @@ HTML_TEMPLATE = """
             <p>This calculator also provides REST API endpoints:</p>
             <div class="endpoint">GET /health - Health check endpoint</div>
             <div class="endpoint">POST /api/calculate - Calculate with JSON payload</div>
+            <div class="endpoint">POST /api/calculate/batch - Many calculations in one request</div>
+            <div class="endpoint">GET /api/calculate/&lt;operation&gt;?num1=&amp;num2= - Cacheable calculation</div>
+            <div class="endpoint">POST /api/matrix - Matrix multiply, transpose, determinant, solve, inverse</div>
+            <div class="endpoint">POST /api/tabulate - Evaluate an operation over a range (streamed)</div>
+            <div class="endpoint">POST /api/window?operation=&amp;window= - Rolling, EMA and cumulative operations over an uploaded series (streamed)</div>
+            <div class="endpoint">POST /api/series - Arithmetic, geometric, power and term sums in closed form</div>
+            <div class="endpoint">POST /api/amortize - Annuity payments and amortization schedules (streamed)</div>
+            <div class="endpoint">POST /api/graphs, PATCH /api/graphs/&lt;id&gt; - Calculation graphs recomputed incrementally</div>
             <p style="margin-top: 15px; font-size: 14px; color: #666;">
                 Example: POST /api/calculate with body:
                 {"operation": "add", "num1": 5, "num2": 3}
@@ -199,11 +355,12 @@ HTML_TEMPLATE = """
     </div>
 
     <script>
-        // Hide second number field for square root operation
+        // Hide second number field for single-operand operations
+        const unaryOperations = {{ unary_operations | tojson }};
         document.getElementById('operation').addEventListener('change', function() {
             const num2Group = document.getElementById('num2-group');
             const num2Input = document.getElementById('num2');
-            if (this.value === 'square_root') {
+            if (unaryOperations.includes(this.value)) {
                 num2Group.style.display = 'none';
                 num2Input.removeAttribute('required');
             } else {
@@ -224,10 +381,94 @@ def _get_environment_label() -> str:
     return os.getenv("ENVIRONMENT", "Development")
 
 
-def _perform_calculation(operation: str, num1: float, num2: float | None) -> float:
+def _parse_operand(value, operation: str) -> float | int:
+    """
+    Convert a raw operand for the given operation.
+
+    Integer operations keep integers exact (JSON ints, integral strings and
+    integral floats), since float() would silently round values above 2^53.
+    Everything else is converted with float() as before.
+    """
+    if operation not in INTEGER_OPERATIONS:
+        return float(value)
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        try:
+            return int(value.strip())
+        except ValueError:
+            pass
+    number = float(value)
+    return int(number) if number.is_integer() else number
+
+
+def _perform_calculation(
+    operation: str, num1: float | int, num2: float | int | None
+):
     """Centralized calculation logic for both web form and API."""
+    key = (operation, _operand_key(num1), _operand_key(num2))
+    if slow_watchdog is not None:
+        slow_watchdog.note(operation, num1, num2)
+    compute = _compute
+    if result_cache is not None and operation in SHARED_CACHE_OPERATIONS:
+        compute = _compute_shared
+    elif micro_batcher is not None and operation in batcher.OPERATIONS:
+        compute = micro_batcher.calculate
+    if audit_trail is None:
+        return single_flight.do(key, compute, operation, num1, num2)
+    # Audit outside single-flight so coalesced requests get their own record
+    try:
+        result = single_flight.do(key, compute, operation, num1, num2)
+    except Exception as e:
+        audit_trail.append(operation, num1, num2, e, ok=False)
+        raise
+    audit_trail.append(operation, num1, num2, result)
+    return result
+
+
+def _operand_key(value):
+    """
+    Single-flight identity of an operand.
+
+    Integers are their own key (repr() refuses ints past 4300 digits); other
+    values use repr(), which keeps 0.0 and -0.0 (and 1 and 1.0) apart.
+    """
+    return value if type(value) is int else repr(value)
+
+
+def _compute_shared(operation: str, num1: float | int, num2: float | int | None):
+    """_compute through the host-wide result cache."""
+    digest = shared_cache.key_digest(operation, num1, num2)
+    hit, result = result_cache.get(digest)
+    if hit:
+        return result
+    result = _compute(operation, num1, num2)
+    result_cache.put(digest, result)
+    return result
+
+
+def _compute(operation: str, num1: float | int, num2: float | int | None):
+    """Dispatch a single calculation to the Calculator."""
+    if operation in BIGINT_OPERATIONS and num1 > BIGINT_MAX_N:
+        raise ValueError(f"Operation {operation} is limited to n <= {BIGINT_MAX_N}")
+    if operation in NUMBER_THEORY_OPERATIONS and any(
+        isinstance(n, int) and n.bit_length() > NUMBER_THEORY_MAX_BITS
+        for n in (num1, num2)
+    ):
+        raise ValueError(
+            f"Operation {operation} is limited to {NUMBER_THEORY_MAX_BITS}-bit operands"
+        )
+
     if operation == "square_root":
         return calc.square_root(num1)
+    if operation == "factorial":
+        return calc.factorial(num1)
+    if operation == "fibonacci":
+        return calc.fibonacci(num1)
+    if operation == "is_prime":
+        return calc.is_prime(num1)
+    if operation == "factorize":
+        return calc.factorize(num1)
 
     if num2 is None:
         raise ValueError(f"Operation {operation} requires num2")
@@ -246,10 +487,317 @@ def _perform_calculation(operation: str, num1: float, num2: float | None) -> flo
         return calc.modulo(num1, num2)
     if operation == "percentage":
         return calc.percentage(num1, num2)
+    if operation == "binomial":
+        return calc.binomial(num1, num2)
+    if operation == "gcd":
+        return calc.gcd(num1, num2)
+    if operation == "lcm":
+        return calc.lcm(num1, num2)
+    if operation == "mod_inverse":
+        return calc.mod_inverse(num1, num2)
 
     raise ValueError(f"Unknown operation: {operation}")
 
 
+# Opt-in micro-batching of concurrent element-wise calculations (MICRO_BATCH=1)
+micro_batcher = batcher.from_env(_compute)
+
+
+def _compute_cell(operation: str, num1, num2):
+    """
+    _perform_calculation for a graph cell.
+
+    Operands are converted exactly as /api/calculate converts them, so a
+    cell gives the same result (and hits the same limits) as the request
+    would, and integer results are capped at GRAPH_MAX_RESULT_BITS.
+    """
+    try:
+        num1 = _parse_operand(num1, operation)
+        if num2 is not None:
+            num2 = _parse_operand(num2, operation)
+    except OverflowError:
+        raise ValueError(f"Operand is too large for {operation}") from None
+    result = _perform_calculation(operation, num1, num2)
+    if (
+        isinstance(result, int)
+        and not isinstance(result, bool)
+        and result.bit_length() > GRAPH_MAX_RESULT_BITS
+    ):
+        raise ValueError(f"Cell results are limited to {GRAPH_MAX_RESULT_BITS} bits")
+    return result
+
+
+# Calculation graphs for /api/graphs, held by this worker
+graph_store = calc_graph.GraphStore(_compute_cell, GRAPH_MAX_GRAPHS, GRAPH_MAX_CELLS)
+
+
+def _compact_json() -> bool:
+    """Whether jsonify writes compact, key-sorted JSON (its non-debug default)."""
+    provider = app.json
+    compact = provider.compact if provider.compact is not None else not app.debug
+    return bool(compact and provider.sort_keys)
+
+
+def _json_response(body: str, status: int = 200) -> Response:
+    """A response for a body already encoded the way jsonify would."""
+    return app.response_class(body, status=status, mimetype=app.json.mimetype)
+
+
+# Pre-encoded bodies of the errors clients hit most often
+_ERROR_BODIES = {
+    message: json.dumps({"error": message}, separators=(",", ":")) + "\n"
+    for message in (
+        "No JSON payload provided",
+        "Missing required fields: operation, num1",
+        "Cannot divide by zero",
+        "Cannot perform modulo with zero divisor",
+        "Cannot calculate square root of negative number",
+        *(f"Operation {name} requires num2" for name in OPERATIONS - UNARY_OPERATIONS),
+    )
+}
+
+
+def _api_error(message: str, status: int):
+    """Build a JSON error response and note the error for the access log."""
+    g.error = message
+    body = _ERROR_BODIES.get(message)
+    if body is not None and _compact_json():
+        return _json_response(body, status)
+    return jsonify({"error": message}), status
+
+
+# operation -> (unary, integer operands, operation as a JSON string)
+_FAST_OPERATIONS = {
+    name: (name in UNARY_OPERATIONS, name in INTEGER_OPERATIONS, json.dumps(name))
+    for name in OPERATIONS
+}
+# Integer results below this are always returned exactly under "auto"
+_FAST_INT_LIMIT = 10 ** min(EXACT_RESULT_MAX_DIGITS, 18)
+
+
+def _fast_operand(value, integer: bool) -> float | int | None:
+    """
+    _parse_operand for JSON numbers.
+
+    Returns:
+        float/int: The operand, or None if _parse_operand has to decide
+    """
+    kind = type(value)
+    if kind is int:
+        return value if integer else float(value)
+    if kind is float:
+        return int(value) if integer and value.is_integer() else value
+    return None
+
+
+def _fast_calculation(data):
+    """
+    Validate the common /api/calculate request shape without raising.
+
+    Returns:
+        tuple: (operation, num1, num2, operation as JSON), or None when the
+        request needs _parse_calculation and _parse_representation (which
+        also report every error)
+    """
+    if type(data) is not dict or "representation" in data or "significant_digits" in data:
+        return None
+    operation = data.get("operation")
+    spec = _FAST_OPERATIONS.get(operation) if type(operation) is str else None
+    if spec is None:
+        return None
+    unary, integer, encoded = spec
+    num1 = _fast_operand(data.get("num1"), integer)
+    if num1 is None:
+        return None
+    num2 = None
+    if not unary:
+        num2 = _fast_operand(data.get("num2"), integer)
+        if num2 is None:
+            return None
+    return operation, num1, num2, encoded
+
+
+def _json_number(value) -> str | None:
+    """A number as the JSON provider writes it, or None for anything else."""
+    kind = type(value)
+    if kind is float:
+        if value != value:
+            return "NaN"
+        if value in (math.inf, -math.inf):
+            return "Infinity" if value > 0 else "-Infinity"
+        return float.__repr__(value)
+    if kind is int:
+        return int.__repr__(value) if -_FAST_INT_LIMIT < value < _FAST_INT_LIMIT else None
+    if kind is bool:
+        return "true" if value else "false"
+    return None
+
+
+def _fast_result_body(encoded_operation: str, num1, num2, result) -> str | None:
+    """
+    The jsonify body of an exact /api/calculate result, built in one pass.
+
+    Returns:
+        str: The body, or None if the result needs _result_fields
+    """
+    text = _json_number(result)
+    num1_text = _json_number(num1)
+    num2_text = "null" if num2 is None else _json_number(num2)
+    if text is None or num1_text is None or num2_text is None or not _compact_json():
+        return None
+    return (
+        f'{{"num1":{num1_text},"num2":{num2_text},'
+        f'"operation":{encoded_operation},"result":{text}}}\n'
+    )
+
+
+def _parse_calculation(data: dict) -> tuple[str, float | int, float | int | None]:
+    """Validate one {"operation", "num1", "num2"} object from the JSON API."""
+    operation = data.get("operation", None)
+    num1 = data.get("num1", None)
+    if not operation or num1 is None:
+        raise ValueError("Missing required fields: operation, num1")
+
+    operation = str(operation).strip()
+    num1_f = _parse_operand(num1, operation)
+
+    num2_f: float | int | None = None
+    if operation not in UNARY_OPERATIONS:
+        if data.get("num2") is None:
+            raise ValueError(f"Operation {operation} requires num2")
+        num2_f = _parse_operand(data.get("num2"), operation)
+    return operation, num1_f, num2_f
+
+
+def _parse_representation(data) -> tuple[str, int]:
+    """Read and validate the optional result representation fields."""
+    representation = str(data.get("representation") or "auto").strip()
+    if representation not in int_format.REPRESENTATIONS:
+        raise ValueError(
+            f"Unknown representation: {representation} "
+            f"(expected one of {', '.join(int_format.REPRESENTATIONS)})"
+        )
+    significant_digits = data.get(
+        "significant_digits", int_format.DEFAULT_SIGNIFICANT_DIGITS
+    )
+    if (
+        not isinstance(significant_digits, int)
+        or isinstance(significant_digits, bool)
+        or not 1 <= significant_digits <= int_format.MAX_SIGNIFICANT_DIGITS
+    ):
+        raise ValueError(
+            "significant_digits must be an integer between 1 and "
+            f"{int_format.MAX_SIGNIFICANT_DIGITS}"
+        )
+    return representation, significant_digits
+
+
+def _result_fields(
+    result,
+    representation: str = "auto",
+    significant_digits: int = int_format.DEFAULT_SIGNIFICANT_DIGITS,
+) -> dict:
+    """
+    JSON fields for a result: the value itself, plus how it is represented
+    whenever that is not the exact value.
+    """
+    value, used, digits = int_format.represent(
+        result, representation, significant_digits, EXACT_RESULT_MAX_DIGITS
+    )
+    if used == "exact":
+        return {"result": value}
+    return {"result": value, "representation": used, "digits": digits}
+
+
+def _display_result(result):
+    """Form-friendly text for a result too large to show exactly."""
+    fields = _result_fields(result)
+    if "representation" not in fields:
+        return result
+    return f"{fields['result']} ({fields['digits']} digits)"
+
+
+def _decimal_download(operation: str, result: int) -> Response:
+    """Stream the full decimal expansion of an integer result."""
+    text_length = int_format.digit_count(result) + (result < 0)
+    response = Response(int_format.iter_decimal(result), mimetype="text/plain")
+    response.headers["Content-Length"] = str(text_length)
+    response.headers["Content-Disposition"] = (
+        f'attachment; filename="{operation}-result.txt"'
+    )
+    return response
+
+
+def _admin_only(view):
+    """Restrict a view to requests carrying the admin token."""
+
+    @functools.wraps(view)
+    def wrapper(*args, **kwargs):
+        if not ADMIN_TOKEN:
+            return _api_error("Not found", 404)
+        supplied = request.headers.get("X-Admin-Token", "")
+        if not hmac.compare_digest(supplied.encode(), ADMIN_TOKEN.encode()):
+            return _api_error("Invalid admin token", 403)
+        return view(*args, **kwargs)
+
+    return wrapper
+
+
+def _route_label() -> str:
+    """The matched route rule (or raw path) with its method, e.g. "POST /api/calculate"."""
+    rule = request.url_rule
+    return f"{request.method} {rule.rule if rule is not None else request.path}"
+
+
+@app.before_request
+def _start_request():
+    g.timer = PhaseTimer()
+    g.operation = None
+    g.error = None
+    if sampling_profiler is not None:
+        sampling_profiler.enter()
+    if slow_watchdog is not None:
+        slow_watchdog.begin(_route_label())
+
+
+@app.teardown_request
+def _end_request(exc):
+    if sampling_profiler is not None:
+        sampling_profiler.exit()
+    if slow_watchdog is not None:
+        slow_watchdog.end()
+
+
+@app.after_request
+def _finish_request(response):
+    timer = g.get("timer")
+    if timer is None:
+        return response
+    route = _route_label()
+    if timer.phases:
+        phase_stats.record(route, timer.phases)
+        if SERVER_TIMING:
+            response.headers["Server-Timing"] = timer.header()
+    if access_logger is not None:
+        access_logger.log(
+            route,
+            g.get("operation"),
+            response.status_code,
+            timer.elapsed_ms(),
+            g.get("error"),
+        )
+    if traffic_capture is not None and route in CAPTURE_ROUTES:
+        kind = CAPTURE_ROUTES[route]
+        traffic_capture.record(
+            kind,
+            request.get_json(silent=True) if kind == capture.API else request.form,
+            response.status_code,
+            timer.elapsed_ms(),
+            None if response.is_streamed else response.get_data(),
+        )
+    return response
+
+
 @app.route("/", methods=["GET"])
 def index():
     """Render the calculator web interface."""
@@ -262,36 +810,48 @@ def index():
 def calculate():
     """Handle calculation requests from the web form."""
     environment = _get_environment_label()
+    timer = g.timer
 
     try:
         operation = request.form.get("operation", "").strip()
+        g.operation = operation
         num1_raw = request.form.get("num1", None)
+        timer.mark("parse")
 
         if num1_raw is None or num1_raw == "":
             raise ValueError("Missing num1")
 
-        num1 = float(num1_raw)
+        num1 = _parse_operand(num1_raw, operation)
 
         num2: float | None = None
-        if operation != "square_root":
+        if operation not in UNARY_OPERATIONS:
             num2_raw = request.form.get("num2", None)
             if num2_raw is None or num2_raw == "":
                 raise ValueError(f"Operation {operation} requires num2")
-            num2 = float(num2_raw)
+            num2 = _parse_operand(num2_raw, operation)
+        timer.mark("validate")
 
         result = _perform_calculation(operation, num1, num2)
+        timer.mark("compute")
 
-        return render_template_string(
-            HTML_TEMPLATE, result=result, error=None, environment=environment
+        html = render_template_string(
+            HTML_TEMPLATE,
+            result=_display_result(result),
+            error=None,
+            environment=environment,
         )
     except ValueError as e:
-        return render_template_string(
+        g.error = str(e)
+        html = render_template_string(
             HTML_TEMPLATE, result=None, error=str(e), environment=environment
         )
     except Exception as e:
-        return render_template_string(
+        g.error = f"Error: {str(e)}"
+        html = render_template_string(
             HTML_TEMPLATE, result=None, error=f"Error: {str(e)}", environment=environment
         )
+    timer.mark("render")
+    return html
 
 
 @app.route("/health", methods=["GET"])
@@ -313,56 +873,790 @@ def health():
     )
 
 
+@app.route("/metrics", methods=["GET"])
+def metrics():
+    """
+    Runtime metrics for this worker process
+    Used by: Performance tests, monitoring
+    """
+    return (
+        jsonify(
+            {
+                "coalescing": single_flight.stats(),
+                "access_log": access_logger.stats() if access_logger else None,
+                "audit_log": audit_trail.stats() if audit_trail else None,
+                "capture": traffic_capture.stats() if traffic_capture else None,
+                "graphs": graph_store.stats(),
+                "profiler": sampling_profiler.stats() if sampling_profiler else None,
+                "slow_requests": slow_watchdog.stats() if slow_watchdog else None,
+                "shared_cache": result_cache.stats() if result_cache else None,
+                "micro_batch": micro_batcher.stats() if micro_batcher else None,
+                "phases": phase_stats.snapshot(),
+            }
+        ),
+        200,
+    )
+
+
+@app.route("/admin/profile", methods=["GET"])
+@_admin_only
+def admin_profile():
+    """
+    Sampled request stacks of this worker in collapsed (flamegraph) format
+    Render with: flamegraph.pl profile.txt > profile.svg  (or speedscope)
+    """
+    if sampling_profiler is None:
+        return _api_error("Profiler is disabled (set PROFILER=1)", 404)
+    return Response(sampling_profiler.collapsed(), mimetype="text/plain")
+
+
+@app.route("/admin/profile", methods=["DELETE"])
+@_admin_only
+def admin_profile_reset():
+    """Discard the aggregated stacks and start a new profile."""
+    if sampling_profiler is None:
+        return _api_error("Profiler is disabled (set PROFILER=1)", 404)
+    sampling_profiler.reset()
+    return jsonify(sampling_profiler.stats()), 200
+
+
+@app.route("/admin/slow-requests", methods=["GET"])
+@_admin_only
+def admin_slow_requests():
+    """
+    Requests of this worker that ran longer than SLOW_REQUEST_MS, oldest first,
+    with their route, operation, sanitized operands and stack at the threshold
+    (total_ms is filled in once the request finishes)
+    """
+    if slow_watchdog is None:
+        return _api_error("Slow-request watchdog is disabled (SLOW_REQUEST_MS=0)", 404)
+    return jsonify({**slow_watchdog.stats(), "requests": slow_watchdog.entries()}), 200
+
+
+@app.route("/admin/slow-requests", methods=["DELETE"])
+@_admin_only
+def admin_slow_requests_reset():
+    """Discard the recorded slow requests."""
+    if slow_watchdog is None:
+        return _api_error("Slow-request watchdog is disabled (SLOW_REQUEST_MS=0)", 404)
+    slow_watchdog.clear()
+    return jsonify(slow_watchdog.stats()), 200
+
+
 @app.route("/api/calculate", methods=["POST"])
 def api_calculate():
     """
     REST API endpoint for calculator operations
     Expected JSON payload:
     {
-        "operation": "add|subtract|multiply|divide|power|square_root|modulo|percentage",
+        "operation": "add|subtract|multiply|divide|power|square_root|modulo|percentage"
+                     "|factorial|binomial|fibonacci"
+                     "|is_prime|factorize|gcd|lcm|mod_inverse",
         "num1": <number>,
-        "num2": <number>  (optional for square_root)
+        "num2": <number>  (omitted for single-operand operations: square_root,
+                           factorial, fibonacci, is_prime, factorize),
+        "representation": "auto|scientific|digits|hex|decimal"  (optional),
+        "significant_digits": <int>  (optional, for scientific; default 17)
     }
+
+    Integer results longer than EXACT_RESULT_MAX_DIGITS come back in
+    scientific notation under "auto". "decimal" streams the full decimal
+    expansion as a text/plain download instead of JSON.
     """
+    timer = g.timer
     try:
         data = request.get_json(silent=True)
+        timer.mark("parse")
 
         if not data:
-            return jsonify({"error": "No JSON payload provided"}), 400
+            return _api_error("No JSON payload provided", 400)
+
+        fast = _fast_calculation(data) if API_FAST_PATH else None
+        if fast is not None:
+            operation, num1_f, num2_f, encoded_operation = fast
+            g.operation = operation
+            representation = "auto"
+            significant_digits = int_format.DEFAULT_SIGNIFICANT_DIGITS
+        else:
+            if data.get("operation"):
+                g.operation = str(data["operation"]).strip()
+            operation, num1_f, num2_f = _parse_calculation(data)
+            representation, significant_digits = _parse_representation(data)
+        timer.mark("validate")
+
+        result = _perform_calculation(operation, num1_f, num2_f)
+        timer.mark("compute")
+
+        if fast is not None:
+            body = _fast_result_body(encoded_operation, num1_f, num2_f, result)
+            if body is not None:
+                response = _json_response(body)
+                timer.mark("serialize")
+                return response
+
+        if (
+            representation == "decimal"
+            and isinstance(result, int)
+            and not isinstance(result, bool)
+        ):
+            response = _decimal_download(operation, result)
+            timer.mark("serialize")
+            return response
+        if representation == "decimal":
+            representation = "auto"
+
+        response = jsonify(
+            {
+                "operation": operation,
+                "num1": num1_f,
+                "num2": num2_f if operation not in UNARY_OPERATIONS else None,
+                **_result_fields(result, representation, significant_digits),
+            }
+        )
+        timer.mark("serialize")
+        return response, 200
+
+    except ValueError as e:
+        return _api_error(str(e), 400)
+    except Exception as e:
+        return _api_error(f"Server error: {str(e)}", 500)
 
-        operation = data.get("operation", None)
-        num1 = data.get("num1", None)
 
-        if not operation or num1 is None:
-            return jsonify({"error": "Missing required fields: operation, num1"}), 400
+@app.route("/api/calculate/batch", methods=["POST"])
+def api_calculate_batch():
+    """
+    Batch REST API endpoint: many calculations in one request
+    Expected JSON payload:
+    {
+        "calculations": [
+            {"operation": "add", "num1": 1, "num2": 2},
+            {"operation": "square_root", "num1": 16},
+            ...
+        ]
+    }
+
+    Returns {"results": [...]} in request order. Each entry is either
+    {"result": ...} or {"error": "...", "status": 400|500}, so one bad
+    calculation does not fail the whole batch.
+    """
+    timer = g.timer
+    g.operation = "batch"
+    data = request.get_json(silent=True)
+    timer.mark("parse")
+
+    items = data.get("calculations") if isinstance(data, dict) else None
+    if not isinstance(items, list) or not items:
+        return _api_error("Missing required field: calculations (a non-empty list)", 400)
+    if len(items) > BATCH_MAX_ITEMS:
+        return _api_error(f"At most {BATCH_MAX_ITEMS} calculations per batch", 400)
+    timer.mark("validate")
+
+    results = [_batch_item(item) for item in items]
+    timer.mark("compute")
+
+    response = jsonify({"results": results})
+    timer.mark("serialize")
+    return response, 200
+
+
+def _batch_item(item) -> dict:
+    """Evaluate one batch entry, reporting failures in place."""
+    try:
+        if not isinstance(item, dict):
+            raise ValueError("Each calculation must be a JSON object")
+        operation, num1, num2 = _parse_calculation(item)
+        return _result_fields(_perform_calculation(operation, num1, num2))
+    except ValueError as e:
+        return {"error": str(e), "status": 400}
+    except Exception as e:
+        return {"error": f"Server error: {str(e)}", "status": 500}
+
+
+def _canonical_query(num1: float | int, num2: float | int | None) -> str:
+    """Canonical query string for a calculation: fixed order, repr() floats."""
+    params = {"num1": repr(num1)}
+    if num2 is not None:
+        params["num2"] = repr(num2)
+    return urlencode(params)
+
+
+def _calculation_etag(operation: str, canonical_query: str) -> str:
+    """Strong validator derived only from the canonical inputs."""
+    digest = hashlib.sha256(
+        f"{API_CACHE_VERSION}|{operation}|{canonical_query}".encode()
+    )
+    return digest.hexdigest()[:32]
 
-        operation = str(operation).strip()
-        num1_f = float(num1)
+
+@app.route("/api/calculate/<operation>", methods=["GET"])
+def api_calculate_get(operation):
+    """
+    Cacheable REST API endpoint for calculator operations
+    GET /api/calculate/<operation>?num1=<number>&num2=<number>
+    (num2 is omitted for single-operand operations such as square_root)
+
+    Non-canonical queries are redirected to the canonical URL so that caches
+    share one entry per calculation. Responses carry a long-lived
+    Cache-Control and an ETag; matching If-None-Match requests get 304
+    without computing anything.
+    """
+    timer = g.timer
+    operation = operation.strip()
+    g.operation = operation
+    try:
+        num1_raw = request.args.get("num1", None)
+        num2_raw = request.args.get("num2", None)
+        timer.mark("parse")
+
+        # Before any redirect: a cached 301 must never point at a 400
+        if operation not in OPERATIONS:
+            raise ValueError(f"Unknown operation: {operation}")
+        if num1_raw is None or num1_raw == "":
+            raise ValueError("Missing required fields: operation, num1")
+        num1_f = _parse_operand(num1_raw, operation)
 
         num2_f: float | None = None
-        if operation != "square_root":
-            if "num2" not in data or data.get("num2") is None:
-                return jsonify({"error": f"Operation {operation} requires num2"}), 400
-            num2_f = float(data.get("num2"))
+        if operation not in UNARY_OPERATIONS:
+            if num2_raw is None or num2_raw == "":
+                raise ValueError(f"Operation {operation} requires num2")
+            num2_f = _parse_operand(num2_raw, operation)
 
-        result = _perform_calculation(operation, num1_f, num2_f)
+        canonical = _canonical_query(num1_f, num2_f)
+        if request.query_string.decode("latin-1") != canonical:
+            response = redirect(f"{request.path}?{canonical}", code=301)
+            response.headers["Cache-Control"] = API_CACHE_CONTROL
+            return response
+
+        etag = _calculation_etag(operation, canonical)
+        timer.mark("validate")
 
-        return (
-            jsonify(
+        if request.if_none_match.contains_weak(etag):
+            response = make_response("", 304)
+        else:
+            result = _perform_calculation(operation, num1_f, num2_f)
+            timer.mark("compute")
+            response = jsonify(
                 {
                     "operation": operation,
                     "num1": num1_f,
-                    "num2": num2_f if operation != "square_root" else None,
-                    "result": result,
+                    "num2": num2_f,
+                    **_result_fields(result),
                 }
+            )
+            timer.mark("serialize")
+        response.set_etag(etag)
+        response.headers["Cache-Control"] = API_CACHE_CONTROL
+        return response
+
+    except ValueError as e:
+        response = make_response(_api_error(str(e), 400))
+    except Exception as e:
+        response = make_response(_api_error(f"Server error: {str(e)}", 500))
+
+    response.headers["Cache-Control"] = "no-store"
+    return response
+
+
+def _parse_shape(raw: str | None, name: str) -> tuple[int, int]:
+    """Parse an "RxC" matrix shape and enforce MATRIX_MAX_DIM."""
+    try:
+        rows, cols = (int(part) for part in (raw or "").lower().split("x"))
+    except ValueError as e:
+        raise ValueError(f"{name}_shape must look like ROWSxCOLS") from e
+    _check_matrix_size(rows, cols, name)
+    return rows, cols
+
+
+def _check_matrix_size(rows: int, cols: int, name: str) -> None:
+    if rows > MATRIX_MAX_DIM or cols > MATRIX_MAX_DIM:
+        raise ValueError(
+            f"Matrix {name} exceeds the {MATRIX_MAX_DIM}x{MATRIX_MAX_DIM} size limit"
+        )
+
+
+def _read_matrix_request():
+    """Return (operation, operands) from a JSON or packed float64 request."""
+    if request.mimetype == PACKED_MIMETYPE:
+        operation = request.args.get("operation", "").strip()
+        arity = MATRIX_OPERATIONS.get(operation)
+        if arity is None:
+            raise ValueError(f"Unknown matrix operation: {operation}")
+        names = ("a", "b")[:arity]
+        shapes = [_parse_shape(request.args.get(f"{n}_shape"), n) for n in names]
+        data = request.get_data(cache=False)
+        operands, offset = [], 0
+        for rows, cols in shapes:
+            size = rows * cols * 8
+            operands.append(linalg.unpack(data[offset:offset + size], rows, cols))
+            offset += size
+        if offset != len(data):
+            raise ValueError(f"Expected {offset} bytes of matrix data, got {len(data)}")
+        return operation, operands
+
+    data = request.get_json(silent=True)
+    if not data:
+        raise ValueError("No JSON payload provided")
+    operation = str(data.get("operation", "")).strip()
+    arity = MATRIX_OPERATIONS.get(operation)
+    if arity is None:
+        raise ValueError(f"Unknown matrix operation: {operation}")
+    operands = []
+    for name in ("a", "b")[:arity]:
+        matrix = data.get(name)
+        if not isinstance(matrix, list) or not matrix or not isinstance(matrix[0], list):
+            raise ValueError(f"Missing required matrix: {name}")
+        _check_matrix_size(len(matrix), len(matrix[0]), name)
+        operands.append(matrix)
+    return operation, operands
+
+
+@app.route("/api/matrix", methods=["POST"])
+def api_matrix():
+    """
+    REST API endpoint for matrix operations
+    JSON payload:
+    {
+        "operation": "multiply|transpose|determinant|solve|inverse",
+        "a": [[...], ...],
+        "b": [[...], ...]  (multiply and solve only)
+    }
+    Packed payload (Content-Type: application/octet-stream):
+        POST /api/matrix?operation=multiply&a_shape=2x3&b_shape=3x2
+        body: a then b as little-endian float64, row-major
+    Send "Accept: application/octet-stream" to get the result packed the
+    same way, with its shape in the X-Matrix-Shape header.
+    """
+    timer = g.timer
+    try:
+        operation, operands = _read_matrix_request()
+        g.operation = f"matrix.{operation}"
+        timer.mark("parse")
+
+        result = getattr(matrix_calc, operation)(*operands)
+        timer.mark("compute")
+
+        if request.accept_mimetypes.best_match(
+            ["application/json", PACKED_MIMETYPE]
+        ) == PACKED_MIMETYPE:
+            matrix = [[result]] if operation == "determinant" else result
+            response = make_response(linalg.pack(matrix))
+            response.mimetype = PACKED_MIMETYPE
+            response.headers["X-Matrix-Shape"] = f"{len(matrix)}x{len(matrix[0])}"
+        else:
+            if not isinstance(result, (list, float)):
+                result = result.tolist()
+            response = jsonify({"operation": operation, "result": result})
+        timer.mark("serialize")
+        return response, 200
+
+    except ValueError as e:
+        return _api_error(str(e), 400)
+    except Exception as e:
+        return _api_error(f"Server error: {str(e)}", 500)
+
+
+@app.route("/api/tabulate", methods=["POST"])
+def api_tabulate():
+    """
+    Evaluate an operation over a sweep of inputs, streamed as a table
+    Expected JSON payload:
+    {
+        "operation": "add|subtract|...|percentage",
+        "operand": <number>,  (the fixed operand; omit for square_root)
+        "variable": "num1|num2",  (which operand is swept, default num1)
+        "range": {"kind": "range", "start": 0, "stop": 10, "step": 0.5}
+               | {"kind": "linspace|logspace", "start": 0, "stop": 3, "num": 1000},
+        "format": "json|binary"  (default json)
+    }
+    JSON responses stream {"operation", "operand", "variable", "count",
+    "rows": [[x, y], ...]}; binary responses stream little-endian float64
+    (x, y) pairs. Points where the operation is undefined are null / NaN.
+    """
+    timer = g.timer
+    try:
+        data = request.get_json(silent=True)
+        timer.mark("parse")
+        if not data:
+            return _api_error("No JSON payload provided", 400)
+
+        operation = str(data.get("operation", "")).strip()
+        g.operation = f"tabulate.{operation}"
+        operand = data.get("operand", None)
+        operand = None if operand is None else float(operand)
+        variable = str(data.get("variable", "num1"))
+        output = str(data.get("format", "json"))
+        if output not in ("json", "binary"):
+            raise ValueError("format must be json or binary")
+
+        spec = tabulate.RangeSpec.from_dict(data.get("range"))
+        if spec.count > TABULATE_MAX_POINTS:
+            raise ValueError(
+                f"Range has {spec.count} points; the limit is {TABULATE_MAX_POINTS}"
+            )
+        chunks = tabulate.tabulate(operation, operand, spec, variable)
+        timer.mark("validate")
+    except ValueError as e:
+        return _api_error(str(e), 400)
+    except Exception as e:
+        return _api_error(f"Server error: {str(e)}", 500)
+
+    if output == "binary":
+        response = Response(
+            (tabulate.encode_binary_rows(xs, ys) for xs, ys in chunks),
+            mimetype=PACKED_MIMETYPE,
+        )
+        response.headers["Content-Length"] = str(spec.count * 16)
+        response.headers["X-Row-Count"] = str(spec.count)
+        return response
+
+    def stream_json():
+        head = json.dumps(
+            {
+                "operation": operation,
+                "operand": operand,
+                "variable": variable,
+                "count": spec.count,
+            }
+        )
+        yield head[:-1] + ', "rows": ['
+        separator = ""
+        for xs, ys in chunks:
+            if len(xs):
+                yield separator + tabulate.encode_json_rows(xs, ys)
+                separator = ","
+        yield "]}"
+
+    return Response(stream_json(), mimetype="application/json")
+
+
+@app.route("/api/window", methods=["POST"])
+def api_window():
+    """
+    Apply a window operation to an uploaded series, streaming the results
+    Query parameters:
+        operation: rolling_sum|rolling_mean|rolling_min|rolling_max|ema|cumsum|cumprod
+        window, min_periods: rolling window length and the values needed
+            before the first result (default: a full window)
+        alpha or span: EMA smoothing
+        format: text|binary output (default text)
+    The body is read incrementally: numbers separated by whitespace or commas,
+    or little-endian float64 values when the Content-Type is
+    application/octet-stream. Text output is one JSON value per line (null
+    before a rolling window fills); binary output is float64 with NaN. An
+    invalid value ends a text stream with an {"error": ...} line and a
+    binary stream with windows.BINARY_ERROR_MARKER followed by the same JSON
+    object. A binary upload whose Content-Length is not a multiple of 8 is
+    a 400.
+    """
+    args = request.args
+    try:
+        operation = args.get("operation", "").strip()
+        g.operation = f"window.{operation}"
+        output = args.get("format", "text")
+        if output not in ("text", "binary"):
+            raise ValueError("format must be text or binary")
+        window = args.get("window", type=int)
+        if window is not None and window > WINDOW_MAX_SIZE:
+            raise ValueError(f"window is limited to {WINDOW_MAX_SIZE}")
+        operator = windows.create(
+            operation,
+            window=window,
+            min_periods=args.get("min_periods", type=int),
+            alpha=args.get("alpha", type=float),
+            span=args.get("span", type=float),
+        )
+    except ValueError as e:
+        return _api_error(str(e), 400)
+    g.timer.mark("validate")
+
+    # Grab the input stream now: the generators below run after the view returns
+    stream = request.stream
+    if request.mimetype == PACKED_MIMETYPE:
+        if (request.content_length or 0) % 8:
+            return _api_error(windows.BINARY_LENGTH_ERROR, 400)
+        values = windows.iter_binary_values(stream)
+    else:
+        values = windows.iter_text_values(stream)
+
+    encode = windows.encode_binary if output == "binary" else windows.encode_text
+
+    def stream_results():
+        results = []
+        try:
+            for value in values:
+                results.append(operator.update(value))
+                if len(results) >= windows.READ_SIZE // 8:
+                    yield encode(results)
+                    results = []
+        except ValueError as e:
+            if output == "text":
+                yield encode(results) + json.dumps({"error": str(e)}) + "\n"
+            else:
+                yield encode(results) + windows.encode_binary_error(str(e))
+            return
+        if results:
+            yield encode(results)
+
+    mimetype = PACKED_MIMETYPE if output == "binary" else "text/plain"
+    return Response(stream_results(), mimetype=mimetype)
+
+
+@app.route("/api/series", methods=["POST"])
+def api_series():
+    """
+    Sum a series, in closed form wherever one exists
+    Expected JSON payload, by "series":
+        {"series": "arithmetic", "first": 1, "difference": 2, "count": 100}
+        {"series": "geometric", "first": 1, "ratio": 0.5, "count": 10}
+            (omit count for the infinite series, which needs |ratio| < 1)
+        {"series": "power_sum", "power": 3, "n": 1000000}  (1^3 + ... + n^3)
+        {"series": "term", "term": "1 / k**2", "start": 1, "stop": 1000000}
+        {"series": "compound", "principal": 1000, "rate": 0.05, "periods": 30}
+        {"series": "compound_interest", "principal": 1000, "annual_rate": 0.06,
+         "years": 10, "periods_per_year": 12}
+    plus the optional "representation" and "significant_digits" of
+    /api/calculate. "method" in the response is "closed_form", or
+    "summation" when a term had to be summed over its range (at most
+    SERIES_MAX_TERMS terms).
+    """
+    timer = g.timer
+    try:
+        data = request.get_json(silent=True)
+        timer.mark("parse")
+        if not data:
+            return _api_error("No JSON payload provided", 400)
+
+        kind = str(data.get("series", "")).strip()
+        g.operation = f"series.{kind}"
+        if kind not in SERIES_KINDS:
+            raise ValueError(
+                f"Unknown series: {kind} (expected one of {', '.join(SERIES_KINDS)})"
+            )
+        method_name, fields = SERIES_KINDS[kind]
+        missing = [
+            field
+            for field in fields
+            if data.get(field) is None and (kind, field) != ("geometric", "count")
+        ]
+        if missing:
+            raise ValueError(f"Missing required fields: {', '.join(missing)}")
+        arguments = [data.get(field) for field in fields]
+        representation, significant_digits = _parse_representation(data)
+        timer.mark("validate")
+
+        if kind == "term":
+            result, method = series.term_sum(*arguments, max_terms=SERIES_MAX_TERMS)
+        else:
+            result = getattr(calc, method_name)(*arguments)
+            method = series.CLOSED_FORM
+        timer.mark("compute")
+
+        if representation == "decimal":
+            if isinstance(result, int):
+                return _decimal_download(f"series-{kind}", result)
+            representation = "auto"
+        response = jsonify(
+            {
+                "series": kind,
+                **dict(zip(fields, arguments)),
+                "method": method,
+                **_result_fields(result, representation, significant_digits),
+            }
+        )
+        timer.mark("serialize")
+        return response, 200
+
+    except ValueError as e:
+        return _api_error(str(e), 400)
+    except Exception as e:
+        return _api_error(f"Server error: {str(e)}", 500)
+
+
+@app.route("/api/amortize", methods=["POST"])
+def api_amortize():
+    """
+    Annuity payments and amortization schedules for one or many loans
+    Expected JSON payload:
+    {
+        "loans": [{"principal": 250000, "rate": 0.0033333, "periods": 360}, ...],
+            (or a single loan's fields at the top level; rate is per period)
+        "schedule": true,  (false returns only payment and total_interest)
+        "format": "json|binary"  (default json)
+    }
+    JSON responses stream {"count": <loans>, "rows": <schedule rows>,
+    "loans": [{"principal", "rate", "periods", "payment", "total_interest",
+    "schedule": [[period, payment, interest, principal, balance], ...]}]}.
+    Binary responses stream the schedule rows of every loan in order as five
+    little-endian float64 values each; periods restart at 1 for each loan.
+    """
+    timer = g.timer
+    g.operation = "amortize"
+    try:
+        data = request.get_json(silent=True)
+        timer.mark("parse")
+        if not isinstance(data, dict) or not data:
+            return _api_error("No JSON payload provided", 400)
+
+        items = data.get("loans", [data])
+        if not isinstance(items, list) or not items:
+            raise ValueError("loans must be a non-empty list")
+        if len(items) > AMORTIZE_MAX_LOANS:
+            raise ValueError(f"At most {AMORTIZE_MAX_LOANS} loans per request")
+        loans = [finance.Loan.from_dict(item) for item in items]
+        with_schedule = data.get("schedule", True) is not False
+        output = str(data.get("format", "json"))
+        if output not in ("json", "binary"):
+            raise ValueError("format must be json or binary")
+        if output == "binary" and not with_schedule:
+            raise ValueError("format binary requires schedule")
+        rows = sum(loan.periods for loan in loans) if with_schedule else 0
+        if rows > AMORTIZE_MAX_ROWS:
+            raise ValueError(f"Request has {rows} schedule rows; the limit is {AMORTIZE_MAX_ROWS}")
+        timer.mark("validate")
+    except ValueError as e:
+        return _api_error(str(e), 400)
+    except Exception as e:
+        return _api_error(f"Server error: {str(e)}", 500)
+
+    if output == "binary":
+        response = Response(
+            (
+                finance.encode_binary_rows(columns)
+                for loan in loans
+                for columns in finance.schedule(loan)
             ),
-            200,
+            mimetype=PACKED_MIMETYPE,
         )
+        response.headers["Content-Length"] = str(rows * 8 * len(finance.SCHEDULE_COLUMNS))
+        response.headers["X-Row-Count"] = str(rows)
+        return response
+
+    def stream_json():
+        yield f'{{"count": {len(loans)}, "rows": {rows}, "loans": ['
+        for index, loan in enumerate(loans):
+            head = json.dumps(loan.summary())
+            if not with_schedule:
+                yield ("," if index else "") + head
+                continue
+            yield ("," if index else "") + head[:-1] + ', "schedule": ['
+            separator = ""
+            for columns in finance.schedule(loan):
+                yield separator + finance.encode_json_rows(columns)
+                separator = ","
+            yield "]}"
+        yield "]}"
+
+    return Response(stream_json(), mimetype="application/json")
+
+
+def _cell_fields(state: calc_graph.CellState) -> dict:
+    """JSON fields for a graph cell, in the format of a batch result."""
+    if state.error is not None:
+        return {"error": state.error, "status": state.status}
+    return _result_fields(state.value)
+
+
+def _graph_cells_payload():
+    """Read the {"cells": {...}} object of a graph request."""
+    data = request.get_json(silent=True)
+    cells = data.get("cells") if isinstance(data, dict) else None
+    if not isinstance(cells, dict) or not cells:
+        raise ValueError("Missing required field: cells (a non-empty object)")
+    return cells
+
+
+@app.route("/api/graphs", methods=["POST"])
+def api_graph_create():
+    """
+    Create a calculation graph
+    Expected JSON payload:
+    {
+        "cells": {
+            "price": 120,
+            "quantity": 3,
+            "subtotal": {"operation": "multiply", "args": ["price", "quantity"]},
+            "tax": {"operation": "percentage", "args": ["subtotal", 23]}
+        }
+    }
+    A number defines an input cell; an operation object applies any
+    /api/calculate operation to cell names and numbers. Returns 201 with
+    {"graph": <id>, "cells": {name: {"result": ...} or {"error", "status"}}}.
+    Graphs live in the worker that created them.
+    """
+    g.operation = "graph.create"
+    try:
+        cells = _graph_cells_payload()
+        g.timer.mark("parse")
+        graph_id, graph = graph_store.create(cells)
+        g.timer.mark("compute")
+    except ValueError as e:
+        return _api_error(str(e), 400)
+    except Exception as e:
+        return _api_error(f"Server error: {str(e)}", 500)
+    values = graph.values()
+    response = jsonify(
+        {"graph": graph_id, "cells": {name: _cell_fields(s) for name, s in values.items()}}
+    )
+    g.timer.mark("serialize")
+    return response, 201
+
+
+@app.route("/api/graphs/<graph_id>", methods=["GET"])
+def api_graph_get(graph_id):
+    """Every cell of a graph."""
+    g.operation = "graph.get"
+    graph = graph_store.get(graph_id)
+    if graph is None:
+        return _api_error(f"Unknown graph: {graph_id}", 404)
+    values = graph.values()
+    return jsonify(
+        {"graph": graph_id, "cells": {name: _cell_fields(s) for name, s in values.items()}}
+    )
 
+
+@app.route("/api/graphs/<graph_id>", methods=["PATCH"])
+def api_graph_update(graph_id):
+    """
+    Change input values or (re)define cells of a graph
+    Expected JSON payload: {"cells": {"price": 150, ...}} (as for creation)
+
+    Only cells downstream of the update are recomputed, and propagation
+    stops where a value comes out unchanged. Returns {"graph": <id>,
+    "changed": {name: fields} for cells whose value changed, "recomputed":
+    <cells evaluated>}. An invalid update or one creating a cycle is a 400
+    and leaves the graph untouched.
+    """
+    g.operation = "graph.update"
+    graph = graph_store.get(graph_id)
+    if graph is None:
+        return _api_error(f"Unknown graph: {graph_id}", 404)
+    try:
+        cells = _graph_cells_payload()
+        g.timer.mark("parse")
+        changed, recomputed = graph.update(cells)
+        g.timer.mark("compute")
     except ValueError as e:
-        return jsonify({"error": str(e)}), 400
+        return _api_error(str(e), 400)
     except Exception as e:
-        return jsonify({"error": f"Server error: {str(e)}"}), 500
+        return _api_error(f"Server error: {str(e)}", 500)
+    response = jsonify(
+        {
+            "graph": graph_id,
+            "changed": {name: _cell_fields(s) for name, s in changed.items()},
+            "recomputed": recomputed,
+        }
+    )
+    g.timer.mark("serialize")
+    return response, 200
+
+
+@app.route("/api/graphs/<graph_id>", methods=["DELETE"])
+def api_graph_delete(graph_id):
+    """Drop a graph."""
+    g.operation = "graph.delete"
+    if not graph_store.delete(graph_id):
+        return _api_error(f"Unknown graph: {graph_id}", 404)
+    return "", 204
 
 
 if __name__ == "__main__":
@@ -0,0 +1,13 @@
+"""
+Python client SDK for the calculator API.
+
+CalculatorClient (threads) and AsyncCalculatorClient (asyncio) keep a pool
+of keep-alive connections and coalesce calls made close together into
+/api/calculate/batch requests.
+"""
+
+from calculator_client.aio import AsyncCalculatorClient
+from calculator_client.protocol import CalculationError
+from calculator_client.sync import CalculatorClient
+
+__all__ = ["AsyncCalculatorClient", "CalculationError", "CalculatorClient"]
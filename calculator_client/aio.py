@@ -0,0 +1,282 @@
+"""
+asyncio calculator client with pooled keep-alive connections.
+
+Uses a small HTTP/1.1 implementation on asyncio streams, so it needs
+nothing beyond the standard library.
+"""
+
+import asyncio
+import ssl
+
+from calculator_client import protocol
+from calculator_client.protocol import CalculationError, OperationsMixin
+
+_STALE_CONNECTION = (
+    asyncio.IncompleteReadError,
+    BrokenPipeError,
+    ConnectionResetError,
+    ConnectionAbortedError,
+)
+
+
+class _Connection:
+    """One keep-alive HTTP/1.1 connection."""
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+
+    async def request(self, method, path, host, body, headers):
+        """
+        Send a request and read the whole response.
+
+        Returns:
+            tuple: (status, body bytes, whether the connection can be reused)
+        """
+        lines = [f"{method} {path} HTTP/1.1", f"Host: {host}"]
+        lines += [f"{name}: {value}" for name, value in headers.items()]
+        lines.append(f"Content-Length: {len(body or b'')}")
+        self.writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + (body or b""))
+        await self.writer.drain()
+
+        status_line = await self.reader.readuntil(b"\r\n")
+        version, status = status_line.decode("latin-1").split(" ", 2)[:2]
+        response_headers = {}
+        while True:
+            line = await self.reader.readuntil(b"\r\n")
+            if line == b"\r\n":
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            response_headers[name.strip().lower()] = value.strip()
+
+        if response_headers.get("transfer-encoding", "").lower() == "chunked":
+            data = await self._read_chunked()
+        else:
+            data = await self.reader.readexactly(
+                int(response_headers.get("content-length", "0"))
+            )
+        connection = response_headers.get("connection", "").lower()
+        keep_alive = connection == "keep-alive" or (
+            version == "HTTP/1.1" and connection != "close"
+        )
+        return int(status), data, keep_alive
+
+    async def _read_chunked(self):
+        chunks = []
+        while True:
+            size = int((await self.reader.readuntil(b"\r\n")).split(b";")[0], 16)
+            if size == 0:
+                await self.reader.readuntil(b"\r\n")
+                return b"".join(chunks)
+            chunks.append(await self.reader.readexactly(size))
+            await self.reader.readexactly(2)
+
+    def close(self):
+        self.writer.close()
+
+
+class AsyncConnectionPool:
+    """Bounded pool of keep-alive connections for one event loop."""
+
+    def __init__(self, base_url, size=4, timeout=10.0):
+        """
+        Args:
+            base_url (str): e.g. "http://localhost:5000"
+            size (int): Connections kept open (callers beyond this wait)
+            timeout (float): Seconds allowed per request
+        """
+        scheme, self.host, self.port = protocol.parse_base_url(base_url)
+        self._ssl = ssl.create_default_context() if scheme == "https" else None
+        self._host_header = f"{self.host}:{self.port}"
+        self.timeout = timeout
+        self._idle = []
+        self._slots = asyncio.Semaphore(size)
+        self.opened = 0
+
+    async def request(self, method, path, body=None, headers=None):
+        """
+        Send a request on a pooled connection, retrying once on a new
+        connection if a reused one turns out to have been closed.
+
+        Returns:
+            tuple: (status, body bytes)
+        """
+        async with self._slots:
+            for attempt in (1, 2):
+                reused = bool(self._idle) and attempt == 1
+                conn = self._idle.pop() if reused else await self._open()
+                try:
+                    status, data, keep_alive = await asyncio.wait_for(
+                        conn.request(method, path, self._host_header, body, headers or {}),
+                        self.timeout,
+                    )
+                except _STALE_CONNECTION:
+                    conn.close()
+                    if not reused:
+                        raise
+                    continue
+                except BaseException:
+                    conn.close()
+                    raise
+                if keep_alive:
+                    self._idle.append(conn)
+                else:
+                    conn.close()
+                return status, data
+
+    async def close(self):
+        """Close every idle connection."""
+        while self._idle:
+            self._idle.pop().close()
+
+    async def _open(self):
+        self.opened += 1
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(self.host, self.port, ssl=self._ssl), self.timeout
+        )
+        return _Connection(reader, writer)
+
+
+class AsyncCalculatorClient(OperationsMixin):
+    """
+    asyncio client for the calculator API.
+
+    await calculate() sends one request. The per-operation methods (add,
+    divide, factorize, ...) return awaitable futures; calls made within
+    batch_window seconds of each other are sent as one batch request.
+
+    Example:
+        async with AsyncCalculatorClient("http://localhost:5000") as calc:
+            results = await asyncio.gather(*(calc.add(i, 1) for i in range(100)))
+    """
+
+    def __init__(
+        self,
+        base_url="http://localhost:5000",
+        pool_size=4,
+        timeout=10.0,
+        batch_window=0.002,
+        max_batch=100,
+    ):
+        """
+        Args:
+            base_url (str): Server base URL
+            pool_size (int): Keep-alive connections (and concurrent batches)
+            timeout (float): Seconds allowed per request
+            batch_window (float): Seconds to wait for more calls before
+                sending a batch
+            max_batch (int): Calls sent per batch at most
+        """
+        self.pool = AsyncConnectionPool(base_url, pool_size, timeout)
+        self.batch_window = batch_window
+        self.max_batch = max_batch
+        self.batch_supported = True
+        self._pending = []
+        self._timer = None
+        self._tasks = set()
+        self.batches_sent = 0
+
+    async def calculate(self, operation, num1, num2=None):
+        """
+        Perform one calculation immediately.
+
+        Returns:
+            The result
+
+        Raises:
+            CalculationError: If the server rejects the calculation
+        """
+        status, body = await self.pool.request(
+            "POST",
+            protocol.CALCULATE_PATH,
+            protocol.encode(protocol.calculation(operation, num1, num2)),
+            protocol.JSON_HEADERS,
+        )
+        return protocol.single_result(status, body)
+
+    def submit(self, operation, num1, num2=None):
+        """
+        Queue a calculation for the next batch.
+
+        Returns:
+            asyncio.Future: Resolves to the result, or raises CalculationError
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((protocol.calculation(operation, num1, num2), future))
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.batch_window, self._flush)
+        return future
+
+    async def close(self):
+        """Send anything still queued, wait for it, then close connections."""
+        self._flush()
+        while self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        await self.pool.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        while self._pending:
+            batch = self._pending[:self.max_batch]
+            del self._pending[:self.max_batch]
+            task = asyncio.get_running_loop().create_task(self._send(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _send(self, batch):
+        try:
+            if self.batch_supported and len(batch) > 1:
+                outcomes = await self._send_batch([item for item, _ in batch])
+                if outcomes is not None:
+                    for (_, future), (ok, value) in zip(batch, outcomes):
+                        _settle(future, ok, value)
+                    return
+            for item, future in batch:
+                try:
+                    result = await self.calculate(
+                        item["operation"], item["num1"], item.get("num2")
+                    )
+                except Exception as e:  # pylint: disable=broad-except
+                    _settle(future, False, e)
+                else:
+                    _settle(future, True, result)
+        except Exception as e:  # pylint: disable=broad-except
+            for _, future in batch:
+                _settle(future, False, e)
+
+    async def _send_batch(self, items):
+        status, body = await self.pool.request(
+            "POST",
+            protocol.BATCH_PATH,
+            protocol.encode({"calculations": items}),
+            protocol.JSON_HEADERS,
+        )
+        if status in (404, 405):
+            self.batch_supported = False
+            return None
+        self.batches_sent += 1
+        return protocol.batch_outcomes(status, body, len(items))
+
+
+def _settle(future, ok, value):
+    # The caller may have cancelled (e.g. a timeout around the await)
+    if future.done():
+        return
+    if ok:
+        future.set_result(value)
+    else:
+        future.set_exception(value)
+
+
+__all__ = ["AsyncCalculatorClient", "AsyncConnectionPool", "CalculationError"]
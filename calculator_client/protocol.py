@@ -0,0 +1,190 @@
+"""
+Wire format shared by the sync and asyncio clients.
+"""
+
+import json
+from urllib.parse import urlsplit
+
+CALCULATE_PATH = "/api/calculate"
+BATCH_PATH = "/api/calculate/batch"
+
+# Operations taking a single operand (num2 is omitted)
+UNARY_OPERATIONS = frozenset(
+    {"square_root", "factorial", "fibonacci", "is_prime", "factorize"}
+)
+
+JSON_HEADERS = {"Content-Type": "application/json", "Accept": "application/json"}
+
+
+class CalculationError(Exception):
+    """
+    A calculation the server rejected (status 400) or failed on (500).
+
+    Attributes:
+        status (int): HTTP status of the failure
+    """
+
+    def __init__(self, message, status=400):
+        super().__init__(message)
+        self.status = status
+
+
+def parse_base_url(base_url):
+    """
+    Split a base URL into what http.client / asyncio need.
+
+    Returns:
+        tuple: (scheme, host, port)
+
+    Raises:
+        ValueError: If the scheme is not http or https
+    """
+    parts = urlsplit(base_url)
+    if parts.scheme not in ("http", "https"):
+        raise ValueError(f"Unsupported URL scheme: {parts.scheme!r}")
+    port = parts.port or (443 if parts.scheme == "https" else 80)
+    return parts.scheme, parts.hostname, port
+
+
+def calculation(operation, num1, num2=None):
+    """
+    Build one calculation object as the API expects it.
+
+    Returns:
+        dict: {"operation", "num1"[, "num2"]}
+    """
+    item = {"operation": operation, "num1": num1}
+    if operation not in UNARY_OPERATIONS:
+        item["num2"] = num2
+    return item
+
+
+def encode(payload):
+    """Serialise a request body."""
+    return json.dumps(payload, separators=(",", ":")).encode()
+
+
+def single_result(status, body):
+    """
+    Interpret a /api/calculate response.
+
+    Returns:
+        The result value
+
+    Raises:
+        CalculationError: If the server reported an error
+    """
+    data = _decode(status, body)
+    if status != 200:
+        raise CalculationError(data.get("error", f"HTTP {status}"), status)
+    return data["result"]
+
+
+def batch_outcomes(status, body, count):
+    """
+    Interpret a /api/calculate/batch response.
+
+    Returns:
+        list: One (ok, result or CalculationError) pair per calculation
+
+    Raises:
+        CalculationError: If the whole batch was rejected
+    """
+    data = _decode(status, body)
+    if status != 200:
+        raise CalculationError(data.get("error", f"HTTP {status}"), status)
+    results = data["results"]
+    if len(results) != count:
+        raise CalculationError(
+            f"Batch returned {len(results)} results for {count} calculations", 500
+        )
+    return [
+        (True, entry["result"])
+        if "error" not in entry
+        else (False, CalculationError(entry["error"], entry.get("status", 400)))
+        for entry in results
+    ]
+
+
+def _decode(status, body):
+    try:
+        data = json.loads(body)
+    except ValueError:
+        raise CalculationError(f"HTTP {status}: invalid JSON response", status) from None
+    return data if isinstance(data, dict) else {}
+
+
+class OperationsMixin:
+    """
+    One method per calculator operation, each delegating to self.submit().
+
+    submit() decides what comes back: a concurrent.futures.Future for the
+    sync client, an awaitable asyncio.Future for the asyncio client.
+    """
+
+    def submit(self, operation, num1, num2=None):  # pragma: no cover - abstract
+        raise NotImplementedError
+
+    def add(self, a, b):
+        """Queue a + b."""
+        return self.submit("add", a, b)
+
+    def subtract(self, a, b):
+        """Queue a - b."""
+        return self.submit("subtract", a, b)
+
+    def multiply(self, a, b):
+        """Queue a * b."""
+        return self.submit("multiply", a, b)
+
+    def divide(self, a, b):
+        """Queue a / b."""
+        return self.submit("divide", a, b)
+
+    def power(self, base, exponent):
+        """Queue base ** exponent."""
+        return self.submit("power", base, exponent)
+
+    def square_root(self, number):
+        """Queue the square root of number."""
+        return self.submit("square_root", number)
+
+    def modulo(self, a, b):
+        """Queue a % b."""
+        return self.submit("modulo", a, b)
+
+    def percentage(self, value, percent):
+        """Queue percent % of value."""
+        return self.submit("percentage", value, percent)
+
+    def factorial(self, n):
+        """Queue n!."""
+        return self.submit("factorial", n)
+
+    def binomial(self, n, k):
+        """Queue C(n, k)."""
+        return self.submit("binomial", n, k)
+
+    def fibonacci(self, n):
+        """Queue F(n)."""
+        return self.submit("fibonacci", n)
+
+    def is_prime(self, n):
+        """Queue a primality test of n."""
+        return self.submit("is_prime", n)
+
+    def factorize(self, n):
+        """Queue the prime factorization of n."""
+        return self.submit("factorize", n)
+
+    def gcd(self, a, b):
+        """Queue gcd(a, b)."""
+        return self.submit("gcd", a, b)
+
+    def lcm(self, a, b):
+        """Queue lcm(a, b)."""
+        return self.submit("lcm", a, b)
+
+    def mod_inverse(self, a, m):
+        """Queue the inverse of a modulo m."""
+        return self.submit("mod_inverse", a, m)
@@ -0,0 +1,251 @@
+"""
+Thread-based calculator client with pooled keep-alive connections.
+"""
+
+import http.client
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from calculator_client import protocol
+from calculator_client.protocol import CalculationError, OperationsMixin
+
+# Errors meaning a pooled keep-alive connection went stale; retried once
+_STALE_CONNECTION = (
+    http.client.RemoteDisconnected,
+    http.client.CannotSendRequest,
+    http.client.BadStatusLine,
+    BrokenPipeError,
+    ConnectionResetError,
+    ConnectionAbortedError,
+)
+
+
+class ConnectionPool:
+    """Bounded pool of reusable http.client connections to one server."""
+
+    def __init__(self, base_url, size=4, timeout=10.0):
+        """
+        Args:
+            base_url (str): e.g. "http://localhost:5000"
+            size (int): Connections kept open (callers beyond this wait)
+            timeout (float): Socket timeout in seconds
+        """
+        scheme, self.host, self.port = protocol.parse_base_url(base_url)
+        self._factory = (
+            http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        )
+        self.timeout = timeout
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(size)
+        self.opened = 0
+
+    def request(self, method, path, body=None, headers=None):
+        """
+        Send a request on a pooled connection.
+
+        Calculations are idempotent, so a request that fails because the
+        server closed an idle connection is retried once on a new one.
+
+        Returns:
+            tuple: (status, body bytes)
+        """
+        with self._slots:
+            for attempt in (1, 2):
+                conn = self._checkout(fresh=attempt == 2)
+                try:
+                    conn.request(method, path, body=body, headers=headers or {})
+                    response = conn.getresponse()
+                    data = response.read()
+                except _STALE_CONNECTION:
+                    conn.close()
+                    if attempt == 2:
+                        raise
+                    continue
+                except BaseException:
+                    conn.close()
+                    raise
+                if response.will_close:
+                    conn.close()
+                else:
+                    self._idle.put(conn)
+                return response.status, data
+
+    def close(self):
+        """Close every idle connection."""
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+    def _checkout(self, fresh=False):
+        if not fresh:
+            try:
+                return self._idle.get_nowait()
+            except queue.Empty:
+                pass
+        self.opened += 1
+        return self._factory(self.host, self.port, timeout=self.timeout)
+
+
+class CalculatorClient(OperationsMixin):
+    """
+    Synchronous client for the calculator API.
+
+    calculate() sends one request and blocks. The per-operation methods
+    (add, divide, factorize, ...) return concurrent.futures.Future objects
+    instead: calls made within batch_window seconds of each other are sent
+    together as one /api/calculate/batch request (or individually if the
+    server has no batch endpoint).
+
+    Example:
+        with CalculatorClient("http://localhost:5000") as calc:
+            futures = [calc.add(i, 1) for i in range(100)]
+            print([f.result() for f in futures])
+    """
+
+    def __init__(
+        self,
+        base_url="http://localhost:5000",
+        pool_size=4,
+        timeout=10.0,
+        batch_window=0.002,
+        max_batch=100,
+    ):
+        """
+        Args:
+            base_url (str): Server base URL
+            pool_size (int): Keep-alive connections (and concurrent batches)
+            timeout (float): Socket timeout in seconds
+            batch_window (float): Seconds to wait for more calls before
+                sending a batch
+            max_batch (int): Calls sent per batch at most
+        """
+        self.pool = ConnectionPool(base_url, pool_size, timeout)
+        self.batch_window = batch_window
+        self.max_batch = max_batch
+        self.batch_supported = True
+        self._pending = []
+        self._cond = threading.Condition()
+        self._closed = False
+        self._senders = ThreadPoolExecutor(pool_size, thread_name_prefix="calc-batch")
+        self._flusher = threading.Thread(
+            target=self._flush_loop, name="calc-batcher", daemon=True
+        )
+        self._flusher.start()
+        self.batches_sent = 0
+
+    def calculate(self, operation, num1, num2=None):
+        """
+        Perform one calculation immediately.
+
+        Returns:
+            The result
+
+        Raises:
+            CalculationError: If the server rejects the calculation
+        """
+        status, body = self.pool.request(
+            "POST",
+            protocol.CALCULATE_PATH,
+            protocol.encode(protocol.calculation(operation, num1, num2)),
+            protocol.JSON_HEADERS,
+        )
+        return protocol.single_result(status, body)
+
+    def submit(self, operation, num1, num2=None):
+        """
+        Queue a calculation for the next batch.
+
+        Returns:
+            concurrent.futures.Future: Resolves to the result, or raises
+            CalculationError
+        """
+        future = Future()
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("CalculatorClient is closed")
+            self._pending.append((protocol.calculation(operation, num1, num2), future))
+            self._cond.notify()
+        return future
+
+    def close(self):
+        """Send anything still queued, then release threads and connections."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self._flusher.join()
+        self._senders.shutdown(wait=True)
+        self.pool.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _flush_loop(self):
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                if not self._pending:
+                    return
+                # Give concurrent callers a moment to join the batch
+                deadline = time.monotonic() + self.batch_window
+                while len(self._pending) < self.max_batch and not self._closed:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                batch = self._pending[:self.max_batch]
+                del self._pending[:self.max_batch]
+            self._senders.submit(self._send, batch)
+
+    def _send(self, batch):
+        try:
+            if self.batch_supported and len(batch) > 1:
+                outcomes = self._send_batch([item for item, _ in batch])
+                if outcomes is not None:
+                    for (_, future), (ok, value) in zip(batch, outcomes):
+                        _settle(future, ok, value)
+                    return
+            for item, future in batch:
+                try:
+                    result = self.calculate(item["operation"], item["num1"], item.get("num2"))
+                except Exception as e:  # pylint: disable=broad-except
+                    _settle(future, False, e)
+                else:
+                    _settle(future, True, result)
+        except Exception as e:  # pylint: disable=broad-except
+            for _, future in batch:
+                _settle(future, False, e)
+
+    def _send_batch(self, items):
+        status, body = self.pool.request(
+            "POST",
+            protocol.BATCH_PATH,
+            protocol.encode({"calculations": items}),
+            protocol.JSON_HEADERS,
+        )
+        if status in (404, 405):
+            # Older server without the batch endpoint
+            self.batch_supported = False
+            return None
+        self.batches_sent += 1
+        return protocol.batch_outcomes(status, body, len(items))
+
+
+def _settle(future, ok, value):
+    # set_running_or_notify_cancel() is False if the caller cancelled
+    if not future.set_running_or_notify_cancel():
+        return
+    if ok:
+        future.set_result(value)
+    else:
+        future.set_exception(value)
+
+
+__all__ = ["CalculatorClient", "CalculationError", "ConnectionPool"]
@@ -8,6 +8,7 @@ $paths = @(
   "uat-results.xml",
   "coverage.xml",
   "uat-report.html",
+  "uat-performance.json",
   "deploy.zip",
   "app.log",
   "htmlcov",
@@ -202,21 +202,21 @@ Write-Host ""
 # Step 7: Run UAT Tests (Selenium) - WITHOUT coverage
 # ============================================================================
 Write-Host "[7/7] Running UAT Tests (Selenium)..." -ForegroundColor Yellow
-Write-Host "      Target: 11 tests" -ForegroundColor Gray
+Write-Host "      Target: 13 tests (11 functional + 2 performance budgets)" -ForegroundColor Gray
 
 $env:TEST_URL = "http://localhost:5000"
 
 # Ensure UAT does not enforce coverage (even if someone adds cov flags again later)
-$uatCmd = "pytest -p no:cov tests/uat_selenium/test_uat.py -v --tb=short --html=uat-report.html --self-contained-html"
+$uatCmd = "pytest -p no:cov tests/uat_selenium/test_uat.py tests/uat_selenium/test_uat_performance.py -v --tb=short --html=uat-report.html --self-contained-html"
 $uatOutput = Invoke-Expression "$uatCmd 2>&1" | Out-String
 Write-Host $uatOutput
 
 if ($uatOutput -match "(\d+)\s+passed") {
     $passedUAT = [int]$matches[1]
-    if ($passedUAT -eq 11) {
-        Write-Host "OK: UAT tests passed ($passedUAT/11)" -ForegroundColor Green
+    if ($passedUAT -eq 13) {
+        Write-Host "OK: UAT tests passed ($passedUAT/13)" -ForegroundColor Green
     } else {
-        Add-Error "ERROR: UAT tests did not run expected count (got $passedUAT/11)."
+        Add-Error "ERROR: UAT tests did not run expected count (got $passedUAT/13)."
     }
 } else {
     Add-Error "ERROR: UAT tests failed!"
@@ -280,8 +280,8 @@ if (Test-Path "tests/performance/${csvPrefix}_stats.csv") {
     Write-Host "WARNING" -ForegroundColor Yellow
 }
 
-Write-Host "  - UAT Tests (11):       " -NoNewline
-if ($uatOutput -match "11\s+passed") {
+Write-Host "  - UAT Tests (13):       " -NoNewline
+if ($uatOutput -match "13\s+passed") {
     Write-Host "PASSED" -ForegroundColor Green
 } else {
     Write-Host "FAILED" -ForegroundColor Red
@@ -293,6 +293,7 @@ Write-Host "  - Coverage:     htmlcov/index.html"
 Write-Host "  - Performance:  tests/performance/performance-report.html"
 Write-Host "  - Performance CSV: tests/performance/${csvPrefix}_stats.csv"
 Write-Host "  - UAT:          uat-report.html"
+Write-Host "  - UAT timings:  uat-performance.json"
 Write-Host ""
 
 if ($script:ErrorCount -eq 0 -and $script:WarningCount -eq 0) {
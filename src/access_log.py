@@ -0,0 +1,172 @@
+"""
+Asynchronous, sampled structured access logging.
+
+Request handlers only enqueue a small tuple; a background thread formats each
+record as a JSON line and hands it to the standard logging machinery, so the
+cost of formatting and I/O stays off the request path.
+"""
+
+import json
+import logging
+import os
+import queue
+import random
+import sys
+import threading
+import time
+
+_STOP = object()
+
+
+class AccessLogger:
+    """
+    Structured per-request logger with sampling and a bounded buffer.
+
+    Records are sampled (errors and successes at separate rates) and placed
+    on a bounded queue. When the queue is full the record is dropped and
+    counted instead of blocking the request.
+    """
+
+    def __init__(
+        self,
+        success_sample_rate=0.01,
+        error_sample_rate=1.0,
+        max_queue_size=10000,
+        logger=None,
+    ):
+        """
+        Args:
+            success_sample_rate (float): Fraction of successful requests logged
+            error_sample_rate (float): Fraction of failed requests logged
+            max_queue_size (int): Records buffered before new ones are dropped
+            logger (logging.Logger): Destination logger (default: stderr JSON lines)
+        """
+        self.success_sample_rate = success_sample_rate
+        self.error_sample_rate = error_sample_rate
+        self._queue = queue.Queue(maxsize=max_queue_size)
+        self._logger = logger or _default_logger()
+        self._thread = None
+        self._pid = None
+        self._start_lock = threading.Lock()
+        self.enqueued = 0
+        self.dropped = 0
+        self.written = 0
+
+    def log(self, route, operation, status, latency_ms, error=None):
+        """
+        Record one request, subject to sampling. Never blocks.
+
+        Args:
+            route (str): Matched route rule or path
+            operation (str): Calculator operation, if any
+            status (int): HTTP status code
+            latency_ms (float): Time spent handling the request
+            error (str): Error message shown to the client, if any
+        """
+        failed = error is not None or status >= 400
+        rate = self.error_sample_rate if failed else self.success_sample_rate
+        # Sampling only, not security sensitive
+        if rate < 1.0 and random.random() >= rate:  # nosec B311
+            return
+
+        self._ensure_writer()
+        try:
+            self._queue.put_nowait(
+                (time.time(), route, operation, status, latency_ms, error)
+            )
+            self.enqueued += 1
+        except queue.Full:
+            self.dropped += 1
+
+    def stats(self):
+        """
+        Return a snapshot of the logger counters.
+
+        Returns:
+            dict: enqueued, written, dropped and queued record counts
+        """
+        return {
+            "enqueued": self.enqueued,
+            "written": self.written,
+            "dropped": self.dropped,
+            "queued": self._queue.qsize(),
+        }
+
+    def close(self, timeout=2.0):
+        """Flush buffered records and stop the writer thread."""
+        thread = self._thread
+        if thread is None or not thread.is_alive():
+            return
+        try:
+            self._queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            return
+        thread.join(timeout)
+
+    def _ensure_writer(self):
+        # Threads do not survive fork, so gunicorn workers start their own
+        if self._thread is not None and self._pid == os.getpid():
+            return
+        with self._start_lock:
+            if self._thread is not None and self._pid == os.getpid():
+                return
+            self._thread = threading.Thread(
+                target=self._run, name="access-log-writer", daemon=True
+            )
+            self._pid = os.getpid()
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            record = self._queue.get()
+            if record is _STOP:
+                return
+            timestamp, route, operation, status, latency_ms, error = record
+            try:
+                self._logger.info(
+                    json.dumps(
+                        {
+                            "ts": round(timestamp, 6),
+                            "route": route,
+                            "operation": operation,
+                            "status": status,
+                            "latency_ms": round(latency_ms, 3),
+                            "error": error,
+                        }
+                    )
+                )
+                self.written += 1
+            except Exception:  # pylint: disable=broad-except
+                # Logging must never take the writer thread down
+                self.dropped += 1
+
+
+def _default_logger():
+    logger = logging.getLogger("calculator.access")
+    if not logger.handlers:
+        handler = logging.StreamHandler(sys.stderr)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+    return logger
+
+
+def from_env():
+    """
+    Build an AccessLogger configured from environment variables.
+
+    ACCESS_LOG=0 disables logging entirely (returns None).
+    ACCESS_LOG_SUCCESS_SAMPLE / ACCESS_LOG_ERROR_SAMPLE set the sample rates
+    and ACCESS_LOG_QUEUE_SIZE bounds the buffer.
+
+    Returns:
+        AccessLogger or None
+    """
+    if os.getenv("ACCESS_LOG", "1") != "1":
+        return None
+    return AccessLogger(
+        success_sample_rate=float(os.getenv("ACCESS_LOG_SUCCESS_SAMPLE", "0.01")),
+        error_sample_rate=float(os.getenv("ACCESS_LOG_ERROR_SAMPLE", "1.0")),
+        max_queue_size=int(os.getenv("ACCESS_LOG_QUEUE_SIZE", "10000")),
+    )
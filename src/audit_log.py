@@ -0,0 +1,335 @@
+"""
+Append-only calculation audit log on a memory-mapped ring file.
+
+Every calculation is written as a fixed-size binary record into a ring of
+slots in a memory-mapped file. Appending only locks long enough to reserve
+a sequence number (an fcntl byte-range lock on the header, so it is safe
+across gunicorn worker processes); the record itself is written without
+holding the lock and committed by writing its sequence number last.
+
+Export the ring for auditors with:
+    python -m src.audit_log export audit.ring -o audit.csv
+"""
+
+import argparse
+import csv
+import math
+import mmap
+import os
+import struct
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows: single-process locking only
+    fcntl = None
+
+MAGIC = b"CALCAUD1"
+VERSION = 1
+
+# magic, version, record size, capacity, next sequence number
+HEADER = struct.Struct("<8sIIQQ")
+HEADER_SIZE = 64
+_SEQ_OFFSET = 24
+
+# seq, timestamp, pid, status, flags, operation, num1, num2, result/error
+RECORD = struct.Struct("<QdIBB2x16s28s28s32s")
+RECORD_SIZE = RECORD.size
+
+STATUS_OK = 0
+STATUS_ERROR = 1
+
+# flags: which text fields were truncated to fit their slot
+TRUNCATED_NUM1 = 1
+TRUNCATED_NUM2 = 2
+TRUNCATED_RESULT = 4
+
+# Integers wider than this are summarised instead of converted to decimal
+_MAX_EXACT_INT_BITS = 96
+
+DEFAULT_CAPACITY = 100000
+
+CSV_COLUMNS = [
+    "seq",
+    "timestamp",
+    "pid",
+    "operation",
+    "num1",
+    "num2",
+    "status",
+    "result",
+    "truncated",
+]
+
+
+class AuditLog:
+    """
+    Ring of fixed-size audit records in a memory-mapped file.
+
+    Sequence numbers start at 1 and increase forever; record n lives in slot
+    (n - 1) % capacity, so once the ring is full the oldest records are
+    overwritten. A slot whose stored sequence number is 0 is empty or being
+    written.
+    """
+
+    def __init__(self, path, capacity=DEFAULT_CAPACITY, create=True):
+        """
+        Open the ring file, creating it if needed.
+
+        Args:
+            path (str): Ring file path
+            capacity (int): Number of record slots for a new file (an
+                existing file keeps its own capacity)
+            create (bool): Create the file if it does not exist
+
+        Raises:
+            ValueError: If an existing file is not an audit ring
+            FileNotFoundError: If create is False and the file is missing
+        """
+        self.path = path
+        self._thread_lock = threading.Lock()
+        flags = os.O_RDWR | getattr(os, "O_BINARY", 0)
+        self._fd = os.open(path, flags | os.O_CREAT if create else flags, 0o640)
+        try:
+            self._lock_header()
+            try:
+                os.lseek(self._fd, 0, os.SEEK_SET)
+                header = os.read(self._fd, HEADER.size)
+                if len(header) < HEADER.size or header[:8] == b"\0" * 8:
+                    if not create:
+                        raise ValueError(f"{path} is not an initialised audit ring")
+                    os.ftruncate(self._fd, HEADER_SIZE + capacity * RECORD_SIZE)
+                    os.lseek(self._fd, 0, os.SEEK_SET)
+                    os.write(
+                        self._fd, HEADER.pack(MAGIC, VERSION, RECORD_SIZE, capacity, 1)
+                    )
+                else:
+                    magic, version, record_size, capacity, _ = HEADER.unpack(header)
+                    if magic != MAGIC or version != VERSION or record_size != RECORD_SIZE:
+                        raise ValueError(f"{path} is not a version {VERSION} audit ring")
+            finally:
+                self._unlock_header()
+            self.capacity = capacity
+            self._map = mmap.mmap(self._fd, HEADER_SIZE + capacity * RECORD_SIZE)
+        except BaseException:
+            os.close(self._fd)
+            raise
+        self.appended = 0
+
+    def append(self, operation, num1, num2, result, ok=True):
+        """
+        Record one calculation.
+
+        Args:
+            operation (str): Calculator operation
+            num1: First operand
+            num2: Second operand (None for unary operations)
+            result: The result, or the exception/error message when not ok
+            ok (bool): Whether the calculation succeeded
+
+        Returns:
+            int: The record's sequence number
+        """
+        op_text, _ = _encode(operation, 16)
+        num1_text, t1 = _encode_value(num1, 28)
+        num2_text, t2 = _encode_value(num2, 28)
+        result_text, t3 = _encode_value(result, 32) if ok else _encode(str(result), 32)
+        flags = (
+            (TRUNCATED_NUM1 if t1 else 0)
+            | (TRUNCATED_NUM2 if t2 else 0)
+            | (TRUNCATED_RESULT if t3 else 0)
+        )
+
+        seq = self._reserve()
+        offset = HEADER_SIZE + ((seq - 1) % self.capacity) * RECORD_SIZE
+        # Clear the commit marker, write the payload, then commit
+        struct.pack_into("<Q", self._map, offset, 0)
+        RECORD.pack_into(
+            self._map,
+            offset,
+            0,
+            time.time(),
+            os.getpid(),
+            STATUS_OK if ok else STATUS_ERROR,
+            flags,
+            op_text,
+            num1_text,
+            num2_text,
+            result_text,
+        )
+        struct.pack_into("<Q", self._map, offset, seq)
+        self.appended += 1
+        return seq
+
+    def records(self):
+        """
+        Read every committed record, oldest first.
+
+        Returns:
+            list: dicts with the CSV_COLUMNS keys
+        """
+        rows = []
+        for slot in range(self.capacity):
+            offset = HEADER_SIZE + slot * RECORD_SIZE
+            raw = bytes(self._map[offset:offset + RECORD_SIZE])
+            seq = struct.unpack_from("<Q", raw)[0]
+            if seq == 0 or (seq - 1) % self.capacity != slot:
+                continue
+            # Skip records overwritten while we were copying them
+            if struct.unpack_from("<Q", self._map, offset)[0] != seq:
+                continue
+            rows.append(_decode(raw))
+        rows.sort(key=lambda row: row["seq"])
+        return rows
+
+    def next_seq(self):
+        """
+        Sequence number the next record will get.
+
+        Returns:
+            int: Next sequence number (1 for an empty log)
+        """
+        return struct.unpack_from("<Q", self._map, _SEQ_OFFSET)[0]
+
+    def stats(self):
+        """
+        Return a snapshot of the audit counters.
+
+        Returns:
+            dict: capacity, next_seq (shared by all processes) and appended
+            (by this process)
+        """
+        return {
+            "capacity": self.capacity,
+            "next_seq": self.next_seq(),
+            "appended": self.appended,
+        }
+
+    def close(self):
+        """Unmap and close the ring file."""
+        self._map.close()
+        os.close(self._fd)
+
+    def _reserve(self):
+        with self._thread_lock:
+            self._lock_header()
+            try:
+                seq = struct.unpack_from("<Q", self._map, _SEQ_OFFSET)[0]
+                struct.pack_into("<Q", self._map, _SEQ_OFFSET, seq + 1)
+            finally:
+                self._unlock_header()
+        return seq
+
+    def _lock_header(self):
+        if fcntl is not None:
+            fcntl.lockf(self._fd, fcntl.LOCK_EX, HEADER_SIZE, 0)
+
+    def _unlock_header(self):
+        if fcntl is not None:
+            fcntl.lockf(self._fd, fcntl.LOCK_UN, HEADER_SIZE, 0)
+
+
+def from_env():
+    """
+    Open the audit log configured by AUDIT_LOG_PATH (and AUDIT_LOG_CAPACITY).
+
+    Returns:
+        AuditLog, or None when auditing is not configured
+    """
+    path = os.getenv("AUDIT_LOG_PATH")
+    if not path:
+        return None
+    return AuditLog(path, int(os.getenv("AUDIT_LOG_CAPACITY", str(DEFAULT_CAPACITY))))
+
+
+def export_csv(path, out):
+    """
+    Write every committed record of a ring file as CSV.
+
+    Args:
+        path (str): Ring file path
+        out: Text stream to write to
+
+    Returns:
+        int: Number of records written
+    """
+    log = AuditLog(path, create=False)
+    try:
+        rows = log.records()
+    finally:
+        log.close()
+    writer = csv.DictWriter(out, fieldnames=CSV_COLUMNS)
+    writer.writeheader()
+    writer.writerows(rows)
+    return len(rows)
+
+
+def _encode(text, size):
+    data = text.encode("utf-8")
+    if len(data) <= size:
+        return data, False
+    return data[:size], True
+
+
+def _encode_value(value, size):
+    if value is None:
+        return b"", False
+    if isinstance(value, int) and not isinstance(value, bool):
+        if value.bit_length() > _MAX_EXACT_INT_BITS:
+            return _encode(f"<{value.bit_length()}-bit int>", size)[0], True
+    elif isinstance(value, float) and not math.isfinite(value):
+        return _encode(str(value), size)
+    elif isinstance(value, (list, tuple)):
+        return _encode(",".join(str(v) for v in value), size)
+    return _encode(repr(value) if isinstance(value, float) else str(value), size)
+
+
+def _decode(raw):
+    seq, timestamp, pid, status, flags, op, num1, num2, result = RECORD.unpack(raw)
+    truncated = [
+        name
+        for name, bit in (
+            ("num1", TRUNCATED_NUM1),
+            ("num2", TRUNCATED_NUM2),
+            ("result", TRUNCATED_RESULT),
+        )
+        if flags & bit
+    ]
+    return {
+        "seq": seq,
+        "timestamp": datetime.fromtimestamp(timestamp, timezone.utc).isoformat(),
+        "pid": pid,
+        "operation": _text(op),
+        "num1": _text(num1),
+        "num2": _text(num2),
+        "status": "ok" if status == STATUS_OK else "error",
+        "result": _text(result),
+        "truncated": "|".join(truncated),
+    }
+
+
+def _text(field):
+    return field.rstrip(b"\0").decode("utf-8", errors="replace")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Calculator audit ring tools")
+    commands = parser.add_subparsers(dest="command", required=True)
+    export = commands.add_parser("export", help="Convert a ring file to CSV")
+    export.add_argument("path", help="Audit ring file")
+    export.add_argument("-o", "--output", help="CSV file (default: stdout)")
+    args = parser.parse_args(argv)
+
+    if args.output:
+        with open(args.output, "w", newline="", encoding="utf-8") as out:
+            count = export_csv(args.path, out)
+    else:
+        count = export_csv(args.path, sys.stdout)
+    print(f"Exported {count} records", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+"""
+Dynamic micro-batching of concurrent scalar calculations.
+
+Requests for the same element-wise operation that arrive within a short
+window are evaluated together in one vectorized pass. The first caller of a
+batch (the leader) waits up to the window, or until the batch is full, then
+computes every result; the other callers block until it is done. There is no
+background thread, so the batcher is safe to create before a fork.
+"""
+
+import math
+import os
+import threading
+
+from src import vectorized
+
+# Operations the batcher accepts; everything else goes straight to the caller
+OPERATIONS = vectorized.VECTOR_OPERATIONS
+
+
+class _Batch:
+    """Calculations for one operation collected during one window."""
+
+    __slots__ = ("operands", "results", "errors", "full", "done")
+
+    def __init__(self):
+        self.operands = []
+        self.results = None
+        self.errors = None
+        self.full = threading.Event()
+        self.done = threading.Event()
+
+
+class MicroBatcher:
+    """
+    Group concurrent calculations into vectorized batches.
+
+    Results match the scalar path exactly: any element the vectorized kernel
+    cannot produce as a finite float (errors, overflow, complex results) is
+    recomputed with the scalar function, which returns or raises for that
+    caller alone.
+    """
+
+    def __init__(self, scalar, window=0.001, max_items=64, evaluate=None):
+        """
+        Args:
+            scalar (callable): scalar(operation, num1, num2) computing one
+                result; used for lone requests and for fallback elements
+            window (float): Seconds the leader waits for more calculations
+            max_items (int): Batch size that is evaluated without waiting
+                for the window to end
+            evaluate (callable): Vectorized kernel (default
+                vectorized.evaluate)
+        """
+        self.scalar = scalar
+        self.window = window
+        self.max_items = max_items
+        self.evaluate = evaluate or vectorized.evaluate
+        self._lock = threading.Lock()
+        self._open = {}
+        self._sizes = {}
+        self.batches = 0
+        self.items = 0
+        self.fallbacks = 0
+
+    def calculate(self, operation, num1, num2=None):
+        """
+        Compute operation(num1, num2), possibly batched with other callers.
+
+        Returns:
+            The same value scalar(operation, num1, num2) would return
+
+        Raises:
+            Whatever scalar(operation, num1, num2) would raise
+        """
+        if operation not in OPERATIONS:
+            return self.scalar(operation, num1, num2)
+
+        with self._lock:
+            batch = self._open.get(operation)
+            leader = batch is None
+            if leader:
+                batch = self._open[operation] = _Batch()
+            index = len(batch.operands)
+            batch.operands.append((num1, num2))
+            if len(batch.operands) >= self.max_items:
+                del self._open[operation]
+                batch.full.set()
+
+        if leader:
+            batch.full.wait(self.window)
+            with self._lock:
+                if self._open.get(operation) is batch:
+                    del self._open[operation]
+            try:
+                self._run(operation, batch)
+            finally:
+                batch.done.set()
+        else:
+            batch.done.wait()
+
+        error = batch.errors[index]
+        if error is not None:
+            raise error
+        return batch.results[index]
+
+    def stats(self):
+        """
+        Return batch counters and the batch size distribution.
+
+        Returns:
+            dict: window_ms, max_items, batches, items, mean_size, fallbacks
+            and sizes ({upper bound: batches}, power-of-two buckets)
+        """
+        with self._lock:
+            sizes = dict(sorted(self._sizes.items()))
+            batches, items, fallbacks = self.batches, self.items, self.fallbacks
+        return {
+            "window_ms": self.window * 1000,
+            "max_items": self.max_items,
+            "batches": batches,
+            "items": items,
+            "mean_size": round(items / batches, 2) if batches else 0.0,
+            "fallbacks": fallbacks,
+            "sizes": {str(bound): count for bound, count in sizes.items()},
+        }
+
+    def _run(self, operation, batch):
+        operands = batch.operands
+        count = len(operands)
+        results = [None] * count
+        errors = [None] * count
+        values = None
+        if count > 1:
+            xs = [num1 for num1, _ in operands]
+            ys = None
+            if operation not in vectorized.UNARY_OPERATIONS:
+                ys = [num2 for _, num2 in operands]
+            try:
+                values = self.evaluate(operation, xs, ys)
+                values = values.tolist() if hasattr(values, "tolist") else list(values)
+            except (ValueError, TypeError, ArithmeticError):
+                values = None
+
+        fallbacks = 0
+        for i, (num1, num2) in enumerate(operands):
+            if values is not None and math.isfinite(values[i]):
+                results[i] = values[i]
+                continue
+            if count > 1:
+                fallbacks += 1
+            try:
+                results[i] = self.scalar(operation, num1, num2)
+            except Exception as e:  # pylint: disable=broad-except
+                errors[i] = e
+        batch.results, batch.errors = results, errors
+
+        bound = 1 << (count - 1).bit_length()
+        with self._lock:
+            self.batches += 1
+            self.items += count
+            self.fallbacks += fallbacks
+            self._sizes[bound] = self._sizes.get(bound, 0) + 1
+
+
+def from_env(scalar):
+    """
+    Build a MicroBatcher configured from environment variables.
+
+    MICRO_BATCH=1 enables batching (off by default). MICRO_BATCH_WINDOW_MS
+    sets how long the first request of a batch waits for others, and
+    MICRO_BATCH_MAX_ITEMS the batch size that is evaluated immediately.
+
+    Args:
+        scalar (callable): Scalar calculation function (see MicroBatcher)
+
+    Returns:
+        MicroBatcher or None
+    """
+    if os.getenv("MICRO_BATCH", "0") != "1":
+        return None
+    return MicroBatcher(
+        scalar,
+        window=float(os.getenv("MICRO_BATCH_WINDOW_MS", "1")) / 1000,
+        max_items=int(os.getenv("MICRO_BATCH_MAX_ITEMS", "64")),
+    )
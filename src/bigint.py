@@ -0,0 +1,237 @@
+"""
+Exact big-integer combinatorics: factorial, binomial coefficients and
+Fibonacci numbers.
+
+Cold factorials and binomials use CPython's math.factorial / math.comb, which
+already implement divide-and-conquer (binary splitting) products in C and
+beat pure-Python re-implementations of the same algorithms. On top of that a
+bounded checkpoint cache keeps recent large results: a factorial near a
+cached one is finished with a binary-splitting product of the gap instead of
+being recomputed from scratch. Fibonacci numbers use fast doubling.
+"""
+
+import bisect
+import math
+import threading
+from collections import OrderedDict
+
+# Cached results are bounded by total size rather than entry count
+DEFAULT_CACHE_BITS = 256 * 1024 * 1024
+
+# Only cache results big enough to be worth keeping
+MIN_CHECKPOINT_N = 1000
+
+# Ranges shorter than this are multiplied with a plain loop
+_SPLIT_THRESHOLD = 32
+
+
+class CheckpointCache:
+    """
+    Thread-safe LRU cache of large integers bounded by total bit length.
+
+    Keys are (kind, n) pairs; nearest_below() finds the largest cached n not
+    above a target for a given kind, so callers can extend from it.
+    """
+
+    def __init__(self, max_bits=DEFAULT_CACHE_BITS):
+        self.max_bits = max_bits
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._sorted = {}
+        self._bits = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, kind, n):
+        """
+        Look up an exact entry.
+
+        Returns:
+            The cached value, or None
+        """
+        with self._lock:
+            entry = self._entries.get((kind, n))
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end((kind, n))
+            self.hits += 1
+            return entry[0]
+
+    def nearest_below(self, kind, n):
+        """
+        Find the entry of this kind with the largest key not above n.
+
+        Returns:
+            (key, value) or None
+        """
+        with self._lock:
+            keys = self._sorted.get(kind)
+            if not keys:
+                return None
+            i = bisect.bisect_right(keys, n)
+            if i == 0:
+                return None
+            m = keys[i - 1]
+            self._entries.move_to_end((kind, m))
+            return m, self._entries[(kind, m)][0]
+
+    def put(self, kind, n, value, bits):
+        """
+        Store a value, evicting least recently used entries to stay in budget.
+
+        Args:
+            kind (str): Family of the value (e.g. "factorial")
+            n (int): Index of the value within its family
+            value: The value to cache
+            bits (int): Size charged against the budget
+        """
+        if bits > self.max_bits:
+            return
+        with self._lock:
+            if (kind, n) in self._entries:
+                return
+            self._entries[(kind, n)] = (value, bits)
+            bisect.insort(self._sorted.setdefault(kind, []), n)
+            self._bits += bits
+            while self._bits > self.max_bits:
+                (old_kind, old_n), (_, old_bits) = self._entries.popitem(last=False)
+                self._sorted[old_kind].remove(old_n)
+                self._bits -= old_bits
+
+    def stats(self):
+        """
+        Return a snapshot of the cache counters.
+
+        Returns:
+            dict: entries, bits, hits and misses
+        """
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bits": self._bits,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+class BigIntEngine:
+    """
+    Factorials, binomial coefficients and Fibonacci numbers with caching.
+    """
+
+    def __init__(self, cache=None):
+        """
+        Args:
+            cache (CheckpointCache): Shared checkpoint cache (default: new one)
+        """
+        self.cache = cache if cache is not None else CheckpointCache()
+
+    def factorial(self, n):
+        """
+        Calculate n!.
+
+        Args:
+            n (int): Non-negative integer
+
+        Returns:
+            int: n factorial
+        """
+        if n < MIN_CHECKPOINT_N:
+            return math.factorial(n)
+        cached = self.cache.get("factorial", n)
+        if cached is not None:
+            return cached
+
+        nearest = self.cache.nearest_below("factorial", n)
+        if nearest is not None and n - nearest[0] <= n // 4:
+            m, m_factorial = nearest
+            result = m_factorial * range_product(m + 1, n + 1)
+        else:
+            result = math.factorial(n)
+        self.cache.put("factorial", n, result, result.bit_length())
+        return result
+
+    def binomial(self, n, k):
+        """
+        Calculate the binomial coefficient C(n, k).
+
+        Args:
+            n (int): Non-negative integer
+            k (int): Non-negative integer
+
+        Returns:
+            int: Number of ways to choose k items from n (0 if k > n)
+        """
+        if k > n:
+            return 0
+        k = min(k, n - k)
+        if k < MIN_CHECKPOINT_N:
+            return math.comb(n, k)
+        key = (n, k)
+        cached = self.cache.get("binomial", key)
+        if cached is not None:
+            return cached
+        result = math.comb(n, k)
+        self.cache.put("binomial", key, result, result.bit_length())
+        return result
+
+    def fibonacci(self, n):
+        """
+        Calculate the n-th Fibonacci number (F(0) = 0, F(1) = 1).
+
+        Args:
+            n (int): Non-negative integer
+
+        Returns:
+            int: F(n)
+        """
+        if n < MIN_CHECKPOINT_N:
+            return fibonacci_pair(n)[0]
+        cached = self.cache.get("fibonacci", n)
+        if cached is not None:
+            return cached
+        result = fibonacci_pair(n)[0]
+        self.cache.put("fibonacci", n, result, result.bit_length())
+        return result
+
+
+def range_product(lo, hi):
+    """
+    Product of the integers in [lo, hi) by binary splitting.
+
+    Splitting keeps the operands of each multiplication similar in size,
+    which is where CPython's Karatsuba multiplication pays off.
+
+    Returns:
+        int: lo * (lo + 1) * ... * (hi - 1), or 1 for an empty range
+    """
+    if hi - lo <= _SPLIT_THRESHOLD:
+        result = 1
+        for i in range(lo, hi):
+            result *= i
+        return result
+    mid = (lo + hi) // 2
+    return range_product(lo, mid) * range_product(mid, hi)
+
+
+def fibonacci_pair(n):
+    """
+    Return (F(n), F(n + 1)) by fast doubling.
+
+    Uses F(2k) = F(k) * (2F(k+1) - F(k)) and F(2k+1) = F(k)^2 + F(k+1)^2,
+    walking the bits of n from the most significant: O(log n) big-integer
+    multiplications.
+
+    Returns:
+        tuple: (F(n), F(n + 1))
+    """
+    a, b = 0, 1
+    for bit in bin(n)[2:]:
+        c = a * ((b << 1) - a)
+        d = a * a + b * b
+        if bit == "1":
+            a, b = d, c + d
+        else:
+            a, b = c, d
+    return a, b
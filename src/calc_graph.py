@@ -0,0 +1,327 @@
+"""
+Spreadsheet-style calculation graphs with incremental recomputation.
+
+A graph is a set of named cells. An input cell holds a number; a formula
+cell applies a Calculator operation to other cells and constants. Updating
+cells recomputes only their dependents, in topological order, and stops
+propagating wherever a recomputed value comes out unchanged, so the cost of
+an update follows the change set rather than the size of the model.
+
+Graphs are held in memory by the worker process that created them.
+"""
+
+import math
+import re
+import secrets
+import threading
+from collections import OrderedDict, namedtuple
+
+from src.calculator import OPERATIONS, UNARY_OPERATIONS
+
+CELL_NAME = re.compile(r"^[A-Za-z_][A-Za-z0-9_.]{0,63}$")
+
+# What a cell currently holds: a value, or an error message and HTTP status
+CellState = namedtuple("CellState", "value error status")
+
+
+class _Cell:
+    __slots__ = ("operation", "args", "refs", "state")
+
+    def __init__(self, operation, args):
+        self.operation = operation
+        self.args = args
+        self.refs = frozenset(arg for arg in args if isinstance(arg, str))
+        self.state = None
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def parse_cell(name, definition):
+    """
+    Validate one cell definition.
+
+    Args:
+        name (str): Cell name
+        definition: A number (an input cell), or
+            {"operation": <name>, "args": [<cell name or number>, ...]}
+
+    Returns:
+        tuple: (operation or None for an input, tuple of args)
+
+    Raises:
+        ValueError: If the name or definition is invalid
+    """
+    if not isinstance(name, str) or not CELL_NAME.match(name):
+        raise ValueError(
+            f"Invalid cell name: {name!r} (letters, digits, _ and ., up to 64 characters)"
+        )
+    if _is_number(definition):
+        return None, (definition,)
+    if not isinstance(definition, dict):
+        raise ValueError(f"Cell {name} must be a number or an operation object")
+    operation = definition.get("operation")
+    args = definition.get("args")
+    if operation not in OPERATIONS:
+        raise ValueError(f"Cell {name}: unknown operation {operation}")
+    arity = 1 if operation in UNARY_OPERATIONS else 2
+    if not isinstance(args, list) or len(args) != arity:
+        raise ValueError(f"Cell {name}: {operation} takes {arity} args")
+    for arg in args:
+        if not (_is_number(arg) or isinstance(arg, str)):
+            raise ValueError(f"Cell {name}: args must be cell names or numbers")
+    return operation, tuple(args)
+
+
+def _same(old, new):
+    """Whether a recomputed state equals the previous one (NaN equals NaN)."""
+    if old is None or old.error != new.error:
+        return False
+    if old.error is not None:
+        return True
+    a, b = old.value, new.value
+    if type(a) is not type(b):
+        return False
+    if isinstance(a, float) and math.isnan(a):
+        return math.isnan(b)
+    return a == b
+
+
+class CalculationGraph:
+    """
+    Named cells recomputed incrementally when their inputs change.
+
+    Thread-safe: updates to one graph are serialised.
+    """
+
+    def __init__(self, compute, max_cells=10000):
+        """
+        Args:
+            compute (callable): compute(operation, num1, num2) -> result
+            max_cells (int): Most cells the graph may hold
+        """
+        self._compute = compute
+        self.max_cells = max_cells
+        self._cells = {}
+        self._dependents = {}
+        self._lock = threading.Lock()
+        self.updates = 0
+        self.recomputed = 0
+
+    def __len__(self):
+        return len(self._cells)
+
+    def update(self, definitions):
+        """
+        Define or redefine cells and recompute everything downstream.
+
+        Nothing changes if any definition is invalid or the update would
+        create a cycle.
+
+        Args:
+            definitions (dict): {cell name: definition} (see parse_cell)
+
+        Returns:
+            tuple: ({cell name: CellState} for every cell whose value
+                changed, number of cells recomputed)
+
+        Raises:
+            ValueError: If a definition is invalid, references an unknown
+                cell, creates a cycle or exceeds max_cells
+        """
+        if not isinstance(definitions, dict) or not definitions:
+            raise ValueError("cells must be a non-empty object")
+        specs = {name: parse_cell(name, d) for name, d in definitions.items()}
+        with self._lock:
+            added = sum(name not in self._cells for name in specs)
+            if len(self._cells) + added > self.max_cells:
+                raise ValueError(f"A graph is limited to {self.max_cells} cells")
+            cells = {name: _Cell(*spec) for name, spec in specs.items()}
+            for name, cell in cells.items():
+                for ref in cell.refs:
+                    if ref not in self._cells and ref not in cells:
+                        raise ValueError(f"Cell {name} references unknown cell {ref}")
+            order = self._order(cells)
+            self._apply(cells)
+            changed, recomputed = self._recompute(order, cells)
+            self.updates += 1
+            self.recomputed += recomputed
+            return changed, recomputed
+
+    def values(self):
+        """
+        Returns:
+            dict: {cell name: CellState} for every cell
+        """
+        with self._lock:
+            return {name: cell.state for name, cell in self._cells.items()}
+
+    def _order(self, cells):
+        """
+        Topologically order the redefined cells and their dependents as they
+        will be after the update.
+
+        Raises:
+            ValueError: If the update creates a cycle
+        """
+        gained, lost = {}, {}
+        for name, cell in cells.items():
+            old = self._cells.get(name)
+            old_refs = old.refs if old is not None else frozenset()
+            for ref in cell.refs - old_refs:
+                gained.setdefault(ref, set()).add(name)
+            for ref in old_refs - cell.refs:
+                lost.setdefault(ref, set()).add(name)
+
+        def dependents(name):
+            current = self._dependents.get(name, set())
+            if name in gained or name in lost:
+                current = (current - lost.get(name, set())) | gained.get(name, set())
+            return iter(current)
+
+        # Iterative depth-first search; reverse post-order is topological
+        order, visiting, done = [], set(), set()
+        for root in cells:
+            if root in done:
+                continue
+            visiting.add(root)
+            stack = [(root, dependents(root))]
+            while stack:
+                node, children = stack[-1]
+                for child in children:
+                    if child in visiting:
+                        path = [name for name, _ in stack]
+                        cycle = path[path.index(child):] + [child]
+                        raise ValueError(f"Circular reference: {' -> '.join(cycle)}")
+                    if child not in done:
+                        visiting.add(child)
+                        stack.append((child, dependents(child)))
+                        break
+                else:
+                    stack.pop()
+                    visiting.discard(node)
+                    done.add(node)
+                    order.append(node)
+        order.reverse()
+        return order
+
+    def _apply(self, cells):
+        for name, cell in cells.items():
+            old = self._cells.get(name)
+            if old is not None:
+                cell.state = old.state
+                for ref in old.refs - cell.refs:
+                    self._dependents[ref].discard(name)
+            for ref in cell.refs:
+                self._dependents.setdefault(ref, set()).add(name)
+            self._cells[name] = cell
+
+    def _recompute(self, order, redefined):
+        changed = {}
+        recomputed = 0
+        for name in order:
+            cell = self._cells[name]
+            if name not in redefined and cell.refs.isdisjoint(changed):
+                continue
+            recomputed += 1
+            state = self._evaluate(cell)
+            if not _same(cell.state, state):
+                changed[name] = state
+            cell.state = state
+        return changed, recomputed
+
+    def _evaluate(self, cell):
+        if cell.operation is None:
+            return CellState(cell.args[0], None, None)
+        operands = []
+        for arg in cell.args:
+            if isinstance(arg, str):
+                source = self._cells[arg].state
+                if source.error is not None:
+                    return CellState(None, f"Depends on {arg}, which has an error", source.status)
+                arg = source.value
+            operands.append(arg)
+        if len(operands) == 1:
+            operands.append(None)
+        try:
+            return CellState(self._compute(cell.operation, *operands), None, None)
+        except ValueError as e:
+            return CellState(None, str(e), 400)
+        except Exception as e:  # pylint: disable=broad-except
+            return CellState(None, f"Server error: {str(e)}", 500)
+
+
+class GraphStore:
+    """
+    The graphs of one worker process, evicting the least recently used.
+
+    Thread-safe.
+    """
+
+    def __init__(self, compute, max_graphs=1000, max_cells=10000):
+        """
+        Args:
+            compute (callable): compute(operation, num1, num2) -> result
+            max_graphs (int): Graphs kept before the least recently used is dropped
+            max_cells (int): Most cells per graph
+        """
+        self._compute = compute
+        self.max_graphs = max_graphs
+        self.max_cells = max_cells
+        self._graphs = OrderedDict()
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    def create(self, definitions):
+        """
+        Build a graph from its cell definitions.
+
+        Returns:
+            tuple: (graph id, CalculationGraph)
+
+        Raises:
+            ValueError: If the definitions are invalid (see CalculationGraph.update)
+        """
+        graph = CalculationGraph(self._compute, self.max_cells)
+        graph.update(definitions)
+        graph_id = secrets.token_hex(8)
+        with self._lock:
+            self._graphs[graph_id] = graph
+            while len(self._graphs) > self.max_graphs:
+                self._graphs.popitem(last=False)
+                self.evictions += 1
+        return graph_id, graph
+
+    def get(self, graph_id):
+        """
+        Returns:
+            CalculationGraph or None if unknown (or evicted)
+        """
+        with self._lock:
+            graph = self._graphs.get(graph_id)
+            if graph is not None:
+                self._graphs.move_to_end(graph_id)
+            return graph
+
+    def delete(self, graph_id):
+        """
+        Returns:
+            bool: Whether the graph existed
+        """
+        with self._lock:
+            return self._graphs.pop(graph_id, None) is not None
+
+    def stats(self):
+        """Graph counts and recomputation totals for /metrics."""
+        with self._lock:
+            graphs = list(self._graphs.values())
+        updates = sum(graph.updates for graph in graphs)
+        return {
+            "graphs": len(graphs),
+            "max_graphs": self.max_graphs,
+            "cells": sum(len(graph) for graph in graphs),
+            "updates": updates,
+            "recomputed": sum(graph.recomputed for graph in graphs),
+            "evictions": self.evictions,
+        }
@@ -4,6 +4,56 @@ Calculator module providing basic and advanced arithmetic operations.
 
 import math
 
+from src import finance, number_theory, series
+from src.bigint import BigIntEngine
+
+# Every operation the web form and /api/calculate accept
+OPERATIONS = frozenset(
+    {
+        "add",
+        "subtract",
+        "multiply",
+        "divide",
+        "power",
+        "square_root",
+        "modulo",
+        "percentage",
+        "factorial",
+        "binomial",
+        "fibonacci",
+        "is_prime",
+        "factorize",
+        "gcd",
+        "lcm",
+        "mod_inverse",
+    }
+)
+
+# Operations that take a single operand
+UNARY_OPERATIONS = frozenset(
+    {"square_root", "factorial", "fibonacci", "is_prime", "factorize"}
+)
+
+# Operations whose operands must be exact integers (never rounded via float)
+INTEGER_OPERATIONS = frozenset(
+    {
+        "factorial",
+        "binomial",
+        "fibonacci",
+        "is_prime",
+        "factorize",
+        "gcd",
+        "lcm",
+        "mod_inverse",
+    }
+)
+
+# Largest exact integer power computed when the float result overflows
+POWER_MAX_BITS = 1 << 22
+
+# Shared so every Calculator benefits from the same checkpoint cache
+_bigint = BigIntEngine()
+
 
 class Calculator:
     """
@@ -76,9 +126,22 @@ class Calculator:
             exponent (float): Exponent
 
         Returns:
-            float: base raised to exponent
+            float: base raised to exponent (an exact int when the float
+            result would overflow but both operands are integral)
+
+        Raises:
+            ValueError: If the result is too large to represent
         """
-        return base**exponent
+        try:
+            return base**exponent
+        except OverflowError:
+            if not (float(base).is_integer() and float(exponent).is_integer()):
+                raise ValueError("Result is too large to represent") from None
+            if exponent * math.log2(abs(base)) > POWER_MAX_BITS:
+                raise ValueError(
+                    f"Result exceeds the {POWER_MAX_BITS}-bit limit for exact powers"
+                ) from None
+            return int(base) ** int(exponent)
 
     def square_root(self, number):
         """
@@ -131,4 +194,269 @@ class Calculator:
             percentage(50, 25) returns 12.5 (25% of 50)
         """
         return (number * percent) / 100
-    
\ No newline at end of file
+    
+
+    def factorial(self, n):
+        """
+        Calculate the factorial of a non-negative integer.
+
+        Args:
+            n (int): Non-negative integer (integral floats are accepted)
+
+        Returns:
+            int: n!
+
+        Raises:
+            ValueError: If n is negative or not an integer
+        """
+        return _bigint.factorial(_as_natural(n, "Factorial"))
+
+    def binomial(self, n, k):
+        """
+        Calculate the binomial coefficient C(n, k) ("n choose k").
+
+        Args:
+            n (int): Number of items
+            k (int): Number of items chosen
+
+        Returns:
+            int: Number of ways to choose k of n items (0 if k > n)
+
+        Raises:
+            ValueError: If n or k is negative or not an integer
+        """
+        return _bigint.binomial(_as_natural(n, "Binomial"), _as_natural(k, "Binomial"))
+
+    def fibonacci(self, n):
+        """
+        Calculate the n-th Fibonacci number.
+
+        Args:
+            n (int): Non-negative index (F(0) = 0, F(1) = 1)
+
+        Returns:
+            int: F(n)
+
+        Raises:
+            ValueError: If n is negative or not an integer
+        """
+        return _bigint.fibonacci(_as_natural(n, "Fibonacci"))
+
+    def is_prime(self, n):
+        """
+        Test whether an integer is prime.
+
+        Args:
+            n (int): Integer to test
+
+        Returns:
+            bool: True if n is prime (probabilistic above 3.3e24)
+
+        Raises:
+            ValueError: If n is not an integer
+        """
+        return number_theory.is_prime(_as_integer(n, "Primality test"))
+
+    def factorize(self, n):
+        """
+        Factor a positive integer into primes.
+
+        Args:
+            n (int): Positive integer
+
+        Returns:
+            list: Prime factors in ascending order, with multiplicity
+
+        Raises:
+            ValueError: If n is not a positive integer, or factoring takes
+                longer than the time budget
+        """
+        n = _as_integer(n, "Factorize")
+        if n < 1:
+            raise ValueError("Factorize requires a positive integer")
+        return number_theory.factorize(n)
+
+    def gcd(self, a, b):
+        """
+        Calculate the greatest common divisor of two integers.
+
+        Args:
+            a (int): First integer
+            b (int): Second integer
+
+        Returns:
+            int: Greatest common divisor (non-negative)
+        """
+        return math.gcd(_as_integer(a, "GCD"), _as_integer(b, "GCD"))
+
+    def lcm(self, a, b):
+        """
+        Calculate the least common multiple of two integers.
+
+        Args:
+            a (int): First integer
+            b (int): Second integer
+
+        Returns:
+            int: Least common multiple (non-negative)
+        """
+        return math.lcm(_as_integer(a, "LCM"), _as_integer(b, "LCM"))
+
+    def mod_inverse(self, a, m):
+        """
+        Calculate the modular multiplicative inverse of a modulo m.
+
+        Args:
+            a (int): Value to invert
+            m (int): Positive modulus
+
+        Returns:
+            int: x in [0, m) with a * x = 1 (mod m)
+
+        Raises:
+            ValueError: If m is not positive or a has no inverse modulo m
+        """
+        a = _as_integer(a, "Modular inverse")
+        m = _as_integer(m, "Modular inverse")
+        if m < 1:
+            raise ValueError("Modular inverse requires a positive modulus")
+        return number_theory.mod_inverse(a, m)
+
+    def arithmetic_series(self, first, difference, count):
+        """
+        Sum an arithmetic series in O(1).
+
+        Args:
+            first (int/float): First term
+            difference (int/float): Common difference
+            count (int): Number of terms
+
+        Returns:
+            int/float: first + (first + difference) + ... (exact for integers)
+
+        Raises:
+            ValueError: If count is negative or not an integer
+        """
+        return series.arithmetic_sum(first, difference, count)
+
+    def geometric_series(self, first, ratio, count=None):
+        """
+        Sum a geometric series in O(1).
+
+        Args:
+            first (int/float): First term
+            ratio (int/float): Common ratio
+            count (int): Number of terms (None for the infinite series)
+
+        Returns:
+            int/float: first + first * ratio + ... (exact for integers)
+
+        Raises:
+            ValueError: If count is invalid or an infinite series diverges
+        """
+        return series.geometric_sum(first, ratio, count)
+
+    def power_sum(self, power, n):
+        """
+        Sum the first n integers raised to a power (Faulhaber's formula).
+
+        Args:
+            power (int): Non-negative exponent
+            n (int): Number of terms
+
+        Returns:
+            int: 1**power + 2**power + ... + n**power
+
+        Raises:
+            ValueError: If power or n is negative, not an integer or too large
+        """
+        return series.power_sum(power, n)
+
+    def series_sum(self, term, start, stop, max_terms=None):
+        """
+        Sum an expression in k over k = start .. stop.
+
+        Args:
+            term (str): Expression in k, e.g. "1 / k**2"
+            start (int): First k
+            stop (int): Last k (inclusive)
+            max_terms (int): Most terms summed when there is no closed form
+
+        Returns:
+            int/float: The sum
+
+        Raises:
+            ValueError: If the term is invalid or undefined in the range, or
+                the range is too long
+        """
+        return series.term_sum(term, start, stop, max_terms=max_terms)[0]
+
+    def compound_growth(self, principal, rate, periods):
+        """
+        Grow a principal at a fixed rate per period.
+
+        Args:
+            principal (int/float): Starting amount
+            rate (int/float): Growth per period (0.05 for 5%)
+            periods (int/float): Number of periods
+
+        Returns:
+            float: principal * (1 + rate) ** periods
+
+        Raises:
+            ValueError: If rate <= -1 or the result overflows
+        """
+        return series.compound_growth(principal, rate, periods)
+
+    def compound_interest(self, principal, annual_rate, years, periods_per_year=1):
+        """
+        Calculate the future value of a principal under compound interest.
+
+        Args:
+            principal (int/float): Starting amount
+            annual_rate (int/float): Nominal annual rate (0.05 for 5%)
+            years (int/float): Duration in years
+            periods_per_year (int): Compounding periods per year (12 = monthly)
+
+        Returns:
+            float: Principal plus compounded interest
+
+        Raises:
+            ValueError: If an argument is invalid or the result overflows
+        """
+        return finance.compound_interest(principal, annual_rate, years, periods_per_year)
+
+    def annuity_payment(self, principal, rate, periods):
+        """
+        Calculate the level payment that repays a loan.
+
+        Args:
+            principal (int/float): Amount borrowed
+            rate (int/float): Interest rate per period (0.04 / 12 for 4% monthly)
+            periods (int): Number of payments
+
+        Returns:
+            float: Payment per period
+
+        Raises:
+            ValueError: If periods is not a positive integer or rate <= -1
+        """
+        return finance.annuity_payment(principal, rate, periods)
+
+
+def _as_integer(value, what):
+    """Convert an int or integral float to an int."""
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    if not isinstance(value, int) or isinstance(value, bool):
+        raise ValueError(f"{what} requires an integer")
+    return value
+
+
+def _as_natural(value, what):
+    """Convert an int or integral float to a non-negative int."""
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    if not isinstance(value, int) or isinstance(value, bool) or value < 0:
+        raise ValueError(f"{what} requires a non-negative integer")
+    return value
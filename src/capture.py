@@ -0,0 +1,292 @@
+"""
+Opt-in capture of calculation traffic to a compact binary log.
+
+Each captured request keeps only what is needed to replay it and check the
+answer: when it arrived, which endpoint, the calculation fields (operation,
+operands, representation), the response status, the server-side latency and
+a short digest of the response body. Headers, cookies, client addresses and
+any other payload keys are never written.
+
+File layout: an 8-byte magic, then records of
+    "<dBHI8sI" (timestamp, kind, status, latency_us, digest, payload length)
+followed by the payload as compact JSON. Every record is appended with a
+single write to a file opened with O_APPEND, so gunicorn workers can share
+one capture file.
+"""
+
+import hashlib
+import json
+import os
+import random
+import struct
+import threading
+import time
+from collections import namedtuple
+from urllib.parse import urlencode
+
+MAGIC = b"CALCCAP\x01"
+RECORD = struct.Struct("<dBHI8sI")
+
+# Endpoint kinds
+API = 0
+FORM = 1
+KIND_NAMES = {API: "api", FORM: "form"}
+
+# Request fields kept; everything else in the payload is dropped
+CAPTURED_FIELDS = ("operation", "num1", "num2", "representation", "significant_digits")
+# Longer field values are cut short and the record marked as truncated
+MAX_FIELD_CHARS = 8192
+# Larger ints are summarised (CPython refuses int -> str past 4300 digits)
+MAX_INT_BITS = 14000
+
+# Digest written when the body was not available (streamed responses)
+NO_DIGEST = bytes(8)
+
+CapturedRequest = namedtuple(
+    "CapturedRequest", "timestamp kind status latency_us digest fields truncated"
+)
+
+
+def response_digest(body):
+    """
+    Short digest identifying a response body.
+
+    Returns:
+        bytes: 8-byte BLAKE2b digest
+    """
+    return hashlib.blake2b(body, digest_size=8).digest()
+
+
+def sanitize(fields):
+    """
+    Keep only the calculation fields of a request payload.
+
+    Values keep their JSON type (a boolean operand stays a boolean) so a
+    replay sends what the client sent; only oversized values are cut.
+
+    Args:
+        fields (Mapping): Parsed JSON object or form fields
+
+    Returns:
+        tuple: (dict of kept fields, whether any value was truncated)
+    """
+    kept = {}
+    truncated = False
+    if not hasattr(fields, "get"):
+        return kept, truncated
+    for name in CAPTURED_FIELDS:
+        value = fields.get(name)
+        if value is None:
+            continue
+        if isinstance(value, (list, dict)):
+            value, cut = _sanitize_container(value)
+            truncated = truncated or cut
+        elif not isinstance(value, (int, float, str)):
+            value = str(value)
+        if isinstance(value, int) and value.bit_length() > MAX_INT_BITS:
+            value = f"<{value.bit_length()}-bit int>"
+            truncated = True
+        elif isinstance(value, str) and len(value) > MAX_FIELD_CHARS:
+            value = value[:MAX_FIELD_CHARS]
+            truncated = True
+        kept[name] = value
+    return kept, truncated
+
+
+def _sanitize_container(value):
+    # JSON arrays/objects replay as-is when small; otherwise their text is cut
+    try:
+        text = json.dumps(value, separators=(",", ":"))
+    except ValueError:
+        return f"<unencodable {type(value).__name__}>", True
+    if len(text) > MAX_FIELD_CHARS:
+        return text[:MAX_FIELD_CHARS], True
+    return value, False
+
+
+class TrafficCapture:
+    """
+    Append sanitized calculation requests to a capture file.
+
+    Sampling happens before any encoding, and records stop being written
+    once the file reaches max_bytes (counted as dropped).
+    """
+
+    def __init__(self, path, sample_rate=1.0, max_bytes=256 * 1024 * 1024):
+        """
+        Args:
+            path (str): Capture file (created with a header if missing)
+            sample_rate (float): Fraction of requests captured
+            max_bytes (int): File size at which capture stops
+
+        Raises:
+            ValueError: If an existing file is not a capture file
+        """
+        self.path = path
+        self.sample_rate = sample_rate
+        self.max_bytes = max_bytes
+        binary = getattr(os, "O_BINARY", 0)
+        try:
+            fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY | binary, 0o600)
+        except FileExistsError:
+            with open(path, "rb") as f:
+                if f.read(len(MAGIC)) != MAGIC:
+                    raise ValueError(f"{path} is not a capture file") from None
+        else:
+            os.write(fd, MAGIC)
+            os.close(fd)
+        self._fd = os.open(path, os.O_WRONLY | os.O_APPEND | binary)
+        self._lock = threading.Lock()
+        self._full = False
+        self.captured = 0
+        self.dropped = 0
+
+    def record(self, kind, fields, status, latency_ms, body=None):
+        """
+        Capture one request, subject to sampling.
+
+        Timestamps are wall-clock so captures from several workers merge.
+        Recording happens once the response is ready, so the arrival time is
+        taken as now minus latency_ms.
+
+        Args:
+            kind (int): API or FORM
+            fields (Mapping): Request payload (sanitized here)
+            status (int): HTTP status of the response
+            latency_ms (float): Server-side handling time
+            body (bytes): Response body, or None if it was streamed
+        """
+        # Sampling only, not security sensitive
+        if self.sample_rate < 1.0 and random.random() >= self.sample_rate:  # nosec B311
+            return
+        if self._full:
+            self.dropped += 1
+            return
+        kept, truncated = sanitize(fields)
+        if truncated:
+            kept["truncated"] = True
+        payload = json.dumps(kept, separators=(",", ":")).encode()
+        digest = NO_DIGEST if body is None else response_digest(body)
+        data = RECORD.pack(
+            time.time() - latency_ms / 1000,
+            kind,
+            status,
+            min(int(latency_ms * 1000), 0xFFFFFFFF),
+            digest,
+            len(payload),
+        ) + payload
+        with self._lock:
+            if self._full or os.fstat(self._fd).st_size + len(data) > self.max_bytes:
+                self._full = True
+                self.dropped += 1
+                return
+            os.write(self._fd, data)
+            self.captured += 1
+
+    def stats(self):
+        """
+        Return capture counters.
+
+        Returns:
+            dict: path, captured, dropped, full
+        """
+        return {
+            "path": self.path,
+            "captured": self.captured,
+            "dropped": self.dropped,
+            "full": self._full,
+        }
+
+    def close(self):
+        """Close the capture file."""
+        with self._lock:
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
+
+
+def read(path):
+    """
+    Iterate over the requests in a capture file.
+
+    Returns:
+        Iterator of CapturedRequest
+
+    Raises:
+        ValueError: If the file is not a capture file or is corrupt
+    """
+    with open(path, "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} is not a capture file")
+        while True:
+            head = f.read(RECORD.size)
+            if not head:
+                return
+            if len(head) < RECORD.size:
+                # A record cut short by a crash mid-write ends the capture
+                return
+            timestamp, kind, status, latency_us, digest, length = RECORD.unpack(head)
+            payload = f.read(length)
+            if len(payload) < length:
+                return
+            try:
+                fields = json.loads(payload)
+            except ValueError:
+                raise ValueError(f"Corrupt capture record at offset {f.tell()}") from None
+            truncated = bool(fields.pop("truncated", False))
+            yield CapturedRequest(
+                timestamp, kind, status, latency_us, digest, fields, truncated
+            )
+
+
+def load(path):
+    """
+    Read a whole capture, ordered by arrival time.
+
+    Returns:
+        list: CapturedRequest records
+    """
+    return sorted(read(path), key=lambda record: record.timestamp)
+
+
+def replay_request(record):
+    """
+    Rebuild the HTTP request for a captured record.
+
+    Returns:
+        tuple: (method, path, body bytes, headers)
+    """
+    if record.kind == FORM:
+        return (
+            "POST",
+            "/",
+            urlencode(record.fields).encode(),
+            {"Content-Type": "application/x-www-form-urlencoded"},
+        )
+    return (
+        "POST",
+        "/api/calculate",
+        json.dumps(record.fields, separators=(",", ":")).encode(),
+        {"Content-Type": "application/json"},
+    )
+
+
+def from_env():
+    """
+    Build a TrafficCapture configured from environment variables.
+
+    CAPTURE_PATH enables capture (unset disables it). CAPTURE_SAMPLE is the
+    fraction of requests captured and CAPTURE_MAX_MB the file size at which
+    capture stops.
+
+    Returns:
+        TrafficCapture or None
+    """
+    path = os.getenv("CAPTURE_PATH", "")
+    if not path:
+        return None
+    return TrafficCapture(
+        path,
+        sample_rate=float(os.getenv("CAPTURE_SAMPLE", "1.0")),
+        max_bytes=int(float(os.getenv("CAPTURE_MAX_MB", "256")) * 1024 * 1024),
+    )
@@ -0,0 +1,250 @@
+"""
+Financial schedules: compound interest, annuity payments and amortization.
+
+Amortization tables are built from the closed-form outstanding balance
+
+    B(k) = P * (expm1(n * L) - expm1(k * L)) / expm1(n * L),  L = log1p(r)
+
+evaluated for a chunk of periods at a time with NumPy, so a row costs the
+same whatever its position and memory stays bounded for any loan length.
+Balances are unrounded; the last one is exactly zero.
+"""
+
+import array
+import json
+import math
+import sys
+
+from src import series
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+HAS_NUMPY = np is not None
+
+DEFAULT_CHUNK_SIZE = 8192
+SCHEDULE_COLUMNS = ("period", "payment", "interest", "principal", "balance")
+
+
+def _positive_periods(periods, what="periods"):
+    if isinstance(periods, float) and periods.is_integer():
+        periods = int(periods)
+    if isinstance(periods, bool) or not isinstance(periods, int) or periods < 1:
+        raise ValueError(f"{what} must be a positive integer")
+    return periods
+
+
+def compound_interest(principal, annual_rate, years, periods_per_year=1):
+    """
+    Future value of a principal compounded periods_per_year times a year.
+
+    Args:
+        principal (int/float): Starting amount
+        annual_rate (int/float): Nominal annual rate (0.05 for 5%)
+        years (int/float): Duration in years
+        periods_per_year (int): Compounding periods per year (12 = monthly)
+
+    Returns:
+        float: principal * (1 + annual_rate / m) ** (years * m)
+
+    Raises:
+        ValueError: If an argument is invalid or the result overflows
+    """
+    periods_per_year = _positive_periods(periods_per_year, "periods_per_year")
+    if isinstance(annual_rate, bool) or not isinstance(annual_rate, (int, float)):
+        raise ValueError("annual_rate must be a number")
+    if isinstance(years, bool) or not isinstance(years, (int, float)):
+        raise ValueError("years must be a number")
+    return series.compound_growth(
+        principal, annual_rate / periods_per_year, years * periods_per_year
+    )
+
+
+class Loan:
+    """A fully amortizing loan with level payments at the end of each period."""
+
+    def __init__(self, principal, rate, periods):
+        """
+        Args:
+            principal (int/float): Amount borrowed
+            rate (int/float): Interest rate per period (0.04 / 12 monthly)
+            periods (int): Number of payments
+
+        Raises:
+            ValueError: If an argument is invalid or the loan is too long for
+                its rate to be represented
+        """
+        for name, value in (("principal", principal), ("rate", rate)):
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                raise ValueError(f"{name} must be a number")
+            if not math.isfinite(value):
+                raise ValueError(f"{name} must be finite")
+        if rate <= -1:
+            raise ValueError("rate must be greater than -1")
+        self.principal = float(principal)
+        self.rate = float(rate)
+        self.periods = _positive_periods(periods)
+        self._log_growth = math.log1p(self.rate)
+        try:
+            self._total_growth = math.expm1(self.periods * self._log_growth)
+        except OverflowError:
+            raise ValueError("Loan is too long for its rate to be represented") from None
+        if self.rate == 0:
+            self.payment = self.principal / self.periods
+        else:
+            self.payment = self.principal * self.rate / -math.expm1(
+                -self.periods * self._log_growth
+            )
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Build a Loan from a {"principal", "rate", "periods"} JSON object.
+
+        Raises:
+            ValueError: If a field is missing or invalid
+        """
+        if not isinstance(data, dict):
+            raise ValueError("Each loan must be a JSON object")
+        missing = [key for key in ("principal", "rate", "periods") if data.get(key) is None]
+        if missing:
+            raise ValueError(f"Missing required loan fields: {', '.join(missing)}")
+        return cls(data["principal"], data["rate"], data["periods"])
+
+    @property
+    def total_interest(self):
+        """Interest paid over the life of the loan."""
+        return self.payment * self.periods - self.principal
+
+    def summary(self):
+        """
+        Returns:
+            dict: principal, rate, periods, payment and total_interest
+        """
+        return {
+            "principal": self.principal,
+            "rate": self.rate,
+            "periods": self.periods,
+            "payment": self.payment,
+            "total_interest": self.total_interest,
+        }
+
+    def balances(self, first, last):
+        """
+        Outstanding balance after periods first .. last - 1 (0 = at the start).
+
+        Returns:
+            ndarray or list of floats
+        """
+        if HAS_NUMPY:
+            ks = np.arange(first, last, dtype=float)
+            if self.rate == 0:
+                values = self.principal * (1 - ks / self.periods)
+            else:
+                values = self.principal * (
+                    (self._total_growth - np.expm1(ks * self._log_growth))
+                    / self._total_growth
+                )
+        elif self.rate == 0:
+            values = [self.principal * (1 - k / self.periods) for k in range(first, last)]
+        else:
+            values = [
+                self.principal
+                * ((self._total_growth - math.expm1(k * self._log_growth)) / self._total_growth)
+                for k in range(first, last)
+            ]
+        if first <= self.periods < last:
+            # np.expm1 and math.expm1 may differ in the last place
+            values[self.periods - first] = 0.0
+        return values
+
+
+def annuity_payment(principal, rate, periods):
+    """
+    Level payment that repays a principal over a number of periods.
+
+    Args:
+        principal (int/float): Amount borrowed
+        rate (int/float): Interest rate per period
+        periods (int): Number of payments
+
+    Returns:
+        float: Payment per period
+
+    Raises:
+        ValueError: If an argument is invalid
+    """
+    return Loan(principal, rate, periods).payment
+
+
+def schedule(loan, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    The amortization table of a loan, one chunk of periods at a time.
+
+    Args:
+        loan (Loan): The loan
+        chunk_size (int): Rows per chunk
+
+    Returns:
+        Iterator of column tuples in SCHEDULE_COLUMNS order
+    """
+    for first in range(1, loan.periods + 1, chunk_size):
+        last = min(first + chunk_size, loan.periods + 1)
+        # One balance before the chunk plus one per period in it
+        balances = loan.balances(first - 1, last)
+        before, after = balances[:-1], balances[1:]
+        if HAS_NUMPY:
+            periods = np.arange(first, last, dtype=float)
+            payments = np.full(len(periods), loan.payment)
+            interest = before * loan.rate
+            principal = before - after
+        else:
+            periods = [float(k) for k in range(first, last)]
+            payments = [loan.payment] * len(periods)
+            interest = [b * loan.rate for b in before]
+            principal = [b - a for b, a in zip(before, after)]
+        yield periods, payments, interest, principal, after
+
+
+def encode_json_rows(columns):
+    """
+    Encode a schedule chunk as comma-separated JSON rows.
+
+    Returns:
+        str: [period, payment, interest, principal, balance] rows without
+        the enclosing brackets (non-finite values become null)
+    """
+    if HAS_NUMPY:
+        columns = [column.tolist() for column in columns]
+    periods, *values = columns
+    rows = list(zip(map(int, periods), *values))
+    try:
+        # The C encoder formats floats much faster than repr() per value
+        return json.dumps(rows, separators=(",", ":"), allow_nan=False)[1:-1]
+    except ValueError:
+        return ",".join(
+            f"[{row[0]},{','.join(map(_json_number, row[1:]))}]" for row in rows
+        )
+
+
+def encode_binary_rows(columns):
+    """
+    Encode a schedule chunk as little-endian float64 rows.
+
+    Returns:
+        bytes: 40 bytes per row, columns in SCHEDULE_COLUMNS order
+    """
+    if HAS_NUMPY:
+        return np.column_stack(columns).astype("<f8", copy=False).tobytes()
+    values = array.array("d")
+    for row in zip(*columns):
+        values.extend(row)
+    if sys.byteorder != "little":
+        values.byteswap()
+    return values.tobytes()
+
+
+def _json_number(value):
+    return repr(value) if math.isfinite(value) else "null"
@@ -0,0 +1,204 @@
+"""
+Representations of very large integer results.
+
+CPython converts int to decimal text in quadratic time, and refuses outright
+beyond sys.get_int_max_str_digits() (4300 digits by default). The helpers
+here avoid that conversion:
+
+- digit_count() and scientific() work from logarithms and the top bits of
+  the number, so they cost little more than reading its bit length;
+- to_hex() is linear (power-of-two bases are not limited);
+- to_decimal() / iter_decimal() produce the full decimal text with a
+  divide-and-conquer conversion on top of the decimal module, whose
+  number-theoretic-transform multiplication makes it sub-quadratic.
+"""
+
+import decimal
+import math
+from decimal import Decimal
+
+REPRESENTATIONS = ("auto", "scientific", "digits", "hex", "decimal")
+
+DEFAULT_SIGNIFICANT_DIGITS = 17
+MAX_SIGNIFICANT_DIGITS = 1000
+
+# Below this many bits the divide-and-conquer recursion bottoms out
+_BASE_BITS = 512
+
+_EXACT = decimal.Context(
+    prec=decimal.MAX_PREC, Emax=decimal.MAX_EMAX, Emin=decimal.MIN_EMIN
+)
+
+
+def digit_count(n):
+    """
+    Count the decimal digits of n (ignoring the sign) without converting it.
+
+    Args:
+        n (int): Integer
+
+    Returns:
+        int: Number of decimal digits (1 for 0)
+    """
+    n = abs(n)
+    if n < 10**15:
+        return len(str(n))
+    log = math.log10(n)
+    digits = math.floor(log)
+    # log10 of a huge int is only accurate to a few ulps; settle values that
+    # land next to an integer with an exact comparison
+    if abs(log - round(log)) < 1e-9 + log * 1e-13:
+        digits = round(log)
+        return digits + 1 if n >= 10**digits else digits
+    return digits + 1
+
+
+def scientific(n, significant_digits=DEFAULT_SIGNIFICANT_DIGITS):
+    """
+    Format n in scientific notation without a full decimal conversion.
+
+    The top bits of n are scaled by a power of two in a limited-precision
+    decimal context, so the cost depends on significant_digits rather than
+    on the size of n.
+
+    Args:
+        n (int): Integer
+        significant_digits (int): Digits in the mantissa
+
+    Returns:
+        str: e.g. "4.0238726007709377e+2567"
+
+    Raises:
+        ValueError: If significant_digits is out of range
+    """
+    if not 1 <= significant_digits <= MAX_SIGNIFICANT_DIGITS:
+        raise ValueError(
+            f"significant_digits must be between 1 and {MAX_SIGNIFICANT_DIGITS}"
+        )
+    guard = significant_digits + 20
+    context = decimal.Context(
+        prec=guard, Emax=decimal.MAX_EMAX, Emin=decimal.MIN_EMIN
+    )
+    # Keep enough leading bits that truncating the rest cannot show up
+    keep = math.ceil(guard * math.log2(10)) + 64
+    shift = max(abs(n).bit_length() - keep, 0)
+    top = abs(n) >> shift
+    value = context.multiply(Decimal(top), context.power(Decimal(2), shift))
+
+    rounded = decimal.Context(
+        prec=significant_digits, Emax=decimal.MAX_EMAX, Emin=decimal.MIN_EMIN
+    ).plus(value)
+    text = f"{rounded:.{significant_digits - 1}e}"
+    return f"-{text}" if n < 0 else text
+
+
+def to_hex(n):
+    """
+    Format n in hexadecimal.
+
+    Returns:
+        str: e.g. "0x1f" or "-0x1f"
+    """
+    return hex(n)
+
+
+def to_decimal(n):
+    """
+    Convert n to its full decimal text in sub-quadratic time.
+
+    n is split recursively into high and low halves by bit position (cheap
+    shifts); the halves are converted and recombined as hi * 2^k + lo using
+    decimal arithmetic, with the powers of two memoised.
+
+    Args:
+        n (int): Integer of any size
+
+    Returns:
+        str: Decimal digits, with a leading "-" for negative n
+    """
+    if n < 0:
+        return "-" + to_decimal(-n)
+    powers = {}
+
+    def power_of_two(bits):
+        result = powers.get(bits)
+        if result is None:
+            if bits <= _BASE_BITS:
+                result = Decimal(1 << bits)
+            elif bits - 1 in powers:
+                result = _EXACT.add(powers[bits - 1], powers[bits - 1])
+            else:
+                half = bits >> 1
+                result = _EXACT.multiply(power_of_two(half), power_of_two(bits - half))
+            powers[bits] = result
+        return result
+
+    def convert(m, bits):
+        if bits <= _BASE_BITS:
+            return Decimal(m)
+        half = bits >> 1
+        hi = m >> half
+        lo = m - (hi << half)
+        return _EXACT.add(
+            convert(lo, half),
+            _EXACT.multiply(convert(hi, bits - half), power_of_two(half)),
+        )
+
+    return str(convert(n, n.bit_length()))
+
+
+def iter_decimal(n, chunk_size=65536):
+    """
+    Yield the full decimal text of n in chunks, for streaming downloads.
+
+    Args:
+        n (int): Integer of any size
+        chunk_size (int): Characters per chunk
+
+    Yields:
+        str: Consecutive slices of to_decimal(n)
+    """
+    text = to_decimal(n)
+    for start in range(0, len(text), chunk_size):
+        yield text[start:start + chunk_size]
+
+
+def represent(value, mode="auto", significant_digits=DEFAULT_SIGNIFICANT_DIGITS,
+              max_exact_digits=4300):
+    """
+    Choose a JSON-friendly representation of a calculation result.
+
+    Only integers are affected; every other result is returned as-is.
+
+    Args:
+        value: Calculation result
+        mode (str): One of REPRESENTATIONS except "decimal" (which is
+            streamed by the caller). "auto" keeps integers up to
+            max_exact_digits exact and falls back to "scientific"
+        significant_digits (int): Mantissa digits for "scientific"
+        max_exact_digits (int): Largest integer "auto" returns exactly
+
+    Returns:
+        tuple: (representation, mode actually used, digit count or None)
+
+    Raises:
+        ValueError: If mode is unknown
+    """
+    if mode not in REPRESENTATIONS or mode == "decimal":
+        raise ValueError(
+            f"Unknown representation: {mode} "
+            f"(expected one of {', '.join(REPRESENTATIONS)})"
+        )
+    if not isinstance(value, int) or isinstance(value, bool):
+        return value, "exact", None
+
+    digits = digit_count(value)
+    if mode == "auto":
+        if digits <= max_exact_digits:
+            return value, "exact", digits
+        mode = "scientific"
+    if mode == "scientific":
+        return scientific(value, significant_digits), mode, digits
+    if mode == "hex":
+        return to_hex(value), mode, digits
+    return digits, mode, digits
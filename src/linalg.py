@@ -0,0 +1,335 @@
+"""
+Linear algebra operations on dense matrices.
+
+Uses NumPy when it is installed and falls back to pure-Python kernels
+(cache-blocked multiplication, LU decomposition with partial pivoting)
+otherwise. Matrices are accepted as lists of rows and returned the same way;
+with the NumPy backend, ndarray inputs give ndarray results so large packed
+matrices never round-trip through Python lists.
+"""
+
+import array
+import sys
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+HAS_NUMPY = np is not None
+
+# Tile edge for the pure-Python multiply; keeps the rows being combined hot
+BLOCK_SIZE = 64
+
+
+class MatrixCalculator:
+    """
+    Matrix operations: multiply, transpose, determinant, solve and inverse.
+    """
+
+    def __init__(self, use_numpy=None, block_size=BLOCK_SIZE):
+        """
+        Args:
+            use_numpy (bool): Force (True) or disable (False) the NumPy
+                kernels; None picks NumPy when it is installed
+            block_size (int): Tile edge for the pure-Python multiply
+
+        Raises:
+            ValueError: If NumPy is requested but not installed
+        """
+        if use_numpy is None:
+            use_numpy = HAS_NUMPY
+        if use_numpy and not HAS_NUMPY:
+            raise ValueError("NumPy is not installed")
+        self.use_numpy = use_numpy
+        self.block_size = block_size
+
+    def multiply(self, a, b):
+        """
+        Multiply two matrices.
+
+        Args:
+            a (list): m x n matrix
+            b (list): n x p matrix
+
+        Returns:
+            list: m x p product a @ b
+
+        Raises:
+            ValueError: If the inner dimensions do not match
+        """
+        if self.use_numpy:
+            x, y = _as_array(a, "a"), _as_array(b, "b")
+            if x.shape[1] != y.shape[0]:
+                raise ValueError(
+                    f"Cannot multiply {_shape_str(x)} matrix by {_shape_str(y)} matrix"
+                )
+            return _like(x @ y, a, b)
+        a = _check_matrix(a, "a")
+        b = _check_matrix(b, "b")
+        if len(a[0]) != len(b):
+            raise ValueError(
+                f"Cannot multiply {_shape_str(a)} matrix by {_shape_str(b)} matrix"
+            )
+        return _blocked_multiply(a, b, self.block_size)
+
+    def transpose(self, a):
+        """
+        Transpose a matrix.
+
+        Args:
+            a (list): m x n matrix
+
+        Returns:
+            list: n x m transpose of a
+        """
+        if self.use_numpy:
+            return _like(np.ascontiguousarray(_as_array(a, "a").T), a)
+        a = _check_matrix(a, "a")
+        return [list(column) for column in zip(*a)]
+
+    def determinant(self, a):
+        """
+        Calculate the determinant of a square matrix.
+
+        Args:
+            a (list): n x n matrix
+
+        Returns:
+            float: Determinant of a
+
+        Raises:
+            ValueError: If a is not square
+        """
+        a = _check_square(a, "Determinant", self.use_numpy)
+        if self.use_numpy:
+            return float(np.linalg.det(a))
+        lu, _, sign = _lu_decompose(a)
+        if lu is None:
+            return 0.0
+        det = float(sign)
+        for i, row in enumerate(lu):
+            det *= row[i]
+        return det
+
+    def solve(self, a, b):
+        """
+        Solve the linear system a @ x = b.
+
+        Args:
+            a (list): n x n coefficient matrix
+            b (list): n x k right-hand side matrix
+
+        Returns:
+            list: n x k solution x
+
+        Raises:
+            ValueError: If a is not square, is singular, or b has the wrong
+                number of rows
+        """
+        x = _check_square(a, "Solve", self.use_numpy)
+        y = _as_array(b, "b") if self.use_numpy else _check_matrix(b, "b")
+        if len(y) != len(x):
+            raise ValueError(
+                f"Cannot solve {_shape_str(x)} system with {_shape_str(y)} right-hand side"
+            )
+        if self.use_numpy:
+            try:
+                return _like(np.linalg.solve(x, y), a, b)
+            except np.linalg.LinAlgError as e:
+                raise ValueError("Matrix is singular") from e
+        return _lu_solve(x, y)
+
+    def inverse(self, a):
+        """
+        Calculate the inverse of a square matrix.
+
+        Args:
+            a (list): n x n matrix
+
+        Returns:
+            list: n x n inverse of a
+
+        Raises:
+            ValueError: If a is not square or is singular
+        """
+        x = _check_square(a, "Inverse", self.use_numpy)
+        if self.use_numpy:
+            try:
+                return _like(np.linalg.inv(x), a)
+            except np.linalg.LinAlgError as e:
+                raise ValueError("Matrix is singular") from e
+        n = len(x)
+        identity = [[1.0 if i == j else 0.0 for j in range(n)] for i in range(n)]
+        return _lu_solve(x, identity)
+
+
+def pack(matrix):
+    """
+    Pack a matrix as little-endian float64 values in row-major order.
+
+    Args:
+        matrix (list): Matrix as a list of rows (or a 2-D ndarray)
+
+    Returns:
+        bytes: 8 * rows * cols bytes
+    """
+    if HAS_NUMPY and isinstance(matrix, np.ndarray):
+        return np.ascontiguousarray(matrix, dtype="<f8").tobytes()
+    values = array.array("d", (value for row in matrix for value in row))
+    if sys.byteorder != "little":
+        values.byteswap()
+    return values.tobytes()
+
+
+def unpack(data, rows, cols):
+    """
+    Unpack little-endian float64 values in row-major order into a matrix.
+
+    Args:
+        data (bytes): Packed values
+        rows (int): Number of rows
+        cols (int): Number of columns
+
+    Returns:
+        Matrix as a 2-D ndarray when NumPy is installed, else a list of rows
+
+    Raises:
+        ValueError: If the data length does not match the shape
+    """
+    if rows < 1 or cols < 1:
+        raise ValueError("Matrix dimensions must be positive")
+    if len(data) != rows * cols * 8:
+        raise ValueError(
+            f"Expected {rows * cols * 8} bytes for a {rows}x{cols} matrix, got {len(data)}"
+        )
+    if HAS_NUMPY:
+        return np.frombuffer(data, dtype="<f8").astype(float).reshape(rows, cols)
+    values = array.array("d")
+    values.frombytes(data)
+    if sys.byteorder != "little":
+        values.byteswap()
+    return [values[i * cols:(i + 1) * cols].tolist() for i in range(rows)]
+
+
+def _shape_str(a):
+    return f"{len(a)}x{len(a[0])}"
+
+
+def _check_matrix(a, name):
+    if not isinstance(a, (list, tuple)) or not a:
+        raise ValueError(f"Matrix {name} must be a non-empty list of rows")
+    width = None
+    rows = []
+    for row in a:
+        if not isinstance(row, (list, tuple)) or not row:
+            raise ValueError(f"Matrix {name} must be a non-empty list of rows")
+        if width is None:
+            width = len(row)
+        elif len(row) != width:
+            raise ValueError(f"Matrix {name} rows must all have the same length")
+        rows.append([float(value) for value in row])
+    return rows
+
+
+def _as_array(a, name):
+    try:
+        x = np.asarray(a, dtype=float)
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Matrix {name} must be a non-empty list of rows") from e
+    if x.ndim != 2 or x.size == 0:
+        raise ValueError(f"Matrix {name} must be a non-empty list of rows")
+    return x
+
+
+def _like(result, *inputs):
+    """Return ndarrays to ndarray callers and lists to everyone else."""
+    if any(isinstance(x, np.ndarray) for x in inputs):
+        return result
+    return result.tolist()
+
+
+def _check_square(a, what, use_numpy=False):
+    a = _as_array(a, "a") if use_numpy else _check_matrix(a, "a")
+    if len(a) != len(a[0]):
+        raise ValueError(f"{what} requires a square matrix, got {_shape_str(a)}")
+    return a
+
+
+def _blocked_multiply(a, b, block):
+    """i-k-j multiply over block x block tiles, accumulating row slices."""
+    n_rows, n_inner, n_cols = len(a), len(b), len(b[0])
+    c = [[0.0] * n_cols for _ in range(n_rows)]
+    for jj in range(0, n_cols, block):
+        j_end = min(jj + block, n_cols)
+        for kk in range(0, n_inner, block):
+            k_end = min(kk + block, n_inner)
+            b_tile = [row[jj:j_end] for row in b[kk:k_end]]
+            for i in range(n_rows):
+                a_row = a[i]
+                acc = c[i][jj:j_end]
+                for k in range(kk, k_end):
+                    scale = a_row[k]
+                    if scale == 0.0:
+                        continue
+                    acc = [x + scale * y for x, y in zip(acc, b_tile[k - kk])]
+                c[i][jj:j_end] = acc
+    return c
+
+
+def _lu_decompose(a):
+    """
+    In-place style Doolittle LU with partial pivoting on a copy of a.
+
+    Returns (lu, permutation, sign), or (None, None, 0) if a is singular.
+    """
+    n = len(a)
+    lu = [row[:] for row in a]
+    perm = list(range(n))
+    sign = 1
+    for col in range(n):
+        pivot = max(range(col, n), key=lambda r: abs(lu[r][col]))
+        if lu[pivot][col] == 0.0:
+            return None, None, 0
+        if pivot != col:
+            lu[col], lu[pivot] = lu[pivot], lu[col]
+            perm[col], perm[pivot] = perm[pivot], perm[col]
+            sign = -sign
+        pivot_row = lu[col]
+        inv_pivot = 1.0 / pivot_row[col]
+        tail = pivot_row[col + 1:]
+        for r in range(col + 1, n):
+            row = lu[r]
+            factor = row[col] * inv_pivot
+            row[col] = factor
+            if factor != 0.0:
+                row[col + 1:] = [x - factor * y for x, y in zip(row[col + 1:], tail)]
+    return lu, perm, sign
+
+
+def _lu_solve(a, b):
+    lu, perm, _ = _lu_decompose(a)
+    if lu is None:
+        raise ValueError("Matrix is singular")
+    n = len(lu)
+    # Forward substitution (unit lower triangle) on the permuted rows of b
+    y = [b[p][:] for p in perm]
+    for i in range(1, n):
+        row = lu[i]
+        acc = y[i]
+        for k in range(i):
+            factor = row[k]
+            if factor != 0.0:
+                acc = [x - factor * v for x, v in zip(acc, y[k])]
+        y[i] = acc
+    # Back substitution (upper triangle)
+    for i in range(n - 1, -1, -1):
+        row = lu[i]
+        acc = y[i]
+        for k in range(i + 1, n):
+            factor = row[k]
+            if factor != 0.0:
+                acc = [x - factor * v for x, v in zip(acc, y[k])]
+        inv_diag = 1.0 / row[i]
+        y[i] = [x * inv_diag for x in acc]
+    return y
@@ -0,0 +1,240 @@
+"""
+Number-theory primitives: primality, factorization, gcd/lcm and modular
+inverse.
+
+All operations share one small prime sieve. Primality uses
+Miller-Rabin (deterministic below 3.3 * 10^24, which covers every 64-bit
+value, probabilistic above). Factorization strips small primes with the
+sieve and splits the rest with Pollard-Brent rho under a time budget, so a
+hard input cannot tie up a worker indefinitely.
+"""
+
+import math
+import secrets
+import time
+
+# First twelve primes: a deterministic Miller-Rabin base set for n < 3.3e24
+_DETERMINISTIC_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+_DETERMINISTIC_LIMIT = 3317044064679887385961981
+
+# Extra random Miller-Rabin rounds for larger n (error < 4^-rounds)
+PROBABILISTIC_ROUNDS = 24
+
+# Primes below this are stripped by trial division before Pollard-Brent
+TRIAL_DIVISION_LIMIT = 10000
+
+DEFAULT_TIME_BUDGET = 2.0
+
+
+class FactorizationTimeout(ValueError):
+    """Raised when factorization exceeds its time budget."""
+
+
+class PrimeSieve:
+    """
+    Sieve of Eratosthenes over odd numbers, built once.
+
+    One byte per odd number (index i stands for 2i + 1), so a sieve up to
+    N costs N / 2 bytes. It only needs to reach past TRIAL_DIVISION_LIMIT:
+    beyond that, Miller-Rabin and Pollard-Brent are faster than any lookup
+    or trial division the sieve could feed.
+    """
+
+    def __init__(self, limit=1 << 16):
+        """
+        Args:
+            limit (int): Numbers below this are sieved
+        """
+        size = (limit + 1) // 2
+        flags = bytearray(b"\x01") * size
+        flags[0] = 0  # index 0 is the number 1
+        for p in range(3, math.isqrt(limit - 1) + 1, 2):
+            if flags[p // 2]:
+                start = p * p // 2
+                flags[start::p] = bytes(len(range(start, size, p)))
+        self._flags = flags
+        self.limit = limit
+
+    def is_prime(self, n):
+        """
+        Look n up in the sieve.
+
+        Args:
+            n (int): Number below self.limit
+
+        Returns:
+            bool: Whether n is prime
+        """
+        if n < 2:
+            return False
+        if n % 2 == 0:
+            return n == 2
+        return bool(self._flags[n // 2])
+
+    def primes(self, limit):
+        """
+        Yield the primes below limit.
+
+        Args:
+            limit (int): Exclusive upper bound, at most self.limit
+
+        Raises:
+            ValueError: If limit is beyond the sieve
+        """
+        if limit > self.limit:
+            raise ValueError(f"Sieve only covers numbers below {self.limit}")
+        if limit > 2:
+            yield 2
+        flags = self._flags
+        for i in range(1, (limit + 1) // 2):
+            if flags[i]:
+                yield 2 * i + 1
+
+
+SIEVE = PrimeSieve()
+
+
+def is_prime(n, rounds=PROBABILISTIC_ROUNDS):
+    """
+    Test n for primality.
+
+    Args:
+        n (int): Integer to test
+        rounds (int): Random Miller-Rabin rounds used above the
+            deterministic range
+
+    Returns:
+        bool: True if n is prime (probably prime above 3.3e24)
+    """
+    if n < SIEVE.limit:
+        return SIEVE.is_prime(n)
+    for p in _DETERMINISTIC_BASES:
+        if n % p == 0:
+            return False
+
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+
+    for a in _DETERMINISTIC_BASES:
+        if not _miller_rabin_round(n, a, d, s):
+            return False
+    if n < _DETERMINISTIC_LIMIT:
+        return True
+    for _ in range(rounds):
+        if not _miller_rabin_round(n, 2 + secrets.randbelow(n - 3), d, s):
+            return False
+    return True
+
+
+def factorize(n, time_budget=DEFAULT_TIME_BUDGET):
+    """
+    Factor n into primes.
+
+    Args:
+        n (int): Integer >= 1
+        time_budget (float): Seconds allowed before giving up
+
+    Returns:
+        list: Prime factors in ascending order, with multiplicity
+
+    Raises:
+        FactorizationTimeout: If the budget runs out
+    """
+    deadline = time.monotonic() + time_budget
+    factors = []
+    for p in SIEVE.primes(TRIAL_DIVISION_LIMIT):
+        if p * p > n:
+            break
+        while n % p == 0:
+            factors.append(p)
+            n //= p
+
+    pending = [n] if n > 1 else []
+    while pending:
+        m = pending.pop()
+        if is_prime(m):
+            factors.append(m)
+            continue
+        root = math.isqrt(m)
+        if root * root == m:
+            pending.extend((root, root))
+            continue
+        divisor = _pollard_brent(m, deadline)
+        pending.extend((divisor, m // divisor))
+    return sorted(factors)
+
+
+def mod_inverse(a, m):
+    """
+    Calculate the inverse of a modulo m.
+
+    Args:
+        a (int): Value to invert
+        m (int): Modulus (>= 1)
+
+    Returns:
+        int: x in [0, m) with a * x = 1 (mod m)
+
+    Raises:
+        ValueError: If a and m are not coprime
+    """
+    if math.gcd(a, m) != 1:
+        raise ValueError(f"{a} has no inverse modulo {m}")
+    return pow(a, -1, m)
+
+
+def _miller_rabin_round(n, a, d, s):
+    x = pow(a, d, n)
+    if x in (1, n - 1):
+        return True
+    for _ in range(s - 1):
+        x = x * x % n
+        if x == n - 1:
+            return True
+    return False
+
+
+def _check_deadline(deadline):
+    if time.monotonic() > deadline:
+        raise FactorizationTimeout("Factorization exceeded its time budget")
+
+
+def _pollard_brent(n, deadline):
+    """
+    Find a non-trivial factor of the odd composite n (Brent's variant).
+
+    The deadline is checked every batch steps, so a hard input overruns its
+    budget by one batch rather than by a whole r-doubling.
+    """
+    while True:
+        y = 1 + secrets.randbelow(n - 1)
+        c = 1 + secrets.randbelow(n - 1)
+        batch = 128
+        g = r = q = 1
+        x = ys = y
+        while g == 1:
+            x = y
+            for k in range(0, r, batch):
+                _check_deadline(deadline)
+                for _ in range(min(batch, r - k)):
+                    y = (y * y + c) % n
+            k = 0
+            while k < r and g == 1:
+                _check_deadline(deadline)
+                ys = y
+                for _ in range(min(batch, r - k)):
+                    y = (y * y + c) % n
+                    q = q * abs(x - y) % n
+                g = math.gcd(q, n)
+                k += batch
+            r *= 2
+        if g == n:
+            # The batched product overshot; step back one term at a time
+            g = 1
+            while g == 1:
+                ys = (ys * ys + c) % n
+                g = math.gcd(abs(x - ys), n)
+        if g != n:
+            return g
@@ -0,0 +1,173 @@
+"""
+Continuous low-overhead sampling profiler.
+
+Request handlers mark their thread as active for the duration of a request;
+a background thread wakes up every interval, reads the current frame of each
+active thread from sys._current_frames() and counts the stack. Nothing runs
+on the request path except two set operations, and the sampler measures its
+own CPU time (time.thread_time, so waiting on the GIL does not count) so the
+overhead can be checked in production.
+
+Stacks are kept in the collapsed format ("root;caller;callee count") that
+flamegraph.pl and speedscope read directly.
+"""
+
+import os
+import sys
+import threading
+import time
+from collections import Counter
+
+# Samples whose stack would exceed max_stacks distinct entries land here
+OVERFLOW_STACK = "[other stacks]"
+
+
+class SamplingProfiler:
+    """
+    Statistical profiler for request-handling threads.
+
+    Stack counts are bounded by max_stacks distinct stacks (later new stacks
+    are counted under OVERFLOW_STACK) and max_depth frames per stack.
+    """
+
+    def __init__(self, interval=0.01, max_stacks=10000, max_depth=64):
+        """
+        Args:
+            interval (float): Seconds between samples
+            max_stacks (int): Distinct stacks kept before new ones are lumped
+            max_depth (int): Innermost frames kept per stack
+        """
+        self.interval = interval
+        self.max_stacks = max_stacks
+        self.max_depth = max_depth
+        self._active = set()
+        self._counts = Counter()
+        self._labels = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._pid = None
+        self._start_lock = threading.Lock()
+        self._started_at = None
+        self.samples = 0
+        self.sample_cpu_seconds = 0.0
+
+    def enter(self):
+        """Mark the calling thread as handling a request."""
+        self._ensure_sampler()
+        self._active.add(threading.get_ident())
+
+    def exit(self):
+        """Mark the calling thread as idle again."""
+        self._active.discard(threading.get_ident())
+
+    def sample(self):
+        """Take one sample of every active thread (called by the sampler)."""
+        start = time.thread_time()
+        active = tuple(self._active)
+        if active:
+            frames = sys._current_frames()
+            stacks = [
+                self._collapse(frames[ident]) for ident in active if ident in frames
+            ]
+            with self._lock:
+                for stack in stacks:
+                    if stack not in self._counts and len(self._counts) >= self.max_stacks:
+                        stack = OVERFLOW_STACK
+                    self._counts[stack] += 1
+                    self.samples += 1
+        self.sample_cpu_seconds += time.thread_time() - start
+
+    def collapsed(self):
+        """
+        Return the aggregated stacks in collapsed (flamegraph) format.
+
+        Returns:
+            str: One "frame;frame;frame count" line per stack, busiest first
+        """
+        with self._lock:
+            items = self._counts.most_common()
+        return "".join(f"{stack} {count}\n" for stack, count in items)
+
+    def reset(self):
+        """Discard the aggregated stacks and counters."""
+        with self._lock:
+            self._counts.clear()
+            self.samples = 0
+            self.sample_cpu_seconds = 0.0
+            self._started_at = time.perf_counter()
+
+    def stats(self):
+        """
+        Return a snapshot of the profiler counters.
+
+        Returns:
+            dict: interval_ms, samples, stacks, active threads and the
+            sampler's own CPU time as overhead_pct of wall time
+        """
+        elapsed = time.perf_counter() - self._started_at if self._started_at else 0.0
+        return {
+            "interval_ms": self.interval * 1000,
+            "samples": self.samples,
+            "stacks": len(self._counts),
+            "active_threads": len(self._active),
+            "overhead_pct": round(100 * self.sample_cpu_seconds / elapsed, 4) if elapsed else 0.0,
+        }
+
+    def close(self, timeout=2.0):
+        """Stop the sampler thread."""
+        self._stop.set()
+        thread = self._thread
+        if thread is not None and thread.is_alive():
+            thread.join(timeout)
+
+    def _collapse(self, frame):
+        labels = self._labels
+        names = []
+        while frame is not None and len(names) < self.max_depth:
+            code = frame.f_code
+            label = labels.get(code)
+            if label is None:
+                module = frame.f_globals.get("__name__", "?")
+                label = labels[code] = f"{module}:{code.co_name}"
+            names.append(label)
+            frame = frame.f_back
+        names.reverse()
+        return ";".join(names)
+
+    def _ensure_sampler(self):
+        # Threads do not survive fork, so gunicorn workers start their own
+        if self._thread is not None and self._pid == os.getpid():
+            return
+        with self._start_lock:
+            if self._thread is not None and self._pid == os.getpid():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="sampling-profiler", daemon=True
+            )
+            self._pid = os.getpid()
+            self._started_at = time.perf_counter()
+            self._thread.start()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+
+def from_env():
+    """
+    Build a SamplingProfiler configured from environment variables.
+
+    PROFILER=1 enables profiling (off by default). PROFILER_INTERVAL_MS sets
+    the sampling interval and PROFILER_MAX_STACKS bounds the stack table.
+
+    Returns:
+        SamplingProfiler or None
+    """
+    if os.getenv("PROFILER", "0") != "1":
+        return None
+    return SamplingProfiler(
+        interval=float(os.getenv("PROFILER_INTERVAL_MS", "10")) / 1000,
+        max_stacks=int(os.getenv("PROFILER_MAX_STACKS", "10000")),
+    )
@@ -0,0 +1,387 @@
+"""
+Series and summation with closed forms where they exist.
+
+Arithmetic and geometric series, sums of powers (Faulhaber's formula with
+cached Bernoulli numbers) and compound growth are O(1) in the number of
+terms. Sums of an arbitrary term expression in k fall back to chunked
+vectorized evaluation, with each chunk summed pairwise and the chunk totals
+combined with math.fsum, unless the expression is a power of k or a constant
+raised to k, which use the closed forms.
+"""
+
+import ast
+import math
+import threading
+from fractions import Fraction
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+HAS_NUMPY = np is not None
+
+# Largest exact integer result (bits) the integer closed forms will build
+MAX_EXACT_BITS = 1 << 22
+# Float geometric sums switch to expm1/log1p when |ratio - 1| is below this;
+# further out, (r^n - 1) / (r - 1) is the more accurate of the two
+NEAR_ONE = 1 / 16
+# Highest power accepted by power_sum (the Bernoulli numbers it needs are
+# computed once, about 0.4s for p = 500)
+MAX_POWER = 500
+# Longest accepted term expression
+MAX_EXPRESSION_CHARS = 200
+DEFAULT_CHUNK_SIZE = 65536
+
+CLOSED_FORM = "closed_form"
+SUMMATION = "summation"
+
+_bernoulli = [Fraction(1)]
+_bernoulli_lock = threading.Lock()
+
+
+def _number(value, what):
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise ValueError(f"{what} must be a number")
+    if isinstance(value, float) and not math.isfinite(value):
+        raise ValueError(f"{what} must be finite")
+    return value
+
+
+def _count(value, what="count"):
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    if isinstance(value, bool) or not isinstance(value, int) or value < 0:
+        raise ValueError(f"{what} must be a non-negative integer")
+    return value
+
+
+def _finite_result(value):
+    if isinstance(value, float) and not math.isfinite(value):
+        raise ValueError("Result is too large to represent")
+    return value
+
+
+def arithmetic_sum(first, difference, count):
+    """
+    Sum of first, first + difference, ... (count terms).
+
+    Returns:
+        int when every argument is an int, else float
+
+    Raises:
+        ValueError: If an argument is invalid or the result overflows
+    """
+    first = _number(first, "first")
+    difference = _number(difference, "difference")
+    count = _count(count)
+    if isinstance(first, int) and isinstance(difference, int):
+        return count * (2 * first + (count - 1) * difference) // 2
+    try:
+        return _finite_result(count * (first + 0.5 * (count - 1) * difference))
+    except OverflowError:
+        raise ValueError("Result is too large to represent") from None
+
+
+def geometric_sum(first, ratio, count=None):
+    """
+    Sum of first * ratio**k for k = 0 .. count-1, or the infinite series
+    first / (1 - ratio) when count is None.
+
+    Returns:
+        int when every argument is an int, else float
+
+    Raises:
+        ValueError: If an argument is invalid, an infinite series diverges
+            (|ratio| >= 1) or the result is too large
+    """
+    first = _number(first, "first")
+    ratio = _number(ratio, "ratio")
+    if count is None:
+        if abs(ratio) >= 1:
+            raise ValueError("Infinite geometric series requires |ratio| < 1")
+        return first / (1 - ratio)
+    count = _count(count)
+    if ratio == 1:
+        return first * count
+    if isinstance(first, int) and isinstance(ratio, int):
+        if count * math.log2(abs(ratio) or 1) > MAX_EXACT_BITS:
+            raise ValueError(f"Result exceeds the {MAX_EXACT_BITS}-bit limit")
+        return first * ((ratio**count - 1) // (ratio - 1))
+    try:
+        if abs(ratio - 1) < NEAR_ONE:
+            # (r^n - 1) / (r - 1) without cancellation when r is close to 1
+            factor = math.expm1(count * math.log1p(ratio - 1)) / (ratio - 1)
+        else:
+            factor = (ratio**count - 1) / (ratio - 1)
+        return _finite_result(first * factor)
+    except OverflowError:
+        raise ValueError("Result is too large to represent") from None
+
+
+def bernoulli(index):
+    """
+    The Bernoulli number B_index (B_1 = +1/2 convention), cached.
+
+    Returns:
+        Fraction
+    """
+    with _bernoulli_lock:
+        # Recurrence sum_{j<=m} C(m+1, j) B_j = m + 1 (B_1 = +1/2 convention)
+        for m in range(len(_bernoulli), index + 1):
+            if m > 1 and m % 2:
+                _bernoulli.append(Fraction(0))
+                continue
+            total = sum(
+                math.comb(m + 1, j) * _bernoulli[j] for j in range(m) if _bernoulli[j]
+            )
+            _bernoulli.append((m + 1 - total) / (m + 1))
+        return _bernoulli[index]
+
+
+def power_sum(power, n):
+    """
+    Sum of k**power for k = 1 .. n (Faulhaber's formula).
+
+    Returns:
+        int: Exact sum
+
+    Raises:
+        ValueError: If power or n is invalid or out of range
+    """
+    power = _count(power, "power")
+    n = _count(n, "n")
+    if power > MAX_POWER:
+        raise ValueError(f"power is limited to {MAX_POWER}")
+    if (power + 1) * n.bit_length() > MAX_EXACT_BITS:
+        raise ValueError(f"Result exceeds the {MAX_EXACT_BITS}-bit limit")
+    if n == 0:
+        return 0
+    bernoulli(power)
+    total = sum(
+        math.comb(power + 1, j) * _bernoulli[j] * n ** (power + 1 - j)
+        for j in range(power + 1)
+    )
+    return int(total / (power + 1))
+
+
+def compound_growth(principal, rate, periods):
+    """
+    principal * (1 + rate)**periods, accurate for small rates.
+
+    Returns:
+        float
+
+    Raises:
+        ValueError: If rate <= -1 or the result overflows
+    """
+    principal = _number(principal, "principal")
+    rate = _number(rate, "rate")
+    periods = _number(periods, "periods")
+    if rate <= -1:
+        raise ValueError("rate must be greater than -1")
+    try:
+        return _finite_result(principal * math.exp(periods * math.log1p(rate)))
+    except OverflowError:
+        raise ValueError("Result is too large to represent") from None
+
+
+class Term:
+    """
+    A safe arithmetic expression in k, e.g. "1 / k**2" or "sin(k) / k".
+
+    Supports + - * / % **, unary minus, numbers, k, pi, e and the functions
+    in FUNCTIONS. It is evaluated over NumPy arrays when NumPy is installed.
+    """
+
+    FUNCTIONS = ("sqrt", "exp", "log", "sin", "cos", "tan", "abs")
+    _BINARY = {
+        ast.Add: lambda a, b: a + b,
+        ast.Sub: lambda a, b: a - b,
+        ast.Mult: lambda a, b: a * b,
+        ast.Div: lambda a, b: a / b,
+        ast.Mod: lambda a, b: a % b,
+        ast.Pow: lambda a, b: a**b,
+    }
+
+    def __init__(self, expression):
+        """
+        Raises:
+            ValueError: If the expression is too long or not allowed
+        """
+        if not isinstance(expression, str) or not expression.strip():
+            raise ValueError("term must be a non-empty expression in k")
+        if len(expression) > MAX_EXPRESSION_CHARS:
+            raise ValueError(f"term is limited to {MAX_EXPRESSION_CHARS} characters")
+        self.expression = expression
+        try:
+            self.tree = ast.parse(expression.strip(), mode="eval").body
+        except SyntaxError:
+            raise ValueError(f"Invalid term: {expression}") from None
+        self._check(self.tree)
+
+    def _check(self, node):
+        if isinstance(node, ast.BinOp) and type(node.op) in self._BINARY:
+            self._check(node.left)
+            self._check(node.right)
+        elif isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.USub, ast.UAdd)):
+            self._check(node.operand)
+        elif isinstance(node, ast.Constant) and type(node.value) in (int, float):
+            pass
+        elif isinstance(node, ast.Name) and node.id in ("k", "pi", "e"):
+            pass
+        elif (
+            isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Name)
+            and node.func.id in self.FUNCTIONS
+            and len(node.args) == 1
+            and not node.keywords
+        ):
+            self._check(node.args[0])
+        else:
+            raise ValueError(f"Unsupported syntax in term: {ast.unparse(node)}")
+
+    def evaluate(self, ks):
+        """
+        Evaluate the term for every k.
+
+        Args:
+            ks: ndarray of float64 (or a list of floats without NumPy)
+
+        Returns:
+            ndarray or list of floats; invalid points are NaN
+        """
+        if HAS_NUMPY:
+            with np.errstate(all="ignore"):
+                return np.asarray(self._eval(self.tree, ks, np), dtype=float) + 0 * ks
+        return [self._eval_scalar(k) for k in ks]
+
+    def _eval_scalar(self, k):
+        try:
+            value = self._eval(self.tree, k, math)
+        except (ValueError, ArithmeticError):
+            return math.nan
+        # A negative base to a fractional power is complex in Python
+        return value if isinstance(value, float) else math.nan
+
+    def _eval(self, node, k, lib):
+        if isinstance(node, ast.BinOp):
+            return self._BINARY[type(node.op)](
+                self._eval(node.left, k, lib), self._eval(node.right, k, lib)
+            )
+        if isinstance(node, ast.UnaryOp):
+            value = self._eval(node.operand, k, lib)
+            return -value if isinstance(node.op, ast.USub) else value
+        if isinstance(node, ast.Constant):
+            return float(node.value)
+        if isinstance(node, ast.Name):
+            return {"k": k, "pi": math.pi, "e": math.e}[node.id]
+        name = "fabs" if node.func.id == "abs" and lib is math else node.func.id
+        return getattr(lib, name)(self._eval(node.args[0], k, lib))
+
+    def closed_form(self):
+        """
+        Recognise k, k**p (integer p >= 0) and c**k.
+
+        Returns:
+            tuple: ("power", p) or ("geometric", c), or None
+        """
+        node = self.tree
+        if isinstance(node, ast.Name) and node.id == "k":
+            return ("power", 1)
+        if not (isinstance(node, ast.BinOp) and isinstance(node.op, ast.Pow)):
+            return None
+        left, right = node.left, node.right
+        if (
+            isinstance(left, ast.Name)
+            and left.id == "k"
+            and isinstance(right, ast.Constant)
+            and type(right.value) is int
+            and 0 <= right.value <= MAX_POWER
+        ):
+            return ("power", right.value)
+        if (
+            isinstance(right, ast.Name)
+            and right.id == "k"
+            and isinstance(left, ast.Constant)
+            and type(left.value) in (int, float)
+        ):
+            return ("geometric", left.value)
+        return None
+
+
+def term_sum(term, start, stop, chunk_size=DEFAULT_CHUNK_SIZE, max_terms=None):
+    """
+    Sum term(k) for k = start .. stop inclusive.
+
+    Args:
+        term (Term or str): The term expression
+        start (int): First k
+        stop (int): Last k
+        chunk_size (int): Terms evaluated per vectorized chunk
+        max_terms (int): Largest number of terms summed without a closed form
+
+    Returns:
+        tuple: (sum, CLOSED_FORM or SUMMATION)
+
+    Raises:
+        ValueError: If the range or term is invalid, too many terms would
+            have to be summed, or a term is undefined (NaN) or the sum
+            overflows
+    """
+    if not isinstance(term, Term):
+        term = Term(term)
+    if isinstance(start, float) and start.is_integer():
+        start = int(start)
+    if isinstance(stop, float) and stop.is_integer():
+        stop = int(stop)
+    if not all(isinstance(v, int) and not isinstance(v, bool) for v in (start, stop)):
+        raise ValueError("start and stop must be integers")
+    if stop < start:
+        return 0, CLOSED_FORM
+
+    shape = term.closed_form()
+    if shape is not None and start >= 0:
+        kind, parameter = shape
+        if kind == "power":
+            total = power_sum(parameter, stop) - power_sum(parameter, max(start - 1, 0))
+            if parameter == 0 and start == 0:
+                total += 1
+            return total, CLOSED_FORM
+        if parameter != 0:
+            if isinstance(parameter, int):
+                if (stop + 1) * math.log2(abs(parameter)) > MAX_EXACT_BITS:
+                    raise ValueError(f"Result exceeds the {MAX_EXACT_BITS}-bit limit")
+                first = parameter**start
+            else:
+                try:
+                    first = parameter**start
+                except OverflowError:
+                    raise ValueError("Result is too large to represent") from None
+            return geometric_sum(first, parameter, stop - start + 1), CLOSED_FORM
+
+    count = stop - start + 1
+    if max_terms is not None and count > max_terms:
+        raise ValueError(
+            f"Sum has {count} terms; without a closed form the limit is {max_terms}"
+        )
+    partials = []
+    for first in range(start, stop + 1, chunk_size):
+        last = min(first + chunk_size, stop + 1)
+        if HAS_NUMPY:
+            values = term.evaluate(np.arange(first, last, dtype=float))
+            if not np.all(np.isfinite(values)):
+                _raise_invalid(values.tolist(), first)
+            partials.append(float(np.sum(values)))
+        else:
+            values = term.evaluate([float(k) for k in range(first, last)])
+            if not all(math.isfinite(v) for v in values):
+                _raise_invalid(values, first)
+            partials.append(math.fsum(values))
+    return _finite_result(math.fsum(partials)), SUMMATION
+
+
+def _raise_invalid(values, first):
+    for offset, value in enumerate(values):
+        if not math.isfinite(value):
+            raise ValueError(f"Term is undefined or infinite at k = {first + offset}")
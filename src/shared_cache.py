@@ -0,0 +1,446 @@
+"""
+Host-wide calculation result cache in a shared memory segment.
+
+Every gunicorn worker on the host attaches to the same fixed-size,
+open-addressing hash table, so a result computed by one worker is a hit for
+all of them.
+
+Layout (all little-endian):
+
+    header   64 bytes    magic, layout version, bucket count, bucket size,
+                         worker slot count, counters of retired workers
+    workers  40 B each   pid, hits, misses, stores, evictions; each worker
+                         owns one slot and is its only writer
+    buckets  128 B each  version, clock bit, value length, 16-byte key
+                         digest, JSON-encoded value
+
+Reads take no locks: a bucket's version is odd while it is being written,
+and a reader that sees the version change (or odd) treats the bucket as a
+miss (a seqlock). Writers take an fcntl byte-range lock on one of
+LOCK_STRIPES stripes of a side lock file, so concurrent stores to the same
+bucket from different processes are serialised. A key may live in any of
+PROBE_LIMIT consecutive buckets; when they are all full, a CLOCK sweep over
+them evicts the first bucket that has not been read since it was last
+passed over.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import struct
+import tempfile
+import threading
+from multiprocessing import resource_tracker, shared_memory
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows: single-process locking only
+    fcntl = None
+
+MAGIC = b"CALCSHM1"
+LAYOUT_VERSION = 1
+
+HEADER = struct.Struct("<8sIIII")
+HEADER_SIZE = 64
+
+# Counters of workers whose slots were recycled: hits, misses, stores, evictions
+RETIRED = struct.Struct("<QQQQ")
+_RETIRED_OFFSET = 24
+
+# pid, hits, misses, stores, evictions
+WORKER = struct.Struct("<I4xQQQQ")
+MAX_WORKERS = 128
+
+# version, clock bit, value length, key digest, value
+BUCKET = struct.Struct("<IBB2x16s104s")
+BUCKET_SIZE = BUCKET.size
+VALUE_SIZE = 104
+_KEY_OFFSET = 8
+_CLOCK_OFFSET = 4
+
+PROBE_LIMIT = 8
+LOCK_STRIPES = 256
+
+# Attempts to read a bucket that is being written before calling it a miss
+_READ_RETRIES = 3
+
+DEFAULT_BUCKETS = 65536
+DEFAULT_NAME = "calculator-results"
+
+_EMPTY_KEY = bytes(16)
+
+
+def key_digest(operation, num1, num2):
+    """
+    Hash a calculation into a cache key.
+
+    Integers are hashed from their bytes (repr() refuses ints past 4300
+    digits); other operands by repr(), which keeps 0.0 and -0.0 (and 1 and
+    1.0) apart.
+
+    Returns:
+        bytes: 16-byte digest (never all zeros, which marks an empty bucket)
+    """
+    h = hashlib.blake2b(digest_size=16)
+    for data in (operation.encode(), _operand_bytes(num1), _operand_bytes(num2)):
+        h.update(len(data).to_bytes(8, "little"))
+        h.update(data)
+    digest = h.digest()
+    return digest if digest != _EMPTY_KEY else b"\x01" + digest[1:]
+
+
+def _operand_bytes(value):
+    if type(value) is int:
+        return b"i" + value.to_bytes(value.bit_length() // 8 + 1, "little", signed=True)
+    return b"r" + repr(value).encode()
+
+
+class SharedResultCache:
+    """
+    Fixed-size result cache shared by every process that opens the same name.
+
+    Only values whose JSON encoding fits in VALUE_SIZE bytes are cached;
+    larger results are simply not stored.
+    """
+
+    def __init__(self, name, buckets=DEFAULT_BUCKETS, lock_path=None):
+        """
+        Attach to the named segment, creating it if this is the first process.
+
+        Args:
+            name (str): Shared memory segment name
+            buckets (int): Bucket count for a new segment (an existing
+                segment keeps its own)
+            lock_path (str): Stripe lock file (default: next to the system
+                temp dir, derived from name)
+
+        Raises:
+            ValueError: If an existing segment has a different layout
+        """
+        self.name = name
+        self.lock_path = lock_path or os.path.join(
+            tempfile.gettempdir(), f"{name}.lock"
+        )
+        self._lock_fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o600)
+        self._thread_locks = [threading.Lock() for _ in range(LOCK_STRIPES)]
+        # The extra byte after the stripes guards segment creation
+        self._with_file_lock(LOCK_STRIPES, self._open_segment, buckets)
+        self._buf = self._shm.buf
+        self._buckets_offset = HEADER_SIZE + MAX_WORKERS * WORKER.size
+        self._slot = None
+        self._slot_pid = None
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+
+    def get(self, key):
+        """
+        Look a key up without taking any lock.
+
+        Args:
+            key (bytes): Digest from key_digest()
+
+        Returns:
+            tuple: (True, value) on a hit, (False, None) on a miss
+        """
+        for index in self._probe(key):
+            found, value, empty = self._read_bucket(index, key)
+            if found:
+                self._count(hits=1)
+                return True, value
+            if empty:
+                break
+        self._count(misses=1)
+        return False, None
+
+    def put(self, key, value):
+        """
+        Store a value, evicting an older entry from the key's probe window
+        if needed.
+
+        Args:
+            key (bytes): Digest from key_digest()
+            value: JSON-serialisable result
+
+        Returns:
+            bool: Whether the value was stored
+        """
+        # Skip the (quadratic) text conversion of ints that cannot fit anyway
+        if isinstance(value, int) and value.bit_length() > VALUE_SIZE * 3:
+            return False
+        try:
+            raw = json.dumps(value, separators=(",", ":")).encode()
+        except (TypeError, ValueError):
+            return False
+        if len(raw) > VALUE_SIZE:
+            return False
+
+        buf = self._buf
+        window = self._probe(key)
+        index = None
+        for candidate in window:
+            stored = self._stored_key(candidate)
+            if stored == key:
+                return True
+            if stored == _EMPTY_KEY:
+                index = candidate
+                break
+        evicted = index is None
+        if evicted:
+            index = self._clock_victim(window)
+
+        offset = self._buckets_offset + index * BUCKET_SIZE
+        stripe = index % LOCK_STRIPES
+        with self._thread_locks[stripe]:
+            self._lock_file(stripe)
+            try:
+                # Another writer may have claimed an empty bucket meanwhile
+                if not evicted and self._stored_key(index) not in (_EMPTY_KEY, key):
+                    return False
+                version = struct.unpack_from("<I", buf, offset)[0]
+                struct.pack_into("<I", buf, offset, (version + 1) & 0xFFFFFFFF)
+                # Stored unreferenced: only a later read earns a second chance
+                BUCKET.pack_into(
+                    buf, offset, (version + 1) & 0xFFFFFFFF, 0, len(raw), key, raw
+                )
+                struct.pack_into("<I", buf, offset, (version + 2) & 0xFFFFFFFF)
+            finally:
+                self._unlock_file(stripe)
+        self._count(stores=1, evictions=1 if evicted else 0)
+        return True
+
+    def stats(self):
+        """
+        Return this worker's and the host-wide counters.
+
+        Returns:
+            dict: worker and host dicts of hits, misses, stores, evictions
+            and hit_rate (host totals include exited workers), plus the
+            bucket count and number of live attached workers
+        """
+        host = dict(
+            zip(
+                ("hits", "misses", "stores", "evictions"),
+                RETIRED.unpack_from(self._buf, _RETIRED_OFFSET),
+            )
+        )
+        workers = 0
+        for slot in range(MAX_WORKERS):
+            pid, hits, misses, stores, evictions = WORKER.unpack_from(
+                self._buf, HEADER_SIZE + slot * WORKER.size
+            )
+            if pid == 0:
+                continue
+            workers += _alive(pid)
+            host["hits"] += hits
+            host["misses"] += misses
+            host["stores"] += stores
+            host["evictions"] += evictions
+        worker = {
+            "hits": self.hits,
+            "misses": self.misses,
+            "stores": self.stores,
+            "evictions": self.evictions,
+        }
+        for counters in (worker, host):
+            lookups = counters["hits"] + counters["misses"]
+            counters["hit_rate"] = round(counters["hits"] / lookups, 4) if lookups else 0.0
+        return {
+            "buckets": self.buckets,
+            "workers": workers,
+            "worker": worker,
+            "host": host,
+        }
+
+    def close(self):
+        """Detach from the segment (it stays available to other processes)."""
+        self._buf = None
+        self._shm.close()
+        os.close(self._lock_fd)
+
+    def unlink(self):
+        """Remove the segment and lock file from the host."""
+        # unlink() unregisters the segment again; keep the tracker consistent
+        resource_tracker.register(self._shm._name, "shared_memory")
+        self._shm.unlink()
+        try:
+            os.unlink(self.lock_path)
+        except FileNotFoundError:
+            pass
+
+    def _open_segment(self, buckets):
+        size = HEADER_SIZE + MAX_WORKERS * WORKER.size + buckets * BUCKET_SIZE
+        try:
+            self._shm = shared_memory.SharedMemory(self.name, create=True, size=size)
+            HEADER.pack_into(
+                self._shm.buf, 0, MAGIC, LAYOUT_VERSION, buckets, BUCKET_SIZE, MAX_WORKERS
+            )
+        except FileExistsError:
+            self._shm = shared_memory.SharedMemory(self.name)
+        # Before Python 3.13 every attaching process registers the segment
+        # with its resource tracker, which unlinks it when that process
+        # exits - under the feet of every other worker. Lifetime is managed
+        # explicitly with unlink() instead.
+        try:
+            resource_tracker.unregister(self._shm._name, "shared_memory")
+        except Exception:  # pylint: disable=broad-except  # pragma: no cover
+            pass
+
+        magic, version, count, bucket_size, workers = HEADER.unpack_from(self._shm.buf, 0)
+        if (magic, version, bucket_size, workers) != (
+            MAGIC, LAYOUT_VERSION, BUCKET_SIZE, MAX_WORKERS
+        ):
+            self._shm.close()
+            raise ValueError(f"Shared memory segment {self.name} has an unknown layout")
+        self.buckets = count
+
+    def _probe(self, key):
+        start = int.from_bytes(key[:8], "little") % self.buckets
+        return [(start + i) % self.buckets for i in range(min(PROBE_LIMIT, self.buckets))]
+
+    def _read_bucket(self, index, key):
+        """Seqlock read of one bucket: (found, value, bucket is empty)."""
+        buf = self._buf
+        offset = self._buckets_offset + index * BUCKET_SIZE
+        for _ in range(_READ_RETRIES):
+            version = struct.unpack_from("<I", buf, offset)[0]
+            if version & 1:
+                continue
+            _, _, length, stored_key, raw = BUCKET.unpack_from(buf, offset)
+            if struct.unpack_from("<I", buf, offset)[0] != version:
+                continue
+            if stored_key != key:
+                return False, None, stored_key == _EMPTY_KEY
+            buf[offset + _CLOCK_OFFSET] = 1
+            return True, json.loads(raw[:length]), False
+        # Still being rewritten: treat as a miss rather than wait
+        return False, None, False
+
+    def _stored_key(self, index):
+        offset = self._buckets_offset + index * BUCKET_SIZE + _KEY_OFFSET
+        return bytes(self._buf[offset:offset + 16])
+
+    def _clock_victim(self, window):
+        # Second chance: clear reference bits until an unreferenced bucket
+        # turns up; after one full pass every bit is clear
+        buf = self._buf
+        for index in window + window[:1]:
+            offset = self._buckets_offset + index * BUCKET_SIZE + _CLOCK_OFFSET
+            if buf[offset] == 0:
+                return index
+            buf[offset] = 0
+        return window[0]
+
+    def _count(self, hits=0, misses=0, stores=0, evictions=0):
+        slot = self._worker_slot()
+        self.hits += hits
+        self.misses += misses
+        self.stores += stores
+        self.evictions += evictions
+        if slot is not None:
+            WORKER.pack_into(
+                self._buf,
+                HEADER_SIZE + slot * WORKER.size,
+                os.getpid(),
+                self.hits,
+                self.misses,
+                self.stores,
+                self.evictions,
+            )
+
+    def _worker_slot(self):
+        pid = os.getpid()
+        if self._slot_pid == pid:
+            return self._slot
+        # A forked worker starts its own counters in its own slot
+        self.hits = self.misses = self.stores = self.evictions = 0
+        self._slot = self._with_file_lock(LOCK_STRIPES, self._claim_slot, pid)
+        self._slot_pid = pid
+        return self._slot
+
+    def _claim_slot(self, pid):
+        # Prefer never-used slots; recycle a dead worker's slot (or one left
+        # by an earlier process with our pid) only after folding its counters
+        # into the retired totals, so host-wide numbers keep their history
+        free = None
+        for slot in range(MAX_WORKERS):
+            owner = WORKER.unpack_from(self._buf, HEADER_SIZE + slot * WORKER.size)[0]
+            if owner == 0:
+                free = slot
+                break
+            if free is None and (owner == pid or not _alive(owner)):
+                free = slot
+        if free is None:
+            return None
+        offset = HEADER_SIZE + free * WORKER.size
+        counters = WORKER.unpack_from(self._buf, offset)[1:]
+        retired = RETIRED.unpack_from(self._buf, _RETIRED_OFFSET)
+        RETIRED.pack_into(
+            self._buf, _RETIRED_OFFSET, *(a + b for a, b in zip(retired, counters))
+        )
+        WORKER.pack_into(self._buf, offset, pid, 0, 0, 0, 0)
+        return free
+
+    def _with_file_lock(self, stripe, func, *args):
+        self._lock_file(stripe)
+        try:
+            return func(*args)
+        finally:
+            self._unlock_file(stripe)
+
+    def _lock_file(self, stripe):
+        if fcntl is not None:
+            fcntl.lockf(self._lock_fd, fcntl.LOCK_EX, 1, stripe)
+
+    def _unlock_file(self, stripe):
+        if fcntl is not None:
+            fcntl.lockf(self._lock_fd, fcntl.LOCK_UN, 1, stripe)
+
+
+def _alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def from_env():
+    """
+    Attach to the shared result cache configured by environment variables.
+
+    SHARED_CACHE=1 enables it (off by default). SHARED_CACHE_NAME names the
+    segment and SHARED_CACHE_BUCKETS sizes a new one.
+
+    Returns:
+        SharedResultCache or None
+    """
+    if os.getenv("SHARED_CACHE", "0") != "1":
+        return None
+    return SharedResultCache(
+        os.getenv("SHARED_CACHE_NAME", DEFAULT_NAME),
+        int(os.getenv("SHARED_CACHE_BUCKETS", str(DEFAULT_BUCKETS))),
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Shared result cache tools")
+    parser.add_argument("command", choices=["stats", "unlink"])
+    parser.add_argument("--name", default=os.getenv("SHARED_CACHE_NAME", DEFAULT_NAME))
+    args = parser.parse_args(argv)
+
+    cache = SharedResultCache(args.name)
+    if args.command == "stats":
+        print(json.dumps(cache.stats(), indent=2))
+    else:
+        cache.unlink()
+        print(f"Removed shared memory segment {args.name}")
+    cache.close()
+
+
+if __name__ == "__main__":
+    main()
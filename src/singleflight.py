@@ -0,0 +1,92 @@
+"""
+Single-flight request coalescing.
+
+Concurrent callers asking for the same key share one in-progress computation
+instead of each running it independently.
+"""
+
+import threading
+
+
+class _Call:
+    """An in-progress computation that followers can wait on."""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent identical calls into a single execution.
+
+    The first caller for a key (the leader) runs the function; callers that
+    arrive with the same key while it is running wait for it and receive the
+    same result, or have the same exception raised.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self.executed = 0
+        self.coalesced = 0
+
+    def do(self, key, func, *args):
+        """
+        Run func(*args), or wait for an identical in-flight call.
+
+        Args:
+            key (hashable): Identity of the computation
+            func (callable): Function to run if no call is in flight
+            *args: Arguments passed to func
+
+        Returns:
+            The result of func(*args)
+
+        Raises:
+            Whatever exception func raised for this key
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = _Call()
+                self._calls[key] = call
+                self.executed += 1
+                leader = True
+            else:
+                self.coalesced += 1
+                leader = False
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func(*args)
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    def stats(self):
+        """
+        Return a snapshot of the coalescing counters.
+
+        Returns:
+            dict: executed, coalesced and in_flight counts
+        """
+        with self._lock:
+            return {
+                "executed": self.executed,
+                "coalesced": self.coalesced,
+                "in_flight": len(self._calls),
+            }
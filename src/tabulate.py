@@ -0,0 +1,200 @@
+"""
+Range tabulation: evaluate an operation over a sweep of inputs.
+
+A RangeSpec describes the swept column (start/stop/step, linspace or
+logspace). tabulate() evaluates the operation chunk by chunk with the
+vectorized kernels, so memory stays bounded however long the sweep is.
+"""
+
+import array
+import math
+import sys
+
+from src import vectorized
+
+np = vectorized.np
+
+DEFAULT_CHUNK_SIZE = 65536
+RANGE_KINDS = ("range", "linspace", "logspace")
+
+
+class RangeSpec:
+    """
+    A sweep of input values.
+
+    kind "range": start, start + step, ... while below stop (like range())
+    kind "linspace": num evenly spaced values from start to stop inclusive
+    kind "logspace": base ** v for v in linspace(start, stop, num)
+    """
+
+    def __init__(self, kind, start, stop, step=None, num=None, base=10.0):
+        """
+        Raises:
+            ValueError: If the specification is incomplete or inconsistent
+        """
+        if kind not in RANGE_KINDS:
+            raise ValueError(f"Unknown range kind: {kind}")
+        self.kind = kind
+        self.start = _finite(start, "start")
+        self.stop = _finite(stop, "stop")
+        self.base = _finite(base, "base")
+
+        if kind == "range":
+            if step is None:
+                raise ValueError("Range kind 'range' requires step")
+            self.step = _finite(step, "step")
+            if self.step == 0:
+                raise ValueError("Range step must be a non-zero finite number")
+            count = (self.stop - self.start) / self.step
+            if not math.isfinite(count):
+                raise ValueError("Range has too many values")
+            self.count = max(0, math.ceil(count))
+        else:
+            if num is None:
+                raise ValueError(f"Range kind '{kind}' requires num")
+            self.count = int(_finite(num, "num"))
+            if self.count < 1:
+                raise ValueError("Range num must be at least 1")
+            self.step = (
+                (self.stop - self.start) / (self.count - 1) if self.count > 1 else 0.0
+            )
+            if not math.isfinite(self.step):
+                raise ValueError("Range is too wide to divide evenly")
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Build a RangeSpec from a JSON object.
+
+        Args:
+            data (dict): {"kind", "start", "stop", "step"|"num", "base"}
+
+        Returns:
+            RangeSpec
+        """
+        if not isinstance(data, dict):
+            raise ValueError("Missing required field: range")
+        try:
+            return cls(
+                data.get("kind", "linspace"),
+                data["start"],
+                data["stop"],
+                step=data.get("step"),
+                num=data.get("num"),
+                base=data.get("base", 10.0),
+            )
+        except KeyError as e:
+            raise ValueError(f"Range requires {e.args[0]}") from e
+
+    def chunk(self, first, last):
+        """
+        Values with indices first..last-1.
+
+        Returns:
+            ndarray when NumPy is installed, else a list of floats
+        """
+        if np is not None:
+            values = self.start + np.arange(first, last, dtype=float) * self.step
+            if self.kind == "linspace" and last == self.count and self.count > 1:
+                values[-1] = self.stop
+            if self.kind == "logspace":
+                values = np.power(self.base, values)
+            return values
+        values = [self.start + i * self.step for i in range(first, last)]
+        if self.kind == "linspace" and last == self.count and self.count > 1:
+            values[-1] = self.stop
+        if self.kind == "logspace":
+            values = [self.base**v for v in values]
+        return values
+
+
+def _finite(value, name):
+    """Convert a range field to a finite float, or raise ValueError."""
+    try:
+        value = float(value)
+    except (TypeError, ValueError, OverflowError):
+        raise ValueError(f"Range {name} must be a number") from None
+    if not math.isfinite(value):
+        raise ValueError(f"Range {name} must be finite")
+    return value
+
+
+def tabulate(operation, operand, spec, variable="num1", chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Evaluate the operation over the sweep, one chunk at a time.
+
+    Args:
+        operation (str): Calculator operation
+        operand (float): The fixed operand (ignored for unary operations)
+        spec (RangeSpec): The swept values
+        variable (str): Which operand is swept, "num1" or "num2"
+        chunk_size (int): Rows evaluated per chunk
+
+    Returns:
+        Iterator of (xs, ys) pairs of equal-length columns; invalid points
+        are NaN. Arguments are validated before the iterator is returned.
+
+    Raises:
+        ValueError: If the operation, operand or variable is invalid
+    """
+    if variable not in ("num1", "num2"):
+        raise ValueError("variable must be num1 or num2")
+    if operation not in vectorized.VECTOR_OPERATIONS:
+        raise ValueError(f"Unknown operation: {operation}")
+    unary = operation in vectorized.UNARY_OPERATIONS
+    if variable == "num2" and unary:
+        raise ValueError(f"Operation {operation} has no num2 to sweep")
+    if operand is None and not unary:
+        raise ValueError(f"Operation {operation} requires operand")
+    return _chunks(operation, operand, spec, variable, unary, chunk_size)
+
+
+def _chunks(operation, operand, spec, variable, unary, chunk_size):
+    for first in range(0, spec.count, chunk_size):
+        xs = spec.chunk(first, min(first + chunk_size, spec.count))
+        if unary:
+            ys = vectorized.evaluate(operation, xs)
+        elif variable == "num1":
+            ys = vectorized.evaluate(operation, xs, operand)
+        else:
+            fixed = [operand] * len(xs) if np is None else np.full(len(xs), operand)
+            ys = vectorized.evaluate(operation, fixed, xs)
+        yield xs, ys
+
+
+def encode_json_rows(xs, ys):
+    """
+    Encode a chunk as comma-separated JSON [x, y] rows (NaN/inf become null).
+
+    Returns:
+        str: Rows without the enclosing brackets
+    """
+    if np is not None:
+        xs, ys = xs.tolist(), ys.tolist()
+    # repr() of a finite float is already valid JSON; skip json.dumps per row
+    return ",".join(f"[{_json_number(x)},{_json_number(y)}]" for x, y in zip(xs, ys))
+
+
+def encode_binary_rows(xs, ys):
+    """
+    Encode a chunk as interleaved little-endian float64 (x, y) pairs.
+
+    Returns:
+        bytes: 16 bytes per row
+    """
+    if np is not None:
+        out = np.empty((len(xs), 2), dtype="<f8")
+        out[:, 0] = xs
+        out[:, 1] = ys
+        return out.tobytes()
+    values = array.array("d")
+    for x, y in zip(xs, ys):
+        values.append(x)
+        values.append(y)
+    if sys.byteorder != "little":
+        values.byteswap()
+    return values.tobytes()
+
+
+def _json_number(value):
+    return repr(value) if math.isfinite(value) else "null"
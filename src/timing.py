@@ -0,0 +1,108 @@
+"""
+Per-request phase timing.
+
+PhaseTimer measures consecutive phases of a request (parse, validate,
+compute, render...) and formats them as a Server-Timing header.
+PhaseStats aggregates those timings across requests for the metrics endpoint.
+"""
+
+import threading
+import time
+
+
+class PhaseTimer:
+    """
+    Record the duration of consecutive request phases.
+
+    Each call to mark() closes the phase that started at the previous mark
+    (or when the timer was created).
+    """
+
+    __slots__ = ("start", "phases", "_last")
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self._last = self.start
+        self.phases = []
+
+    def mark(self, name):
+        """
+        End the current phase.
+
+        Args:
+            name (str): Name of the phase that just finished
+        """
+        now = time.perf_counter()
+        self.phases.append((name, (now - self._last) * 1000.0))
+        self._last = now
+
+    def elapsed_ms(self):
+        """
+        Time since the timer was created.
+
+        Returns:
+            float: Elapsed milliseconds
+        """
+        return (time.perf_counter() - self.start) * 1000.0
+
+    def header(self):
+        """
+        Format the phases as a Server-Timing header value.
+
+        Returns:
+            str: e.g. "parse;dur=0.012, compute;dur=0.003, total;dur=0.051"
+        """
+        parts = [f"{name};dur={ms:.3f}" for name, ms in self.phases]
+        parts.append(f"total;dur={self.elapsed_ms():.3f}")
+        return ", ".join(parts)
+
+
+class PhaseStats:
+    """
+    Thread-safe aggregate of phase timings per route.
+
+    Keeps count, total and maximum milliseconds for every (route, phase).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats = {}
+
+    def record(self, route, phases):
+        """
+        Add one request's phase timings.
+
+        Args:
+            route (str): Route the request was handled by
+            phases (list): (phase name, milliseconds) pairs
+        """
+        with self._lock:
+            for name, ms in phases:
+                key = (route, name)
+                entry = self._stats.get(key)
+                if entry is None:
+                    self._stats[key] = [1, ms, ms]
+                else:
+                    entry[0] += 1
+                    entry[1] += ms
+                    if ms > entry[2]:
+                        entry[2] = ms
+
+    def snapshot(self):
+        """
+        Return the aggregated timings.
+
+        Returns:
+            dict: {route: {phase: {count, total_ms, mean_ms, max_ms}}}
+        """
+        with self._lock:
+            items = [(key, list(entry)) for key, entry in self._stats.items()]
+        result = {}
+        for (route, name), (count, total, peak) in items:
+            result.setdefault(route, {})[name] = {
+                "count": count,
+                "total_ms": round(total, 3),
+                "mean_ms": round(total / count, 3),
+                "max_ms": round(peak, 3),
+            }
+        return result
@@ -0,0 +1,115 @@
+"""
+Element-wise evaluation of Calculator operations over whole columns.
+
+Uses NumPy ufuncs when NumPy is installed and a per-element loop over the
+Calculator otherwise. Points where the scalar operation would raise (division
+by zero, square root of a negative number, overflow, complex results) come
+back as NaN instead of aborting the whole column.
+"""
+
+import math
+
+from src.calculator import Calculator
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+HAS_NUMPY = np is not None
+
+# Operations that take a single operand (num2 is ignored)
+UNARY_OPERATIONS = frozenset({"square_root"})
+
+VECTOR_OPERATIONS = frozenset(
+    {
+        "add",
+        "subtract",
+        "multiply",
+        "divide",
+        "power",
+        "square_root",
+        "modulo",
+        "percentage",
+    }
+)
+
+_calc = Calculator()
+
+
+def evaluate(operation, xs, ys=None):
+    """
+    Evaluate operation(x, y) for every element.
+
+    Args:
+        operation (str): One of VECTOR_OPERATIONS
+        xs: Sequence (or ndarray) of first operands
+        ys: Sequence, ndarray or scalar of second operands (None for unary)
+
+    Returns:
+        ndarray of float64 when NumPy is installed, else a list of floats;
+        invalid points are NaN
+
+    Raises:
+        ValueError: If the operation is unknown or needs ys
+    """
+    if operation not in VECTOR_OPERATIONS:
+        raise ValueError(f"Unknown operation: {operation}")
+    if ys is None and operation not in UNARY_OPERATIONS:
+        raise ValueError(f"Operation {operation} requires num2")
+    if HAS_NUMPY:
+        return _evaluate_numpy(operation, xs, ys)
+    return _evaluate_python(operation, xs, ys)
+
+
+def _evaluate_numpy(operation, xs, ys):
+    x = np.asarray(xs, dtype=float)
+    y = None if ys is None else np.asarray(ys, dtype=float)
+    with np.errstate(all="ignore"):
+        if operation == "add":
+            out = x + y
+        elif operation == "subtract":
+            out = x - y
+        elif operation == "multiply":
+            out = x * y
+        elif operation == "divide":
+            out = np.where(y == 0, np.nan, x / np.where(y == 0, 1.0, y))
+        elif operation == "power":
+            out = np.power(x, y)
+        elif operation == "square_root":
+            out = np.sqrt(x)
+        elif operation == "modulo":
+            out = np.where(y == 0, np.nan, np.mod(x, np.where(y == 0, 1.0, y)))
+        else:  # percentage
+            out = (x * y) / 100
+    out = np.asarray(out, dtype=float)
+    if operation == "power":
+        # Float ** raises OverflowError rather than returning inf
+        out = np.where(np.isfinite(x) & np.isfinite(y) & ~np.isfinite(out), np.nan, out)
+    return out
+
+
+def _evaluate_python(operation, xs, ys):
+    # Stay in floats like the NumPy kernel: Calculator.power returns an exact
+    # (possibly huge) int where the float result would overflow
+    func = _float_power if operation == "power" else getattr(_calc, operation)
+    if ys is None:
+        return [_safe(func, x) for x in xs]
+    if isinstance(ys, (int, float)):
+        return [_safe(func, x, ys) for x in xs]
+    return [_safe(func, x, y) for x, y in zip(xs, ys)]
+
+
+def _float_power(base, exponent):
+    return float(base) ** float(exponent)
+
+
+def _safe(func, *args):
+    try:
+        value = func(*args)
+        if isinstance(value, complex):
+            return math.nan
+        return float(value)
+    except (ValueError, ArithmeticError):
+        # OverflowError included, as the NumPy kernel maps overflow to NaN
+        return math.nan
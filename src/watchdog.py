@@ -0,0 +1,235 @@
+"""
+Slow-request watchdog.
+
+Request handlers register themselves on entry (route) and note the
+calculation they are about to run (operation and operands). A background
+thread wakes up a few times per threshold and, for every request that has
+been in flight longer than the threshold, captures its thread's stack from
+sys._current_frames() once. The record goes to a bounded in-memory log and,
+as a JSON line, to stderr so it survives the worker being killed.
+
+Like any Python thread the watchdog needs the GIL, so a request stuck inside
+one long C call (a single huge integer multiplication) is reported as soon
+as that call returns to the interpreter, rather than at the threshold.
+"""
+
+import json
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+
+# Integers wider than this are logged as "<N-bit int>"
+MAX_LOGGED_INT_BITS = 256
+MAX_LOGGED_CHARS = 200
+
+
+def describe(value):
+    """
+    A loggable stand-in for an operand: huge integers are summarised and
+    long strings cut, so a slow-request log never holds megabyte inputs.
+    """
+    if isinstance(value, int) and not isinstance(value, bool):
+        bits = value.bit_length()
+        return f"<{bits}-bit int>" if bits > MAX_LOGGED_INT_BITS else value
+    if isinstance(value, float) or value is None or isinstance(value, bool):
+        return value
+    text = str(value)
+    if len(text) > MAX_LOGGED_CHARS:
+        return f"{text[:MAX_LOGGED_CHARS]}... ({len(text)} chars)"
+    return text
+
+
+class _InFlight:
+    __slots__ = ("route", "started", "wall", "operation", "operands", "entry")
+
+    def __init__(self, route):
+        self.route = route
+        self.started = time.monotonic()
+        self.wall = time.time()
+        self.operation = None
+        self.operands = ()
+        self.entry = None
+
+
+class SlowRequestWatchdog:
+    """
+    Dumps the stack, route and sanitized inputs of requests that run longer
+    than a threshold.
+
+    Each slow request is recorded once; the log keeps the newest
+    max_entries records.
+    """
+
+    def __init__(self, threshold=10.0, interval=None, max_entries=100, max_depth=64,
+                 logger=None):
+        """
+        Args:
+            threshold (float): Seconds in flight before a request is dumped
+            interval (float): Seconds between checks (default: threshold / 4,
+                at most 1s)
+            max_entries (int): Slow-request records kept in memory
+            max_depth (int): Innermost frames kept per stack
+            logger (logging.Logger): Destination for JSON lines (default: stderr)
+        """
+        self.threshold = threshold
+        self.interval = interval if interval is not None else min(1.0, threshold / 4)
+        self.max_depth = max_depth
+        self._logger = logger or _default_logger()
+        self._inflight = {}
+        self._entries = deque(maxlen=max_entries)
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._pid = None
+        self._start_lock = threading.Lock()
+        self.tracked = 0
+        self.slow = 0
+
+    def begin(self, route):
+        """Start tracking the calling thread's request."""
+        self._ensure_thread()
+        self._inflight[threading.get_ident()] = _InFlight(route)
+        self.tracked += 1
+
+    def note(self, operation, *operands):
+        """Record the calculation the calling thread's request is running."""
+        request = self._inflight.get(threading.get_ident())
+        if request is not None:
+            request.operation = operation
+            request.operands = operands
+
+    def end(self):
+        """Stop tracking the calling thread's request."""
+        request = self._inflight.pop(threading.get_ident(), None)
+        if request is not None and request.entry is not None:
+            request.entry["total_ms"] = round((time.monotonic() - request.started) * 1000, 3)
+
+    def check(self):
+        """Dump every newly overdue request (called by the watchdog thread)."""
+        now = time.monotonic()
+        overdue = [
+            (ident, request)
+            for ident, request in list(self._inflight.items())
+            if request.entry is None and now - request.started >= self.threshold
+        ]
+        if not overdue:
+            return
+        frames = sys._current_frames()
+        for ident, request in overdue:
+            frame = frames.get(ident)
+            entry = {
+                "ts": round(request.wall, 6),
+                "pid": os.getpid(),
+                "thread": ident,
+                "route": request.route,
+                "operation": request.operation,
+                "operands": [describe(value) for value in request.operands],
+                "elapsed_ms": round((now - request.started) * 1000, 3),
+                "total_ms": None,
+                "stack": self._stack(frame) if frame is not None else [],
+            }
+            request.entry = entry
+            with self._lock:
+                self._entries.append(entry)
+                self.slow += 1
+            try:
+                self._logger.warning(json.dumps({"slow_request": entry}, default=str))
+            except Exception:  # pylint: disable=broad-except
+                # Logging must never take the watchdog thread down
+                pass
+
+    def entries(self):
+        """
+        Returns:
+            list: Slow-request records, oldest first
+        """
+        with self._lock:
+            return list(self._entries)
+
+    def clear(self):
+        """Discard the recorded slow requests."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        """
+        Return a snapshot of the watchdog counters.
+
+        Returns:
+            dict: threshold_ms, tracked and in-flight requests, slow
+            requests seen and records kept
+        """
+        return {
+            "threshold_ms": self.threshold * 1000,
+            "tracked": self.tracked,
+            "in_flight": len(self._inflight),
+            "slow": self.slow,
+            "entries": len(self._entries),
+        }
+
+    def close(self, timeout=2.0):
+        """Stop the watchdog thread."""
+        self._stop.set()
+        thread = self._thread
+        if thread is not None and thread.is_alive():
+            thread.join(timeout)
+
+    def _stack(self, frame):
+        summary = traceback.extract_stack(frame, limit=self.max_depth)
+        return [
+            f"{entry.filename}:{entry.lineno} in {entry.name}"
+            + (f": {entry.line}" if entry.line else "")
+            for entry in summary
+        ]
+
+    def _ensure_thread(self):
+        # Threads do not survive fork, so gunicorn workers start their own
+        if self._thread is not None and self._pid == os.getpid():
+            return
+        with self._start_lock:
+            if self._thread is not None and self._pid == os.getpid():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="slow-request-watchdog", daemon=True
+            )
+            self._pid = os.getpid()
+            self._thread.start()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.check()
+
+
+def _default_logger():
+    logger = logging.getLogger("calculator.slow")
+    if not logger.handlers:
+        handler = logging.StreamHandler(sys.stderr)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+    return logger
+
+
+def from_env():
+    """
+    Build a SlowRequestWatchdog configured from environment variables.
+
+    SLOW_REQUEST_MS is the threshold (default 10000; 0 disables the
+    watchdog) and SLOW_REQUEST_LOG_SIZE bounds the in-memory log.
+
+    Returns:
+        SlowRequestWatchdog or None
+    """
+    threshold_ms = float(os.getenv("SLOW_REQUEST_MS", "10000"))
+    if threshold_ms <= 0:
+        return None
+    return SlowRequestWatchdog(
+        threshold=threshold_ms / 1000,
+        max_entries=int(os.getenv("SLOW_REQUEST_LOG_SIZE", "100")),
+    )
@@ -0,0 +1,400 @@
+"""
+Streaming window operators over a sequence of numbers.
+
+Each operator consumes one value at a time and keeps constant state: a
+running compensated sum for sums and means, a monotonic deque for minima and
+maxima, and a single accumulator for the exponential moving average and the
+cumulative operations. Input can be any iterable (including a generator), a
+text stream of numbers or a stream of packed float64 values.
+"""
+
+import array
+import json
+import math
+import re
+import sys
+from collections import deque
+
+WINDOW_OPERATIONS = (
+    "rolling_sum",
+    "rolling_mean",
+    "rolling_min",
+    "rolling_max",
+    "ema",
+    "cumsum",
+    "cumprod",
+)
+ROLLING_OPERATIONS = frozenset(
+    {"rolling_sum", "rolling_mean", "rolling_min", "rolling_max"}
+)
+
+READ_SIZE = 65536
+
+# Starts the trailer of a binary result stream cut short by an invalid value.
+# Operators only see finite inputs, so no result carries this NaN payload.
+BINARY_ERROR_MARKER = b"\xff" * 8
+BINARY_LENGTH_ERROR = "Binary input length must be a multiple of 8 bytes"
+_SEPARATORS = re.compile(rb"[\s,]+")
+
+
+def _finite(value):
+    value = float(value)
+    if not math.isfinite(value):
+        raise ValueError(f"Values must be finite numbers, got {value!r}")
+    return value
+
+
+class _CompensatedSum:
+    """Neumaier summation: adding and removing values without drift."""
+
+    __slots__ = ("total", "compensation")
+
+    def __init__(self):
+        self.total = 0.0
+        self.compensation = 0.0
+
+    def add(self, value):
+        total = self.total + value
+        if abs(self.total) >= abs(value):
+            self.compensation += (self.total - total) + value
+        else:
+            self.compensation += (value - total) + self.total
+        self.total = total
+
+    def value(self):
+        return self.total + self.compensation
+
+
+class RollingSum:
+    """Sum of the last `window` values."""
+
+    def __init__(self, window, min_periods=None):
+        """
+        Args:
+            window (int): Number of values in the window
+            min_periods (int): Values needed before a result is produced
+                (default: a full window); earlier updates return None
+
+        Raises:
+            ValueError: If window or min_periods is out of range
+        """
+        if int(window) < 1:
+            raise ValueError("window must be at least 1")
+        self.window = int(window)
+        self.min_periods = self.window if min_periods is None else int(min_periods)
+        if not 1 <= self.min_periods <= self.window:
+            raise ValueError("min_periods must be between 1 and window")
+        self._values = deque()
+        self._sum = _CompensatedSum()
+
+    def update(self, value):
+        """
+        Add a value and return the statistic of the current window.
+
+        Returns:
+            float, or None until min_periods values have been seen
+
+        Raises:
+            ValueError: If the value is not a finite number
+        """
+        value = _finite(value)
+        self._values.append(value)
+        self._sum.add(value)
+        if len(self._values) > self.window:
+            self._sum.add(-self._values.popleft())
+        if len(self._values) < self.min_periods:
+            return None
+        return self._result()
+
+    def _result(self):
+        return self._sum.value()
+
+
+class RollingMean(RollingSum):
+    """Mean of the last `window` values."""
+
+    def _result(self):
+        return self._sum.value() / len(self._values)
+
+
+class RollingMin:
+    """Minimum of the last `window` values (monotonic deque, O(1) amortized)."""
+
+    def __init__(self, window, min_periods=None):
+        """
+        Args:
+            window (int): Number of values in the window
+            min_periods (int): Values needed before a result is produced
+                (default: a full window); earlier updates return None
+
+        Raises:
+            ValueError: If window or min_periods is out of range
+        """
+        if int(window) < 1:
+            raise ValueError("window must be at least 1")
+        self.window = int(window)
+        self.min_periods = self.window if min_periods is None else int(min_periods)
+        if not 1 <= self.min_periods <= self.window:
+            raise ValueError("min_periods must be between 1 and window")
+        # (index, value) pairs; values strictly increase from the front
+        self._candidates = deque()
+        self._seen = 0
+
+    def update(self, value):
+        """
+        Add a value and return the statistic of the current window.
+
+        Returns:
+            float, or None until min_periods values have been seen
+
+        Raises:
+            ValueError: If the value is not a finite number
+        """
+        value = _finite(value)
+        candidates = self._candidates
+        while candidates and not self._keeps(candidates[-1][1], value):
+            candidates.pop()
+        candidates.append((self._seen, value))
+        self._seen += 1
+        if candidates[0][0] <= self._seen - 1 - self.window:
+            candidates.popleft()
+        if self._seen < self.min_periods:
+            return None
+        return candidates[0][1]
+
+    @staticmethod
+    def _keeps(older, newer):
+        return older < newer
+
+
+class RollingMax(RollingMin):
+    """Maximum of the last `window` values (monotonic deque, O(1) amortized)."""
+
+    @staticmethod
+    def _keeps(older, newer):
+        return older > newer
+
+
+class ExponentialMovingAverage:
+    """EMA: s = alpha * x + (1 - alpha) * s, seeded with the first value."""
+
+    def __init__(self, alpha=None, span=None):
+        """
+        Args:
+            alpha (float): Smoothing factor in (0, 1]
+            span (float): Alternative to alpha: alpha = 2 / (span + 1)
+
+        Raises:
+            ValueError: If neither (or both) are given, or alpha is out of range
+        """
+        if (alpha is None) == (span is None):
+            raise ValueError("ema requires exactly one of alpha or span")
+        if span is not None:
+            if float(span) < 1:
+                raise ValueError("span must be at least 1")
+            alpha = 2.0 / (float(span) + 1.0)
+        self.alpha = float(alpha)
+        if not 0 < self.alpha <= 1:
+            raise ValueError("alpha must be in (0, 1]")
+        self._value = None
+
+    def update(self, value):
+        """
+        Add a value and return the updated average.
+
+        Raises:
+            ValueError: If the value is not a finite number
+        """
+        value = _finite(value)
+        if self._value is None:
+            self._value = value
+        else:
+            self._value += self.alpha * (value - self._value)
+        return self._value
+
+
+class CumulativeSum:
+    """Running total of every value seen (compensated)."""
+
+    def __init__(self):
+        self._sum = _CompensatedSum()
+
+    def update(self, value):
+        """
+        Add a value and return the running total.
+
+        Raises:
+            ValueError: If the value is not a finite number
+        """
+        self._sum.add(_finite(value))
+        return self._sum.value()
+
+
+class CumulativeProduct:
+    """Running product of every value seen (may overflow to inf)."""
+
+    def __init__(self):
+        self._product = 1.0
+
+    def update(self, value):
+        """
+        Multiply in a value and return the running product.
+
+        Raises:
+            ValueError: If the value is not a finite number
+        """
+        self._product *= _finite(value)
+        return self._product
+
+
+def create(operation, window=None, min_periods=None, alpha=None, span=None):
+    """
+    Build the operator for an operation name.
+
+    Args:
+        operation (str): One of WINDOW_OPERATIONS
+        window (int): Window length (rolling operations)
+        min_periods (int): See RollingSum
+        alpha (float): EMA smoothing factor
+        span (float): EMA span
+
+    Returns:
+        An operator with an update(value) method
+
+    Raises:
+        ValueError: If the operation is unknown or its parameters are invalid
+    """
+    if operation in ROLLING_OPERATIONS:
+        if window is None:
+            raise ValueError(f"Operation {operation} requires window")
+        cls = {
+            "rolling_sum": RollingSum,
+            "rolling_mean": RollingMean,
+            "rolling_min": RollingMin,
+            "rolling_max": RollingMax,
+        }[operation]
+        return cls(window, min_periods)
+    if operation == "ema":
+        return ExponentialMovingAverage(alpha, span)
+    if operation == "cumsum":
+        return CumulativeSum()
+    if operation == "cumprod":
+        return CumulativeProduct()
+    raise ValueError(f"Unknown operation: {operation}")
+
+
+def apply(operation, values, **params):
+    """
+    Run a window operation over an iterable, lazily.
+
+    Args:
+        operation (str): One of WINDOW_OPERATIONS
+        values: Iterable of numbers (may be a generator)
+        **params: window, min_periods, alpha or span (see create())
+
+    Returns:
+        Iterator of results, one per input value (None while a rolling
+        window has fewer than min_periods values)
+
+    Raises:
+        ValueError: If the operation or parameters are invalid (immediately),
+        or a value is not a finite number (when it is reached)
+    """
+    operator = create(operation, **params)
+    return map(operator.update, values)
+
+
+def iter_text_values(stream, read_size=READ_SIZE):
+    """
+    Parse numbers separated by whitespace or commas from a binary stream.
+
+    Reads read_size bytes at a time, so memory stays constant however long
+    the stream is.
+
+    Raises:
+        ValueError: On a token that is not a number
+    """
+    pending = b""
+    while True:
+        chunk = stream.read(read_size)
+        if not chunk:
+            break
+        tokens = _SEPARATORS.split(pending + chunk)
+        # The last token may continue in the next chunk
+        pending = tokens.pop()
+        if tokens and not tokens[0]:
+            del tokens[0]
+        try:
+            yield from list(map(float, tokens))
+        except ValueError:
+            # Slow path only to name the offending token
+            yield from map(_parse_token, tokens)
+    if pending:
+        yield _parse_token(pending)
+
+
+def iter_binary_values(stream, read_size=READ_SIZE):
+    """
+    Read little-endian float64 values from a binary stream.
+
+    Raises:
+        ValueError: If the stream length is not a multiple of 8 bytes
+    """
+    pending = b""
+    read_size -= read_size % 8
+    while True:
+        chunk = stream.read(read_size)
+        if not chunk:
+            break
+        data = pending + chunk
+        usable = len(data) - len(data) % 8
+        values = array.array("d", data[:usable])
+        pending = data[usable:]
+        if sys.byteorder != "little":
+            values.byteswap()
+        yield from values
+    if pending:
+        raise ValueError(BINARY_LENGTH_ERROR)
+
+
+def encode_text(results):
+    """
+    Encode results as one JSON value per line (None and non-finite become null).
+
+    Returns:
+        str
+    """
+    return "".join(
+        f"{value!r}\n" if value is not None and math.isfinite(value) else "null\n"
+        for value in results
+    )
+
+
+def encode_binary(results):
+    """
+    Encode results as little-endian float64 (None becomes NaN).
+
+    Returns:
+        bytes: 8 bytes per result
+    """
+    values = array.array("d", (math.nan if value is None else value for value in results))
+    if sys.byteorder != "little":
+        values.byteswap()
+    return values.tobytes()
+
+
+def encode_binary_error(message):
+    """
+    Encode the trailer that ends a binary result stream early.
+
+    Returns:
+        bytes: BINARY_ERROR_MARKER followed by {"error": message} as UTF-8 JSON
+    """
+    return BINARY_ERROR_MARKER + json.dumps({"error": message}).encode()
+
+
+def _parse_token(token):
+    try:
+        return float(token)
+    except ValueError:
+        raise ValueError(f"Invalid number: {token.decode(errors='replace')!r}") from None
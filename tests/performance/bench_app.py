@@ -0,0 +1,175 @@
+"""
+In-Process Endpoint Benchmark - CA3
+Measures what the Flask layer costs per request, without network or client noise
+
+Usage:
+  python -m tests.performance.bench_app
+  python -m tests.performance.bench_app --requests 5000 --budget api_calculate=96
+
+Each endpoint is driven through the WSGI test client in a tight loop and
+reported as requests/s and us/request. A second, tracemalloc-instrumented
+pass reports per request:
+  peak KB        memory high-water mark above the pre-request baseline
+  retained B     bytes still allocated afterwards (averaged; leaks show here)
+  retained blk   memory blocks (objects) still allocated afterwards
+
+The process exits with status 1 if any endpoint's peak exceeds its
+allocation budget (DEFAULT_BUDGETS_KB, overridden with --budget NAME=KB).
+"""
+
+import argparse
+import sys
+import time
+import tracemalloc
+
+from app import app
+
+# name -> (method, path, test client keyword arguments)
+ENDPOINTS = {
+    "health": ("GET", "/health", {}),
+    "index": ("GET", "/", {}),
+    "form_calculate": (
+        "POST",
+        "/",
+        {"data": {"operation": "multiply", "num1": "6", "num2": "7"}},
+    ),
+    "api_calculate": (
+        "POST",
+        "/api/calculate",
+        {"json": {"operation": "multiply", "num1": 6, "num2": 7}},
+    ),
+}
+
+# Peak memory allowed per request, in KB
+DEFAULT_BUDGETS_KB = {
+    "health": 32,
+    "index": 384,
+    "form_calculate": 384,
+    "api_calculate": 128,
+}
+
+
+def _request(client, endpoint):
+    method, path, kwargs = ENDPOINTS[endpoint]
+    response = client.open(path, method=method, **kwargs)
+    if response.status_code != 200:
+        raise RuntimeError(f"{endpoint} returned {response.status_code}")
+    return response
+
+
+def measure_throughput(client, endpoint, requests):
+    """
+    Time a tight loop of requests.
+
+    Returns:
+        float: Seconds per request
+    """
+    start = time.perf_counter()
+    for _ in range(requests):
+        _request(client, endpoint)
+    return (time.perf_counter() - start) / requests
+
+
+def measure_allocations(client, endpoint, requests):
+    """
+    Trace memory allocations of individual requests.
+
+    Returns:
+        dict: peak_kb (worst request), retained_bytes and retained_blocks
+        (per request, averaged over the run)
+    """
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        peak = 0
+        for _ in range(requests):
+            baseline = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            _request(client, endpoint)
+            peak = max(peak, tracemalloc.get_traced_memory()[1] - baseline)
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+
+    diff = after.compare_to(before, "filename")
+    return {
+        "peak_kb": peak / 1024,
+        "retained_bytes": sum(d.size_diff for d in diff) / requests,
+        "retained_blocks": sum(d.count_diff for d in diff) / requests,
+    }
+
+
+def run(endpoints, requests, alloc_requests, warmup=50):
+    """
+    Benchmark each endpoint's throughput and allocations.
+
+    Returns:
+        list: (endpoint, seconds per request, allocation dict) rows
+    """
+    app.config["TESTING"] = True
+    rows = []
+    with app.test_client() as client:
+        for endpoint in endpoints:
+            for _ in range(warmup):
+                _request(client, endpoint)
+            per_request = measure_throughput(client, endpoint, requests)
+            allocations = measure_allocations(client, endpoint, alloc_requests)
+            rows.append((endpoint, per_request, allocations))
+    return rows
+
+
+def over_budget(rows, budgets_kb):
+    """
+    Find endpoints whose peak allocation exceeds their budget.
+
+    Returns:
+        list: (endpoint, peak KB, budget KB) for each violation
+    """
+    return [
+        (endpoint, allocations["peak_kb"], budgets_kb[endpoint])
+        for endpoint, _, allocations in rows
+        if endpoint in budgets_kb and allocations["peak_kb"] > budgets_kb[endpoint]
+    ]
+
+
+def _parse_budget(text):
+    name, _, kb = text.partition("=")
+    if name not in ENDPOINTS or not kb:
+        raise argparse.ArgumentTypeError(f"expected ENDPOINT=KB, got {text!r}")
+    return name, float(kb)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--endpoints", nargs="+", choices=list(ENDPOINTS), default=list(ENDPOINTS)
+    )
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--alloc-requests", type=int, default=200)
+    parser.add_argument(
+        "--budget", type=_parse_budget, action="append", default=[],
+        metavar="ENDPOINT=KB", help="Override a peak allocation budget",
+    )
+    args = parser.parse_args()
+    budgets = dict(DEFAULT_BUDGETS_KB, **dict(args.budget))
+
+    rows = run(args.endpoints, args.requests, args.alloc_requests)
+    print(
+        f"{'endpoint':<16} {'req/s':>9} {'us/req':>9} {'peak KB':>9} "
+        f"{'budget':>7} {'retained B':>11} {'retained blk':>13}"
+    )
+    for endpoint, per_request, allocations in rows:
+        print(
+            f"{endpoint:<16} {1 / per_request:9.0f} {per_request * 1e6:9.1f} "
+            f"{allocations['peak_kb']:9.1f} {budgets.get(endpoint, 0):7.0f} "
+            f"{allocations['retained_bytes']:11.1f} {allocations['retained_blocks']:13.2f}"
+        )
+
+    violations = over_budget(rows, budgets)
+    for endpoint, peak, budget in violations:
+        print(f"OVER BUDGET: {endpoint} peaked at {peak:.1f} KB (budget {budget:.0f} KB)")
+    return 1 if violations else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,109 @@
+"""
+Micro-Batching Benchmark - CA3
+Measures concurrent /api/calculate throughput and latency with and without micro-batching
+
+Usage:
+  python -m tests.performance.bench_batcher
+  python -m tests.performance.bench_batcher --windows 0 0.5 2 --threads 64
+
+Each configuration has --threads client threads post element-wise
+calculations through the in-process Flask test client. "batch" is the mean
+batch size the batcher formed, from its /metrics counters.
+"""
+
+import argparse
+import statistics
+import threading
+import time
+
+import app as app_module
+from src.batcher import MicroBatcher
+
+
+def _drive(threads, requests):
+    latencies = []
+    lock = threading.Lock()
+    start = threading.Barrier(threads + 1)
+
+    def worker(offset):
+        mine = []
+        with app_module.app.test_client() as client:
+            start.wait()
+            for i in range(requests):
+                began = time.perf_counter()
+                client.post(
+                    "/api/calculate",
+                    json={"operation": "multiply", "num1": offset + i, "num2": 1.5},
+                )
+                mine.append(time.perf_counter() - began)
+        with lock:
+            latencies.extend(mine)
+
+    pool = [threading.Thread(target=worker, args=(n * requests,)) for n in range(threads)]
+    for thread in pool:
+        thread.start()
+    start.wait()
+    began = time.perf_counter()
+    for thread in pool:
+        thread.join()
+    return time.perf_counter() - began, latencies
+
+
+def run(windows_ms, threads, requests, max_items):
+    """
+    Drive the endpoint without a batcher and with each window.
+
+    Returns:
+        list: (window ms or None, requests/s, median ms, p99 ms, mean batch) rows
+    """
+    app_module.app.config["TESTING"] = True
+    original = app_module.micro_batcher
+    rows = []
+    try:
+        for window_ms in [None, *windows_ms]:
+            app_module.micro_batcher = (
+                None
+                if window_ms is None
+                else MicroBatcher(
+                    app_module._compute, window=window_ms / 1000, max_items=max_items
+                )
+            )
+            elapsed, latencies = _drive(threads, requests)
+            latencies.sort()
+            mean_batch = (
+                app_module.micro_batcher.stats()["mean_size"]
+                if app_module.micro_batcher
+                else None
+            )
+            rows.append(
+                (
+                    window_ms,
+                    len(latencies) / elapsed,
+                    statistics.median(latencies) * 1000,
+                    latencies[int(len(latencies) * 0.99) - 1] * 1000,
+                    mean_batch,
+                )
+            )
+    finally:
+        app_module.micro_batcher = original
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--windows", type=float, nargs="+", default=[0, 0.5, 1, 2])
+    parser.add_argument("--threads", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--max-items", type=int, default=64)
+    args = parser.parse_args()
+
+    rows = run(args.windows, args.threads, args.requests, args.max_items)
+    print(f"{'window ms':>9} {'req/s':>8} {'p50 ms':>7} {'p99 ms':>7} {'batch':>6}")
+    for window_ms, rate, p50, p99, mean_batch in rows:
+        label = "off" if window_ms is None else f"{window_ms:g}"
+        batch = "-" if mean_batch is None else f"{mean_batch:.1f}"
+        print(f"{label:>9} {rate:8.0f} {p50:7.2f} {p99:7.2f} {batch:>6}")
+
+
+if __name__ == "__main__":
+    main()
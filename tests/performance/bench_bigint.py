@@ -0,0 +1,85 @@
+"""
+Big-Integer Benchmark - CA3
+Compares the BigIntEngine against naive loops for n = 10^3 ... 10^6
+
+Usage:
+  python -m tests.performance.bench_bigint
+  python -m tests.performance.bench_bigint --exponents 3 4 5 --max-naive 10000
+
+Naive loops are quadratic in the size of the result, so they only run up to
+--max-naive (default 10^5). The "warm" column repeats the engine call for
+n + n/10, which extends the cached checkpoint for n.
+"""
+
+import argparse
+import time
+
+from src.bigint import BigIntEngine, CheckpointCache
+
+
+def naive_factorial(n):
+    result = 1
+    for i in range(2, n + 1):
+        result *= i
+    return result
+
+
+def naive_binomial(n, k):
+    result = 1
+    for i in range(1, k + 1):
+        result = result * (n - k + i) // i
+    return result
+
+
+def naive_fibonacci(n):
+    a, b = 0, 1
+    for _ in range(n):
+        a, b = b, a + b
+    return a
+
+
+def _timed(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def run(exponents, max_naive):
+    """
+    Time each operation cold, warm (from a checkpoint) and naively.
+
+    Returns:
+        list: (operation, n, cold s, warm s, naive s or None) rows
+    """
+    rows = []
+    for exponent in exponents:
+        n = 10**exponent
+        engine = BigIntEngine(CheckpointCache())
+        cases = [
+            ("factorial", engine.factorial, naive_factorial, (n,), (n + n // 10,)),
+            ("binomial", engine.binomial, naive_binomial, (2 * n, n), (2 * n, n)),
+            ("fibonacci", engine.fibonacci, naive_fibonacci, (n,), (n,)),
+        ]
+        for name, fast, naive, args, warm_args in cases:
+            cold = _timed(fast, *args)
+            warm = _timed(fast, *warm_args)
+            slow = _timed(naive, *args) if n <= max_naive else None
+            rows.append((name, n, cold, warm, slow))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--exponents", type=int, nargs="+", default=[3, 4, 5, 6])
+    parser.add_argument("--max-naive", type=int, default=10**5)
+    args = parser.parse_args()
+
+    print(f"{'operation':<10} {'n':>8} {'cold ms':>11} {'warm ms':>11} {'naive ms':>11} {'speedup':>8}")
+    for name, n, cold, warm, slow in run(args.exponents, args.max_naive):
+        naive_ms = f"{slow * 1000:11.2f}" if slow is not None else f"{'-':>11}"
+        speedup = f"{slow / cold:8.1f}" if slow else f"{'-':>8}"
+        print(f"{name:<10} {n:>8} {cold * 1000:11.2f} {warm * 1000:11.2f} {naive_ms} {speedup}")
+
+
+if __name__ == "__main__":
+    main()
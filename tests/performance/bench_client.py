@@ -0,0 +1,182 @@
+"""
+Client SDK Benchmark - CA3
+Compares calculations per second for naive, pooled, batched and asyncio clients
+
+Usage:
+  python -m tests.performance.bench_client
+  python -m tests.performance.bench_client --host http://localhost:5000 --calls 5000
+
+Without --host, a local server is started on a free port: gunicorn with the
+gthread worker (which honours keep-alive) when gunicorn is installed,
+otherwise the Flask development server (which closes every connection, so
+the "pooled" row then only measures the client's own overhead).
+
+Rows:
+  naive     new http.client connection per calculation (what ad-hoc scripts do)
+  pooled    CalculatorClient.calculate(), one request per calculation
+  batched   CalculatorClient futures, coalesced into /api/calculate/batch
+  async     AsyncCalculatorClient futures, coalesced the same way
+"""
+
+import argparse
+import asyncio
+import http.client
+import importlib.util
+import socket
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from calculator_client import AsyncCalculatorClient, CalculatorClient, protocol
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(workers, worker_class="gthread", threads=4):
+    """
+    Start the app on a free local port and wait for /health.
+
+    Args:
+        workers (int): gunicorn worker processes
+        worker_class (str): gunicorn worker class (sync, gthread, ...)
+        threads (int): Threads per worker (gthread only)
+
+    Returns:
+        tuple: (subprocess.Popen, base URL, server description)
+    """
+    port = _free_port()
+    if importlib.util.find_spec("gunicorn") and sys.platform != "win32":
+        command = [
+            sys.executable, "-m", "gunicorn", "app:app",
+            f"--bind=127.0.0.1:{port}", f"--workers={workers}",
+            f"--worker-class={worker_class}", "--keep-alive=5",
+            "--log-level=warning",
+        ]
+        description = f"gunicorn {worker_class} x{workers}"
+        if worker_class == "gthread":
+            command.append(f"--threads={threads}")
+            description += f" ({threads} threads)"
+    else:
+        command = [
+            sys.executable, "-m", "flask", "--app", "app", "run",
+            "--port", str(port), "--with-threads",
+        ]
+        description = "flask development server"
+    proc = subprocess.Popen(  # nosec B603 - fixed argv, no shell
+        command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            conn = http.client.HTTPConnection("127.0.0.1", port, timeout=1)
+            conn.request("GET", "/health")
+            if conn.getresponse().status == 200:
+                conn.close()
+                return proc, f"http://127.0.0.1:{port}", description
+        except OSError:
+            time.sleep(0.1)
+    proc.kill()
+    raise RuntimeError("Server did not become healthy within 30s")
+
+
+def _workload(calls):
+    return [("add", i, 1) for i in range(calls)]
+
+
+def bench_naive(base_url, calls, concurrency):
+    _, host, port = protocol.parse_base_url(base_url)
+
+    def one(call):
+        conn = http.client.HTTPConnection(host, port, timeout=10)
+        conn.request(
+            "POST",
+            protocol.CALCULATE_PATH,
+            protocol.encode(protocol.calculation(*call)),
+            protocol.JSON_HEADERS,
+        )
+        conn.getresponse().read()
+        conn.close()
+
+    with ThreadPoolExecutor(concurrency) as executor:
+        list(executor.map(one, _workload(calls)))
+
+
+def bench_pooled(base_url, calls, concurrency):
+    with CalculatorClient(base_url, pool_size=concurrency) as client:
+        with ThreadPoolExecutor(concurrency) as executor:
+            list(executor.map(lambda call: client.calculate(*call), _workload(calls)))
+
+
+def bench_batched(base_url, calls, concurrency):
+    with CalculatorClient(base_url, pool_size=concurrency) as client:
+        futures = [client.submit(*call) for call in _workload(calls)]
+        for future in futures:
+            future.result()
+
+
+def bench_async(base_url, calls, concurrency):
+    async def scenario():
+        async with AsyncCalculatorClient(base_url, pool_size=concurrency) as client:
+            await asyncio.gather(*(client.submit(*call) for call in _workload(calls)))
+
+    asyncio.run(scenario())
+
+
+BENCHMARKS = {
+    "naive": bench_naive,
+    "pooled": bench_pooled,
+    "batched": bench_batched,
+    "async": bench_async,
+}
+
+
+def run(base_url, calls, concurrency, names=tuple(BENCHMARKS)):
+    """
+    Time each client strategy over the same workload.
+
+    Returns:
+        list: (name, seconds) rows
+    """
+    rows = []
+    for name in names:
+        start = time.perf_counter()
+        BENCHMARKS[name](base_url, calls, concurrency)
+        rows.append((name, time.perf_counter() - start))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--host", help="Existing server base URL (default: start one)")
+    parser.add_argument("--calls", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--only", nargs="+", choices=list(BENCHMARKS))
+    args = parser.parse_args()
+
+    proc = None
+    if args.host:
+        base_url, description = args.host, args.host
+    else:
+        proc, base_url, description = start_server(args.workers)
+    try:
+        rows = run(base_url, args.calls, args.concurrency, args.only or tuple(BENCHMARKS))
+    finally:
+        if proc is not None:
+            proc.terminate()
+            proc.wait()
+
+    print(f"{args.calls} calculations, concurrency {args.concurrency}, {description}")
+    baseline = rows[0][1]
+    print(f"{'client':>8} {'seconds':>8} {'calcs/s':>9} {'speedup':>8}")
+    for name, seconds in rows:
+        print(f"{name:>8} {seconds:8.3f} {args.calls / seconds:9.0f} {baseline / seconds:7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+API Fast Path Benchmark - CA3
+Compares the /api/calculate fast path with the general parser and jsonify
+
+Usage:
+  python -m tests.performance.bench_fast_path
+  python -m tests.performance.bench_fast_path --calls 50000
+
+Each payload runs twice, with API_FAST_PATH off ("general") and on ("fast"):
+  view us     the api_calculate view alone, called repeatedly in one request
+              context (JSON already parsed), so Werkzeug's per-request cost
+              does not hide the difference
+  view peak   tracemalloc high-water mark of one view call, in bytes
+  request us  the whole request through the in-process test client
+Error payloads take the general path's code either way; only their
+response body is pre-encoded.
+"""
+
+import argparse
+import time
+import tracemalloc
+
+from flask import g, request
+
+import app as app_module
+from src.timing import PhaseTimer
+
+PAYLOADS = {
+    "multiply": {"operation": "multiply", "num1": 6, "num2": 7},
+    "divide": {"operation": "divide", "num1": 22.5, "num2": 7.25},
+    "is_prime": {"operation": "is_prime", "num1": 1000003},
+    "divide_by_zero": {"operation": "divide", "num1": 1, "num2": 0},
+    "missing_num1": {"operation": "add"},
+}
+
+
+def _call_view():
+    g.timer = PhaseTimer()
+    return app_module.api_calculate()
+
+
+def measure_view(payload, calls):
+    """
+    Time and trace the view function for one payload.
+
+    Returns:
+        tuple: (seconds per call, peak bytes of one call)
+    """
+    app = app_module.app
+    with app.test_request_context("/api/calculate", method="POST", json=payload):
+        request.get_json()
+        g.error = None
+        for _ in range(200):
+            _call_view()
+        start = time.perf_counter()
+        for _ in range(calls):
+            _call_view()
+        elapsed = (time.perf_counter() - start) / calls
+
+        tracemalloc.start()
+        try:
+            peak = 0
+            for _ in range(200):
+                baseline = tracemalloc.get_traced_memory()[0]
+                tracemalloc.reset_peak()
+                response = _call_view()
+                peak = max(peak, tracemalloc.get_traced_memory()[1] - baseline)
+                del response
+        finally:
+            tracemalloc.stop()
+    return elapsed, peak
+
+
+def measure_requests(payload, requests):
+    """
+    Returns:
+        float: Seconds per request through the test client
+    """
+    with app_module.app.test_client() as client:
+        for _ in range(100):
+            client.post("/api/calculate", json=payload)
+        start = time.perf_counter()
+        for _ in range(requests):
+            client.post("/api/calculate", json=payload)
+        return (time.perf_counter() - start) / requests
+
+
+def run(calls, requests):
+    """
+    Benchmark every payload on both paths.
+
+    Returns:
+        list: (payload, path, view seconds, view peak bytes, request seconds) rows
+    """
+    app_module.app.config["TESTING"] = True
+    original = app_module.API_FAST_PATH
+    # Keep sampled access-log lines out of the timings
+    access_logger, app_module.access_logger = app_module.access_logger, None
+    rows = []
+    try:
+        for name, payload in PAYLOADS.items():
+            for path, fast in (("general", False), ("fast", True)):
+                app_module.API_FAST_PATH = fast
+                view, peak = measure_view(payload, calls)
+                rows.append((name, path, view, peak, measure_requests(payload, requests)))
+    finally:
+        app_module.API_FAST_PATH = original
+        app_module.access_logger = access_logger
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=20000)
+    parser.add_argument("--requests", type=int, default=3000)
+    args = parser.parse_args()
+
+    rows = run(args.calls, args.requests)
+    print(
+        f"{'payload':<15} {'path':>8} {'view us':>8} {'view peak':>10} "
+        f"{'request us':>11} {'view speedup':>13}"
+    )
+    general = {}
+    for name, path, view, peak, per_request in rows:
+        general.setdefault(name, view)
+        print(
+            f"{name:<15} {path:>8} {view * 1e6:8.1f} {peak:10d} "
+            f"{per_request * 1e6:11.1f} {general[name] / view:12.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""
+Finance Benchmark - CA3
+Compares vectorized amortization schedules with period-by-period percentage loops
+
+Usage:
+  python -m tests.performance.bench_finance
+  python -m tests.performance.bench_finance --loans 5000
+
+Rows:
+  api-loop  one /api/calculate request per percentage / subtract, as clients build schedules today
+            (in-process test client, so no network time; daily scenario only)
+  loop      the same loop calling Calculator directly
+  library   src/finance.py schedule chunks (columns only, no encoding)
+  endpoint  POST /api/amortize through the in-process test client, JSON body fully read
+
+"daily" is one 30-year loan with daily periods (10,950 rows); "portfolio" is
+--loans 30-year monthly loans (360 rows each). "peak" is the largest
+traced allocation (tracemalloc, measured in a second run) while building
+the schedule; the endpoint's includes the test client holding the whole
+response body. The endpoint's time is mostly spent formatting floats as JSON.
+"""
+
+import argparse
+import time
+import tracemalloc
+
+import app as app_module
+from src import finance
+from src.calculator import Calculator
+
+calc = Calculator()
+
+
+def loop_schedule(principal, annual_percent, periods_per_year, periods):
+    """Build a schedule the way clients do today, one period at a time."""
+    percent = annual_percent / periods_per_year
+    payment = finance.annuity_payment(principal, percent / 100, periods)
+    rows, balance = [], principal
+    for period in range(1, periods + 1):
+        interest = calc.percentage(balance, percent)
+        repaid = calc.subtract(payment, interest)
+        balance = calc.subtract(balance, repaid)
+        rows.append((period, payment, interest, repaid, balance))
+    return rows
+
+
+def api_loop_schedule(principal, annual_percent, periods_per_year, periods):
+    """The period loop with every operation sent to /api/calculate."""
+    percent = annual_percent / periods_per_year
+    payment = finance.annuity_payment(principal, percent / 100, periods)
+    rows, balance = [], principal
+    with app_module.app.test_client() as client:
+
+        def call(operation, num1, num2):
+            payload = {"operation": operation, "num1": num1, "num2": num2}
+            return client.post("/api/calculate", json=payload).get_json()["result"]
+
+        for period in range(1, periods + 1):
+            interest = call("percentage", balance, percent)
+            repaid = call("subtract", payment, interest)
+            balance = call("subtract", balance, repaid)
+            rows.append((period, payment, interest, repaid, balance))
+    return rows
+
+
+def library_schedule(principal, annual_percent, periods_per_year, periods):
+    loan = finance.Loan(principal, annual_percent / 100 / periods_per_year, periods)
+    return [columns for columns in finance.schedule(loan)]
+
+
+def endpoint_schedule(loans):
+    with app_module.app.test_client() as client:
+        response = client.post("/api/amortize", json={"loans": loans})
+        return response.get_data()
+
+
+def _measure(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    elapsed = time.perf_counter() - start
+    # Separate run: tracing slows allocation-heavy code several times over
+    tracemalloc.start()
+    func(*args)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def run(loans):
+    """
+    Time each approach for the daily loan and the portfolio.
+
+    Returns:
+        list: (scenario, approach, seconds, peak bytes) rows
+    """
+    app_module.app.config["TESTING"] = True
+    daily = (300000, 5.0, 365, 10950)
+    monthly = (250000, 4.0, 12, 360)
+    portfolio = [
+        {"principal": 100000 + i, "rate": 0.04 / 12, "periods": 360} for i in range(loans)
+    ]
+    rows = []
+    for scenario, cases in (
+        (
+            "daily",
+            [
+                ("api-loop", api_loop_schedule, daily),
+                ("loop", loop_schedule, daily),
+                ("library", library_schedule, daily),
+                (
+                    "endpoint",
+                    endpoint_schedule,
+                    ([{"principal": 300000, "rate": 0.05 / 365, "periods": 10950}],),
+                ),
+            ],
+        ),
+        (
+            "portfolio",
+            [
+                ("loop", lambda: [loop_schedule(*monthly) for _ in range(loans)], ()),
+                ("library", lambda: [library_schedule(*monthly) for _ in range(loans)], ()),
+                ("endpoint", endpoint_schedule, (portfolio,)),
+            ],
+        ),
+    ):
+        for approach, func, args in cases:
+            seconds, peak = _measure(func, *args)
+            rows.append((scenario, approach, seconds, peak))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--loans", type=int, default=1000)
+    args = parser.parse_args()
+
+    rows = run(args.loans)
+    print(f"daily: 1 loan x 10950 periods; portfolio: {args.loans} loans x 360 periods")
+    print(f"{'scenario':>10} {'approach':>9} {'ms':>9} {'peak MB':>8} {'speedup':>8}")
+    baselines = {}
+    for scenario, _, seconds, _ in rows:
+        baselines.setdefault(scenario, seconds)
+    for scenario, approach, seconds, peak in rows:
+        print(
+            f"{scenario:>10} {approach:>9} {seconds * 1000:9.1f} {peak / 1e6:8.1f} "
+            f"{baselines[scenario] / seconds:7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Calculation Graph Benchmark - CA3
+Compares recomputing a whole model through /api/calculate with an incremental /api/graphs update
+
+Usage:
+  python -m tests.performance.bench_graph
+  python -m tests.performance.bench_graph --cells 10000 --chains 100
+
+The model is --chains independent chains of add/multiply cells, each fed by
+one input. "full" is what clients do today: one /api/calculate request per
+cell after any change. "graph" is one PATCH of a single input, which only
+recomputes that input's chain. Requests go through the in-process Flask test
+client.
+"""
+
+import argparse
+import time
+
+import app as app_module
+
+
+def build_model(cells, chains):
+    """
+    Returns:
+        dict: {cell name: definition} for POST /api/graphs
+    """
+    model = {}
+    per_chain = max(1, cells // chains - 1)
+    for chain in range(chains):
+        model[f"in{chain}"] = chain + 1
+        for step in range(per_chain):
+            source = f"in{chain}" if step == 0 else f"c{chain}.{step - 1}"
+            operation = "add" if step % 2 else "multiply"
+            model[f"c{chain}.{step}"] = {"operation": operation, "args": [source, 1.0001]}
+    return model
+
+
+def full_recompute(client, model):
+    """Evaluate every formula cell in order through /api/calculate."""
+    values = {}
+    for name, definition in model.items():
+        if not isinstance(definition, dict):
+            values[name] = definition
+            continue
+        source, constant = definition["args"]
+        response = client.post(
+            "/api/calculate",
+            json={"operation": definition["operation"], "num1": values[source], "num2": constant},
+        )
+        values[name] = response.get_json()["result"]
+    return values
+
+
+def run(cells, chains, updates):
+    """
+    Time a full recompute and incremental updates of the same model.
+
+    Returns:
+        list: (name, seconds per update, cells computed per update) rows
+    """
+    app_module.app.config["TESTING"] = True
+    model = build_model(cells, chains)
+    formulas = sum(isinstance(d, dict) for d in model.values())
+    with app_module.app.test_client() as client:
+        start = time.perf_counter()
+        full_recompute(client, model)
+        full = time.perf_counter() - start
+
+        graph_id = client.post("/api/graphs", json={"cells": model}).get_json()["graph"]
+        recomputed = 0
+        start = time.perf_counter()
+        for i in range(updates):
+            response = client.patch(
+                f"/api/graphs/{graph_id}", json={"cells": {f"in{i % chains}": i + 100}}
+            )
+            recomputed += response.get_json()["recomputed"]
+        incremental = (time.perf_counter() - start) / updates
+        client.delete(f"/api/graphs/{graph_id}")
+    return [("full", full, formulas), ("graph", incremental, recomputed / updates)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--cells", type=int, default=2000)
+    parser.add_argument("--chains", type=int, default=50)
+    parser.add_argument("--updates", type=int, default=50)
+    args = parser.parse_args()
+
+    rows = run(args.cells, args.chains, args.updates)
+    print(f"{args.cells} cells in {args.chains} chains, one input changed per update")
+    baseline = rows[0][1]
+    print(f"{'strategy':>8} {'ms/update':>10} {'cells':>7} {'speedup':>8}")
+    for name, seconds, computed in rows:
+        print(f"{name:>8} {seconds * 1000:10.2f} {computed:7.0f} {baseline / seconds:7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Linear Algebra Benchmark - CA3
+Times MatrixCalculator kernels (NumPy and pure-Python fallback) across sizes
+
+Usage:
+  python -m tests.performance.bench_linalg
+  python -m tests.performance.bench_linalg --sizes 4 64 512 --max-python 128
+
+The pure-Python kernels are O(n^3) interpreted loops, so they are only run
+up to --max-python (default 256); NumPy runs every size up to 2000x2000.
+"""
+
+import argparse
+import random
+import time
+
+from src import linalg
+from src.linalg import MatrixCalculator
+
+DEFAULT_SIZES = [4, 16, 64, 256, 512, 1000, 2000]
+OPERATIONS = ["multiply", "transpose", "determinant", "solve", "inverse"]
+
+
+def _random_matrix(rows, cols, rng):
+    return [[rng.uniform(-1.0, 1.0) for _ in range(cols)] for _ in range(rows)]
+
+
+def _operands(operation, a, b):
+    if operation in ("multiply", "solve"):
+        return a, b
+    return (a,)
+
+
+def _best_time(func, args, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(sizes, max_python, repeat, seed=0):
+    """
+    Benchmark every operation for every size and backend.
+
+    Returns:
+        list: (backend, operation, size, best seconds) rows
+    """
+    rng = random.Random(seed)  # nosec B311 - benchmark data only
+    backends = [("python", MatrixCalculator(use_numpy=False))]
+    if linalg.HAS_NUMPY:
+        backends.insert(0, ("numpy", MatrixCalculator(use_numpy=True)))
+
+    rows = []
+    for size in sizes:
+        a = _random_matrix(size, size, rng)
+        b = _random_matrix(size, size, rng)
+        for backend, matrix_calc in backends:
+            if backend == "python" and size > max_python:
+                continue
+            if backend == "numpy":
+                # Time the kernels, not list -> ndarray conversion
+                a_in, b_in = linalg.np.asarray(a), linalg.np.asarray(b)
+            else:
+                a_in, b_in = a, b
+            for operation in OPERATIONS:
+                func = getattr(matrix_calc, operation)
+                seconds = _best_time(func, _operands(operation, a_in, b_in), repeat)
+                rows.append((backend, operation, size, seconds))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--max-python", type=int, default=256)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'backend':<8} {'operation':<12} {'size':>6} {'best ms':>12} {'GFLOP/s':>9}")
+    for backend, operation, size, seconds in run(args.sizes, args.max_python, args.repeat):
+        gflops = ""
+        if operation == "multiply" and seconds > 0:
+            gflops = f"{2 * size ** 3 / seconds / 1e9:9.2f}"
+        print(f"{backend:<8} {operation:<12} {size:>6} {seconds * 1000:>12.3f} {gflops:>9}")
+
+
+if __name__ == "__main__":
+    main()
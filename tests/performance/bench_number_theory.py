@@ -0,0 +1,135 @@
+"""
+Number-Theory Benchmark - CA3
+Compares Miller-Rabin and Pollard-Brent against trial division
+
+Usage:
+  python -m tests.performance.bench_number_theory
+  python -m tests.performance.bench_number_theory --bits 20 32 40 --trial-budget 5
+
+Trial division is O(sqrt(n)), so it is skipped (shown as "-") once a single
+run would exceed --trial-budget seconds (estimated from the previous size).
+Pollard-Brent is O(n^1/4); semiprimes it cannot split within
+--factor-budget seconds are reported as "timeout".
+"""
+
+import argparse
+import math
+import time
+
+from src import number_theory
+from src.number_theory import PrimeSieve
+
+
+def trial_division_is_prime(n):
+    if n < 2:
+        return False
+    if n % 2 == 0:
+        return n == 2
+    for d in range(3, math.isqrt(n) + 1, 2):
+        if n % d == 0:
+            return False
+    return True
+
+
+def trial_division_factorize(n):
+    factors = []
+    d = 2
+    while d * d <= n:
+        while n % d == 0:
+            factors.append(d)
+            n //= d
+        d += 1 if d == 2 else 2
+    if n > 1:
+        factors.append(n)
+    return factors
+
+
+def _prime_at_least(n):
+    while not number_theory.is_prime(n):
+        n += 1
+    return n
+
+
+def _timed(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def run(bit_sizes, trial_budget, factor_budget):
+    """
+    Time primality and factorization of primes / semiprimes per bit size.
+
+    Returns:
+        list: (task, bits, fast seconds, trial seconds or None) rows
+    """
+    rows = []
+    # Last measured trial-division run per task: (bits, seconds)
+    last_trial = {"is_prime": (0, 0.0), "factorize": (0, 0.0)}
+    for bits in bit_sizes:
+        p = _prime_at_least(1 << (bits - 1))
+        q = _prime_at_least((1 << (bits // 2 - 1)) + 12345)
+        r = _prime_at_least(q + q // 2)
+        for task, fast, slow, arg in (
+            ("is_prime", number_theory.is_prime, trial_division_is_prime, p),
+            ("factorize", number_theory.factorize, trial_division_factorize, q * r),
+        ):
+            try:
+                if task == "factorize":
+                    fast_s = _timed(fast, arg, factor_budget)
+                else:
+                    fast_s = _timed(fast, arg)
+            except number_theory.FactorizationTimeout:
+                fast_s = None
+            # Trial division costs ~sqrt(n): twice as long every two bits
+            last_bits, last_s = last_trial[task]
+            slow_s = None
+            if last_s * 2 ** ((bits - last_bits) / 2) < trial_budget:
+                slow_s = _timed(slow, arg)
+                last_trial[task] = (bits, slow_s)
+            else:
+                last_trial[task] = (bits, float("inf"))
+            rows.append((task, bits, fast_s, slow_s))
+    return rows
+
+
+def sieve_timings(limits):
+    """
+    Time building a fresh sieve to each limit.
+
+    Returns:
+        list: (limit, seconds, bytes) rows
+    """
+    result = []
+    for limit in limits:
+        start = time.perf_counter()
+        sieve = PrimeSieve(limit)
+        result.append((limit, time.perf_counter() - start, len(sieve._flags)))
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--bits", type=int, nargs="+", default=[16, 24, 32, 40, 48, 56, 64, 80, 128]
+    )
+    parser.add_argument("--trial-budget", type=float, default=10.0)
+    parser.add_argument("--factor-budget", type=float, default=30.0)
+    args = parser.parse_args()
+
+    print(f"{'task':<10} {'bits':>5} {'fast ms':>11} {'trial ms':>12} {'speedup':>9}")
+    rows = run(args.bits, args.trial_budget, args.factor_budget)
+    for task, bits, fast_s, slow_s in rows:
+        fast = f"{fast_s * 1000:11.3f}" if fast_s is not None else f"{'timeout':>11}"
+        trial = f"{slow_s * 1000:12.3f}" if slow_s is not None else f"{'-':>12}"
+        speedup = f"{slow_s / fast_s:9.1f}" if slow_s and fast_s else f"{'-':>9}"
+        print(f"{task:<10} {bits:>5} {fast} {trial} {speedup}")
+
+    print()
+    print(f"{'sieve limit':>12} {'build ms':>10} {'bytes':>10}")
+    for limit, seconds, size in sieve_timings([10**5, 10**6, 10**7]):
+        print(f"{limit:>12} {seconds * 1000:10.2f} {size:>10}")
+
+
+if __name__ == "__main__":
+    main()
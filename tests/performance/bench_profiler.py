@@ -0,0 +1,82 @@
+"""
+Sampling Profiler Overhead Benchmark - CA3
+Measures request throughput with the sampling profiler off and at several intervals
+
+Usage:
+  python -m tests.performance.bench_profiler
+  python -m tests.performance.bench_profiler --intervals 1 10 --requests 5000
+
+Each configuration drives the endpoint through the in-process harness from
+bench_app. "overhead" compares us/request against the profiler-off run
+(noisy at the 1% level: use more --requests and --rounds to settle it);
+"self %" is the sampler's own CPU time as a share of wall time, as reported
+by /metrics.
+"""
+
+import argparse
+import statistics
+
+import app as app_module
+from src.profiler import SamplingProfiler
+from tests.performance import bench_app
+
+
+def _per_request(client, endpoint, requests, rounds):
+    return statistics.median(
+        bench_app.measure_throughput(client, endpoint, requests) for _ in range(rounds)
+    )
+
+
+def run(endpoint, intervals_ms, requests, rounds):
+    """
+    Time the endpoint with no profiler and with each sampling interval.
+
+    Returns:
+        list: (interval ms or None, seconds per request, profiler stats) rows
+    """
+    app_module.app.config["TESTING"] = True
+    original = app_module.sampling_profiler
+    rows = []
+    try:
+        with app_module.app.test_client() as client:
+            for _ in range(100):
+                bench_app._request(client, endpoint)
+            app_module.sampling_profiler = None
+            rows.append((None, _per_request(client, endpoint, requests, rounds), None))
+            for interval_ms in intervals_ms:
+                sampler = SamplingProfiler(interval=interval_ms / 1000)
+                app_module.sampling_profiler = sampler
+                per_request = _per_request(client, endpoint, requests, rounds)
+                sampler.close()
+                rows.append((interval_ms, per_request, sampler.stats()))
+    finally:
+        app_module.sampling_profiler = original
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--endpoint", choices=list(bench_app.ENDPOINTS), default="api_calculate"
+    )
+    parser.add_argument("--intervals", type=float, nargs="+", default=[1, 5, 10, 20])
+    parser.add_argument("--requests", type=int, default=3000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    rows = run(args.endpoint, args.intervals, args.requests, args.rounds)
+    baseline = rows[0][1]
+    print(f"{'interval ms':>11} {'us/req':>9} {'overhead':>9} {'self %':>8} {'samples':>8}")
+    for interval_ms, per_request, stats in rows:
+        if stats is None:
+            print(f"{'off':>11} {per_request * 1e6:9.1f} {'-':>9} {'-':>8} {'-':>8}")
+            continue
+        overhead = 100 * (per_request / baseline - 1)
+        print(
+            f"{interval_ms:>11g} {per_request * 1e6:9.1f} {overhead:8.2f}% "
+            f"{stats['overhead_pct']:7.3f}% {stats['samples']:>8}"
+        )
+
+
+if __name__ == "__main__":
+    main()
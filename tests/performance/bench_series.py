@@ -0,0 +1,166 @@
+"""
+Series Benchmark - CA3
+Compares closed-form and vectorized series sums with the iterative Calculator loops they replace
+
+Usage:
+  python -m tests.performance.bench_series
+  python -m tests.performance.bench_series --terms 100000
+
+"loop" is what clients do today: one Calculator.add / multiply / power call
+per term, accumulating in floating point. "series" is src/series.py. Errors
+are relative to a reference computed with 60-digit decimals (exact integers
+for the power sum, math.fsum of the terms for 1/k^2).
+"""
+
+import argparse
+import math
+import time
+from decimal import Decimal, localcontext
+
+from src import series
+from src.calculator import Calculator
+
+calc = Calculator()
+
+
+def _decimal(value):
+    return Decimal(value) if isinstance(value, float) else Decimal(int(value))
+
+
+def arithmetic_case(n):
+    first, difference = 0.1, 0.1
+
+    def loop():
+        total, term = 0.0, first
+        for _ in range(n):
+            total = calc.add(total, term)
+            term = calc.add(term, difference)
+        return total
+
+    with localcontext() as ctx:
+        ctx.prec = 60
+        d_first, d_diff = _decimal(first), _decimal(difference)
+        reference = n * (2 * d_first + (n - 1) * d_diff) / 2
+    return loop, lambda: series.arithmetic_sum(first, difference, n), reference
+
+
+def geometric_case(n):
+    first, ratio = 1.0, 1 + 1e-7
+
+    def loop():
+        total, term = 0.0, first
+        for _ in range(n):
+            total = calc.add(total, term)
+            term = calc.multiply(term, ratio)
+        return total
+
+    with localcontext() as ctx:
+        ctx.prec = 60
+        d_ratio = _decimal(ratio)
+        reference = _decimal(first) * (d_ratio**n - 1) / (d_ratio - 1)
+    return loop, lambda: series.geometric_sum(first, ratio, n), reference
+
+
+def power_sum_case(n):
+    def loop():
+        total = 0
+        for k in range(1, n + 1):
+            total = calc.add(total, calc.power(k, 3))
+        return total
+
+    reference = Decimal((n * (n + 1) // 2) ** 2)
+    return loop, lambda: series.power_sum(3, n), reference
+
+
+def term_case(n):
+    def loop():
+        total = 0.0
+        for k in range(1, n + 1):
+            total = calc.add(total, calc.divide(1, calc.power(k, 2)))
+        return total
+
+    reference = Decimal(math.fsum(1 / k**2 for k in range(1, n + 1)))
+    return loop, lambda: series.term_sum("1 / k**2", 1, n)[0], reference
+
+
+def compound_case(n):
+    principal, rate = 1000.0, 1e-9
+
+    def loop():
+        value = principal
+        for _ in range(n):
+            value = calc.multiply(value, 1 + rate)
+        return value
+
+    with localcontext() as ctx:
+        ctx.prec = 60
+        reference = _decimal(principal) * (1 + _decimal(rate)) ** n
+    return loop, lambda: series.compound_growth(principal, rate, n), reference
+
+
+CASES = {
+    "arithmetic": arithmetic_case,
+    "geometric": geometric_case,
+    "power_sum": power_sum_case,
+    "1/k^2": term_case,
+    "compound": compound_case,
+}
+
+
+def _relative_error(value, reference):
+    with localcontext() as ctx:
+        ctx.prec = 60
+        return float(abs((_decimal(value) - reference) / reference))
+
+
+def _timed(func):
+    start = time.perf_counter()
+    value = func()
+    return value, time.perf_counter() - start
+
+
+def run(terms, names=tuple(CASES)):
+    """
+    Time each series both ways and measure its error.
+
+    Returns:
+        list: (name, loop seconds, series seconds, loop error, series error) rows
+    """
+    rows = []
+    for name in names:
+        loop, closed, reference = CASES[name](terms)
+        loop_value, loop_seconds = _timed(loop)
+        series_value, series_seconds = _timed(closed)
+        rows.append(
+            (
+                name,
+                loop_seconds,
+                series_seconds,
+                _relative_error(loop_value, reference),
+                _relative_error(series_value, reference),
+            )
+        )
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--terms", type=int, default=1_000_000)
+    parser.add_argument("--only", nargs="+", choices=list(CASES))
+    args = parser.parse_args()
+
+    rows = run(args.terms, args.only or tuple(CASES))
+    print(f"{args.terms} terms, NumPy {'on' if series.HAS_NUMPY else 'off'}")
+    print(
+        f"{'series':>10} {'loop ms':>9} {'series ms':>10} {'speedup':>9} "
+        f"{'loop rel err':>13} {'series rel err':>15}"
+    )
+    for name, loop_s, series_s, loop_err, series_err in rows:
+        print(
+            f"{name:>10} {loop_s * 1000:9.1f} {series_s * 1000:10.3f} "
+            f"{loop_s / series_s:8.0f}x {loop_err:13.1e} {series_err:15.1e}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,555 @@
+"""
+Performance History - CA3
+Keeps Locust results of every run in SQLite and reports trends and regressions
+
+Usage:
+  python -m tests.performance.history ingest tests/performance/performance-results
+  python -m tests.performance.history ingest performance-results --label "$BUILD_BUILDNUMBER" --fail-on-regression
+  python -m tests.performance.history compare
+  python -m tests.performance.history report --html tests/performance/performance-trends.html
+
+"ingest" reads <prefix>_stats.csv and <prefix>_stats_history.csv (written by
+locust --csv <prefix>; add --csv-full-history for per-endpoint history rows)
+into --db, then compares the run with earlier ones. Ingesting the same files
+twice is a no-op.
+
+A metric (p50/p95/p99 latency, requests/s, failure rate) regresses when it
+moved the bad way by at least --min-effect and the move is significant at
+--alpha:
+  * with 3+ earlier runs: one-sided z-test of the new value against the mean
+    and run-to-run standard deviation of the last --baseline-runs runs
+  * otherwise: one-sided Mann-Whitney U test on the per-second history of
+    both runs, one sample per --window seconds so Locust's rolling windows
+    do not overlap
+  * failure rate: one-sided two-proportion z-test against the previous run
+"""
+
+import argparse
+import csv
+import hashlib
+import html
+import math
+import os
+import sqlite3
+import statistics
+import sys
+import time
+from collections import namedtuple
+
+DEFAULT_DB = os.path.join(os.path.dirname(os.path.abspath(__file__)), "performance-history.sqlite")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    digest TEXT UNIQUE NOT NULL,
+    label TEXT,
+    started REAL NOT NULL,
+    duration REAL,
+    users INTEGER,
+    ingested REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS endpoint_stats (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    method TEXT NOT NULL,
+    name TEXT NOT NULL,
+    requests INTEGER NOT NULL,
+    failures INTEGER NOT NULL,
+    mean REAL, median REAL, min REAL, max REAL,
+    rps REAL, p50 REAL, p66 REAL, p75 REAL, p80 REAL, p90 REAL,
+    p95 REAL, p98 REAL, p99 REAL, p999 REAL, p100 REAL,
+    PRIMARY KEY (run_id, method, name)
+);
+CREATE TABLE IF NOT EXISTS history (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    ts INTEGER NOT NULL,
+    method TEXT NOT NULL,
+    name TEXT NOT NULL,
+    rps REAL, p50 REAL, p95 REAL, p99 REAL
+);
+CREATE INDEX IF NOT EXISTS history_run ON history (run_id, method, name);
+"""
+
+# (metric, whether a higher value is worse)
+METRICS = (("p50", True), ("p95", True), ("p99", True), ("rps", False))
+# endpoint_stats column -> Locust stats CSV column
+STATS_COLUMNS = {
+    "mean": "Average Response Time",
+    "median": "Median Response Time",
+    "min": "Min Response Time",
+    "max": "Max Response Time",
+    "rps": "Requests/s",
+    "p50": "50%",
+    "p66": "66%",
+    "p75": "75%",
+    "p80": "80%",
+    "p90": "90%",
+    "p95": "95%",
+    "p98": "98%",
+    "p99": "99%",
+    "p999": "99.9%",
+    "p100": "100%",
+}
+# Locust reports percentiles to two significant figures, so run-to-run
+# spread below this fraction of the mean is not meaningful
+NOISE_FLOOR = 0.02
+MIN_BASELINE_RUNS = 3
+MIN_SAMPLES = 5
+
+Finding = namedtuple(
+    "Finding", "method name metric baseline current change p_value test regression"
+)
+
+
+def _number(text):
+    if text in (None, "", "N/A"):
+        return None
+    return float(text)
+
+
+def connect(path=DEFAULT_DB):
+    """Open (creating if needed) a history database."""
+    conn = sqlite3.connect(path)
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def ingest(conn, prefix, label=None):
+    """
+    Store one Locust run.
+
+    Args:
+        conn (sqlite3.Connection): History database
+        prefix (str): The --csv prefix the run was written with
+        label (str): Build number, commit or other name for the run
+
+    Returns:
+        tuple: (run id, whether it was newly added)
+
+    Raises:
+        ValueError: If <prefix>_stats.csv is missing or malformed
+    """
+    stats_path = f"{prefix}_stats.csv"
+    history_path = f"{prefix}_stats_history.csv"
+    if not os.path.exists(stats_path):
+        raise ValueError(f"No Locust stats file at {stats_path}")
+    digest = hashlib.sha256()
+    with open(stats_path, "rb") as f:
+        digest.update(f.read())
+    history_rows = []
+    if os.path.exists(history_path):
+        with open(history_path, "rb") as f:
+            digest.update(f.read())
+        with open(history_path, newline="", encoding="utf-8") as f:
+            history_rows = list(csv.DictReader(f))
+    existing = conn.execute(
+        "SELECT id FROM runs WHERE digest = ?", (digest.hexdigest(),)
+    ).fetchone()
+    if existing:
+        return existing[0], False
+
+    with open(stats_path, newline="", encoding="utf-8") as f:
+        stats_rows = list(csv.DictReader(f))
+    if not stats_rows or "Request Count" not in stats_rows[0]:
+        raise ValueError(f"{stats_path} is not a Locust stats file")
+
+    timestamps = [int(row["Timestamp"]) for row in history_rows]
+    users = max((int(row["User Count"]) for row in history_rows), default=None)
+    started = min(timestamps) if timestamps else os.path.getmtime(stats_path)
+    duration = max(timestamps) - min(timestamps) if timestamps else None
+    with conn:
+        run_id = conn.execute(
+            "INSERT INTO runs (digest, label, started, duration, users, ingested)"
+            " VALUES (?, ?, ?, ?, ?, ?)",
+            (digest.hexdigest(), label, started, duration, users, time.time()),
+        ).lastrowid
+        conn.executemany(
+            f"INSERT INTO endpoint_stats (run_id, method, name, requests, failures,"
+            f" {', '.join(STATS_COLUMNS)})"
+            f" VALUES (?, ?, ?, ?, ?{', ?' * len(STATS_COLUMNS)})",
+            [
+                (
+                    run_id,
+                    row["Type"],
+                    row["Name"],
+                    int(row["Request Count"]),
+                    int(row["Failure Count"]),
+                    *(_number(row.get(column)) for column in STATS_COLUMNS.values()),
+                )
+                for row in stats_rows
+            ],
+        )
+        # Steady state only: full user count and percentiles available
+        conn.executemany(
+            "INSERT INTO history (run_id, ts, method, name, rps, p50, p95, p99)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    run_id,
+                    int(row["Timestamp"]),
+                    row["Type"],
+                    row["Name"],
+                    _number(row["Requests/s"]),
+                    _number(row["50%"]),
+                    _number(row["95%"]),
+                    _number(row["99%"]),
+                )
+                for row in history_rows
+                if int(row["User Count"]) == users and _number(row["50%"]) is not None
+            ],
+        )
+    return run_id, True
+
+
+def runs(conn, limit=None):
+    """
+    Returns:
+        list: (id, label, started) of stored runs, oldest first
+    """
+    rows = conn.execute("SELECT id, label, started FROM runs ORDER BY started DESC, id DESC")
+    rows = rows.fetchall()
+    if limit:
+        rows = rows[:limit]
+    return rows[::-1]
+
+
+def normal_sf(z):
+    """P(Z > z) for a standard normal Z."""
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def mann_whitney_greater(before, after):
+    """
+    One-sided Mann-Whitney U test that after tends to exceed before.
+
+    Normal approximation with tie correction.
+
+    Returns:
+        float: p-value
+    """
+    n1, n2 = len(before), len(after)
+    ranked = sorted([(value, 0) for value in before] + [(value, 1) for value in after])
+    ranks = [0.0] * len(ranked)
+    ties = 0.0
+    i = 0
+    while i < len(ranked):
+        j = i
+        while j + 1 < len(ranked) and ranked[j + 1][0] == ranked[i][0]:
+            j += 1
+        for k in range(i, j + 1):
+            ranks[k] = (i + j) / 2 + 1
+        size = j - i + 1
+        ties += size**3 - size
+        i = j + 1
+    rank_sum = sum(rank for rank, (_, group) in zip(ranks, ranked) if group == 1)
+    u = rank_sum - n2 * (n2 + 1) / 2
+    n = n1 + n2
+    variance = n1 * n2 / 12 * ((n + 1) - ties / (n * (n - 1)))
+    if variance <= 0:
+        return 1.0
+    # Continuity correction
+    return normal_sf((u - n1 * n2 / 2 - 0.5) / math.sqrt(variance))
+
+
+def two_proportion_greater(failures1, total1, failures2, total2):
+    """
+    One-sided two-proportion z-test that the second failure rate is higher.
+
+    Returns:
+        float: p-value
+    """
+    if not total1 or not total2:
+        return 1.0
+    pooled = (failures1 + failures2) / (total1 + total2)
+    variance = pooled * (1 - pooled) * (1 / total1 + 1 / total2)
+    if variance <= 0:
+        return 1.0
+    return normal_sf((failures2 / total2 - failures1 / total1) / math.sqrt(variance))
+
+
+def _stats(conn, run_id):
+    rows = conn.execute(
+        "SELECT method, name, requests, failures, p50, p95, p99, rps"
+        " FROM endpoint_stats WHERE run_id = ?",
+        (run_id,),
+    )
+    return {
+        (method, name): dict(
+            zip(("requests", "failures", "p50", "p95", "p99", "rps"), values)
+        )
+        for method, name, *values in rows
+    }
+
+
+def _samples(conn, run_id, method, name, metric, window):
+    rows = conn.execute(
+        f"SELECT {metric} FROM history WHERE run_id = ? AND method = ? AND name = ?"
+        f" AND {metric} IS NOT NULL ORDER BY ts",
+        (run_id, method, name),
+    ).fetchall()
+    return [value for (value,) in rows[::window]]
+
+
+def compare(conn, run_id, baseline_runs=5, alpha=0.01, min_effect=0.10, window=10):
+    """
+    Compare a run's endpoints with the runs before it.
+
+    Returns:
+        list: Finding per endpoint and metric that has a baseline
+    """
+    started = conn.execute("SELECT started FROM runs WHERE id = ?", (run_id,)).fetchone()
+    if started is None:
+        raise ValueError(f"Unknown run: {run_id}")
+    earlier = [
+        row[0]
+        for row in conn.execute(
+            "SELECT id FROM runs WHERE (started, id) < (?, ?) ORDER BY started DESC, id DESC",
+            (started[0], run_id),
+        )
+    ]
+    if not earlier:
+        return []
+    current = _stats(conn, run_id)
+    earlier_stats = [(rid, _stats(conn, rid)) for rid in earlier]
+    findings = []
+    for key, values in sorted(current.items()):
+        baseline = [(rid, stats[key]) for rid, stats in earlier_stats if key in stats]
+        baseline = baseline[:baseline_runs]
+        if not baseline:
+            continue
+        for metric, higher_is_worse in METRICS:
+            findings.append(
+                _compare_metric(
+                    conn, run_id, key, metric, higher_is_worse, values[metric], baseline,
+                    alpha, min_effect, window,
+                )
+            )
+        previous = baseline[0][1]
+        rate = values["failures"] / values["requests"] if values["requests"] else 0.0
+        before = previous["failures"] / previous["requests"] if previous["requests"] else 0.0
+        p_value = two_proportion_greater(
+            previous["failures"], previous["requests"], values["failures"], values["requests"]
+        )
+        findings.append(
+            Finding(
+                *key, "failure_rate", before, rate, rate - before, p_value,
+                "two-proportion", p_value < alpha and rate > before,
+            )
+        )
+    return findings
+
+
+def _compare_metric(conn, run_id, key, metric, higher_is_worse, value, baseline, alpha,
+                    min_effect, window):
+    history = [stats[metric] for _, stats in baseline if stats[metric] is not None]
+    if value is None or not history:
+        return Finding(*key, metric, None, value, None, None, "no data", False)
+    sign = 1 if higher_is_worse else -1
+    if len(history) >= MIN_BASELINE_RUNS:
+        reference = statistics.fmean(history)
+        spread = max(statistics.stdev(history), NOISE_FLOOR * abs(reference), 1e-9)
+        p_value = normal_sf(sign * (value - reference) / spread)
+        test = f"z vs {len(history)} runs"
+    else:
+        reference = history[0]
+        before = _samples(conn, baseline[0][0], *key, metric, window)
+        after = _samples(conn, run_id, *key, metric, window)
+        if len(before) >= MIN_SAMPLES and len(after) >= MIN_SAMPLES:
+            if not higher_is_worse:
+                before, after = [-v for v in before], [-v for v in after]
+            p_value = mann_whitney_greater(before, after)
+            test = "mann-whitney"
+        else:
+            p_value, test = None, "too few samples"
+    change = (value - reference) / reference if reference else None
+    regression = (
+        p_value is not None
+        and p_value < alpha
+        and change is not None
+        and sign * change >= min_effect
+    )
+    return Finding(*key, metric, reference, value, change, p_value, test, regression)
+
+
+def _format(value, metric):
+    if value is None:
+        return "-"
+    if metric == "failure_rate":
+        return f"{value * 100:.2f}%"
+    return f"{value:.1f}" if metric == "rps" else f"{value:.0f} ms"
+
+
+def print_findings(findings, show_all=False, out=None):
+    """Print regressions (or every comparison with show_all)."""
+    out = out or sys.stdout
+    rows = [f for f in findings if show_all or f.regression]
+    regressions = sum(f.regression for f in findings)
+    print(f"{regressions} regressions in {len(findings)} comparisons", file=out)
+    for f in rows:
+        change = "-" if f.change is None else (
+            f"{f.change * 100:+.2f}pp" if f.metric == "failure_rate" else f"{f.change:+.1%}"
+        )
+        p_value = "-" if f.p_value is None else f"{f.p_value:.2g}"
+        flag = "REGRESSION" if f.regression else ""
+        print(
+            f"  {f.method:>5} {f.name:<28} {f.metric:<12} {_format(f.baseline, f.metric):>10}"
+            f" -> {_format(f.current, f.metric):>10} {change:>8} p={p_value:<7} {f.test} {flag}",
+            file=out,
+        )
+
+
+def _sparkline(values, width=160, height=36):
+    points = [(i, v) for i, v in enumerate(values) if v is not None]
+    if not points:
+        return ""
+    low = min(v for _, v in points)
+    high = max(v for _, v in points)
+    span = (high - low) or 1.0
+    step = width / max(1, len(values) - 1)
+    coords = " ".join(
+        f"{i * step:.1f},{height - 3 - (v - low) / span * (height - 6):.1f}" for i, v in points
+    )
+    last_x, last_y = coords.rsplit(" ", 1)[-1].split(",")
+    title = html.escape(" / ".join(f"{v:.4g}" for _, v in points))
+    return (
+        f'<svg width="{width}" height="{height}" viewBox="0 0 {width} {height}">'
+        f"<title>{title}</title>"
+        f'<polyline fill="none" stroke="#4a6cf7" stroke-width="1.5" points="{coords}"/>'
+        f'<circle cx="{last_x}" cy="{last_y}" r="2.5" fill="#4a6cf7"/></svg>'
+    )
+
+
+def report(conn, path, last=30, **compare_options):
+    """
+    Write a static HTML trend report of the last runs.
+
+    Returns:
+        list: Findings for the newest run
+    """
+    recent = runs(conn, last)
+    findings = compare(conn, recent[-1][0], **compare_options) if recent else []
+    flagged = {(f.method, f.name, f.metric): f for f in findings}
+    series = {}
+    for index, (run_id, _, _) in enumerate(recent):
+        for key, values in _stats(conn, run_id).items():
+            columns = series.setdefault(key, {metric: [None] * len(recent) for metric, _ in METRICS})
+            for metric, _ in METRICS:
+                columns[metric][index] = values[metric]
+
+    def cell(key, metric):
+        values = series[key][metric]
+        finding = flagged.get((*key, metric))
+        note = ""
+        if finding is not None and finding.change is not None:
+            note = f"{finding.change:+.1%}"
+            if finding.regression:
+                note = f'<span class="bad">{note} (p={finding.p_value:.2g})</span>'
+        latest = values[-1]
+        return (
+            f"<td>{_sparkline(values)}<div>{_format(latest, metric)} {note}</div></td>"
+        )
+
+    names = sorted(series, key=lambda key: (key[1] != "Aggregated", key[1], key[0]))
+    rows = "".join(
+        f"<tr><th>{html.escape(f'{method} {name}'.strip())}</th>"
+        + "".join(cell((method, name), metric) for metric, _ in METRICS)
+        + "</tr>"
+        for method, name in names
+    )
+    regressions = [f for f in findings if f.regression]
+    listed = "".join(
+        f"<li>{html.escape(f'{f.method} {f.name}'.strip())}: {f.metric} "
+        f"{_format(f.baseline, f.metric)} &rarr; {_format(f.current, f.metric)} "
+        f"(p={f.p_value:.2g}, {html.escape(f.test)})</li>"
+        for f in regressions
+    )
+    labels = ", ".join(html.escape(str(label or run_id)) for run_id, label, _ in recent[-5:])
+    document = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="UTF-8">
+<title>Performance Trends - CA3</title>
+<style>
+body {{ font-family: Arial, sans-serif; margin: 24px; color: #333; }}
+table {{ border-collapse: collapse; }}
+th, td {{ border-bottom: 1px solid #ddd; padding: 6px 10px; text-align: left; vertical-align: top; }}
+td div {{ font-size: 13px; }}
+.bad {{ color: #c0392b; font-weight: bold; }}
+</style>
+</head>
+<body>
+<h1>Performance Trends</h1>
+<p>{len(recent)} runs (latest: {labels}). Sparklines run oldest to newest; the
+change and p-value compare the latest run with the runs before it.</p>
+<h2>{len(regressions)} regressions in the latest run</h2>
+<ul>{listed}</ul>
+<table>
+<tr><th>Endpoint</th><th>p50</th><th>p95</th><th>p99</th><th>Requests/s</th></tr>
+{rows}
+</table>
+</body>
+</html>
+"""
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(document)
+    return findings
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--db", default=DEFAULT_DB, help="History database")
+    parser.add_argument("--alpha", type=float, default=0.01)
+    parser.add_argument("--min-effect", type=float, default=0.10)
+    parser.add_argument("--baseline-runs", type=int, default=5)
+    parser.add_argument("--window", type=int, default=10, help="Seconds per history sample")
+    commands = parser.add_subparsers(dest="command", required=True)
+    add = commands.add_parser("ingest", help="Store a run and compare it with earlier runs")
+    add.add_argument("prefix", help="Locust --csv prefix")
+    add.add_argument("--label")
+    add.add_argument("--fail-on-regression", action="store_true")
+    check = commands.add_parser("compare", help="Compare a run (default: latest)")
+    check.add_argument("--run", type=int)
+    check.add_argument("--all", action="store_true", help="Show every comparison")
+    check.add_argument("--fail-on-regression", action="store_true")
+    trend = commands.add_parser("report", help="Write the HTML trend report")
+    trend.add_argument(
+        "--html",
+        default=os.path.join(os.path.dirname(os.path.abspath(__file__)), "performance-trends.html"),
+    )
+    trend.add_argument("--last", type=int, default=30, help="Runs to include")
+    args = parser.parse_args(argv)
+
+    options = {
+        "baseline_runs": args.baseline_runs,
+        "alpha": args.alpha,
+        "min_effect": args.min_effect,
+        "window": args.window,
+    }
+    conn = connect(args.db)
+    if args.command == "report":
+        findings = report(conn, args.html, args.last, **options)
+        print(f"Wrote {args.html}")
+        print_findings(findings)
+        return 0
+
+    if args.command == "ingest":
+        try:
+            run_id, added = ingest(conn, args.prefix, args.label)
+        except ValueError as e:
+            parser.error(str(e))
+        print(f"Run {run_id} {'ingested' if added else 'already stored'}")
+        show_all = False
+    else:
+        latest = runs(conn, 1)
+        run_id = args.run or (latest[0][0] if latest else None)
+        if run_id is None:
+            parser.error("No runs stored yet")
+        show_all = args.all
+    findings = compare(conn, run_id, **options)
+    print_findings(findings, show_all)
+    if args.fail_on_regression and any(f.regression for f in findings):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,212 @@
+"""
+Traffic Replay - CA3
+Replays a captured traffic file against the app and reports latency percentiles and divergences
+
+Usage:
+  python -m tests.performance.replay capture.bin
+  python -m tests.performance.replay capture.bin --speed 10 --concurrency 8
+  python -m tests.performance.replay capture.bin --host http://localhost:5000 --speed 0
+
+Capture traffic with CAPTURE_PATH=capture.bin (see README). Without --host,
+requests go through the in-process Flask test client. --speed 1 keeps the
+recorded inter-arrival times, N plays N times faster and 0 sends as fast as
+--concurrency allows. A divergence is a response whose status or body digest
+differs from the recorded one: run against the baseline first to confirm it
+reproduces, then against the change under test.
+"""
+
+import argparse
+import statistics
+import sys
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+from src import capture
+
+Outcome = namedtuple("Outcome", "record status body latency lag")
+
+
+def in_process_sender():
+    """
+    Send requests through a Flask test client per thread.
+
+    Returns:
+        callable: send(method, path, body, headers) -> (status, body bytes)
+    """
+    import app as app_module
+
+    app_module.app.config["TESTING"] = True
+    # Never append the replay to a capture configured in the environment
+    app_module.traffic_capture = None
+    local = threading.local()
+
+    def send(method, path, body, headers):
+        client = getattr(local, "client", None)
+        if client is None:
+            client = local.client = app_module.app.test_client()
+        response = client.open(path, method=method, data=body, headers=headers)
+        return response.status_code, response.get_data()
+
+    return send
+
+
+def http_sender(base_url, concurrency):
+    """
+    Send requests over pooled keep-alive HTTP connections.
+
+    Returns:
+        callable: send(method, path, body, headers) -> (status, body bytes)
+    """
+    from calculator_client.sync import ConnectionPool
+
+    return ConnectionPool(base_url, size=concurrency).request
+
+
+def replay(records, send, speed=1.0, concurrency=4):
+    """
+    Play records back, preserving their relative timing scaled by speed.
+
+    Args:
+        records (list): CapturedRequest records ordered by timestamp
+        send (callable): See in_process_sender()
+        speed (float): Time compression (0 = as fast as possible)
+        concurrency (int): Requests in flight at most
+
+    Returns:
+        tuple: (list of Outcome, elapsed seconds)
+    """
+    outcomes = []
+    lock = threading.Lock()
+
+    def one(record, due):
+        method, path, body, headers = capture.replay_request(record)
+        started = time.perf_counter()
+        try:
+            status, data = send(method, path, body, headers)
+        except Exception:  # pylint: disable=broad-except
+            # Connection failures count as status 0 divergences
+            status, data = 0, b""
+        latency = time.perf_counter() - started
+        with lock:
+            outcomes.append(Outcome(record, status, data, latency, started - due))
+
+    start = time.perf_counter()
+    first = records[0].timestamp if records else 0.0
+    with ThreadPoolExecutor(concurrency) as executor:
+        for record in records:
+            due = start
+            if speed > 0:
+                due = start + (record.timestamp - first) / speed
+                delay = due - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+            executor.submit(one, record, due)
+    return outcomes, time.perf_counter() - start
+
+
+def divergences(outcomes):
+    """
+    Outcomes whose status or body differs from the capture.
+
+    Bodies are only compared where the capture has a digest (streamed
+    responses are recorded without one).
+
+    Returns:
+        list: (Outcome, reason) pairs
+    """
+    found = []
+    for outcome in outcomes:
+        record = outcome.record
+        if outcome.status != record.status:
+            found.append((outcome, f"status {record.status} -> {outcome.status}"))
+        elif (
+            record.digest != capture.NO_DIGEST
+            and capture.response_digest(outcome.body) != record.digest
+        ):
+            found.append((outcome, "response body differs"))
+    return found
+
+
+def _percentiles(values):
+    if not values:
+        return [0.0] * 4
+    values = sorted(values)
+
+    def pick(q):
+        return values[min(len(values) - 1, int(q * len(values)))]
+
+    return [statistics.median(values), pick(0.9), pick(0.99), values[-1]]
+
+
+def report(outcomes, elapsed, skipped, show=5):
+    """
+    Print latency percentiles, per-operation latency and divergences.
+
+    Returns:
+        int: Number of divergences
+    """
+    print(
+        f"{len(outcomes)} requests in {elapsed:.2f}s "
+        f"({len(outcomes) / elapsed if elapsed else 0:.0f} req/s); "
+        f"{skipped} truncated records skipped"
+    )
+    print(f"{'latency ms':<22} {'p50':>8} {'p90':>8} {'p99':>8} {'max':>8}")
+    rows = [
+        ("replay", [o.latency * 1000 for o in outcomes]),
+        ("recorded (server)", [o.record.latency_us / 1000 for o in outcomes]),
+        ("schedule lag", [max(0.0, o.lag) * 1000 for o in outcomes]),
+    ]
+    for label, values in rows:
+        print(f"{label:<22} " + " ".join(f"{v:8.2f}" for v in _percentiles(values)))
+
+    by_operation = {}
+    for outcome in outcomes:
+        name = (
+            f"{capture.KIND_NAMES.get(outcome.record.kind, '?')}:"
+            f"{outcome.record.fields.get('operation', '')}"
+        )
+        by_operation.setdefault(name, []).append(outcome.latency * 1000)
+    print(f"\n{'operation':<22} {'count':>8} {'p50':>8} {'p99':>8}")
+    for name, values in sorted(by_operation.items(), key=lambda item: -len(item[1])):
+        p50, _, p99, _ = _percentiles(values)
+        print(f"{name:<22} {len(values):>8} {p50:8.2f} {p99:8.2f}")
+
+    found = divergences(outcomes)
+    print(f"\n{len(found)} divergences")
+    for outcome, reason in found[:show]:
+        print(f"  {reason}: {outcome.record.fields}")
+    return len(found)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("capture_file")
+    parser.add_argument("--host", help="Base URL to replay against (default: in-process)")
+    parser.add_argument("--speed", type=float, default=1.0)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--limit", type=int, help="Replay only the first N records")
+    parser.add_argument("--show", type=int, default=5, help="Divergences to print")
+    parser.add_argument(
+        "--fail-on-divergence", action="store_true", help="Exit 1 if any response diverged"
+    )
+    args = parser.parse_args()
+
+    records = capture.load(args.capture_file)
+    if args.limit:
+        records = records[:args.limit]
+    replayable = [record for record in records if not record.truncated]
+    send = (
+        http_sender(args.host, args.concurrency)
+        if args.host
+        else in_process_sender()
+    )
+    outcomes, elapsed = replay(replayable, send, args.speed, args.concurrency)
+    diverged = report(outcomes, elapsed, len(records) - len(replayable), args.show)
+    if diverged and args.fail_on_divergence:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
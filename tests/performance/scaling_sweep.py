@@ -0,0 +1,214 @@
+"""
+Worker Scaling Sweep - CA3
+Measures throughput, latency and memory of app:app under gunicorn across worker counts and classes
+
+Usage:
+  python -m tests.performance.scaling_sweep
+  python -m tests.performance.scaling_sweep --workers 1 2 4 8 --classes sync gthread --duration 20
+  python -m tests.performance.scaling_sweep --csv sweep.csv --plot sweep.png
+
+For each configuration a fresh gunicorn is started and driven closed-loop
+(no think time) by --connections connections spread over several driver
+processes, using the locustfile's request mix (tests/performance/workload.py).
+"efficiency" is req/s per worker relative to the smallest worker count of
+the same class: 100% means linear scaling. "peak RSS" is the summed
+high-water mark of the gunicorn master and workers (Linux only). Keep the
+driver off the measured cores (e.g. taskset) when sweeping up to all CPUs.
+"""
+
+import argparse
+import csv
+import importlib.util
+import multiprocessing
+import os
+import random
+import statistics
+import sys
+import threading
+import time
+
+from calculator_client.sync import ConnectionPool
+from tests.performance.bench_client import start_server
+from tests.performance.workload import Workload
+
+
+def _drive(args):
+    base_url, connections, duration, seed = args
+    workload = Workload()
+    deadline = time.perf_counter() + duration
+    results = []
+    lock = threading.Lock()
+
+    def connection(index):
+        rng = random.Random(seed * 1000 + index)  # nosec B311 - load generation
+        pool = ConnectionPool(base_url, size=1)
+        latencies, errors = [], 0
+        while time.perf_counter() < deadline:
+            _, method, path, body = workload.next_request(rng)
+            headers = {"Content-Type": "application/json"} if body else {}
+            started = time.perf_counter()
+            try:
+                status, _ = pool.request(method, path, body, headers)
+            except OSError:
+                errors += 1
+                continue
+            latencies.append(time.perf_counter() - started)
+            # The divide-by-zero task expects its 400
+            if status >= 500:
+                errors += 1
+        pool.close()
+        with lock:
+            results.append((latencies, errors))
+
+    threads = [threading.Thread(target=connection, args=(i,)) for i in range(connections)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    latencies = [value for chunk, _ in results for value in chunk]
+    return latencies, sum(errors for _, errors in results)
+
+
+def _peak_rss_mb(pid):
+    """Summed VmHWM of a process and its children, or None off Linux."""
+    pids = [pid]
+    try:
+        with open(f"/proc/{pid}/task/{pid}/children", encoding="ascii") as f:
+            pids += [int(child) for child in f.read().split()]
+        total_kb = 0
+        for each in pids:
+            with open(f"/proc/{each}/status", encoding="ascii") as f:
+                for line in f:
+                    if line.startswith("VmHWM:"):
+                        total_kb += int(line.split()[1])
+    except OSError:
+        return None
+    return total_kb / 1024
+
+
+def measure(workers, worker_class, threads, connections, duration, drivers, warmup):
+    """
+    Start one configuration, load it and tear it down.
+
+    Returns:
+        dict: Configuration and its req/s, p50/p99 ms, errors and peak RSS MB
+    """
+    proc, base_url, _ = start_server(workers, worker_class, threads)
+    try:
+        per_driver = [connections // drivers + (i < connections % drivers) for i in range(drivers)]
+        jobs = [(base_url, n, duration, seed) for seed, n in enumerate(per_driver) if n]
+        with multiprocessing.Pool(len(jobs)) as pool:
+            if warmup:
+                pool.map(_drive, [(url, n, warmup, seed) for url, n, _, seed in jobs])
+            began = time.perf_counter()
+            outcomes = pool.map(_drive, jobs)
+            elapsed = time.perf_counter() - began
+        rss = _peak_rss_mb(proc.pid)
+    finally:
+        proc.terminate()
+        proc.wait()
+
+    latencies = sorted(value for chunk, _ in outcomes for value in chunk)
+    count = len(latencies)
+    return {
+        "class": worker_class,
+        "workers": workers,
+        "threads": threads if worker_class == "gthread" else 1,
+        "req_s": count / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000 if count else 0.0,
+        "p99_ms": latencies[max(0, int(count * 0.99) - 1)] * 1000 if count else 0.0,
+        "errors": sum(errors for _, errors in outcomes),
+        "peak_rss_mb": rss,
+    }
+
+
+def add_efficiency(rows):
+    """Add per-worker scaling efficiency against each class's smallest run."""
+    for row in rows:
+        base = min(
+            (r for r in rows if r["class"] == row["class"]), key=lambda r: r["workers"]
+        )
+        per_worker = row["req_s"] / row["workers"]
+        base_per_worker = base["req_s"] / base["workers"]
+        row["efficiency_pct"] = 100 * per_worker / base_per_worker if base_per_worker else 0.0
+    return rows
+
+
+def plot(rows, path):
+    """Plot req/s and p99 against worker count, one line per class."""
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    figure, (throughput, tail) = plt.subplots(1, 2, figsize=(11, 4))
+    for worker_class in sorted({row["class"] for row in rows}):
+        mine = sorted((r for r in rows if r["class"] == worker_class), key=lambda r: r["workers"])
+        xs = [r["workers"] for r in mine]
+        throughput.plot(xs, [r["req_s"] for r in mine], marker="o", label=worker_class)
+        tail.plot(xs, [r["p99_ms"] for r in mine], marker="o", label=worker_class)
+    throughput.set(xlabel="workers", ylabel="req/s", title="Throughput")
+    tail.set(xlabel="workers", ylabel="p99 ms", title="Tail latency")
+    throughput.legend()
+    figure.tight_layout()
+    figure.savefig(path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    cpus = os.cpu_count() or 1
+    parser.add_argument(
+        "--workers", type=int, nargs="+",
+        default=sorted({1, 2, max(1, cpus // 2), cpus, 2 * cpus + 1}),
+    )
+    parser.add_argument("--classes", nargs="+", default=["sync", "gthread"])
+    parser.add_argument("--threads", type=int, default=4, help="Threads per gthread worker")
+    parser.add_argument("--connections", type=int, default=32)
+    parser.add_argument("--drivers", type=int, default=min(4, cpus))
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--warmup", type=float, default=2.0)
+    parser.add_argument("--csv", help="Also write the table as CSV")
+    parser.add_argument("--plot", help="Also plot to this image (needs matplotlib)")
+    args = parser.parse_args()
+
+    if not importlib.util.find_spec("gunicorn") or sys.platform == "win32":
+        parser.error("gunicorn is required (Linux/macOS)")
+
+    rows = []
+    for worker_class in args.classes:
+        for workers in args.workers:
+            row = measure(
+                workers, worker_class, args.threads, args.connections,
+                args.duration, args.drivers, args.warmup,
+            )
+            rows.append(row)
+            print(f"measured {worker_class} x{workers}: {row['req_s']:.0f} req/s", file=sys.stderr)
+    add_efficiency(rows)
+
+    print(f"{cpus} CPUs, {args.connections} connections, {args.duration:g}s per configuration")
+    print(
+        f"{'class':>8} {'workers':>7} {'threads':>7} {'req/s':>8} {'p50 ms':>7} "
+        f"{'p99 ms':>7} {'errors':>6} {'peak RSS':>9} {'efficiency':>10}"
+    )
+    for row in rows:
+        rss = "-" if row["peak_rss_mb"] is None else f"{row['peak_rss_mb']:.0f} MB"
+        print(
+            f"{row['class']:>8} {row['workers']:>7} {row['threads']:>7} {row['req_s']:8.0f} "
+            f"{row['p50_ms']:7.2f} {row['p99_ms']:7.2f} {row['errors']:>6} {rss:>9} "
+            f"{row['efficiency_pct']:9.0f}%"
+        )
+
+    if args.csv:
+        with open(args.csv, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+            writer.writeheader()
+            writer.writerows(rows)
+    if args.plot:
+        if importlib.util.find_spec("matplotlib") is None:
+            print("matplotlib is not installed; skipping --plot", file=sys.stderr)
+        else:
+            plot(rows, args.plot)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+The locustfile's request mix, usable without Locust.
+
+Task weights are read from the @task decorators in locustfile.py, so
+benchmark drivers follow the same mix as the load tests. Each task has a
+request builder here mirroring the operand ranges the task uses.
+"""
+
+import ast
+import json
+import os
+
+LOCUSTFILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "locustfile.py")
+
+
+def _calculate(operation, num1, num2=None):
+    payload = {"operation": operation, "num1": num1}
+    if num2 is not None:
+        payload["num2"] = num2
+    return "POST", "/api/calculate", json.dumps(payload).encode()
+
+
+# locustfile task name -> builder(rng) returning (method, path, body)
+BUILDERS = {
+    "health_check": lambda rng: ("GET", "/health", None),
+    "home_page": lambda rng: ("GET", "/", None),
+    "api_add": lambda rng: _calculate("add", rng.randint(1, 100), rng.randint(1, 100)),
+    "api_subtract": lambda rng: _calculate(
+        "subtract", rng.randint(50, 150), rng.randint(1, 50)
+    ),
+    "api_multiply": lambda rng: _calculate(
+        "multiply", rng.randint(1, 20), rng.randint(1, 20)
+    ),
+    "api_divide": lambda rng: _calculate("divide", rng.randint(10, 100), rng.randint(1, 10)),
+    "api_power": lambda rng: _calculate("power", rng.randint(2, 10), rng.randint(2, 5)),
+    "api_square_root": lambda rng: _calculate("square_root", rng.randint(1, 100)),
+    "api_modulo": lambda rng: _calculate("modulo", rng.randint(10, 100), rng.randint(3, 10)),
+    "api_percentage": lambda rng: _calculate(
+        "percentage", rng.randint(100, 1000), rng.randint(5, 50)
+    ),
+    "api_error_handling_divide_by_zero": lambda rng: _calculate("divide", 10, 0),
+}
+
+
+def locust_weights(path=LOCUSTFILE):
+    """
+    Read task weights from the @task decorators of a locustfile.
+
+    Returns:
+        dict: {task method name: weight}
+    """
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+    weights = {}
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.FunctionDef):
+            continue
+        for decorator in node.decorator_list:
+            if isinstance(decorator, ast.Name) and decorator.id == "task":
+                weights[node.name] = 1
+            elif (
+                isinstance(decorator, ast.Call)
+                and getattr(decorator.func, "id", None) == "task"
+            ):
+                weights[node.name] = decorator.args[0].value if decorator.args else 1
+    return weights
+
+
+class Workload:
+    """Weighted random requests following the locustfile mix."""
+
+    def __init__(self, weights=None):
+        """
+        Args:
+            weights (dict): {task name: weight} (default: from locustfile.py)
+
+        Raises:
+            ValueError: If a task has no request builder
+        """
+        weights = locust_weights() if weights is None else weights
+        missing = sorted(set(weights) - set(BUILDERS))
+        if missing:
+            raise ValueError(f"No request builder for locust tasks: {', '.join(missing)}")
+        self.names = list(weights)
+        self.weights = [weights[name] for name in self.names]
+
+    def next_request(self, rng):
+        """
+        Pick the next request.
+
+        Args:
+            rng (random.Random): Source of randomness for this driver
+
+        Returns:
+            tuple: (task name, method, path, body bytes or None)
+        """
+        name = rng.choices(self.names, self.weights)[0]
+        return (name, *BUILDERS[name](rng))
@@ -0,0 +1,87 @@
+"""
+Unit tests for the asynchronous access logger.
+"""
+
+import json
+import logging
+
+import pytest
+from src.access_log import AccessLogger
+
+
+class _ListHandler(logging.Handler):
+    """Logging handler that keeps emitted messages in memory."""
+
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+class TestAccessLogger:
+    """Test suite for AccessLogger."""
+
+    @pytest.fixture
+    def handler(self):
+        """
+        Fixture providing an in-memory handler on a private logger.
+
+        Returns:
+            _ListHandler: Handler collecting log lines
+        """
+        return _ListHandler()
+
+    def _make_logger(self, handler, **kwargs):
+        logger = logging.getLogger(f"test.access.{id(handler)}")
+        logger.propagate = False
+        logger.setLevel(logging.INFO)
+        logger.addHandler(handler)
+        return AccessLogger(logger=logger, **kwargs)
+
+    def test_records_are_written_as_json(self, handler):
+        """Test records are formatted as structured JSON lines."""
+        access = self._make_logger(handler, success_sample_rate=1.0)
+        access.log("POST /api/calculate", "add", 200, 1.23456)
+        access.close()
+
+        record = json.loads(handler.messages[0])
+        assert record["route"] == "POST /api/calculate"
+        assert record["operation"] == "add"
+        assert record["status"] == 200
+        assert record["latency_ms"] == 1.235
+        assert record["error"] is None
+
+    def test_errors_sampled_separately(self, handler):
+        """Test successes can be dropped by sampling while errors are kept."""
+        access = self._make_logger(
+            handler, success_sample_rate=0.0, error_sample_rate=1.0
+        )
+        access.log("POST /api/calculate", "add", 200, 1.0)
+        access.log("POST /api/calculate", "divide", 400, 1.0, "Cannot divide by zero")
+        access.close()
+
+        assert len(handler.messages) == 1
+        assert json.loads(handler.messages[0])["error"] == "Cannot divide by zero"
+
+    def test_full_buffer_drops_instead_of_blocking(self, handler):
+        """Test records are dropped and counted when the queue is full."""
+        access = self._make_logger(handler, success_sample_rate=1.0, max_queue_size=1)
+        # Keep the writer from draining the queue
+        access._ensure_writer = lambda: None
+        access.log("GET /", None, 200, 1.0)
+        access.log("GET /", None, 200, 1.0)
+
+        assert access.stats()["enqueued"] == 1
+        assert access.stats()["dropped"] == 1
+
+    def test_stats_counts_written_records(self, handler):
+        """Test the written counter tracks records handed to the logger."""
+        access = self._make_logger(handler, success_sample_rate=1.0)
+        for _ in range(3):
+            access.log("GET /health", None, 200, 0.1)
+        access.close()
+
+        assert access.stats()["written"] == 3
+        assert access.stats()["queued"] == 0
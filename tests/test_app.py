@@ -0,0 +1,768 @@
+"""
+Integration tests for the Flask application.
+Drives the routes through the Flask test client.
+"""
+
+import json
+import math
+import os
+import struct
+
+import pytest
+from app import app
+import app as app_module
+from src import (
+    audit_log,
+    batcher,
+    capture,
+    linalg,
+    profiler,
+    shared_cache,
+    watchdog,
+    windows,
+)
+
+
+class TestApp:
+    """Test suite for the Flask routes."""
+
+    @pytest.fixture
+    def client(self):
+        """
+        Fixture to create a Flask test client for each test.
+
+        Returns:
+            FlaskClient: Test client bound to the app
+        """
+        app.config["TESTING"] = True
+        with app.test_client() as client:
+            yield client
+
+    def test_api_calculate_add(self, client):
+        """Test a basic API calculation."""
+        response = client.post(
+            "/api/calculate", json={"operation": "add", "num1": 5, "num2": 3}
+        )
+        assert response.status_code == 200
+        assert response.get_json()["result"] == 8
+
+    def test_api_calculate_divide_by_zero(self, client):
+        """Test calculator errors are reported as 400."""
+        response = client.post(
+            "/api/calculate", json={"operation": "divide", "num1": 1, "num2": 0}
+        )
+        assert response.status_code == 400
+        assert response.get_json()["error"] == "Cannot divide by zero"
+
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            {"operation": "multiply", "num1": 6, "num2": 7},
+            {"operation": "divide", "num1": 1.5, "num2": -0.25},
+            {"operation": "power", "num1": 10, "num2": 400},
+            {"operation": "multiply", "num1": 1e308, "num2": -10},
+            {"operation": "square_root", "num1": 2, "num2": 9},
+            {"operation": "factorial", "num1": 20.0},
+            {"operation": "factorial", "num1": 30},
+            {"operation": "is_prime", "num1": 97},
+            {"operation": "factorize", "num1": 360},
+            {"operation": "gcd", "num1": 2**70, "num2": 2**64},
+            {"operation": "divide", "num1": 1, "num2": 0},
+            {"operation": "add", "num1": 1},
+            {"operation": "add", "num1": True, "num2": 2},
+            {"operation": " add ", "num1": 1, "num2": 2},
+            {"operation": "add", "num1": "1", "num2": 2},
+            {"operation": "add", "num1": 1, "num2": 2, "representation": "hex"},
+            {"operation": "cube", "num1": 1, "num2": 2},
+            {"operation": ["add"], "num1": 1, "num2": 2},
+            {"num1": 1},
+            {},
+            [1, 2],
+        ],
+    )
+    def test_api_calculate_fast_path_matches(self, client, monkeypatch, payload):
+        """Test the fast path returns exactly what the general path does."""
+        responses = []
+        for fast in (False, True):
+            monkeypatch.setattr("app.API_FAST_PATH", fast)
+            response = client.post("/api/calculate", json=payload)
+            responses.append((response.status_code, response.content_type, response.data))
+        assert responses[0] == responses[1]
+
+    def test_metrics_reports_coalescing(self, client):
+        """Test the metrics endpoint exposes the coalescing counters."""
+        client.post("/api/calculate", json={"operation": "add", "num1": 1, "num2": 2})
+        response = client.get("/metrics")
+        assert response.status_code == 200
+        coalescing = response.get_json()["coalescing"]
+        assert coalescing["executed"] >= 1
+        assert "coalesced" in coalescing
+
+    def test_api_calculate_server_timing_header(self, client):
+        """Test API responses carry per-phase Server-Timing entries."""
+        response = client.post(
+            "/api/calculate", json={"operation": "power", "num1": 2, "num2": 8}
+        )
+        header = response.headers["Server-Timing"]
+        for phase in ("parse", "validate", "compute", "serialize", "total"):
+            assert f"{phase};dur=" in header
+
+    def test_form_server_timing_header(self, client):
+        """Test form submissions carry per-phase Server-Timing entries."""
+        response = client.post(
+            "/", data={"operation": "add", "num1": "1", "num2": "2"}
+        )
+        assert response.status_code == 200
+        assert "render;dur=" in response.headers["Server-Timing"]
+
+    def test_metrics_reports_phase_timings(self, client):
+        """Test phase timings are aggregated into the metrics endpoint."""
+        client.post("/api/calculate", json={"operation": "add", "num1": 1, "num2": 2})
+        phases = client.get("/metrics").get_json()["phases"]
+        assert phases["POST /api/calculate"]["compute"]["count"] >= 1
+
+    def test_calculations_are_audited(self, client, monkeypatch, tmp_path):
+        """Test successful and failed calculations are written to the audit ring."""
+        trail = audit_log.AuditLog(str(tmp_path / "audit.ring"), capacity=16)
+        monkeypatch.setattr("app.audit_trail", trail)
+        client.post("/api/calculate", json={"operation": "add", "num1": 5, "num2": 3})
+        client.post("/api/calculate", json={"operation": "divide", "num1": 1, "num2": 0})
+        records = trail.records()
+        trail.close()
+
+        assert [(r["operation"], r["status"]) for r in records] == [
+            ("add", "ok"),
+            ("divide", "error"),
+        ]
+        assert records[1]["result"] == "Cannot divide by zero"
+
+    def test_huge_result_falls_back_to_scientific(self, client):
+        """Test results past the exact digit limit are not converted in full."""
+        response = client.post(
+            "/api/calculate", json={"operation": "power", "num1": 10, "num2": 5000}
+        )
+        assert response.status_code == 200
+        data = response.get_json()
+        assert data["result"] == "1.0000000000000000e+5000"
+        assert data["representation"] == "scientific"
+        assert data["digits"] == 5001
+
+    def test_result_representation_modes(self, client):
+        """Test explicit digits and hex representations."""
+        payload = {"operation": "factorial", "num1": 20}
+        digits = client.post(
+            "/api/calculate", json={**payload, "representation": "digits"}
+        ).get_json()
+        assert digits["result"] == 19
+        hexed = client.post(
+            "/api/calculate", json={**payload, "representation": "hex"}
+        ).get_json()
+        assert hexed["result"] == hex(2432902008176640000)
+
+    def test_result_decimal_download(self, client):
+        """Test the decimal representation streams the full expansion."""
+        response = client.post(
+            "/api/calculate",
+            json={"operation": "fibonacci", "num1": 30000, "representation": "decimal"},
+        )
+        assert response.status_code == 200
+        assert response.mimetype == "text/plain"
+        text = response.get_data(as_text=True)
+        assert len(text) == int(response.headers["Content-Length"]) == 6270
+        assert text.startswith("19042")
+
+    def test_unknown_representation(self, client):
+        """Test an unknown representation is rejected with 400."""
+        response = client.post(
+            "/api/calculate",
+            json={"operation": "add", "num1": 1, "num2": 2, "representation": "octal"},
+        )
+        assert response.status_code == 400
+        assert "Unknown representation" in response.get_json()["error"]
+
+    def test_admin_disabled_without_token(self, client, monkeypatch):
+        """Test admin endpoints are hidden when ADMIN_TOKEN is unset."""
+        monkeypatch.setattr("app.ADMIN_TOKEN", "")
+        assert client.get("/admin/profile").status_code == 404
+
+    def test_admin_rejects_wrong_token(self, client, monkeypatch):
+        """Test admin endpoints require the configured token."""
+        monkeypatch.setattr("app.ADMIN_TOKEN", "secret")
+        response = client.get("/admin/profile", headers={"X-Admin-Token": "guess"})
+        assert response.status_code == 403
+
+    def test_admin_profile_returns_collapsed_stacks(self, client, monkeypatch):
+        """Test the profile endpoint serves sampled request stacks."""
+        sampler = profiler.SamplingProfiler(interval=3600)
+        monkeypatch.setattr("app.ADMIN_TOKEN", "secret")
+        monkeypatch.setattr("app.sampling_profiler", sampler)
+        headers = {"X-Admin-Token": "secret"}
+
+        sampler.enter()
+        sampler.sample()
+        sampler.exit()
+        response = client.get("/admin/profile", headers=headers)
+        assert response.status_code == 200
+        assert response.mimetype == "text/plain"
+        assert response.get_data(as_text=True).rstrip().endswith(" 1")
+
+        reset = client.delete("/admin/profile", headers=headers)
+        assert reset.get_json()["samples"] == 0
+        sampler.close()
+
+    def test_admin_slow_requests_lists_overdue_requests(self, client, monkeypatch):
+        """Test the slow-request endpoint serves watchdog records and resets them."""
+        dog = watchdog.SlowRequestWatchdog(threshold=3600, interval=3600)
+        monkeypatch.setattr("app.ADMIN_TOKEN", "secret")
+        monkeypatch.setattr("app.slow_watchdog", dog)
+        headers = {"X-Admin-Token": "secret"}
+
+        client.post("/api/calculate", json={"operation": "power", "num1": 2, "num2": 8})
+        assert dog.stats()["tracked"] == 1
+        dog.threshold = 0
+        dog.begin("POST /api/calculate")
+        dog.note("square_root", 2**4000)
+        dog.check()
+        dog.end()
+
+        data = client.get("/admin/slow-requests", headers=headers).get_json()
+        (entry,) = data["requests"]
+        assert entry["operation"] == "square_root"
+        assert entry["operands"] == ["<4001-bit int>"]
+        reset = client.delete("/admin/slow-requests", headers=headers)
+        assert reset.get_json()["entries"] == 0
+        dog.close()
+
+    def test_shared_cache_serves_repeat_calculations(self, client, monkeypatch, tmp_path):
+        """Test expensive operations are answered from the shared cache."""
+        cache = shared_cache.SharedResultCache(
+            f"calc-app-test-{os.getpid()}",
+            buckets=64,
+            lock_path=str(tmp_path / "cache.lock"),
+        )
+        monkeypatch.setattr("app.result_cache", cache)
+        try:
+            payload = {"operation": "factorize", "num1": 8051}
+            first = client.post("/api/calculate", json=payload).get_json()
+            second = client.post("/api/calculate", json=payload).get_json()
+            client.post("/api/calculate", json={"operation": "add", "num1": 1, "num2": 2})
+            stats = client.get("/metrics").get_json()["shared_cache"]
+        finally:
+            cache.unlink()
+            cache.close()
+
+        assert first["result"] == second["result"] == [83, 97]
+        assert stats["worker"]["hits"] == 1
+        assert stats["worker"]["misses"] == 1
+
+    def test_batch_returns_results_in_order(self, client):
+        """Test the batch endpoint evaluates every calculation in order."""
+        response = client.post(
+            "/api/calculate/batch",
+            json={
+                "calculations": [
+                    {"operation": "add", "num1": 1, "num2": 2},
+                    {"operation": "square_root", "num1": 16},
+                    {"operation": "factorial", "num1": 5},
+                ]
+            },
+        )
+        assert response.status_code == 200
+        assert response.get_json() == {
+            "results": [{"result": 3}, {"result": 4.0}, {"result": 120}]
+        }
+
+    def test_batch_reports_item_errors_in_place(self, client):
+        """Test one failing calculation does not fail the batch."""
+        response = client.post(
+            "/api/calculate/batch",
+            json={
+                "calculations": [
+                    {"operation": "divide", "num1": 1, "num2": 0},
+                    {"operation": "add", "num1": 1},
+                    "not an object",
+                    {"operation": "multiply", "num1": 2, "num2": 3},
+                ]
+            },
+        )
+        results = response.get_json()["results"]
+        assert response.status_code == 200
+        assert [entry.get("status") for entry in results] == [400, 400, 400, None]
+        assert results[1]["error"] == "Operation add requires num2"
+        assert results[3] == {"result": 6}
+
+    def test_batch_rejects_bad_envelope(self, client, monkeypatch):
+        """Test missing, empty and oversized batches are rejected."""
+        monkeypatch.setattr("app.BATCH_MAX_ITEMS", 2)
+        assert client.post("/api/calculate/batch", json={}).status_code == 400
+        assert (
+            client.post("/api/calculate/batch", json={"calculations": []}).status_code
+            == 400
+        )
+        item = {"operation": "add", "num1": 1, "num2": 1}
+        response = client.post(
+            "/api/calculate/batch", json={"calculations": [item] * 3}
+        )
+        assert response.status_code == 400
+        assert "At most 2" in response.get_json()["error"]
+
+    def test_micro_batcher_serves_elementwise_operations(self, client, monkeypatch):
+        """Test element-wise calculations go through the micro-batcher when enabled."""
+        monkeypatch.setattr(
+            "app.micro_batcher", batcher.MicroBatcher(app_module._compute, window=0)
+        )
+        response = client.post(
+            "/api/calculate", json={"operation": "divide", "num1": 1, "num2": 4}
+        )
+        assert response.get_json()["result"] == 0.25
+        response = client.post(
+            "/api/calculate", json={"operation": "divide", "num1": 1, "num2": 0}
+        )
+        assert response.status_code == 400
+        client.post("/api/calculate", json={"operation": "factorial", "num1": 5})
+
+        stats = client.get("/metrics").get_json()["micro_batch"]
+        assert (stats["batches"], stats["items"]) == (2, 2)
+
+    def test_window_streams_text_results(self, client):
+        """Test /api/window applies a rolling mean to a text upload."""
+        response = client.post(
+            "/api/window?operation=rolling_mean&window=2",
+            data=b"1 3,5\n7",
+            content_type="text/plain",
+        )
+        assert response.status_code == 200
+        assert response.get_data(as_text=True) == "null\n2.0\n4.0\n6.0\n"
+
+    def test_window_binary_round_trip(self, client):
+        """Test packed float64 input and output."""
+        response = client.post(
+            "/api/window?operation=cumsum&format=binary",
+            data=struct.pack("<3d", 1.0, 2.0, 3.0),
+            content_type="application/octet-stream",
+        )
+        assert response.status_code == 200
+        assert struct.unpack("<3d", response.data) == (1.0, 3.0, 6.0)
+
+    def test_window_rejects_bad_parameters(self, client, monkeypatch):
+        """Test invalid operations and oversized windows are 400s."""
+        assert client.post("/api/window?operation=median", data=b"1").status_code == 400
+        monkeypatch.setattr("app.WINDOW_MAX_SIZE", 10)
+        response = client.post("/api/window?operation=rolling_sum&window=11", data=b"1")
+        assert response.status_code == 400
+        assert "limited to 10" in response.get_json()["error"]
+
+    def test_window_reports_invalid_value_in_stream(self, client):
+        """Test a bad value ends the text stream with an error line."""
+        response = client.post("/api/window?operation=cumsum", data=b"1 2 x 4")
+        lines = response.get_data(as_text=True).splitlines()
+        assert lines[:2] == ["1.0", "3.0"]
+        assert "Invalid number" in lines[2]
+
+    def test_window_binary_reports_invalid_value(self, client):
+        """Test a bad binary value ends the stream with a detectable error trailer."""
+        response = client.post(
+            "/api/window?operation=cumsum&format=binary",
+            data=struct.pack("<3d", 1.0, 2.0, math.nan),
+            content_type="application/octet-stream",
+        )
+        body = response.data
+        assert struct.unpack("<2d", body[:16]) == (1.0, 3.0)
+        assert body[16:24] == windows.BINARY_ERROR_MARKER
+        assert "finite" in json.loads(body[24:])["error"]
+
+        response = client.post(
+            "/api/window?operation=cumsum&format=binary",
+            data=b"\x00" * 12,
+            content_type="application/octet-stream",
+        )
+        assert response.status_code == 400
+        assert "multiple of 8" in response.get_json()["error"]
+
+    def test_calculations_are_captured_and_replay_identically(
+        self, client, monkeypatch, tmp_path
+    ):
+        """Test API and form calculations are captured and replay to the same bodies."""
+        recorder = capture.TrafficCapture(str(tmp_path / "capture.bin"))
+        monkeypatch.setattr("app.traffic_capture", recorder)
+        client.post("/api/calculate", json={"operation": "add", "num1": 2, "num2": 3})
+        client.post("/", data={"operation": "square_root", "num1": "16"})
+        client.post("/api/calculate", json={"operation": "divide", "num1": 1, "num2": 0})
+        client.get("/health")
+        recorder.close()
+
+        records = capture.load(recorder.path)
+        assert [(r.kind, r.status) for r in records] == [
+            (capture.API, 200),
+            (capture.FORM, 200),
+            (capture.API, 400),
+        ]
+        monkeypatch.setattr("app.traffic_capture", None)
+        for record in records:
+            method, path, body, headers = capture.replay_request(record)
+            response = client.open(path, method=method, data=body, headers=headers)
+            assert response.status_code == record.status
+            assert capture.response_digest(response.get_data()) == record.digest
+
+    def test_series_closed_forms(self, client):
+        """Test /api/series sums each kind, exactly for integers."""
+        cases = [
+            ({"series": "arithmetic", "first": 1, "difference": 1, "count": 100}, 5050),
+            ({"series": "geometric", "first": 1, "ratio": 0.5}, 2.0),
+            ({"series": "power_sum", "power": 3, "n": 10**6}, (10**6 * (10**6 + 1) // 2) ** 2),
+            ({"series": "term", "term": "k**2", "start": 1, "stop": 10}, 385),
+        ]
+        for body, expected in cases:
+            response = client.post("/api/series", json=body)
+            assert response.status_code == 200
+            data = response.get_json()
+            assert data["result"] == expected
+            assert data["method"] == "closed_form"
+
+    def test_series_term_summation(self, client, monkeypatch):
+        """Test terms without a closed form are summed up to SERIES_MAX_TERMS."""
+        body = {"series": "term", "term": "1 / k**2", "start": 1, "stop": 1000}
+        data = client.post("/api/series", json=body).get_json()
+        assert data["method"] == "summation"
+        assert data["result"] == pytest.approx(math.fsum(1 / k**2 for k in range(1, 1001)))
+        monkeypatch.setattr("app.SERIES_MAX_TERMS", 999)
+        response = client.post("/api/series", json=body)
+        assert response.status_code == 400
+        assert "limit is 999" in response.get_json()["error"]
+
+    def test_series_compound_interest(self, client):
+        """Test compound interest on a nominal annual rate matches finance."""
+        body = {
+            "series": "compound_interest",
+            "principal": 1000,
+            "annual_rate": 0.06,
+            "years": 10,
+            "periods_per_year": 12,
+        }
+        data = client.post("/api/series", json=body).get_json()
+        assert data["result"] == pytest.approx(1000 * (1 + 0.005) ** 120)
+        assert data["periods_per_year"] == 12
+        body["periods_per_year"] = 0
+        response = client.post("/api/series", json=body)
+        assert response.status_code == 400
+        assert "periods_per_year" in response.get_json()["error"]
+
+    def test_series_rejects_bad_requests(self, client):
+        """Test unknown kinds, missing fields and unsafe terms are 400s."""
+        bodies = [
+            {"series": "harmonic", "n": 5},
+            {"series": "arithmetic", "first": 1},
+            {"series": "term", "term": "__import__('os')", "start": 1, "stop": 2},
+        ]
+        for body in bodies:
+            assert client.post("/api/series", json=body).status_code == 400
+
+    def test_amortize_streams_schedule(self, client):
+        """Test /api/amortize returns each loan's summary and schedule."""
+        response = client.post(
+            "/api/amortize",
+            json={"loans": [{"principal": 1200, "rate": 0, "periods": 12}] * 2},
+        )
+        assert response.status_code == 200
+        data = response.get_json()
+        assert (data["count"], data["rows"]) == (2, 24)
+        loan = data["loans"][1]
+        assert loan["payment"] == 100
+        assert loan["schedule"][0] == [1, 100.0, 0.0, 100.0, 1100.0]
+        assert loan["schedule"][-1][4] == 0.0
+
+    def test_amortize_summary_and_binary(self, client):
+        """Test summary-only requests and packed float64 schedules."""
+        data = client.post(
+            "/api/amortize",
+            json={"principal": 250000, "rate": 0.04 / 12, "periods": 360, "schedule": False},
+        ).get_json()
+        assert "schedule" not in data["loans"][0]
+        assert data["loans"][0]["payment"] == pytest.approx(1193.54, abs=0.005)
+        response = client.post(
+            "/api/amortize",
+            json={"principal": 100, "rate": 0, "periods": 2, "format": "binary"},
+        )
+        assert response.headers["X-Row-Count"] == "2"
+        assert struct.unpack("<10d", response.data)[5:] == (2.0, 50.0, 0.0, 50.0, 0.0)
+
+    def test_amortize_limits(self, client, monkeypatch):
+        """Test invalid loans and oversized requests are 400s."""
+        assert client.post("/api/amortize", json={"principal": 1}).status_code == 400
+        monkeypatch.setattr("app.AMORTIZE_MAX_ROWS", 100)
+        response = client.post(
+            "/api/amortize", json={"principal": 1, "rate": 0.01, "periods": 101}
+        )
+        assert response.status_code == 400
+        assert "limit is 100" in response.get_json()["error"]
+
+    def test_graph_lifecycle(self, client):
+        """Test creating, updating, reading and deleting a calculation graph."""
+        response = client.post(
+            "/api/graphs",
+            json={
+                "cells": {
+                    "a": 2,
+                    "b": 3,
+                    "sum": {"operation": "add", "args": ["a", "b"]},
+                    "ratio": {"operation": "divide", "args": ["sum", "b"]},
+                    "other": {"operation": "square_root", "args": [16]},
+                }
+            },
+        )
+        assert response.status_code == 201
+        data = response.get_json()
+        graph_id = data["graph"]
+        assert data["cells"]["sum"] == {"result": 5}
+
+        response = client.patch(f"/api/graphs/{graph_id}", json={"cells": {"b": 0}})
+        data = response.get_json()
+        assert data["changed"]["sum"] == {"result": 2}
+        assert data["changed"]["ratio"]["status"] == 400
+        assert "other" not in data["changed"]
+        assert data["recomputed"] == 3
+
+        cells = client.get(f"/api/graphs/{graph_id}").get_json()["cells"]
+        assert cells["other"] == {"result": 4.0}
+        assert client.delete(f"/api/graphs/{graph_id}").status_code == 204
+        assert client.get(f"/api/graphs/{graph_id}").status_code == 404
+
+    def test_graph_cells_match_api_calculate(self, client):
+        """Test cells convert operands like /api/calculate and hit its limits."""
+        response = client.post(
+            "/api/graphs",
+            json={
+                "cells": {
+                    "sum": {"operation": "add", "args": [1, 2]},
+                    "huge": {"operation": "power", "args": [3, 30000000]},
+                }
+            },
+        )
+        cells = response.get_json()["cells"]
+        api = client.post("/api/calculate", json={"operation": "power", "num1": 3, "num2": 30000000})
+        assert response.status_code == 201
+        assert b'"sum":{"result":3.0}' in response.data
+        assert cells["huge"] == {"error": api.get_json()["error"], "status": 400}
+        assert "bit limit" in cells["huge"]["error"]
+
+    def test_graph_chains_big_integers(self, client, monkeypatch):
+        """Test big-integer cells feed later cells and results are size-capped."""
+        response = client.post(
+            "/api/graphs",
+            json={
+                "cells": {
+                    "n": 3000,
+                    "f": {"operation": "factorial", "args": ["n"]},
+                    "prime": {"operation": "is_prime", "args": ["f"]},
+                    "g": {"operation": "gcd", "args": ["f100", "fib"]},
+                    "f100": {"operation": "factorial", "args": [100]},
+                    "fib": {"operation": "fibonacci", "args": [300]},
+                    "parts": {"operation": "factorize", "args": ["g"]},
+                }
+            },
+        )
+        cells = response.get_json()["cells"]
+        assert cells["f"]["representation"] == "scientific"
+        assert cells["f"]["digits"] == 9131
+        assert cells["prime"] == {
+            "error": "Operation is_prime is limited to 1024-bit operands",
+            "status": 400,
+        }
+        assert cells["g"] == {"result": 3070227600}
+        assert cells["parts"] == {"result": [2, 2, 2, 2, 3, 3, 5, 5, 11, 31, 41, 61]}
+
+        monkeypatch.setattr("app.GRAPH_MAX_RESULT_BITS", 64)
+        response = client.post(
+            "/api/graphs", json={"cells": {"f": {"operation": "factorial", "args": [100]}}}
+        )
+        assert response.get_json()["cells"]["f"] == {
+            "error": "Cell results are limited to 64 bits",
+            "status": 400,
+        }
+
+    def test_graph_rejects_cycles_and_unknown_ids(self, client):
+        """Test cycles are 400s and unknown graphs 404s."""
+        graph_id = client.post("/api/graphs", json={"cells": {"a": 1}}).get_json()["graph"]
+        response = client.patch(
+            f"/api/graphs/{graph_id}",
+            json={"cells": {"a": {"operation": "add", "args": ["a", 1]}}},
+        )
+        assert response.status_code == 400
+        assert "Circular reference" in response.get_json()["error"]
+        assert client.post("/api/graphs", json={}).status_code == 400
+        assert client.patch("/api/graphs/nope", json={"cells": {"a": 1}}).status_code == 404
+
+    def test_get_calculate_returns_cacheable_result(self, client):
+        """Test the GET API returns the result with caching headers."""
+        response = client.get("/api/calculate/add?num1=5.0&num2=3.0")
+        assert response.status_code == 200
+        assert response.get_json()["result"] == 8
+        assert "max-age=31536000" in response.headers["Cache-Control"]
+        assert response.headers["ETag"]
+
+    def test_get_calculate_redirects_to_canonical_query(self, client):
+        """Test equivalent queries are redirected to one canonical URL."""
+        response = client.get("/api/calculate/add?num2=3&num1=5")
+        assert response.status_code == 301
+        assert response.headers["Location"].endswith(
+            "/api/calculate/add?num1=5.0&num2=3.0"
+        )
+
+    def test_get_calculate_unknown_operation_is_not_redirected(self, client):
+        """Test a non-canonical query for an unknown operation is an uncached 400."""
+        response = client.get("/api/calculate/bogus?num2=1&num1=2")
+        assert response.status_code == 400
+        assert response.headers["Cache-Control"] == "no-store"
+        assert response.get_json()["error"] == "Unknown operation: bogus"
+
+    def test_get_calculate_not_modified(self, client):
+        """Test a matching If-None-Match is answered with 304."""
+        first = client.get("/api/calculate/power?num1=2.0&num2=10.0")
+        etag = first.headers["ETag"]
+        second = client.get(
+            "/api/calculate/power?num1=2.0&num2=10.0",
+            headers={"If-None-Match": etag},
+        )
+        assert second.status_code == 304
+        assert second.headers["ETag"] == etag
+        assert second.data == b""
+
+    def test_get_calculate_square_root_without_num2(self, client):
+        """Test unary operations omit num2 from the canonical query."""
+        response = client.get("/api/calculate/square_root?num1=16.0")
+        assert response.status_code == 200
+        assert response.get_json()["result"] == 4.0
+
+    def test_get_calculate_errors_are_not_cached(self, client):
+        """Test error responses keep the POST messages and are not cached."""
+        response = client.get("/api/calculate/divide?num1=1.0&num2=0.0")
+        assert response.status_code == 400
+        assert response.get_json()["error"] == "Cannot divide by zero"
+        assert response.headers["Cache-Control"] == "no-store"
+
+        missing = client.get("/api/calculate/add?num1=1.0")
+        assert missing.get_json()["error"] == "Operation add requires num2"
+
+    def test_matrix_multiply_json(self, client):
+        """Test a JSON matrix multiplication."""
+        response = client.post(
+            "/api/matrix",
+            json={"operation": "multiply", "a": [[1, 2], [3, 4]], "b": [[5], [6]]},
+        )
+        assert response.status_code == 200
+        assert response.get_json()["result"] == [[17.0], [39.0]]
+
+    def test_matrix_packed_round_trip(self, client):
+        """Test packed float64 request and response bodies."""
+        a = [[1.0, 2.0], [3.0, 4.0]]
+        response = client.post(
+            "/api/matrix?operation=transpose&a_shape=2x2",
+            data=linalg.pack(a),
+            content_type="application/octet-stream",
+            headers={"Accept": "application/octet-stream"},
+        )
+        assert response.status_code == 200
+        assert response.headers["X-Matrix-Shape"] == "2x2"
+        result = linalg.unpack(response.data, 2, 2)
+        assert [list(row) for row in result] == [[1.0, 3.0], [2.0, 4.0]]
+
+    def test_matrix_errors(self, client):
+        """Test invalid matrix requests return 400 with a message."""
+        unknown = client.post("/api/matrix", json={"operation": "eigen", "a": [[1]]})
+        assert unknown.status_code == 400
+        assert unknown.get_json()["error"] == "Unknown matrix operation: eigen"
+
+        singular = client.post(
+            "/api/matrix", json={"operation": "inverse", "a": [[1, 2], [2, 4]]}
+        )
+        assert singular.status_code == 400
+        assert singular.get_json()["error"] == "Matrix is singular"
+
+    def test_tabulate_streams_json(self, client):
+        """Test the tabulation endpoint streams a JSON table."""
+        response = client.post(
+            "/api/tabulate",
+            json={
+                "operation": "power",
+                "operand": 2,
+                "range": {"kind": "range", "start": 0, "stop": 3, "step": 1},
+            },
+        )
+        assert response.status_code == 200
+        body = response.get_json()
+        assert body["count"] == 3
+        assert body["rows"] == [[0.0, 0.0], [1.0, 1.0], [2.0, 4.0]]
+
+    def test_tabulate_streams_binary(self, client):
+        """Test the binary format returns interleaved float64 pairs."""
+        response = client.post(
+            "/api/tabulate",
+            json={
+                "operation": "square_root",
+                "format": "binary",
+                "range": {"kind": "linspace", "start": 0, "stop": 4, "num": 2},
+            },
+        )
+        assert response.headers["X-Row-Count"] == "2"
+        assert struct.unpack("<4d", response.data) == (0.0, 0.0, 4.0, 2.0)
+
+    def test_tabulate_rejects_oversized_range(self, client):
+        """Test sweeps beyond the point limit are rejected up front."""
+        response = client.post(
+            "/api/tabulate",
+            json={
+                "operation": "add",
+                "operand": 1,
+                "range": {"kind": "linspace", "start": 0, "stop": 1, "num": 10**12},
+            },
+        )
+        assert response.status_code == 400
+        assert "limit" in response.get_json()["error"]
+
+    def test_tabulate_rejects_overflowing_range(self, client):
+        """Test a range whose value count overflows is a 400, not a 500."""
+        response = client.post(
+            "/api/tabulate",
+            json={
+                "operation": "add",
+                "operand": 1,
+                "range": {"kind": "range", "start": -1e308, "stop": 1e308, "step": 1e-308},
+            },
+        )
+        assert response.status_code == 400
+        assert "too many values" in response.get_json()["error"]
+
+    def test_api_factorial_is_unary(self, client):
+        """Test factorial needs no num2 and returns an exact integer."""
+        response = client.post(
+            "/api/calculate", json={"operation": "factorial", "num1": 20}
+        )
+        assert response.status_code == 200
+        assert response.get_json()["result"] == 2432902008176640000
+
+    def test_api_bigint_limit(self, client):
+        """Test big-integer operations reject n above the configured limit."""
+        response = client.post(
+            "/api/calculate", json={"operation": "fibonacci", "num1": 10**9}
+        )
+        assert response.status_code == 400
+        assert "limited to n <=" in response.get_json()["error"]
+
+    def test_api_integer_operations_stay_exact(self, client):
+        """Test integer operations do not round operands through float."""
+        response = client.post(
+            "/api/calculate",
+            json={"operation": "factorize", "num1": 18446744073709551617},
+        )
+        assert response.status_code == 200
+        body = response.get_json()
+        assert body["num1"] == 18446744073709551617
+        assert body["result"] == [274177, 67280421310721]
+
+    def test_api_number_theory_size_limit(self, client):
+        """Test number-theory operands above the bit limit are rejected."""
+        response = client.post(
+            "/api/calculate", json={"operation": "is_prime", "num1": 2**4000}
+        )
+        assert response.status_code == 400
+        assert "-bit operands" in response.get_json()["error"]
@@ -0,0 +1,153 @@
+"""
+Unit tests for the memory-mapped audit ring.
+"""
+
+import csv
+import io
+import multiprocessing
+import threading
+
+import pytest
+from src import audit_log
+from src.audit_log import AuditLog
+
+
+def _append_many(path, count):
+    log = AuditLog(path)
+    for i in range(count):
+        log.append("add", i, 1, i + 1)
+    log.close()
+
+
+class TestAuditLog:
+    """Test suite for AuditLog."""
+
+    @pytest.fixture
+    def path(self, tmp_path):
+        """
+        Fixture providing a fresh ring file path.
+
+        Returns:
+            str: Path inside the test's temporary directory
+        """
+        return str(tmp_path / "audit.ring")
+
+    def test_round_trip(self, path):
+        """Test appended records are read back with their fields."""
+        log = AuditLog(path, capacity=8)
+        assert log.append("add", 5.0, 3.0, 8.0) == 1
+        assert log.append("divide", 1.0, 0.0, "Cannot divide by zero", ok=False) == 2
+        records = log.records()
+        log.close()
+
+        assert [r["seq"] for r in records] == [1, 2]
+        assert records[0]["operation"] == "add"
+        assert records[0]["num1"] == "5.0"
+        assert records[0]["result"] == "8.0"
+        assert records[0]["status"] == "ok"
+        assert records[1]["status"] == "error"
+        assert records[1]["result"] == "Cannot divide by zero"
+
+    def test_unary_operand_is_blank(self, path):
+        """Test a missing second operand is stored as an empty field."""
+        log = AuditLog(path, capacity=4)
+        log.append("square_root", 16.0, None, 4.0)
+        assert log.records()[0]["num2"] == ""
+        log.close()
+
+    def test_ring_overwrites_oldest(self, path):
+        """Test the ring keeps only the newest capacity records."""
+        log = AuditLog(path, capacity=4)
+        for i in range(10):
+            log.append("add", i, 1, i + 1)
+        assert [r["seq"] for r in log.records()] == [7, 8, 9, 10]
+        assert log.next_seq() == 11
+        log.close()
+
+    def test_reopen_keeps_records_and_capacity(self, path):
+        """Test reopening continues the existing ring."""
+        log = AuditLog(path, capacity=4)
+        log.append("add", 1, 2, 3)
+        log.close()
+
+        log = AuditLog(path, capacity=100)
+        assert log.capacity == 4
+        assert log.append("add", 2, 2, 4) == 2
+        assert len(log.records()) == 2
+        log.close()
+
+    def test_rejects_foreign_file(self, path):
+        """Test a file that is not an audit ring is refused."""
+        with open(path, "wb") as f:
+            f.write(b"not an audit ring at all" * 4)
+        with pytest.raises(ValueError):
+            AuditLog(path)
+
+    def test_huge_integers_are_summarised(self, path):
+        """Test oversized integers are summarised and flagged as truncated."""
+        log = AuditLog(path, capacity=4)
+        log.append("factorial", 100, None, 2**400)
+        record = log.records()[0]
+        log.close()
+        assert record["result"] == "<401-bit int>"
+        assert record["truncated"] == "result"
+
+    def test_long_text_is_truncated(self, path):
+        """Test text longer than its slot is cut and flagged."""
+        log = AuditLog(path, capacity=4)
+        log.append("factorize", 12, None, list(range(100)))
+        record = log.records()[0]
+        log.close()
+        assert len(record["result"]) == 32
+        assert record["truncated"] == "result"
+
+    def test_concurrent_threads_get_unique_sequence_numbers(self, path):
+        """Test appends from many threads never share a slot."""
+        log = AuditLog(path, capacity=1000)
+        threads = [
+            threading.Thread(
+                target=lambda: [log.append("add", 1, 1, 2) for _ in range(100)]
+            )
+            for _ in range(8)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert [r["seq"] for r in log.records()] == list(range(1, 801))
+        log.close()
+
+    def test_concurrent_processes_share_the_ring(self, path):
+        """Test appends from several processes are all recorded."""
+        AuditLog(path, capacity=1000).close()
+        workers = [
+            multiprocessing.Process(target=_append_many, args=(path, 50))
+            for _ in range(4)
+        ]
+        for w in workers:
+            w.start()
+        for w in workers:
+            w.join()
+
+        log = AuditLog(path)
+        records = log.records()
+        log.close()
+        assert [r["seq"] for r in records] == list(range(1, 201))
+        assert len({r["pid"] for r in records}) == 4
+
+    def test_export_csv(self, path):
+        """Test the ring exports as CSV with a header row."""
+        log = AuditLog(path, capacity=4)
+        log.append("multiply", 2.0, 3.0, 6.0)
+        log.close()
+
+        out = io.StringIO()
+        assert audit_log.export_csv(path, out) == 1
+        rows = list(csv.DictReader(io.StringIO(out.getvalue())))
+        assert rows[0]["operation"] == "multiply"
+        assert rows[0]["result"] == "6.0"
+
+    def test_export_missing_file(self, path):
+        """Test exporting does not create a missing ring."""
+        with pytest.raises(FileNotFoundError):
+            audit_log.export_csv(path, io.StringIO())
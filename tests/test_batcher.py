@@ -0,0 +1,119 @@
+"""
+Unit tests for the dynamic micro-batcher.
+"""
+
+import threading
+
+import pytest
+from src.batcher import MicroBatcher, from_env
+from src.calculator import Calculator
+
+_calc = Calculator()
+
+
+def _scalar(operation, num1, num2):
+    """Scalar reference: the Calculator method for the operation."""
+    if num2 is None:
+        return getattr(_calc, operation)(num1)
+    return getattr(_calc, operation)(num1, num2)
+
+
+def _run_concurrently(batcher, calls):
+    """Submit every (operation, num1, num2) call from its own thread."""
+    outcomes = [None] * len(calls)
+    start = threading.Barrier(len(calls))
+
+    def worker(i):
+        start.wait()
+        try:
+            outcomes[i] = ("ok", batcher.calculate(*calls[i]))
+        except (ValueError, ArithmeticError) as e:
+            outcomes[i] = ("error", str(e))
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(len(calls))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return outcomes
+
+
+class TestMicroBatcher:
+    """Test suite for MicroBatcher."""
+
+    def test_lone_call_uses_scalar_path(self):
+        """Test a single call is computed by the scalar function."""
+        batcher = MicroBatcher(_scalar, window=0.001)
+        assert batcher.calculate("add", 2.0, 3.0) == 5.0
+        stats = batcher.stats()
+        assert (stats["batches"], stats["items"], stats["sizes"]) == (1, 1, {"1": 1})
+
+    def test_concurrent_calls_share_a_batch(self):
+        """Test calls within the window are evaluated together."""
+        batcher = MicroBatcher(_scalar, window=1.0, max_items=8)
+        calls = [("multiply", float(i), 2.0) for i in range(8)]
+        outcomes = _run_concurrently(batcher, calls)
+        assert outcomes == [("ok", 2.0 * i) for i in range(8)]
+        stats = batcher.stats()
+        assert (stats["batches"], stats["items"], stats["mean_size"]) == (1, 8, 8.0)
+        assert stats["sizes"] == {"8": 1}
+
+    def test_results_match_scalar_path(self):
+        """Test batched results and errors equal the scalar ones element by element."""
+        batcher = MicroBatcher(_scalar, window=1.0, max_items=6)
+        calls = [
+            ("power", 2.0, 0.5),
+            ("power", -8.0, 1 / 3),
+            ("power", 0.0, -1.0),
+            ("power", 10.0, 400.0),
+            ("power", 1e10, 1e10),
+            ("power", 3.0, 4.0),
+        ]
+        outcomes = _run_concurrently(batcher, calls)
+        expected = []
+        for call in calls:
+            try:
+                expected.append(("ok", _scalar(*call)))
+            except (ValueError, ArithmeticError) as e:
+                expected.append(("error", str(e)))
+        assert outcomes == expected
+        assert batcher.stats()["fallbacks"] == 4
+
+    def test_errors_stay_with_their_caller(self):
+        """Test a failing element raises only in its own caller."""
+        batcher = MicroBatcher(_scalar, window=1.0, max_items=3)
+        calls = [("divide", 1.0, 2.0), ("divide", 1.0, 0.0), ("square_root", 9.0, None)]
+        outcomes = _run_concurrently(batcher, calls)
+        assert outcomes[0] == ("ok", 0.5)
+        assert outcomes[1] == ("error", "Cannot divide by zero")
+        assert outcomes[2] == ("ok", 3.0)
+        # Different operations form different batches
+        assert batcher.stats()["batches"] == 2
+
+    def test_unsupported_operation_bypasses_batching(self):
+        """Test operations without a vectorized kernel go straight to scalar."""
+        batcher = MicroBatcher(_scalar)
+        assert batcher.calculate("factorial", 5, None) == 120
+        assert batcher.stats()["batches"] == 0
+
+    def test_full_batch_does_not_wait_for_window(self):
+        """Test reaching max_items releases the batch immediately."""
+        batcher = MicroBatcher(_scalar, window=30.0, max_items=2)
+        outcomes = _run_concurrently(batcher, [("add", 1.0, 1.0), ("add", 2.0, 2.0)])
+        assert outcomes == [("ok", 2.0), ("ok", 4.0)]
+
+    @pytest.mark.parametrize(
+        "env, expected",
+        [({}, None), ({"MICRO_BATCH": "1", "MICRO_BATCH_WINDOW_MS": "2"}, (0.002, 64))],
+    )
+    def test_from_env(self, monkeypatch, env, expected):
+        """Test from_env is off by default and reads the tunables."""
+        for name in ("MICRO_BATCH", "MICRO_BATCH_WINDOW_MS", "MICRO_BATCH_MAX_ITEMS"):
+            monkeypatch.delenv(name, raising=False)
+        for name, value in env.items():
+            monkeypatch.setenv(name, value)
+        batcher = from_env(_scalar)
+        if expected is None:
+            assert batcher is None
+        else:
+            assert (batcher.window, batcher.max_items) == expected
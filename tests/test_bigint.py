@@ -0,0 +1,95 @@
+"""
+Unit tests for the big-integer engine.
+"""
+
+import math
+
+import pytest
+from src.bigint import (
+    BigIntEngine,
+    CheckpointCache,
+    fibonacci_pair,
+    range_product,
+)
+
+
+class TestBigIntEngine:
+    """Test suite for BigIntEngine."""
+
+    @pytest.fixture
+    def engine(self):
+        """
+        Fixture to create an engine with a private cache for each test.
+
+        Returns:
+            BigIntEngine: Engine with an empty checkpoint cache
+        """
+        return BigIntEngine(CheckpointCache())
+
+    def test_factorial_matches_math(self, engine):
+        """Test factorials below and above the checkpoint threshold."""
+        for n in (0, 1, 20, 999, 1000, 2500):
+            assert engine.factorial(n) == math.factorial(n)
+
+    def test_factorial_extends_from_checkpoint(self, engine):
+        """Test a nearby factorial is built from a cached checkpoint."""
+        engine.factorial(4000)
+        assert engine.factorial(4500) == math.factorial(4500)
+        assert engine.cache.stats()["entries"] == 2
+
+    def test_repeat_factorial_hits_cache(self, engine):
+        """Test a repeated large factorial is served from the cache."""
+        engine.factorial(3000)
+        engine.factorial(3000)
+        assert engine.cache.stats()["hits"] == 1
+
+    def test_binomial_matches_math(self, engine):
+        """Test binomials use symmetry and match math.comb."""
+        assert engine.binomial(5000, 4990) == math.comb(5000, 10)
+        assert engine.binomial(6000, 3000) == math.comb(6000, 3000)
+        assert engine.binomial(3, 4) == 0
+
+    def test_fibonacci_large(self, engine):
+        """Test a large Fibonacci number satisfies the recurrence."""
+        a, b = engine.fibonacci(5000), engine.fibonacci(5001)
+        assert engine.fibonacci(5002) == a + b
+
+
+class TestHelpers:
+    """Test suite for the binary-splitting and fast-doubling helpers."""
+
+    def test_range_product(self):
+        """Test binary-splitting products including empty ranges."""
+        assert range_product(1, 101) == math.factorial(100)
+        assert range_product(5, 5) == 1
+
+    def test_fibonacci_pair(self):
+        """Test fast doubling against the iterative definition."""
+        a, b = 0, 1
+        for n in range(200):
+            assert fibonacci_pair(n) == (a, b)
+            a, b = b, a + b
+
+
+class TestCheckpointCache:
+    """Test suite for CheckpointCache."""
+
+    def test_evicts_least_recently_used_within_budget(self):
+        """Test the bit budget evicts the oldest entries first."""
+        cache = CheckpointCache(max_bits=100)
+        cache.put("factorial", 1, "a", 60)
+        cache.put("factorial", 2, "b", 30)
+        cache.get("factorial", 1)
+        cache.put("factorial", 3, "c", 30)
+        assert cache.get("factorial", 2) is None
+        assert cache.get("factorial", 1) == "a"
+        assert cache.stats()["bits"] == 90
+
+    def test_nearest_below(self):
+        """Test the nearest lower checkpoint is found."""
+        cache = CheckpointCache()
+        cache.put("factorial", 10, "ten", 1)
+        cache.put("factorial", 20, "twenty", 1)
+        assert cache.nearest_below("factorial", 15) == (10, "ten")
+        assert cache.nearest_below("factorial", 5) is None
+        assert cache.nearest_below("fibonacci", 15) is None
@@ -0,0 +1,179 @@
+"""
+Unit tests for the incremental calculation graph.
+"""
+
+import pytest
+from src import calc_graph
+from src.calculator import Calculator
+
+_calc = Calculator()
+
+
+class CountingCompute:
+    """compute(operation, num1, num2) through Calculator, counting calls."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, operation, num1, num2):
+        self.calls += 1
+        if num2 is None:
+            return getattr(_calc, operation)(num1)
+        return getattr(_calc, operation)(num1, num2)
+
+
+@pytest.fixture
+def compute():
+    """Fixture providing a counting compute function."""
+    return CountingCompute()
+
+
+@pytest.fixture
+def graph(compute):
+    """Fixture providing a small invoice model."""
+    graph = calc_graph.CalculationGraph(compute)
+    graph.update(
+        {
+            "price": 120,
+            "quantity": 3,
+            "subtotal": {"operation": "multiply", "args": ["price", "quantity"]},
+            "tax": {"operation": "percentage", "args": ["subtotal", 20]},
+            "total": {"operation": "add", "args": ["subtotal", "tax"]},
+            "shipping": 5,
+            "root": {"operation": "square_root", "args": ["shipping"]},
+        }
+    )
+    compute.calls = 0
+    return graph
+
+
+class TestCalculationGraph:
+    """Test suite for CalculationGraph."""
+
+    def test_initial_values(self, graph):
+        """Test every cell is computed on creation."""
+        values = graph.values()
+        assert values["subtotal"].value == 360
+        assert values["total"].value == pytest.approx(432)
+        assert values["root"].value == pytest.approx(5**0.5)
+
+    def test_update_recomputes_only_dependents(self, graph, compute):
+        """Test changing one input touches only its downstream cells."""
+        changed, recomputed = graph.update({"quantity": 4})
+        assert set(changed) == {"quantity", "subtotal", "tax", "total"}
+        assert changed["total"].value == pytest.approx(576)
+        assert recomputed == 4
+        assert compute.calls == 3
+
+    def test_unchanged_values_stop_propagation(self, graph, compute):
+        """Test a recomputed cell with the same value does not wake its dependents."""
+        graph.update({"price": 60, "quantity": 6})
+        compute.calls = 0
+        changed, recomputed = graph.update({"price": 90, "quantity": 4})
+        assert set(changed) == {"price", "quantity"}
+        assert recomputed == 3
+        assert compute.calls == 1
+
+    def test_cost_follows_change_set(self, compute):
+        """Test an update to one of many independent chains stays local."""
+        graph = calc_graph.CalculationGraph(compute)
+        cells = {}
+        for chain in range(200):
+            cells[f"in{chain}"] = chain
+            for step in range(10):
+                source = f"in{chain}" if step == 0 else f"c{chain}.{step - 1}"
+                cells[f"c{chain}.{step}"] = {"operation": "add", "args": [source, 1]}
+        graph.update(cells)
+        compute.calls = 0
+        changed, recomputed = graph.update({"in7": 100})
+        assert recomputed == 11
+        assert compute.calls == 10
+        assert changed["c7.9"].value == 110
+
+    def test_redefining_a_formula_rewires_dependencies(self, graph, compute):
+        """Test a redefined cell drops old dependencies and gains new ones."""
+        graph.update({"tax": {"operation": "multiply", "args": ["shipping", 2]}})
+        assert graph.values()["total"].value == 370
+        compute.calls = 0
+        _, recomputed = graph.update({"price": 1})
+        assert recomputed == 3
+        changed, _ = graph.update({"shipping": 6})
+        assert {"tax", "total", "root"} <= set(changed)
+
+    def test_errors_propagate_and_clear(self, graph):
+        """Test a failing cell marks its dependents and recovers when fixed."""
+        changed, _ = graph.update({"shipping": -4})
+        assert changed["root"].status == 400
+        graph.update({"chained": {"operation": "add", "args": ["root", 1]}})
+        assert "Depends on root" in graph.values()["chained"].error
+        changed, _ = graph.update({"shipping": 16})
+        assert changed["chained"].value == 5.0
+
+    @pytest.mark.parametrize(
+        "cells, message",
+        [
+            ({"price": {"operation": "add", "args": ["total", 1]}}, "Circular reference"),
+            ({"loop": {"operation": "add", "args": ["loop", 1]}}, "loop -> loop"),
+            ({"x": {"operation": "add", "args": ["missing", 1]}}, "unknown cell missing"),
+            ({"x": {"operation": "cube", "args": [1, 2]}}, "unknown operation"),
+            ({"x": {"operation": "add", "args": [1]}}, "takes 2 args"),
+            ({"x": "price"}, "must be a number"),
+            ({"1x": 1}, "Invalid cell name"),
+        ],
+    )
+    def test_invalid_updates_leave_graph_untouched(self, graph, cells, message):
+        """Test invalid definitions and cycles are rejected atomically."""
+        before = graph.values()
+        with pytest.raises(ValueError, match=message):
+            graph.update(cells)
+        assert graph.values() == before
+
+    def test_cycle_within_one_update(self, compute):
+        """Test a cycle among cells defined together is detected."""
+        graph = calc_graph.CalculationGraph(compute)
+        with pytest.raises(ValueError, match="Circular reference"):
+            graph.update(
+                {
+                    "a": {"operation": "add", "args": ["b", 1]},
+                    "b": {"operation": "add", "args": ["a", 1]},
+                }
+            )
+
+    def test_max_cells(self, compute):
+        """Test graphs cannot grow past max_cells."""
+        graph = calc_graph.CalculationGraph(compute, max_cells=2)
+        graph.update({"a": 1, "b": 2})
+        graph.update({"a": 3})
+        with pytest.raises(ValueError, match="limited to 2 cells"):
+            graph.update({"c": 1})
+
+
+class TestGraphStore:
+    """Test suite for GraphStore."""
+
+    def test_create_get_delete(self, compute):
+        """Test graphs are stored by id until deleted."""
+        store = calc_graph.GraphStore(compute)
+        graph_id, graph = store.create({"a": 1})
+        assert store.get(graph_id) is graph
+        assert store.delete(graph_id)
+        assert store.get(graph_id) is None
+        assert not store.delete(graph_id)
+
+    def test_least_recently_used_is_evicted(self, compute):
+        """Test the store drops the least recently used graph when full."""
+        store = calc_graph.GraphStore(compute, max_graphs=2)
+        first, _ = store.create({"a": 1})
+        second, _ = store.create({"a": 2})
+        store.get(first)
+        store.create({"a": 3})
+        assert store.get(first) is not None
+        assert store.get(second) is None
+        assert store.stats()["evictions"] == 1
+
+    def test_invalid_graph_is_not_stored(self, compute):
+        """Test a failed creation leaves nothing behind."""
+        store = calc_graph.GraphStore(compute)
+        with pytest.raises(ValueError):
+            store.create({"a": {"operation": "add", "args": ["a", 1]}})
+        assert store.stats()["graphs"] == 0
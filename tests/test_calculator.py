@@ -138,6 +138,20 @@ class TestCalculator:
         """Test power with floating point numbers."""
         assert calculator.power(2.5, 2) == pytest.approx(6.25)
 
+    def test_power_overflow_is_exact_for_integers(self, calculator):
+        """Test overflowing integral float powers fall back to exact ints."""
+        assert calculator.power(10.0, 400.0) == 10**400
+
+    def test_power_overflow_non_integral(self, calculator):
+        """Test overflowing non-integral powers raise ValueError."""
+        with pytest.raises(ValueError, match="too large"):
+            calculator.power(1.5, 1e6)
+
+    def test_power_exact_limit(self, calculator):
+        """Test exact powers beyond the bit limit raise ValueError."""
+        with pytest.raises(ValueError, match="bit limit"):
+            calculator.power(10.0, 1e9)
+
     # Tests for square_root method
     def test_square_root_positive_number(self, calculator):
         """Test square root of positive number."""
@@ -203,4 +217,89 @@ class TestCalculator:
         """Test 100 percent."""
         assert calculator.percentage(80, 100) == pytest.approx(80.0)
 
-    
\ No newline at end of file
+    # Tests for factorial method
+    def test_factorial_small(self, calculator):
+        """Test factorial of small integers."""
+        assert calculator.factorial(0) == 1
+        assert calculator.factorial(5) == 120
+
+    def test_factorial_integral_float(self, calculator):
+        """Test factorial accepts integral floats from the API."""
+        assert calculator.factorial(10.0) == 3628800
+
+    def test_factorial_negative(self, calculator):
+        """Test factorial of a negative number raises ValueError."""
+        with pytest.raises(ValueError, match="Factorial requires a non-negative integer"):
+            calculator.factorial(-1)
+
+    def test_factorial_fraction(self, calculator):
+        """Test factorial of a non-integer raises ValueError."""
+        with pytest.raises(ValueError, match="Factorial requires a non-negative integer"):
+            calculator.factorial(2.5)
+
+    # Tests for binomial method
+    def test_binomial_basic(self, calculator):
+        """Test binomial coefficients."""
+        assert calculator.binomial(5, 2) == 10
+        assert calculator.binomial(10, 0) == 1
+
+    def test_binomial_k_greater_than_n(self, calculator):
+        """Test choosing more items than available gives zero."""
+        assert calculator.binomial(3, 5) == 0
+
+    # Tests for fibonacci method
+    def test_fibonacci_basic(self, calculator):
+        """Test the first Fibonacci numbers."""
+        assert [calculator.fibonacci(n) for n in range(8)] == [0, 1, 1, 2, 3, 5, 8, 13]
+
+    def test_fibonacci_negative(self, calculator):
+        """Test a negative index raises ValueError."""
+        with pytest.raises(ValueError, match="Fibonacci requires a non-negative integer"):
+            calculator.fibonacci(-3)
+
+    # Tests for number-theory methods
+    def test_is_prime(self, calculator):
+        """Test primality of a 64-bit prime and a composite."""
+        assert calculator.is_prime(2**61 - 1) is True
+        assert calculator.is_prime(91) is False
+
+    def test_factorize(self, calculator):
+        """Test prime factorization."""
+        assert calculator.factorize(84) == [2, 2, 3, 7]
+
+    def test_factorize_non_positive(self, calculator):
+        """Test factorizing zero raises ValueError."""
+        with pytest.raises(ValueError, match="Factorize requires a positive integer"):
+            calculator.factorize(0)
+
+    def test_gcd_and_lcm(self, calculator):
+        """Test greatest common divisor and least common multiple."""
+        assert calculator.gcd(48, 18) == 6
+        assert calculator.lcm(4, 6) == 12
+
+    def test_gcd_requires_integers(self, calculator):
+        """Test gcd of a fraction raises ValueError."""
+        with pytest.raises(ValueError, match="GCD requires an integer"):
+            calculator.gcd(2.5, 5)
+
+    def test_mod_inverse(self, calculator):
+        """Test modular inverse."""
+        assert calculator.mod_inverse(3, 7) == 5
+
+    def test_mod_inverse_bad_modulus(self, calculator):
+        """Test a non-positive modulus raises ValueError."""
+        with pytest.raises(ValueError, match="requires a positive modulus"):
+            calculator.mod_inverse(3, 0)
+
+    def test_series_operations(self, calculator):
+        """Test the closed-form series operations."""
+        assert calculator.arithmetic_series(1, 1, 100) == 5050
+        assert calculator.geometric_series(1, 2, 10) == 1023
+        assert calculator.power_sum(2, 10) == 385
+        assert calculator.series_sum("1 / 2**k", 1, 50) == pytest.approx(1.0)
+        assert calculator.compound_growth(100, 0.1, 2) == pytest.approx(121.0)
+
+    def test_finance_operations(self, calculator):
+        """Test compound interest and annuity payments."""
+        assert calculator.compound_interest(1000, 0.1, 2) == pytest.approx(1210.0)
+        assert calculator.annuity_payment(1200, 0, 12) == 100
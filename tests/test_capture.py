@@ -0,0 +1,145 @@
+"""
+Unit tests for traffic capture.
+"""
+
+import json
+import os
+import struct
+
+import pytest
+from src import capture
+
+
+class TestTrafficCapture:
+    """Test suite for TrafficCapture and the capture file reader."""
+
+    @pytest.fixture
+    def path(self, tmp_path):
+        """
+        Fixture giving a fresh capture file path.
+
+        Returns:
+            str: Path inside the test's temporary directory
+        """
+        return str(tmp_path / "capture.bin")
+
+    def test_round_trip(self, path):
+        """Test recorded requests read back with their fields and digest."""
+        recorder = capture.TrafficCapture(path)
+        recorder.record(capture.API, {"operation": "add", "num1": 1, "num2": 2}, 200, 1.5, b"{}")
+        recorder.record(capture.FORM, {"operation": "square_root", "num1": "9"}, 200, 0.25)
+        recorder.close()
+
+        records = capture.load(path)
+        assert [r.kind for r in records] == [capture.API, capture.FORM]
+        assert records[0].fields == {"operation": "add", "num1": 1, "num2": 2}
+        assert records[0].latency_us == 1500
+        assert records[0].digest == capture.response_digest(b"{}")
+        assert records[1].digest == capture.NO_DIGEST
+        assert recorder.stats()["captured"] == 2
+
+    def test_timestamps_are_arrival_times(self, path, monkeypatch):
+        """Test replay offsets follow arrivals, not response completions."""
+        recorder = capture.TrafficCapture(path)
+        # Arrivals at 0.0s, 0.1s and 0.3s; the first request is slow
+        for finished, latency_ms in ((1000.5, 500), (1000.11, 10), (1000.32, 20)):
+            monkeypatch.setattr(capture.time, "time", lambda: finished)
+            recorder.record(capture.API, {"num1": latency_ms}, 200, latency_ms)
+        monkeypatch.undo()
+        recorder.close()
+        records = capture.load(path)
+        assert [r.fields["num1"] for r in records] == [500, 10, 20]
+        offsets = [r.timestamp - records[0].timestamp for r in records]
+        assert offsets == pytest.approx([0.0, 0.1, 0.3])
+
+    def test_sanitize_drops_other_fields(self):
+        """Test only calculation fields are kept."""
+        kept, truncated = capture.sanitize(
+            {"operation": "add", "num1": 1.5, "num2": True, "token": "secret", "email": "x@y"}
+        )
+        assert kept == {"operation": "add", "num1": 1.5, "num2": True}
+        assert truncated is False
+
+    def test_replay_keeps_json_types(self, path):
+        """Test booleans, nulls and arrays replay exactly as they were sent."""
+        payloads = [
+            {"operation": "add", "num1": True, "num2": False},
+            {"operation": "square_root", "num1": 9.0, "num2": None},
+            {"operation": "add", "num1": [1, 2], "num2": {"a": 1}},
+            {"operation": "is_prime", "num1": 7, "representation": "scientific"},
+        ]
+        recorder = capture.TrafficCapture(path)
+        for payload in payloads:
+            recorder.record(capture.API, payload, 400, 1)
+        recorder.close()
+        for payload, record in zip(payloads, capture.load(path)):
+            body = capture.replay_request(record)[2]
+            sent = {k: v for k, v in payload.items() if v is not None}
+            assert json.loads(body) == sent
+            assert [type(v) for v in json.loads(body).values()] == [
+                type(v) for v in sent.values()
+            ]
+
+    def test_oversized_containers_are_truncated(self):
+        """Test long or unencodable arrays are cut and the record flagged."""
+        kept, truncated = capture.sanitize({"num1": list(range(5000))})
+        assert truncated and len(kept["num1"]) == capture.MAX_FIELD_CHARS
+        kept, truncated = capture.sanitize({"num1": [10**5000]})
+        assert truncated and kept["num1"] == "<unencodable list>"
+
+    def test_oversized_values_are_truncated(self, path):
+        """Test huge operands are summarised and the record flagged."""
+        recorder = capture.TrafficCapture(path)
+        recorder.record(capture.API, {"operation": "factorial", "num1": 1 << 20000}, 400, 1)
+        recorder.record(capture.FORM, {"operation": "add", "num1": "1" * 10000}, 400, 1)
+        recorder.close()
+        first, second = capture.load(path)
+        assert first.truncated and first.fields["num1"] == "<20001-bit int>"
+        assert second.truncated and len(second.fields["num1"]) == capture.MAX_FIELD_CHARS
+
+    def test_appends_to_existing_capture(self, path):
+        """Test reopening a capture appends instead of rewriting the header."""
+        for n in range(2):
+            recorder = capture.TrafficCapture(path)
+            recorder.record(capture.API, {"operation": "add", "num1": n, "num2": 0}, 200, 1)
+            recorder.close()
+        assert [r.fields["num1"] for r in capture.load(path)] == [0, 1]
+
+    def test_rejects_foreign_file(self, path):
+        """Test an existing non-capture file is not appended to."""
+        with open(path, "wb") as f:
+            f.write(b"not a capture")
+        with pytest.raises(ValueError, match="not a capture file"):
+            capture.TrafficCapture(path)
+
+    def test_stops_at_max_bytes(self, path):
+        """Test records beyond max_bytes are dropped."""
+        recorder = capture.TrafficCapture(path, max_bytes=100)
+        for n in range(5):
+            recorder.record(capture.API, {"operation": "add", "num1": n, "num2": 0}, 200, 1)
+        recorder.close()
+        assert os.path.getsize(path) <= 100
+        assert recorder.stats()["full"] is True
+        assert recorder.dropped + recorder.captured == 5
+
+    def test_partial_trailing_record_is_ignored(self, path):
+        """Test a record cut short by a crash ends the capture cleanly."""
+        recorder = capture.TrafficCapture(path)
+        recorder.record(capture.API, {"operation": "add", "num1": 1, "num2": 1}, 200, 1)
+        recorder.close()
+        with open(path, "ab") as f:
+            f.write(capture.RECORD.pack(0.0, 0, 200, 1, bytes(8), 50) + b"{")
+        assert len(capture.load(path)) == 1
+
+    def test_replay_request(self):
+        """Test API and form records become the original request shapes."""
+        api = capture.CapturedRequest(0.0, capture.API, 200, 1, bytes(8), {"operation": "add"}, False)
+        form = capture.CapturedRequest(0.0, capture.FORM, 200, 1, bytes(8), {"num1": "2"}, False)
+        method, path, body, headers = capture.replay_request(api)
+        assert (method, path, json.loads(body)) == ("POST", "/api/calculate", {"operation": "add"})
+        assert headers["Content-Type"] == "application/json"
+        assert capture.replay_request(form)[1:3] == ("/", b"num1=2")
+
+    def test_record_layout_is_compact(self, path):
+        """Test the fixed header is 27 bytes per record."""
+        assert struct.calcsize("<dBHI8sI") == capture.RECORD.size == 27
@@ -0,0 +1,183 @@
+"""
+Tests for the calculator_client SDK.
+Runs the clients against the app served on a local port.
+"""
+
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from werkzeug.serving import make_server
+
+from app import app
+from calculator_client import AsyncCalculatorClient, CalculationError, CalculatorClient
+
+
+@pytest.fixture(scope="module")
+def base_url():
+    """
+    Fixture serving the app on an ephemeral port for the whole module.
+
+    Returns:
+        str: Base URL of the running server
+    """
+    server = make_server("127.0.0.1", 0, app, threaded=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    thread.join()
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    """Answers every POST with {"result": 1} and keeps the connection open."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        self.rfile.read(int(self.headers["Content-Length"]))
+        body = json.dumps({"result": 1}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def keepalive_url():
+    """
+    Fixture serving a keep-alive HTTP/1.1 endpoint (the Werkzeug development
+    server closes every connection, so reuse cannot be observed against it).
+
+    Returns:
+        str: Base URL of the running server
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    thread.join()
+    server.server_close()
+
+
+class TestCalculatorClient:
+    """Test suite for the thread-based client."""
+
+    @pytest.fixture
+    def client(self, base_url):
+        """
+        Fixture creating a client with a generous batch window.
+
+        Returns:
+            CalculatorClient: Client bound to the test server
+        """
+        with CalculatorClient(base_url, batch_window=0.05) as client:
+            yield client
+
+    def test_calculate(self, client):
+        """Test a direct calculation returns the result."""
+        assert client.calculate("add", 2, 3) == 5
+        assert client.calculate("square_root", 81) == 9.0
+
+    def test_calculate_error(self, client):
+        """Test a rejected calculation raises CalculationError with its status."""
+        with pytest.raises(CalculationError, match="Cannot divide by zero") as excinfo:
+            client.calculate("divide", 1, 0)
+        assert excinfo.value.status == 400
+
+    def test_connections_are_reused(self, keepalive_url):
+        """Test sequential calls share one keep-alive connection."""
+        with CalculatorClient(keepalive_url) as client:
+            for _ in range(10):
+                assert client.calculate("add", 0, 1) == 1
+            assert client.pool.opened == 1
+
+    def test_server_closed_connections_are_replaced(self, client):
+        """Test a server sending Connection: close gets a new connection each call."""
+        for i in range(5):
+            assert client.calculate("multiply", i, 2) == i * 2
+        assert client.pool.opened == 5
+
+    def test_submitted_calls_are_batched(self, client):
+        """Test calls made together go out as a single batch request."""
+        futures = [client.add(i, 1) for i in range(20)]
+        assert [f.result(timeout=5) for f in futures] == list(range(1, 21))
+        assert client.batches_sent == 1
+
+    def test_batch_item_error(self, client):
+        """Test one failing call in a batch only fails its own future."""
+        ok, bad = client.divide(6, 3), client.divide(1, 0)
+        assert ok.result(timeout=5) == 2
+        with pytest.raises(CalculationError):
+            bad.result(timeout=5)
+
+    def test_falls_back_without_batch_endpoint(self, client, monkeypatch):
+        """Test a server without /api/calculate/batch gets individual requests."""
+        monkeypatch.setattr(
+            "calculator_client.protocol.BATCH_PATH", "/api/calculate/missing"
+        )
+        futures = [client.fibonacci(n) for n in range(1, 6)]
+        assert [f.result(timeout=5) for f in futures] == [1, 1, 2, 3, 5]
+        assert client.batch_supported is False
+        assert client.batches_sent == 0
+
+    def test_close_flushes_pending(self, base_url):
+        """Test close() sends calls still waiting for the batch window."""
+        client = CalculatorClient(base_url, batch_window=10)
+        future = client.gcd(12, 18)
+        client.close()
+        assert future.result(timeout=0) == 6
+        with pytest.raises(RuntimeError):
+            client.gcd(1, 1)
+
+
+class TestAsyncCalculatorClient:
+    """Test suite for the asyncio client."""
+
+    def test_calculate(self, base_url):
+        """Test direct calculations and error reporting."""
+
+        async def scenario():
+            async with AsyncCalculatorClient(base_url) as client:
+                results = [await client.calculate("power", 2, n) for n in range(5)]
+                with pytest.raises(CalculationError) as excinfo:
+                    await client.calculate("factorial", -1)
+                return results, excinfo.value.status
+
+        results, status = asyncio.run(scenario())
+        assert results == [1, 2, 4, 8, 16]
+        assert status == 400
+
+    def test_connections_are_reused(self, keepalive_url):
+        """Test sequential calls share one keep-alive connection."""
+
+        async def scenario():
+            async with AsyncCalculatorClient(keepalive_url) as client:
+                for _ in range(10):
+                    assert await client.calculate("add", 0, 1) == 1
+                return client.pool.opened
+
+        assert asyncio.run(scenario()) == 1
+
+    def test_submitted_calls_are_batched(self, base_url):
+        """Test gathered calls share batches and keep per-item errors."""
+
+        async def scenario():
+            async with AsyncCalculatorClient(base_url, max_batch=10) as client:
+                futures = [client.add(i, i) for i in range(25)]
+                futures.append(client.square_root(-1))
+                results = await asyncio.gather(*futures, return_exceptions=True)
+                return results, client.batches_sent
+
+        results, batches_sent = asyncio.run(scenario())
+        assert results[:25] == [2 * i for i in range(25)]
+        assert isinstance(results[25], CalculationError)
+        assert batches_sent == 3
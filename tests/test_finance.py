@@ -0,0 +1,100 @@
+"""
+Unit tests for the financial schedule operations.
+"""
+
+import struct
+
+import pytest
+from src import finance
+
+
+def _rows(loan, chunk_size=finance.DEFAULT_CHUNK_SIZE):
+    rows = []
+    for columns in finance.schedule(loan, chunk_size):
+        if finance.HAS_NUMPY:
+            columns = [column.tolist() for column in columns]
+        rows.extend(zip(*columns))
+    return rows
+
+
+def _iterative(principal, rate, periods, payment):
+    """Build the schedule period by period, the way clients do today."""
+    rows, balance = [], principal
+    for period in range(1, periods + 1):
+        interest = balance * rate
+        balance = balance + interest - payment
+        rows.append((period, payment, interest, payment - interest, balance))
+    return rows
+
+
+class TestFinance:
+    """Test suite for compound interest, annuities and amortization."""
+
+    def test_compound_interest(self):
+        """Test future value with monthly compounding."""
+        # Reference: 1000 * (1 + 0.06 / 12) ** 120 in 50-digit decimals
+        assert finance.compound_interest(1000, 0.06, 10, 12) == pytest.approx(
+            1819.3967340323133, rel=1e-15
+        )
+        with pytest.raises(ValueError, match="periods_per_year"):
+            finance.compound_interest(1000, 0.06, 10, 0)
+
+    def test_annuity_payment(self):
+        """Test the standard mortgage payment and the zero-rate case."""
+        assert finance.annuity_payment(250000, 0.04 / 12, 360) == pytest.approx(
+            1193.54, abs=0.005
+        )
+        assert finance.annuity_payment(1200, 0, 12) == 100
+
+    @pytest.mark.parametrize("rate", [0.04 / 12, 0.05 / 365, 0, -0.001])
+    def test_schedule_matches_iteration(self, rate):
+        """Test the closed-form schedule against period-by-period iteration."""
+        loan = finance.Loan(300000, rate, 1000)
+        rows = _rows(loan, chunk_size=64)
+        expected = _iterative(300000, rate, 1000, loan.payment)
+        assert len(rows) == 1000
+        for got, want in zip(rows, expected):
+            assert got[0] == want[0]
+            assert got[1:] == pytest.approx(want[1:], rel=1e-9, abs=1e-6)
+        assert rows[-1][4] == 0.0
+
+    def test_schedule_columns_are_consistent(self):
+        """Test interest + principal = payment and principal sums to the loan."""
+        loan = finance.Loan(300000, 0.05 / 365, 10950)
+        rows = _rows(loan)
+        assert sum(row[3] for row in rows) == pytest.approx(300000, rel=1e-12)
+        assert sum(row[2] for row in rows) == pytest.approx(loan.total_interest, rel=1e-9)
+        for _, payment, interest, principal, _ in rows[::997]:
+            assert interest + principal == pytest.approx(payment, rel=1e-9)
+
+    def test_pure_python_fallback(self, monkeypatch):
+        """Test the schedule without NumPy matches the vectorized one."""
+        loan = finance.Loan(10000, 0.01, 50)
+        expected = _rows(loan, chunk_size=16)
+        monkeypatch.setattr(finance, "HAS_NUMPY", False)
+        rows = _rows(loan, chunk_size=16)
+        for got, want in zip(rows, expected):
+            assert got == pytest.approx(want, rel=1e-12, abs=1e-9)
+
+    def test_encodings(self):
+        """Test JSON and binary encodings of a schedule chunk."""
+        columns = next(finance.schedule(finance.Loan(100, 0, 2)))
+        assert finance.encode_json_rows(columns) == "[1,50.0,0.0,50.0,50.0],[2,50.0,0.0,50.0,0.0]"
+        assert struct.unpack("<10d", finance.encode_binary_rows(columns)) == (
+            1.0, 50.0, 0.0, 50.0, 50.0, 2.0, 50.0, 0.0, 50.0, 0.0
+        )
+
+    @pytest.mark.parametrize(
+        "fields, message",
+        [
+            ({"principal": 1000, "rate": 0.01}, "Missing required loan fields: periods"),
+            ({"principal": 1000, "rate": -1, "periods": 5}, "greater than -1"),
+            ({"principal": 1000, "rate": 0.01, "periods": 2.5}, "positive integer"),
+            ({"principal": "1000", "rate": 0.01, "periods": 5}, "must be a number"),
+            ({"principal": 1000, "rate": 5.0, "periods": 10**6}, "too long"),
+        ],
+    )
+    def test_invalid_loans(self, fields, message):
+        """Test invalid loan definitions raise ValueError."""
+        with pytest.raises(ValueError, match=message):
+            finance.Loan.from_dict(fields)
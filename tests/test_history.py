@@ -0,0 +1,181 @@
+"""
+Unit tests for the Locust performance history.
+"""
+
+import csv
+
+import pytest
+from tests.performance import history
+
+STATS_HEADER = [
+    "Type", "Name", "Request Count", "Failure Count", "Median Response Time",
+    "Average Response Time", "Min Response Time", "Max Response Time",
+    "Average Content Size", "Requests/s", "Failures/s", "50%", "66%", "75%", "80%",
+    "90%", "95%", "98%", "99%", "99.9%", "99.99%", "100%",
+]
+HISTORY_HEADER = [
+    "Timestamp", "User Count", "Type", "Name", "Requests/s", "Failures/s", "50%", "66%",
+    "75%", "80%", "90%", "95%", "98%", "99%", "99.9%", "99.99%", "100%",
+    "Total Request Count", "Total Failure Count", "Total Median Response Time",
+    "Total Average Response Time", "Total Min Response Time", "Total Max Response Time",
+    "Total Average Content Size",
+]
+
+
+def write_run(directory, name, latency, rps=50.0, requests=1000, failures=0,
+              start=1700000000, seconds=3, jitter=()):
+    """
+    Write a Locust --csv result pair for one POST /api/calculate endpoint.
+
+    Returns:
+        str: The --csv prefix
+    """
+    prefix = str(directory / name)
+    with open(f"{prefix}_stats.csv", "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(STATS_HEADER)
+        for method, endpoint in (("POST", "/api/calculate"), ("", "Aggregated")):
+            writer.writerow(
+                [method, endpoint, requests, failures, latency, latency, 1, latency * 3, 58,
+                 rps, 0.0, latency, latency, latency, latency, latency * 1.5, latency * 2,
+                 latency * 2, latency * 2.5, latency * 3, latency * 3, latency * 3]
+            )
+    with open(f"{prefix}_stats_history.csv", "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(HISTORY_HEADER)
+        for second in range(seconds):
+            value = latency + (jitter[second % len(jitter)] if jitter else 0)
+            writer.writerow(
+                [start + second, 10, "POST", "/api/calculate", rps, 0.0, value, value, value,
+                 value, value, value * 2, value * 2, value * 2.5, value * 3, value * 3,
+                 value * 3, second * 50, 0, value, value, 1, value * 3, 58]
+            )
+    return prefix
+
+
+class TestHistory:
+    """Test suite for the history store and regression analysis."""
+
+    @pytest.fixture
+    def conn(self, tmp_path):
+        """
+        Fixture giving an empty history database.
+
+        Returns:
+            sqlite3.Connection: Database inside the test's temporary directory
+        """
+        return history.connect(str(tmp_path / "history.sqlite"))
+
+    def test_ingest_is_idempotent(self, conn, tmp_path):
+        """Test the same result files are stored once."""
+        prefix = write_run(tmp_path, "run", 20, seconds=30)
+        run_id, added = history.ingest(conn, prefix, "build-1")
+        assert added
+        assert history.ingest(conn, prefix) == (run_id, False)
+        assert history.runs(conn) == [(run_id, "build-1", 1700000000)]
+        count = conn.execute("SELECT COUNT(*) FROM endpoint_stats").fetchone()[0]
+        assert count == 2
+
+    def test_ingest_keeps_steady_state_history(self, conn, tmp_path):
+        """Test history rows from the ramp-up are not stored."""
+        prefix = write_run(tmp_path, "run", 20, seconds=5)
+        with open(f"{prefix}_stats_history.csv", "a", newline="", encoding="utf-8") as f:
+            csv.writer(f).writerow(
+                [1699999999, 2, "POST", "/api/calculate", 1, 0, 9] + [9] * 10 + [1, 0] + [9] * 5
+            )
+        run_id, _ = history.ingest(conn, prefix)
+        rows = conn.execute("SELECT ts FROM history WHERE run_id = ?", (run_id,)).fetchall()
+        assert len(rows) == 5
+        assert min(rows)[0] == 1700000000
+
+    def test_ingest_missing_stats(self, conn, tmp_path):
+        """Test ingesting a prefix without a stats file raises ValueError."""
+        with pytest.raises(ValueError):
+            history.ingest(conn, str(tmp_path / "missing"))
+
+    def test_mann_whitney(self):
+        """Test a shifted sample is significant and an identical one is not."""
+        before = [10, 11, 12, 10, 11, 12, 10, 11]
+        assert history.mann_whitney_greater(before, [v + 5 for v in before]) < 0.001
+        assert history.mann_whitney_greater(before, list(before)) > 0.4
+        assert history.mann_whitney_greater([5] * 6, [5] * 6) == 1.0
+
+    def test_two_proportion(self):
+        """Test a higher failure rate on large samples is significant."""
+        assert history.two_proportion_greater(10, 10000, 100, 10000) < 0.001
+        assert history.two_proportion_greater(100, 10000, 10, 10000) > 0.99
+        assert history.two_proportion_greater(0, 0, 1, 10) == 1.0
+
+    def test_regression_against_run_history(self, conn, tmp_path):
+        """Test a slower run is flagged against the spread of earlier runs."""
+        for i, latency in enumerate((20, 21, 19, 20, 20)):
+            history.ingest(conn, write_run(tmp_path, f"run{i}", latency, start=1700000000 + i))
+        run_id, _ = history.ingest(conn, write_run(tmp_path, "slow", 30, start=1700000100))
+        findings = {(f.name, f.metric): f for f in history.compare(conn, run_id)}
+        p50 = findings[("/api/calculate", "p50")]
+        assert p50.regression
+        assert p50.test == "z vs 5 runs"
+        assert p50.baseline == pytest.approx(20)
+        assert p50.change == pytest.approx(0.5)
+        assert not findings[("/api/calculate", "rps")].regression
+
+    def test_small_change_is_not_flagged(self, conn, tmp_path):
+        """Test a significant but small change stays below min_effect."""
+        for i in range(4):
+            history.ingest(conn, write_run(tmp_path, f"run{i}", 20, start=1700000000 + i))
+        run_id, _ = history.ingest(conn, write_run(tmp_path, "new", 21, start=1700000100))
+        assert not any(f.regression for f in history.compare(conn, run_id))
+
+    def test_throughput_drop(self, conn, tmp_path):
+        """Test lower requests/s is a regression and higher is not."""
+        for i in range(3):
+            history.ingest(conn, write_run(tmp_path, f"run{i}", 20, start=1700000000 + i))
+        slow, _ = history.ingest(conn, write_run(tmp_path, "a", 20, rps=30, start=1700000100))
+        metrics = {f.metric for f in history.compare(conn, slow) if f.regression}
+        assert metrics == {"rps"}
+
+    def test_regression_with_one_earlier_run(self, conn, tmp_path):
+        """Test per-second history is compared when there are few earlier runs."""
+        jitter = (0, 1, -1, 2, -2, 1, 0, -1, 2, 0)
+        history.ingest(conn, write_run(tmp_path, "before", 20, seconds=80, jitter=jitter))
+        run_id, _ = history.ingest(
+            conn, write_run(tmp_path, "after", 30, seconds=80, start=1700001000, jitter=jitter)
+        )
+        findings = {(f.name, f.metric): f for f in history.compare(conn, run_id, window=3)}
+        assert findings[("/api/calculate", "p50")].test == "mann-whitney"
+        assert findings[("/api/calculate", "p50")].regression
+        # Aggregated has no history rows to test
+        assert findings[("Aggregated", "p50")].test == "too few samples"
+        assert not findings[("Aggregated", "p50")].regression
+
+    def test_failure_rate_regression(self, conn, tmp_path):
+        """Test a jump in failures is flagged against the previous run."""
+        history.ingest(conn, write_run(tmp_path, "before", 20, failures=5))
+        run_id, _ = history.ingest(
+            conn, write_run(tmp_path, "after", 20, failures=80, start=1700001000)
+        )
+        rates = [f for f in history.compare(conn, run_id) if f.metric == "failure_rate"]
+        assert rates and all(f.regression for f in rates)
+
+    def test_report(self, conn, tmp_path):
+        """Test the HTML report lists the latest run's regressions."""
+        for i in range(3):
+            history.ingest(conn, write_run(tmp_path, f"run{i}", 20, start=1700000000 + i))
+        history.ingest(conn, write_run(tmp_path, "slow", 40, start=1700000100), "build-<4>")
+        path = tmp_path / "trends.html"
+        findings = history.report(conn, str(path))
+        document = path.read_text(encoding="utf-8")
+        assert any(f.regression for f in findings)
+        assert "<svg" in document
+        assert "build-&lt;4&gt;" in document
+        assert "POST /api/calculate: p50" in document
+
+    def test_main_fail_on_regression(self, tmp_path, capsys):
+        """Test ingest --fail-on-regression exits non-zero on a regression."""
+        db = str(tmp_path / "history.sqlite")
+        for i in range(3):
+            prefix = write_run(tmp_path, f"run{i}", 20, start=1700000000 + i)
+            assert history.main(["--db", db, "ingest", prefix, "--fail-on-regression"]) == 0
+        prefix = write_run(tmp_path, "slow", 40, start=1700000100)
+        assert history.main(["--db", db, "ingest", prefix, "--fail-on-regression"]) == 1
+        assert "REGRESSION" in capsys.readouterr().out
@@ -0,0 +1,93 @@
+"""
+Unit tests for large-integer result representations.
+"""
+
+import random
+import sys
+from decimal import Context, Decimal
+
+import pytest
+from src import int_format
+
+
+@pytest.fixture(autouse=True)
+def unlimited_int_str():
+    """
+    Lift CPython's int -> str digit limit so tests can compare against str().
+    """
+    limit = sys.get_int_max_str_digits()
+    sys.set_int_max_str_digits(0)
+    yield
+    sys.set_int_max_str_digits(limit)
+
+
+class TestIntFormat:
+    """Test suite for the int_format helpers."""
+
+    @pytest.fixture
+    def samples(self):
+        """
+        Fixture providing integers around digit boundaries and random sizes.
+
+        Returns:
+            list: Integers, including negatives and zero
+        """
+        rng = random.Random(7)  # nosec B311 - test data only
+        values = [0, 1, 9, 10, 10**15 - 1, 10**15, 10**100 - 1, 10**100, 10**5000]
+        values += [rng.getrandbits(rng.randint(1, 30000)) for _ in range(40)]
+        return values + [-v for v in values if v]
+
+    def test_digit_count(self, samples):
+        """Test digit counts match the decimal text length."""
+        for n in samples:
+            assert int_format.digit_count(n) == len(str(abs(n)))
+
+    def test_to_decimal_matches_str(self, samples):
+        """Test the divide-and-conquer conversion is exact."""
+        for n in samples:
+            assert int_format.to_decimal(n) == str(n)
+
+    def test_iter_decimal_chunks(self):
+        """Test the streamed chunks join to the full decimal text."""
+        n = 3**20000
+        chunks = list(int_format.iter_decimal(n, chunk_size=1000))
+        assert all(len(chunk) <= 1000 for chunk in chunks)
+        assert "".join(chunks) == str(n)
+
+    def test_scientific_is_correctly_rounded(self, samples):
+        """Test the mantissa matches exact rounding of the full value."""
+        for n in samples:
+            if n == 0:
+                continue
+            expected = f"{Context(prec=12).plus(Decimal(n)):.11e}"
+            assert int_format.scientific(n, 12) == expected
+
+    def test_scientific_huge_value_is_cheap(self):
+        """Test scientific notation of a ten-million-bit value."""
+        assert int_format.scientific(2**10_000_000, 5) == "9.0498e+3010299"
+
+    def test_scientific_rejects_bad_precision(self):
+        """Test significant_digits must be in range."""
+        with pytest.raises(ValueError):
+            int_format.scientific(10, 0)
+
+    def test_represent_auto_keeps_small_values_exact(self):
+        """Test auto leaves small integers and non-integers untouched."""
+        assert int_format.represent(12345) == (12345, "exact", 5)
+        assert int_format.represent(2.5) == (2.5, "exact", None)
+        assert int_format.represent(True, "hex") == (True, "exact", None)
+
+    def test_represent_auto_falls_back_to_scientific(self):
+        """Test auto switches to scientific beyond max_exact_digits."""
+        value, used, digits = int_format.represent(10**50, max_exact_digits=20)
+        assert (value, used, digits) == ("1.0000000000000000e+50", "scientific", 51)
+
+    def test_represent_modes(self):
+        """Test the hex and digits representations."""
+        assert int_format.represent(255, "hex") == ("0xff", "hex", 3)
+        assert int_format.represent(-10**30, "digits") == (31, "digits", 31)
+
+    def test_represent_rejects_unknown_mode(self):
+        """Test an unknown representation raises ValueError."""
+        with pytest.raises(ValueError):
+            int_format.represent(1, "octal")
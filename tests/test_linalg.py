@@ -0,0 +1,106 @@
+"""
+Unit tests for MatrixCalculator.
+Every test runs against the pure-Python kernels and, when installed, NumPy.
+"""
+
+import pytest
+from src import linalg
+from src.linalg import MatrixCalculator
+
+BACKENDS = [False] + ([True] if linalg.HAS_NUMPY else [])
+
+
+def _assert_matrix_close(actual, expected):
+    assert len(actual) == len(expected)
+    for row, expected_row in zip(actual, expected):
+        assert list(row) == pytest.approx(expected_row)
+
+
+class TestMatrixCalculator:
+    """Test suite for MatrixCalculator."""
+
+    @pytest.fixture(params=BACKENDS, ids=lambda np_: "numpy" if np_ else "python")
+    def matrix_calc(self, request):
+        """
+        Fixture to create a MatrixCalculator for each backend.
+
+        Returns:
+            MatrixCalculator: Calculator using the parametrized backend
+        """
+        return MatrixCalculator(use_numpy=request.param, block_size=2)
+
+    def test_multiply(self, matrix_calc):
+        """Test multiplication of rectangular matrices."""
+        a = [[1, 2, 3], [4, 5, 6]]
+        b = [[7, 8], [9, 10], [11, 12]]
+        _assert_matrix_close(matrix_calc.multiply(a, b), [[58, 64], [139, 154]])
+
+    def test_multiply_spans_several_blocks(self, matrix_calc):
+        """Test blocking covers partial tiles at the matrix edges."""
+        a = [[float(i * 5 + j) for j in range(5)] for i in range(3)]
+        identity = [[1.0 if i == j else 0.0 for j in range(5)] for i in range(5)]
+        _assert_matrix_close(matrix_calc.multiply(a, identity), a)
+
+    def test_multiply_dimension_mismatch(self, matrix_calc):
+        """Test mismatched inner dimensions raise ValueError."""
+        with pytest.raises(ValueError, match="Cannot multiply 2x2 matrix by 3x1 matrix"):
+            matrix_calc.multiply([[1, 2], [3, 4]], [[1], [2], [3]])
+
+    def test_transpose(self, matrix_calc):
+        """Test transposing a rectangular matrix."""
+        _assert_matrix_close(
+            matrix_calc.transpose([[1, 2, 3], [4, 5, 6]]), [[1, 4], [2, 5], [3, 6]]
+        )
+
+    def test_determinant(self, matrix_calc):
+        """Test determinant with pivoting required."""
+        assert matrix_calc.determinant([[0, 1], [2, 3]]) == pytest.approx(-2)
+        assert matrix_calc.determinant(
+            [[2, -3, 1], [2, 0, -1], [1, 4, 5]]
+        ) == pytest.approx(49)
+
+    def test_determinant_singular_is_zero(self, matrix_calc):
+        """Test a singular matrix has zero determinant."""
+        assert matrix_calc.determinant([[1, 2], [2, 4]]) == pytest.approx(0)
+
+    def test_determinant_requires_square(self, matrix_calc):
+        """Test non-square matrices are rejected."""
+        with pytest.raises(ValueError, match="Determinant requires a square matrix"):
+            matrix_calc.determinant([[1, 2, 3], [4, 5, 6]])
+
+    def test_solve(self, matrix_calc):
+        """Test solving a linear system."""
+        x = matrix_calc.solve([[3, 2], [1, 2]], [[5], [5]])
+        _assert_matrix_close(x, [[0], [2.5]])
+
+    def test_solve_singular(self, matrix_calc):
+        """Test solving a singular system raises ValueError."""
+        with pytest.raises(ValueError, match="Matrix is singular"):
+            matrix_calc.solve([[1, 2], [2, 4]], [[1], [2]])
+
+    def test_inverse(self, matrix_calc):
+        """Test inverse multiplied by the matrix gives the identity."""
+        a = [[4, 7, 2], [3, 6, 1], [2, 5, 3]]
+        product = matrix_calc.multiply(a, matrix_calc.inverse(a))
+        _assert_matrix_close(product, [[1, 0, 0], [0, 1, 0], [0, 0, 1]])
+
+    def test_ragged_matrix_rejected(self, matrix_calc):
+        """Test rows of different lengths are rejected."""
+        with pytest.raises(ValueError):
+            matrix_calc.transpose([[1, 2], [3]])
+
+
+class TestPacking:
+    """Test suite for packed float64 matrix transport."""
+
+    def test_pack_unpack_round_trip(self):
+        """Test packing then unpacking returns the same matrix."""
+        matrix = [[1.5, -2.0, 3.25], [0.0, 1e300, -1e-300]]
+        packed = linalg.pack(matrix)
+        assert len(packed) == 6 * 8
+        _assert_matrix_close(linalg.unpack(packed, 2, 3), matrix)
+
+    def test_unpack_wrong_length(self):
+        """Test a payload of the wrong size is rejected."""
+        with pytest.raises(ValueError, match="Expected 32 bytes"):
+            linalg.unpack(b"\0" * 24, 2, 2)
@@ -0,0 +1,116 @@
+"""
+Unit tests for the number-theory primitives.
+"""
+
+import time
+
+import pytest
+from src import number_theory
+from src.number_theory import FactorizationTimeout, PrimeSieve
+
+
+def _trial_division_is_prime(n):
+    if n < 2:
+        return False
+    i = 2
+    while i * i <= n:
+        if n % i == 0:
+            return False
+        i += 1
+    return True
+
+
+class TestPrimeSieve:
+    """Test suite for PrimeSieve."""
+
+    def test_small_primes(self):
+        """Test the sieve finds the primes below 50."""
+        sieve = PrimeSieve(limit=50)
+        assert list(sieve.primes(50)) == [
+            2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47,
+        ]
+
+    def test_matches_trial_division(self):
+        """Test every entry of a small sieve against trial division."""
+        sieve = PrimeSieve(limit=5000)
+        primes = list(sieve.primes(5000))
+        assert primes == [n for n in range(5000) if _trial_division_is_prime(n)]
+        assert len(primes) == 669
+
+    def test_covers_trial_division(self):
+        """Test factorize's trial-division primes come from the shared sieve."""
+        assert number_theory.TRIAL_DIVISION_LIMIT <= number_theory.SIEVE.limit
+        with pytest.raises(ValueError):
+            next(PrimeSieve(limit=1000).primes(1001))
+
+
+class TestPrimality:
+    """Test suite for is_prime()."""
+
+    def test_matches_trial_division(self):
+        """Test agreement with trial division around the sieve boundary."""
+        start = number_theory.SIEVE.limit - 500
+        for n in range(start, start + 1000):
+            assert number_theory.is_prime(n) == _trial_division_is_prime(n)
+
+    def test_strong_pseudoprimes_rejected(self):
+        """Test composites that fool small base sets are rejected."""
+        assert not number_theory.is_prime(3215031751)  # spsp to bases 2, 3, 5, 7
+        assert not number_theory.is_prime(3825123056546413051)
+
+    def test_large_primes(self):
+        """Test Mersenne primes inside and beyond the 64-bit range."""
+        assert number_theory.is_prime(2**61 - 1)
+        assert number_theory.is_prime(2**127 - 1)
+        assert not number_theory.is_prime(2**128 + 1)
+
+    def test_negative_and_small(self):
+        """Test numbers below 2 are not prime."""
+        assert not any(number_theory.is_prime(n) for n in (-7, 0, 1))
+
+
+class TestFactorize:
+    """Test suite for factorize()."""
+
+    def test_small_factors(self):
+        """Test factoring a number with repeated small factors."""
+        assert number_theory.factorize(360) == [2, 2, 2, 3, 3, 5]
+        assert number_theory.factorize(1) == []
+
+    def test_semiprime_with_large_factors(self):
+        """Test Pollard-Brent splits a product of two large primes."""
+        assert number_theory.factorize(1000000007 * 998244353) == [
+            998244353,
+            1000000007,
+        ]
+
+    def test_square_of_prime(self):
+        """Test squares of large primes are factored."""
+        assert number_theory.factorize(1000003**2) == [1000003, 1000003]
+
+    def test_time_budget(self):
+        """Test a hard input raises once the budget is spent."""
+        hard = (2**61 - 1) * (2**89 - 1)
+        with pytest.raises(FactorizationTimeout):
+            number_theory.factorize(hard, time_budget=0.0)
+
+    def test_time_budget_is_not_overrun(self):
+        """Test the deadline is honoured mid-cycle, not once per doubling."""
+        hard = (2**61 - 1) * (2**89 - 1)
+        start = time.monotonic()
+        with pytest.raises(FactorizationTimeout):
+            number_theory.factorize(hard, time_budget=1.0)
+        assert time.monotonic() - start < 1.25
+
+
+class TestModInverse:
+    """Test suite for mod_inverse()."""
+
+    def test_inverse(self):
+        """Test the inverse satisfies a * x = 1 (mod m)."""
+        assert number_theory.mod_inverse(3, 11) * 3 % 11 == 1
+
+    def test_no_inverse(self):
+        """Test non-coprime values raise ValueError."""
+        with pytest.raises(ValueError, match="2 has no inverse modulo 4"):
+            number_theory.mod_inverse(2, 4)
@@ -0,0 +1,111 @@
+"""
+Unit tests for the sampling profiler.
+"""
+
+import threading
+import time
+
+import pytest
+from src import profiler
+from src.profiler import OVERFLOW_STACK, SamplingProfiler
+
+
+def _handler_waiting_on(event, ready, sampler):
+    sampler.enter()
+    ready.set()
+    event.wait(5)
+    sampler.exit()
+
+
+class TestSamplingProfiler:
+    """Test suite for SamplingProfiler."""
+
+    @pytest.fixture
+    def sampler(self):
+        """
+        Fixture providing a profiler whose background thread never fires.
+
+        Returns:
+            SamplingProfiler: Sampled manually via sample()
+        """
+        sampler = SamplingProfiler(interval=3600)
+        yield sampler
+        sampler.close()
+
+    def _sample_waiting_thread(self, sampler, samples=1):
+        release, ready = threading.Event(), threading.Event()
+        thread = threading.Thread(
+            target=_handler_waiting_on, args=(release, ready, sampler)
+        )
+        thread.start()
+        ready.wait(5)
+        for _ in range(samples):
+            sampler.sample()
+        release.set()
+        thread.join()
+
+    def test_samples_active_thread_stack(self, sampler):
+        """Test the stack of an active thread is recorded root first."""
+        self._sample_waiting_thread(sampler, samples=3)
+        stack, count = sampler.collapsed().splitlines()[0].rsplit(" ", 1)
+        assert count == "3"
+        frames = stack.split(";")
+        assert frames[0].endswith(":_bootstrap")
+        assert "tests.test_profiler:_handler_waiting_on" in frames
+
+    def test_idle_threads_are_not_sampled(self, sampler):
+        """Test threads that have exited a request are ignored."""
+        sampler.enter()
+        sampler.exit()
+        sampler.sample()
+        assert sampler.samples == 0
+        assert sampler.collapsed() == ""
+
+    def test_stack_table_is_bounded(self, sampler):
+        """Test new stacks beyond max_stacks are lumped together."""
+        sampler.max_stacks = 1
+        sampler.enter()
+        sampler.sample()
+        self._sample_waiting_thread(sampler)
+        sampler.exit()
+        lines = sampler.collapsed().splitlines()
+        assert len(lines) == 2
+        assert any(line.startswith(OVERFLOW_STACK) for line in lines)
+
+    def test_max_depth_keeps_innermost_frames(self, sampler):
+        """Test deep stacks are cut to the innermost max_depth frames."""
+        sampler.max_depth = 2
+        self._sample_waiting_thread(sampler)
+        stack = sampler.collapsed().rsplit(" ", 1)[0]
+        assert len(stack.split(";")) == 2
+
+    def test_reset_and_stats(self, sampler):
+        """Test reset clears counts and stats report the sampler's cost."""
+        self._sample_waiting_thread(sampler)
+        stats = sampler.stats()
+        assert stats["samples"] == 1
+        assert stats["overhead_pct"] >= 0
+        sampler.reset()
+        assert sampler.stats()["samples"] == 0
+        assert sampler.collapsed() == ""
+
+    def test_overhead_counts_cpu_not_wall_time(self, sampler, monkeypatch):
+        """Test time the sampler spends blocked is not billed as overhead."""
+        collapse = sampler._collapse
+
+        def blocked_collapse(frame):
+            time.sleep(0.05)
+            return collapse(frame)
+
+        monkeypatch.setattr(sampler, "_collapse", blocked_collapse)
+        self._sample_waiting_thread(sampler)
+        assert sampler.samples == 1
+        assert sampler.sample_cpu_seconds < 0.025
+
+    def test_disabled_by_default(self, monkeypatch):
+        """Test the profiler is only built when PROFILER=1."""
+        monkeypatch.delenv("PROFILER", raising=False)
+        assert profiler.from_env() is None
+        monkeypatch.setenv("PROFILER", "1")
+        monkeypatch.setenv("PROFILER_INTERVAL_MS", "20")
+        assert profiler.from_env().interval == pytest.approx(0.02)
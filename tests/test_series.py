@@ -0,0 +1,159 @@
+"""
+Unit tests for the series and summation engine.
+"""
+
+import math
+from fractions import Fraction
+
+import pytest
+from src import series
+
+
+class TestClosedForms:
+    """Test suite for the O(1) series formulas."""
+
+    def test_arithmetic_sum_is_exact_for_integers(self):
+        """Test integer arithmetic series match the loop exactly."""
+        assert series.arithmetic_sum(3, 7, 1000) == sum(3 + 7 * i for i in range(1000))
+        assert series.arithmetic_sum(10**30, -1, 10**20) == (
+            10**20 * (2 * 10**30 - 10**20 + 1) // 2
+        )
+
+    def test_arithmetic_sum_float(self):
+        """Test a float arithmetic series."""
+        assert series.arithmetic_sum(0.5, 0.25, 4) == pytest.approx(3.5)
+
+    def test_geometric_sum_matches_loop(self):
+        """Test finite geometric series, exact for integers."""
+        assert series.geometric_sum(3, 2, 64) == sum(3 * 2**k for k in range(64))
+        assert series.geometric_sum(5, -3, 11) == sum(5 * (-3) ** k for k in range(11))
+        assert series.geometric_sum(2, 1, 9) == 18
+        assert series.geometric_sum(1.0, 0.5, 30) == pytest.approx(2 - 2**-29, rel=1e-15)
+
+    def test_geometric_sum_near_one_keeps_precision(self):
+        """Test a ratio within 1e-12 of 1 does not lose digits to cancellation."""
+        ratio, count = 1 + 2**-40, 1000
+        exact = Fraction(1) * ((Fraction(ratio) ** count - 1) / (Fraction(ratio) - 1))
+        assert series.geometric_sum(1.0, ratio, count) == pytest.approx(float(exact), rel=1e-14)
+
+    def test_geometric_sum_float_ratio_far_from_one(self):
+        """Test float ratios away from 1 are as exact as the loop."""
+        assert series.geometric_sum(1.0, 2, 11) == 2047.0
+        assert series.geometric_sum(1.0, 3.0, 20) == float(sum(3**k for k in range(20)))
+        assert series.geometric_sum(1.0, -2.0, 11) == 683.0
+
+    def test_infinite_geometric_series(self):
+        """Test the infinite series converges only for |ratio| < 1."""
+        assert series.geometric_sum(1, 0.5) == 2.0
+        with pytest.raises(ValueError, match="requires \\|ratio\\| < 1"):
+            series.geometric_sum(1, 1.5)
+
+    def test_power_sum_matches_loop(self):
+        """Test Faulhaber's formula against direct summation."""
+        for power in range(12):
+            for n in (0, 1, 2, 17, 100):
+                assert series.power_sum(power, n) == sum(k**power for k in range(1, n + 1))
+
+    def test_bernoulli_numbers(self):
+        """Test the first Bernoulli numbers (B1 = +1/2)."""
+        assert [series.bernoulli(i) for i in range(7)] == [
+            1, Fraction(1, 2), Fraction(1, 6), 0, Fraction(-1, 30), 0, Fraction(1, 42)
+        ]
+
+    def test_power_sum_limits(self):
+        """Test oversized powers and results are rejected."""
+        with pytest.raises(ValueError, match="power is limited"):
+            series.power_sum(series.MAX_POWER + 1, 10)
+        with pytest.raises(ValueError, match="bit limit"):
+            series.power_sum(100, 1 << 50000)
+        with pytest.raises(ValueError, match="non-negative integer"):
+            series.power_sum(2, -1)
+
+    def test_compound_growth(self):
+        """Test compound growth, including a tiny rate over many periods."""
+        assert series.compound_growth(1000, 0.05, 2) == pytest.approx(1102.5)
+        assert series.compound_growth(1, 1e-12, 10**12) == pytest.approx(math.e, rel=1e-9)
+        with pytest.raises(ValueError, match="greater than -1"):
+            series.compound_growth(1, -1, 5)
+
+    def test_overflow_is_a_value_error(self):
+        """Test float results too large to represent raise ValueError."""
+        with pytest.raises(ValueError, match="too large"):
+            series.geometric_sum(1.0, 10.0, 1000)
+        with pytest.raises(ValueError, match="too large"):
+            series.compound_growth(1, 1.0, 5000)
+
+
+class TestTermSum:
+    """Test suite for sums of a term expression in k."""
+
+    def test_recognised_terms_use_closed_forms(self):
+        """Test k**p and c**k sums are computed in closed form."""
+        assert series.term_sum("k**3", 1, 10**9) == (series.power_sum(3, 10**9), "closed_form")
+        assert series.term_sum("k", 5, 10) == (45, "closed_form")
+        assert series.term_sum("k**0", 0, 9) == (10, "closed_form")
+        total, method = series.term_sum("0.5**k", 2, 60)
+        assert method == "closed_form"
+        assert total == pytest.approx(0.5, rel=1e-15)
+
+    def test_integer_geometric_terms_are_exact(self):
+        """Test c**k with an integer c sums to the exact integer."""
+        assert series.term_sum("2**k", 0, 10) == (2047, "closed_form")
+        assert series.term_sum("3**k", 5, 200) == (
+            sum(3**k for k in range(5, 201)),
+            "closed_form",
+        )
+        assert series.term_sum("2**k", 0, 2000)[0] == 2**2001 - 1
+        with pytest.raises(ValueError, match="bit limit"):
+            series.term_sum("2**k", 0, series.MAX_EXACT_BITS)
+
+    def test_other_terms_are_summed_accurately(self):
+        """Test chunked summation agrees with math.fsum across chunk boundaries."""
+        stop = 200_000
+        total, method = series.term_sum("1 / k**2", 1, stop, chunk_size=4096)
+        assert method == "summation"
+        assert total == pytest.approx(math.fsum(1 / k**2 for k in range(1, stop + 1)), rel=1e-14)
+
+    def test_functions_and_constants(self):
+        """Test allowed functions and constants evaluate like math."""
+        total, _ = series.term_sum("sqrt(k) * sin(pi * k / 6) + abs(-e)", 1, 50)
+        expected = math.fsum(
+            math.sqrt(k) * math.sin(math.pi * k / 6) + math.e for k in range(1, 51)
+        )
+        assert total == pytest.approx(expected, rel=1e-12)
+
+    def test_empty_range(self):
+        """Test a range with stop < start sums to zero."""
+        assert series.term_sum("1 / k", 5, 4) == (0, "closed_form")
+
+    @pytest.mark.parametrize(
+        "term",
+        ["__import__('os')", "k.real", "[k]", "lambda: 1", "open(k)", "k if k else 1", ""],
+    )
+    def test_unsafe_terms_are_rejected(self, term):
+        """Test anything outside the arithmetic whitelist is refused."""
+        with pytest.raises(ValueError):
+            series.Term(term)
+
+    def test_undefined_term_names_k(self):
+        """Test a term undefined in the range reports the offending k."""
+        with pytest.raises(ValueError, match="k = 0"):
+            series.term_sum("1 / k", -3, 3)
+        with pytest.raises(ValueError, match="k = 3"):
+            series.term_sum("log(3 - k)", 1, 5)
+
+    def test_max_terms(self):
+        """Test summation is refused past max_terms but closed forms are not."""
+        with pytest.raises(ValueError, match="limit is 100"):
+            series.term_sum("1 / k", 1, 101, max_terms=100)
+        assert series.term_sum("k**2", 1, 10**12, max_terms=100)[1] == "closed_form"
+
+    def test_pure_python_fallback(self, monkeypatch):
+        """Test summation without NumPy gives the same answer."""
+        expected = series.term_sum("cos(k) / k", 1, 5000)[0]
+        monkeypatch.setattr(series, "HAS_NUMPY", False)
+        assert series.term_sum("cos(k) / k", 1, 5000, chunk_size=1000)[0] == pytest.approx(
+            expected, rel=1e-13
+        )
+        with pytest.raises(ValueError, match="k = 1"):
+            series.term_sum("(-k) ** 0.5", 1, 3)
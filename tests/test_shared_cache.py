@@ -0,0 +1,117 @@
+"""
+Unit tests for the shared-memory result cache.
+"""
+
+import multiprocessing
+import uuid
+
+import pytest
+from src import shared_cache
+from src.shared_cache import SharedResultCache, key_digest
+
+
+def _fill_from_worker(name, lock_path, count):
+    cache = SharedResultCache(name, lock_path=lock_path)
+    for i in range(count):
+        digest = key_digest("factorize", i, None)
+        hit, _ = cache.get(digest)
+        if not hit:
+            cache.put(digest, [i])
+    cache.close()
+
+
+class TestSharedResultCache:
+    """Test suite for SharedResultCache."""
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        """
+        Fixture providing a small, uniquely named cache that is removed
+        afterwards.
+
+        Returns:
+            SharedResultCache: Cache with 64 buckets
+        """
+        cache = SharedResultCache(
+            f"calc-test-{uuid.uuid4().hex[:12]}",
+            buckets=64,
+            lock_path=str(tmp_path / "cache.lock"),
+        )
+        yield cache
+        cache.unlink()
+        cache.close()
+
+    def test_put_then_get(self, cache):
+        """Test a stored result is returned with its type."""
+        digest = key_digest("factorize", 84, None)
+        assert cache.get(digest) == (False, None)
+        assert cache.put(digest, [2, 2, 3, 7])
+        assert cache.get(digest) == (True, [2, 2, 3, 7])
+
+    def test_keys_distinguish_operand_types(self):
+        """Test 1 and 1.0 (and 0.0 and -0.0) hash to different keys."""
+        assert key_digest("add", 1, 2) != key_digest("add", 1.0, 2)
+        assert key_digest("add", 0.0, 2) != key_digest("add", -0.0, 2)
+
+    def test_keys_of_huge_integers(self):
+        """Test integers too long for repr() still get distinct keys."""
+        big = 10**5000
+        assert key_digest("gcd", big, 1) != key_digest("gcd", big + 1, 1)
+        assert key_digest("gcd", -1, None) != key_digest("gcd", 255, None)
+        assert key_digest("gcd", 1, 2) != key_digest("gcd", 2, 1)
+
+    def test_oversized_values_are_not_cached(self, cache):
+        """Test values that do not fit a bucket are skipped."""
+        assert not cache.put(key_digest("factorial", 500, None), 10**400)
+        assert not cache.put(key_digest("factorize", 1, None), list(range(100)))
+
+    def test_eviction_keeps_table_bounded(self, cache):
+        """Test inserting far more keys than buckets evicts older ones."""
+        for i in range(1000):
+            assert cache.put(key_digest("gcd", i, 1), 1)
+        stats = cache.stats()["worker"]
+        assert stats["stores"] == 1000
+        assert stats["evictions"] > 0
+        hits = sum(cache.get(key_digest("gcd", i, 1))[0] for i in range(1000))
+        assert 0 < hits <= 64
+
+    def test_clock_spares_recently_read_entries(self, cache):
+        """Test a repeatedly read entry survives churn in its probe window."""
+        hot = key_digest("is_prime", 97, None)
+        cache.put(hot, True)
+        for i in range(300):
+            cache.get(hot)
+            cache.put(key_digest("gcd", i, 1), 1)
+        assert cache.get(hot) == (True, True)
+
+    def test_shared_across_processes(self, cache):
+        """Test results stored by other processes are visible host-wide."""
+        cache.put(key_digest("factorize", 0, None), [0])
+        workers = [
+            multiprocessing.Process(target=_fill_from_worker, args=(cache.name, cache.lock_path, 20))
+            for _ in range(3)
+        ]
+        for w in workers:
+            w.start()
+        for w in workers:
+            w.join()
+        assert all(w.exitcode == 0 for w in workers)
+
+        assert cache.get(key_digest("factorize", 19, None)) == (True, [19])
+        host = cache.stats()["host"]
+        assert host["hits"] + host["misses"] == 3 * 20 + 1
+        assert host["hits"] >= 1
+
+    def test_reattach_sees_existing_entries(self, cache):
+        """Test a second attachment shares the same table."""
+        digest = key_digest("lcm", 4, 6)
+        cache.put(digest, 12)
+        other = SharedResultCache(cache.name, lock_path=cache.lock_path)
+        assert other.buckets == 64
+        assert other.get(digest) == (True, 12)
+        other.close()
+
+    def test_disabled_by_default(self, monkeypatch):
+        """Test the cache is only attached when SHARED_CACHE=1."""
+        monkeypatch.delenv("SHARED_CACHE", raising=False)
+        assert shared_cache.from_env() is None
@@ -0,0 +1,102 @@
+"""
+Unit tests for SingleFlight request coalescing.
+"""
+
+import threading
+import time
+
+import pytest
+from src.singleflight import SingleFlight
+
+
+def _wait_for(condition, timeout=5.0):
+    """Poll until condition() is true or the timeout expires."""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not met before timeout")
+        time.sleep(0.001)
+
+
+class TestSingleFlight:
+    """Test suite for SingleFlight."""
+
+    @pytest.fixture
+    def flight(self):
+        """
+        Fixture to create a SingleFlight instance for each test.
+
+        Returns:
+            SingleFlight: Fresh coalescer
+        """
+        return SingleFlight()
+
+    def test_single_call_runs_function(self, flight):
+        """Test a lone call simply runs the function."""
+        assert flight.do("k", lambda a, b: a + b, 2, 3) == 5
+        assert flight.stats() == {"executed": 1, "coalesced": 0, "in_flight": 0}
+
+    def test_sequential_calls_are_not_coalesced(self, flight):
+        """Test calls that do not overlap each execute."""
+        flight.do("k", lambda: 1)
+        flight.do("k", lambda: 1)
+        assert flight.stats()["executed"] == 2
+        assert flight.stats()["coalesced"] == 0
+
+    def test_concurrent_identical_calls_share_result(self, flight):
+        """Test followers wait for the leader and share its result."""
+        release = threading.Event()
+        calls = []
+
+        def slow():
+            calls.append(1)
+            release.wait(5)
+            return 42
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(flight.do("k", slow)))
+            for _ in range(5)
+        ]
+        for t in threads:
+            t.start()
+        _wait_for(lambda: flight.stats()["coalesced"] == 4)
+        release.set()
+        for t in threads:
+            t.join()
+
+        assert results == [42] * 5
+        assert len(calls) == 1
+        assert flight.stats() == {"executed": 1, "coalesced": 4, "in_flight": 0}
+
+    def test_concurrent_calls_share_exception(self, flight):
+        """Test an exception raised by the leader reaches every follower."""
+        release = threading.Event()
+
+        def failing():
+            release.wait(5)
+            raise ValueError("Cannot divide by zero")
+
+        errors = []
+
+        def worker():
+            try:
+                flight.do("k", failing)
+            except ValueError as e:
+                errors.append(str(e))
+
+        threads = [threading.Thread(target=worker) for _ in range(3)]
+        for t in threads:
+            t.start()
+        _wait_for(lambda: flight.stats()["coalesced"] == 2)
+        release.set()
+        for t in threads:
+            t.join()
+
+        assert errors == ["Cannot divide by zero"] * 3
+
+    def test_different_keys_run_independently(self, flight):
+        """Test calls with different keys are never coalesced."""
+        assert flight.do("a", lambda: 1) == 1
+        assert flight.do("b", lambda: 2) == 2
+        assert flight.stats()["coalesced"] == 0
@@ -0,0 +1,136 @@
+"""
+Unit tests for range tabulation and vectorized evaluation.
+"""
+
+import math
+
+import pytest
+from src import tabulate, vectorized
+from src.tabulate import RangeSpec
+
+
+def _rows(chunks):
+    rows = []
+    for xs, ys in chunks:
+        rows.extend(zip(list(xs), list(ys)))
+    return rows
+
+
+class TestVectorized:
+    """Test suite for element-wise evaluation."""
+
+    def test_matches_calculator(self):
+        """Test vectorized results match the scalar Calculator."""
+        xs = [1.0, 2.5, -4.0]
+        assert list(vectorized.evaluate("multiply", xs, 2.0)) == [2.0, 5.0, -8.0]
+        assert list(vectorized.evaluate("modulo", [-7.0], [3.0])) == [2.0]
+        assert list(vectorized.evaluate("percentage", [200.0], [10.0])) == [20.0]
+
+    def test_invalid_points_are_nan(self):
+        """Test points the Calculator would reject come back as NaN."""
+        out = list(vectorized.evaluate("divide", [1.0, 1.0], [0.0, 2.0]))
+        assert math.isnan(out[0]) and out[1] == 0.5
+        assert math.isnan(list(vectorized.evaluate("square_root", [-1.0]))[0])
+        assert math.isnan(list(vectorized.evaluate("power", [10.0], [400.0]))[0])
+        assert math.isnan(list(vectorized.evaluate("power", [-8.0], [0.5]))[0])
+
+    def test_unknown_operation(self):
+        """Test unknown operations are rejected."""
+        with pytest.raises(ValueError, match="Unknown operation: cube"):
+            vectorized.evaluate("cube", [1.0], [1.0])
+
+    def test_pure_python_power_overflow_is_nan(self, monkeypatch):
+        """Test the pure-Python kernel maps float overflow to NaN, not an int."""
+        monkeypatch.setattr(vectorized, "HAS_NUMPY", False)
+        out = vectorized.evaluate("power", [2.0, 10.0, -8.0], [400.0, 400.0, 0.5])
+        assert out[0] == 2.0**400
+        assert math.isnan(out[1]) and math.isnan(out[2])
+
+
+class TestRangeSpec:
+    """Test suite for RangeSpec."""
+
+    def test_range_kind(self):
+        """Test start/stop/step sweeps exclude stop like range()."""
+        spec = RangeSpec("range", 0, 1, step=0.25)
+        assert spec.count == 4
+        assert list(spec.chunk(0, spec.count)) == [0.0, 0.25, 0.5, 0.75]
+
+    def test_linspace_includes_stop(self):
+        """Test linspace ends exactly on stop."""
+        spec = RangeSpec("linspace", 0, 1, num=3)
+        assert list(spec.chunk(0, 3)) == [0.0, 0.5, 1.0]
+
+    def test_logspace(self):
+        """Test logspace raises base to a linspace."""
+        spec = RangeSpec("logspace", 0, 2, num=3)
+        assert list(spec.chunk(0, 3)) == pytest.approx([1.0, 10.0, 100.0])
+
+    def test_invalid_specs(self):
+        """Test incomplete or inconsistent specs are rejected."""
+        with pytest.raises(ValueError, match="requires step"):
+            RangeSpec("range", 0, 1)
+        with pytest.raises(ValueError, match="non-zero"):
+            RangeSpec("range", 0, 1, step=0)
+        with pytest.raises(ValueError, match="Range requires stop"):
+            RangeSpec.from_dict({"start": 0, "num": 3})
+
+    def test_non_finite_specs(self):
+        """Test infinite, NaN or overflowing bounds and counts are ValueErrors."""
+        with pytest.raises(ValueError, match="too many values"):
+            RangeSpec("range", -1e308, 1e308, step=1e-308)
+        with pytest.raises(ValueError, match="too wide"):
+            RangeSpec("linspace", -1e308, 1e308, num=2)
+        for bad in ({"start": math.nan}, {"stop": math.inf}, {"step": -math.inf}):
+            fields = {"start": 0, "stop": 1, "step": 0.5, **bad}
+            with pytest.raises(ValueError, match="must be finite"):
+                RangeSpec("range", **fields)
+        with pytest.raises(ValueError, match="num must be finite"):
+            RangeSpec("linspace", 0, 1, num=math.inf)
+        with pytest.raises(ValueError, match="start must be a number"):
+            RangeSpec("linspace", 10**400, 1, num=2)
+        with pytest.raises(ValueError, match="stop must be a number"):
+            RangeSpec.from_dict({"start": 0, "stop": [1], "num": 3})
+
+
+class TestTabulate:
+    """Test suite for tabulate()."""
+
+    def test_power_sweep_past_float_range_without_numpy(self, monkeypatch):
+        """Test a pure-Python power sweep overflowing floats streams every row."""
+        monkeypatch.setattr(vectorized, "HAS_NUMPY", False)
+        monkeypatch.setattr(tabulate, "np", None)
+        spec = RangeSpec("range", 1, 21, step=1)
+        chunks = tabulate.tabulate("power", 400, spec, chunk_size=7)
+        rows = _rows(chunks)
+        assert [x for x, _ in rows] == [float(x) for x in range(1, 21)]
+        assert rows[1] == (2.0, 2.0**400)
+        assert all(math.isnan(y) for _, y in rows[5:])
+        body = ",".join(tabulate.encode_json_rows(xs, ys) for xs, ys in
+                        tabulate.tabulate("power", 400, spec, chunk_size=7))
+        assert body.count("null") == 15
+
+    def test_chunks_cover_whole_range(self):
+        """Test chunking yields every row exactly once and in order."""
+        spec = RangeSpec("range", 0, 10, step=1)
+        rows = _rows(tabulate.tabulate("power", 2.0, spec, chunk_size=3))
+        assert rows == [(float(x), float(x * x)) for x in range(10)]
+
+    def test_sweep_num2(self):
+        """Test the fixed operand can be num1 while num2 is swept."""
+        spec = RangeSpec("linspace", 1, 3, num=3)
+        rows = _rows(tabulate.tabulate("power", 2.0, spec, variable="num2"))
+        assert rows == [(1.0, 2.0), (2.0, 4.0), (3.0, 8.0)]
+
+    def test_validation_is_eager(self):
+        """Test bad arguments fail before any chunk is requested."""
+        with pytest.raises(ValueError, match="requires operand"):
+            tabulate.tabulate("add", None, RangeSpec("linspace", 0, 1, num=2))
+
+    def test_encoders(self):
+        """Test JSON rows use null for NaN and binary rows are 16 bytes each."""
+        xs, ys = next(
+            tabulate.tabulate("divide", 1.0, RangeSpec("range", 0, 2, step=1), "num2")
+        )
+        assert tabulate.encode_json_rows(xs, ys) == "[0.0,null],[1.0,1.0]"
+        assert len(tabulate.encode_binary_rows(xs, ys)) == 32
@@ -0,0 +1,40 @@
+"""
+Unit tests for request phase timing.
+"""
+
+from src.timing import PhaseStats, PhaseTimer
+
+
+class TestPhaseTimer:
+    """Test suite for PhaseTimer."""
+
+    def test_marks_record_consecutive_phases(self):
+        """Test each mark closes one phase in order."""
+        timer = PhaseTimer()
+        timer.mark("parse")
+        timer.mark("compute")
+        assert [name for name, _ in timer.phases] == ["parse", "compute"]
+        assert all(ms >= 0 for _, ms in timer.phases)
+
+    def test_header_format(self):
+        """Test the Server-Timing header lists phases and a total."""
+        timer = PhaseTimer()
+        timer.phases = [("parse", 0.5), ("compute", 1.25)]
+        header = timer.header()
+        assert header.startswith("parse;dur=0.500, compute;dur=1.250, total;dur=")
+
+
+class TestPhaseStats:
+    """Test suite for PhaseStats."""
+
+    def test_aggregates_per_route_and_phase(self):
+        """Test count, total, mean and max are aggregated."""
+        stats = PhaseStats()
+        stats.record("POST /api/calculate", [("parse", 1.0), ("compute", 2.0)])
+        stats.record("POST /api/calculate", [("parse", 3.0)])
+        parse = stats.snapshot()["POST /api/calculate"]["parse"]
+        assert parse == {"count": 2, "total_ms": 4.0, "mean_ms": 2.0, "max_ms": 3.0}
+
+    def test_empty_snapshot(self):
+        """Test a fresh aggregate is empty."""
+        assert PhaseStats().snapshot() == {}
@@ -0,0 +1,127 @@
+"""
+Unit tests for the slow-request watchdog.
+"""
+
+import logging
+import threading
+
+import pytest
+from src import watchdog
+from src.watchdog import SlowRequestWatchdog
+
+
+def _slow_handler(dog, release, ready, operands):
+    dog.begin("POST /api/calculate")
+    dog.note("power", *operands)
+    ready.set()
+    _stuck_in_power(release)
+    dog.end()
+
+
+def _stuck_in_power(release):
+    release.wait(5)
+
+
+class _Records(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+class TestSlowRequestWatchdog:
+    """Test suite for SlowRequestWatchdog."""
+
+    @pytest.fixture
+    def log(self):
+        """Fixture capturing the watchdog's JSON lines."""
+        logger = logging.getLogger("test.watchdog")
+        logger.propagate = False
+        handler = _Records()
+        logger.addHandler(handler)
+        yield logger, handler
+        logger.removeHandler(handler)
+
+    @pytest.fixture
+    def dog(self, log):
+        """
+        Fixture providing a watchdog whose background thread never fires.
+
+        Returns:
+            SlowRequestWatchdog: Checked manually via check()
+        """
+        dog = SlowRequestWatchdog(threshold=0, interval=3600, max_entries=2, logger=log[0])
+        yield dog
+        dog.close()
+
+    def _run_slow(self, dog, operands=(2, 10)):
+        release, ready = threading.Event(), threading.Event()
+        thread = threading.Thread(
+            target=_slow_handler, args=(dog, release, ready, operands)
+        )
+        thread.start()
+        ready.wait(5)
+        dog.check()
+        release.set()
+        thread.join(5)
+
+    def test_overdue_request_is_dumped_with_stack(self, dog, log):
+        """Test a request past the threshold is recorded with its stack and inputs."""
+        self._run_slow(dog)
+        (entry,) = dog.entries()
+        assert entry["route"] == "POST /api/calculate"
+        assert entry["operation"] == "power"
+        assert entry["operands"] == [2, 10]
+        assert any("_stuck_in_power" in line for line in entry["stack"])
+        assert entry["total_ms"] >= entry["elapsed_ms"]
+        assert '"slow_request"' in log[1].messages[0]
+
+    def test_each_request_is_dumped_once(self, dog):
+        """Test repeated checks do not record the same request twice."""
+        release, ready = threading.Event(), threading.Event()
+        thread = threading.Thread(target=_slow_handler, args=(dog, release, ready, (1,)))
+        thread.start()
+        ready.wait(5)
+        dog.check()
+        dog.check()
+        release.set()
+        thread.join(5)
+        assert dog.stats()["slow"] == 1
+
+    def test_fast_requests_are_not_dumped(self, log):
+        """Test requests under the threshold leave no record."""
+        dog = SlowRequestWatchdog(threshold=60, interval=3600, logger=log[0])
+        dog.begin("GET /health")
+        dog.check()
+        dog.end()
+        assert dog.entries() == []
+        assert dog.stats()["tracked"] == 1
+        assert dog.stats()["in_flight"] == 0
+        dog.close()
+
+    def test_log_is_bounded_and_clearable(self, dog):
+        """Test only the newest max_entries records are kept."""
+        for value in range(3):
+            self._run_slow(dog, (value, 1))
+        assert [entry["operands"][0] for entry in dog.entries()] == [1, 2]
+        dog.clear()
+        assert dog.entries() == []
+        assert dog.stats()["slow"] == 3
+
+    def test_operands_are_sanitized(self):
+        """Test huge integers and long strings are summarised."""
+        assert watchdog.describe(2**1000) == "<1001-bit int>"
+        assert watchdog.describe(12345) == 12345
+        assert watchdog.describe(1.5) == 1.5
+        assert watchdog.describe("x" * 500).endswith("(500 chars)")
+
+    def test_from_env(self, monkeypatch):
+        """Test SLOW_REQUEST_MS configures or disables the watchdog."""
+        monkeypatch.setenv("SLOW_REQUEST_MS", "0")
+        assert watchdog.from_env() is None
+        monkeypatch.setenv("SLOW_REQUEST_MS", "2500")
+        dog = watchdog.from_env()
+        assert dog.threshold == 2.5
+        assert dog.interval == 0.625
@@ -0,0 +1,144 @@
+"""
+Unit tests for the streaming window operators.
+"""
+
+import io
+import math
+import random
+import struct
+
+import pytest
+from src import windows
+
+
+def _reference(operation, values, window):
+    """Recompute a rolling statistic from scratch for every position."""
+    func = {"rolling_sum": math.fsum, "rolling_min": min, "rolling_max": max}.get(
+        operation, lambda w: math.fsum(w) / len(w)
+    )
+    return [
+        None if i + 1 < window else func(values[i + 1 - window:i + 1])
+        for i in range(len(values))
+    ]
+
+
+class TestWindowOperators:
+    """Test suite for the window operators."""
+
+    @pytest.mark.parametrize(
+        "operation", ["rolling_sum", "rolling_mean", "rolling_min", "rolling_max"]
+    )
+    def test_rolling_matches_recomputation(self, operation):
+        """Test each rolling operator against a from-scratch computation."""
+        rng = random.Random(7)  # nosec B311 - test data
+        values = [rng.uniform(-100, 100) for _ in range(500)]
+        results = list(windows.apply(operation, values, window=17))
+        for got, want in zip(results, _reference(operation, values, 17)):
+            if want is None:
+                assert got is None
+            else:
+                assert got == pytest.approx(want, rel=1e-12, abs=1e-9)
+
+    def test_min_periods_emits_partial_windows(self):
+        """Test min_periods starts producing results before the window fills."""
+        results = list(windows.apply("rolling_mean", [2, 4, 6, 8], window=3, min_periods=1))
+        assert results == [2.0, 3.0, 4.0, 6.0]
+
+    def test_rolling_min_max_with_ties_and_monotonic_runs(self):
+        """Test the monotonic deques on ties and sorted input."""
+        values = [5, 5, 4, 4, 6, 7, 8, 1, 1, 9]
+        assert list(windows.apply("rolling_min", values, window=3)) == [
+            None, None, 4, 4, 4, 4, 6, 1, 1, 1
+        ]
+        assert list(windows.apply("rolling_max", values, window=3)) == [
+            None, None, 5, 5, 6, 7, 8, 8, 8, 9
+        ]
+
+    def test_rolling_sum_does_not_drift(self):
+        """Test long streams keep the compensated window sum exact."""
+        operator = windows.RollingSum(3)
+        for _ in range(100000):
+            operator.update(0.1)
+            operator.update(1e10)
+            result = operator.update(-1e10)
+        assert result == 0.1
+
+    def test_ema(self):
+        """Test the EMA recurrence and the span parameterisation."""
+        assert list(windows.apply("ema", [10, 20, 20], alpha=0.5)) == [10.0, 15.0, 17.5]
+        assert windows.create("ema", span=3).alpha == 0.5
+
+    def test_cumulative(self):
+        """Test cumulative sum and product."""
+        assert list(windows.apply("cumsum", [1, 2, 3.5])) == [1.0, 3.0, 6.5]
+        assert list(windows.apply("cumprod", [2, 3, 0.5])) == [2.0, 6.0, 3.0]
+
+    def test_generator_input_is_consumed_lazily(self):
+        """Test operators work over an unbounded generator."""
+
+        def naturals():
+            n = 0
+            while True:
+                n += 1
+                yield n
+
+        results = windows.apply("rolling_sum", naturals(), window=2)
+        assert [next(results) for _ in range(4)] == [None, 3.0, 5.0, 7.0]
+
+    @pytest.mark.parametrize(
+        "operation, params, message",
+        [
+            ("rolling_mean", {}, "requires window"),
+            ("rolling_mean", {"window": 0}, "at least 1"),
+            ("rolling_min", {"window": 3, "min_periods": 4}, "min_periods"),
+            ("ema", {}, "exactly one"),
+            ("ema", {"alpha": 1.5}, "alpha"),
+            ("median", {}, "Unknown operation"),
+        ],
+    )
+    def test_invalid_parameters(self, operation, params, message):
+        """Test bad operations and parameters raise ValueError up front."""
+        with pytest.raises(ValueError, match=message):
+            windows.create(operation, **params)
+
+    def test_non_finite_value_rejected(self):
+        """Test NaN and infinities in the input raise ValueError."""
+        with pytest.raises(ValueError, match="finite"):
+            list(windows.apply("cumsum", [1.0, math.nan]))
+
+
+class TestStreamParsing:
+    """Test suite for the stream readers and encoders."""
+
+    def test_text_values_across_read_boundaries(self):
+        """Test numbers split between reads are reassembled."""
+        stream = io.BytesIO(b"1.5, 2\n-3e2 40\r\n,5,")
+        assert list(windows.iter_text_values(stream, read_size=3)) == [
+            1.5, 2.0, -300.0, 40.0, 5.0
+        ]
+
+    def test_text_invalid_token(self):
+        """Test a non-numeric token raises ValueError naming it."""
+        with pytest.raises(ValueError, match="'abc'"):
+            list(windows.iter_text_values(io.BytesIO(b"1 abc 2")))
+
+    def test_binary_values(self):
+        """Test packed little-endian float64 input, including partial reads."""
+        stream = io.BytesIO(struct.pack("<3d", 1.0, -2.5, 1e300))
+        assert list(windows.iter_binary_values(stream, read_size=12)) == [1.0, -2.5, 1e300]
+        with pytest.raises(ValueError, match="multiple of 8"):
+            list(windows.iter_binary_values(io.BytesIO(b"\x00" * 9)))
+
+    def test_encoders(self):
+        """Test None and overflow encode as null / NaN."""
+        assert windows.encode_text([None, 1.5, math.inf]) == "null\n1.5\nnull\n"
+        decoded = struct.unpack("<2d", windows.encode_binary([None, 2.0]))
+        assert math.isnan(decoded[0]) and decoded[1] == 2.0
+
+    def test_binary_error_trailer(self):
+        """Test the error trailer cannot be mistaken for an encoded result."""
+        trailer = windows.encode_binary_error("Invalid number: 'x'")
+        assert trailer.startswith(windows.BINARY_ERROR_MARKER)
+        assert trailer[8:] == b'{"error": "Invalid number: \'x\'"}'
+        results = windows.encode_binary([None, math.inf, -math.inf, math.inf - math.inf])
+        assert windows.BINARY_ERROR_MARKER not in [results[i:i + 8] for i in range(0, 32, 8)]
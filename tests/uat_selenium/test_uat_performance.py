@@ -0,0 +1,134 @@
+"""
+Selenium UAT Performance Budgets - CA3
+Collects Navigation / Resource Timing from the browser and checks it
+against budgets, so regressions in HTML_TEMPLATE show up in UAT.
+
+Budgets (override with environment variables):
+  UAT_BUDGET_TTFB_MS        time to first byte            (default 800)
+  UAT_BUDGET_DCL_MS         DOMContentLoaded              (default 2000)
+  UAT_BUDGET_TRANSFER_KB    document + resources on wire  (default 32)
+
+Measurements are written to UAT_PERF_RESULTS (default uat-performance.json),
+next to uat-report.html.
+"""
+
+import json
+import os
+import time
+
+import pytest
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import Select, WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+
+TEST_URL = os.getenv("TEST_URL", "http://localhost:5000").rstrip("/")
+
+BUDGETS = {
+    "ttfb_ms": float(os.getenv("UAT_BUDGET_TTFB_MS", "800")),
+    "dom_content_loaded_ms": float(os.getenv("UAT_BUDGET_DCL_MS", "2000")),
+    "transfer_kb": float(os.getenv("UAT_BUDGET_TRANSFER_KB", "32")),
+}
+
+RESULTS_PATH = os.getenv("UAT_PERF_RESULTS", "uat-performance.json")
+
+# Navigation + Resource Timing for the current document, once it has loaded
+COLLECT_TIMINGS = """
+const nav = performance.getEntriesByType("navigation")[0].toJSON();
+const resources = performance.getEntriesByType("resource").map(r => ({
+    name: r.name,
+    type: r.initiatorType,
+    duration: r.duration,
+    transferSize: r.transferSize,
+}));
+return {nav: nav, resources: resources};
+"""
+
+
+@pytest.fixture(scope="module")
+def perf_results():
+    """
+    Collect measurements from every test and save them when the module ends.
+    """
+    results = {
+        "url": TEST_URL,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "budgets": BUDGETS,
+        "pages": {},
+    }
+    yield results
+    with open(RESULTS_PATH, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+    print(f"Performance results saved: {RESULTS_PATH}")
+
+
+def collect_timings(driver, timeout=10):
+    """
+    Wait for the load event and summarise the page's timing entries.
+    """
+    WebDriverWait(driver, timeout).until(
+        lambda d: d.execute_script(
+            "const n = performance.getEntriesByType('navigation')[0];"
+            "return n !== undefined && n.loadEventEnd > 0;"
+        )
+    )
+    raw = driver.execute_script(COLLECT_TIMINGS)
+    nav = raw["nav"]
+    transfer = nav["transferSize"] + sum(r["transferSize"] for r in raw["resources"])
+    return {
+        "ttfb_ms": round(nav["responseStart"] - nav["startTime"], 1),
+        "dom_content_loaded_ms": round(nav["domContentLoadedEventEnd"] - nav["startTime"], 1),
+        "load_ms": round(nav["loadEventEnd"] - nav["startTime"], 1),
+        "document_bytes": nav["decodedBodySize"],
+        "transfer_kb": round(transfer / 1024, 2),
+        "resource_count": len(raw["resources"]),
+        "resources": raw["resources"],
+    }
+
+
+def check_budgets(page, metrics, perf_results):
+    """
+    Record a page's metrics and assert every budget holds.
+    """
+    over = {
+        name: metrics[name]
+        for name, budget in BUDGETS.items()
+        if metrics[name] > budget
+    }
+    perf_results["pages"][page] = dict(metrics, over_budget=sorted(over))
+    print(
+        f"{page}: TTFB {metrics['ttfb_ms']} ms, "
+        f"DOMContentLoaded {metrics['dom_content_loaded_ms']} ms, "
+        f"transfer {metrics['transfer_kb']} KB"
+    )
+    assert not over, f"{page} over budget {BUDGETS}: {over}"
+
+
+class TestPerformanceBudgets:
+    def test_home_page_budget(self, driver, perf_results):
+        driver.get(TEST_URL)
+        WebDriverWait(driver, 10).until(
+            EC.presence_of_element_located((By.NAME, "operation"))
+        )
+
+        metrics = collect_timings(driver)
+        check_budgets("home", metrics, perf_results)
+
+    def test_form_calculation_budget(self, driver, perf_results):
+        driver.get(TEST_URL)
+        WebDriverWait(driver, 10).until(
+            EC.presence_of_element_located((By.NAME, "operation"))
+        )
+
+        Select(driver.find_element(By.NAME, "operation")).select_by_value("multiply")
+        driver.find_element(By.NAME, "num1").send_keys("6")
+        driver.find_element(By.NAME, "num2").send_keys("7")
+        driver.find_element(By.CSS_SELECTOR, "button[type='submit']").click()
+
+        WebDriverWait(driver, 10).until(
+            EC.presence_of_element_located((By.CLASS_NAME, "result"))
+        )
+        assert "42" in driver.find_element(By.CLASS_NAME, "result").text
+
+        # The result page is a fresh navigation (the form POST)
+        metrics = collect_timings(driver)
+        check_budgets("form_calculation", metrics, perf_results)